@@ -0,0 +1,136 @@
+"""
+Benchmark operation calls to a local HTTP server with artificial latency,
+made sequentially and with the batch() helper of a generated client.
+"""
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import threading
+import time
+import timeit
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+from typing import Any, Dict
+
+from bravado.client import SwaggerClient
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT: Dict[str, Any] = {
+    'swagger': '2.0',
+    'info': {'title': 'Batch benchmark', 'version': '1.0'},
+    'schemes': ['http'],
+    'paths': {
+        '/items/{id}': {
+            'get': {
+                'operationId': 'getItem',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {'$ref': '#/definitions/Item'},
+                    },
+                },
+            },
+        },
+    },
+    'definitions': {
+        'Item': {
+            'type': 'object',
+            'properties': {'id': {'type': 'integer'}},
+        },
+    },
+}
+
+
+def generate(directory: str) -> ModuleType:
+    """Generate and import a client module."""
+    path = f'{directory}/bench.py'
+    config = Config(name='Bench', path=path, batch_helper=True)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    module_spec = importlib.util.spec_from_file_location('bench', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def serve(latency: float) -> ThreadingHTTPServer:
+    """Start an HTTP server which serves items after a delay."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            item_id = int(self.path.rsplit('/', 1)[1])
+            body = json.dumps({'id': item_id}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=100,
+                        help="Number of operation calls. Default 100.")
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help="Response delay in seconds. Default 0.02.")
+    parser.add_argument('--workers', type=int, default=10,
+                        help="Number of concurrent calls. The default "
+                        "connection pool of the requests HTTP client holds "
+                        "10 connections per host. Default 10.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timed runs. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    server = serve(ns.latency)
+    with tempfile.TemporaryDirectory() as directory:
+        module = generate(directory)
+    client = module.BenchSwaggerClient.from_spec(
+        dict(SPEC_DICT, host=f'127.0.0.1:{server.server_port}'),
+        http_client=RequestsClient())
+
+    def sequential() -> None:
+        for i in range(ns.calls):
+            client.items.getItem(id=i).result()
+
+    def batch() -> None:
+        with client.batch(max_workers=ns.workers) as b:
+            futures = b.submit_all(client.items.getItem(id=i)
+                                   for i in range(ns.calls))
+        for future in futures:
+            future.result()
+
+    print(f"calls={ns.calls} latency={ns.latency}s workers={ns.workers}")
+    for name, func in [('sequential', sequential), ('batch', batch)]:
+        times = timeit.repeat(func, repeat=ns.repeat, number=1)
+        best = min(times)
+        print(f"{name}: best {best:.3f}s ({ns.calls / best:.0f} calls/s), "
+              f"mean {sum(times) / len(times):.3f}s")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
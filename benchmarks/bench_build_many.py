@@ -0,0 +1,108 @@
+"""
+Benchmark creating many model instances from dicts of property values, by
+calling the model type for each dict and with the build_many() method
+generated with the build_helper option.
+
+Both methods are also timed with each instance validated against the model
+schema, by calling bravado_core.validate.validate_object() after the model
+type, and by passing validate=True to build_many(). The runs of each method
+are interleaved, so that changes in machine load affect all methods alike.
+"""
+
+import argparse
+import importlib.util
+import tempfile
+import timeit
+import warnings
+from typing import Any, Callable, Dict, List
+
+from bravado.client import SwaggerClient
+from bravado_core.marshal import marshal_model
+from bravado_core.validate import validate_object
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT: Dict[str, Any] = {
+    'swagger': '2.0',
+    'info': {'title': 'Build helper benchmark', 'version': '1.0'},
+    'paths': {},
+    'definitions': {
+        'Pet': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer', 'format': 'int64'},
+                'name': {'type': 'string'},
+                'photoUrls': {'type': 'array', 'items': {'type': 'string'}},
+                'status': {'type': 'string'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+                'category': {'type': 'string'},
+            },
+            'required': ['name', 'photoUrls'],
+        },
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000,
+                        help="Number of instances. Default 10000.")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Number of timed runs. Default 5.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    with tempfile.TemporaryDirectory() as directory:
+        path = f'{directory}/bench.py'
+        config = Config(name='Bench', path=path, build_helper=True)
+        spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+        render(get_metadata(spec), get_spec_info(spec, config), config)
+        module_spec = importlib.util.spec_from_file_location('bench', path)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)  # type: ignore
+
+    client = module.BenchSwaggerClient.from_spec(SPEC_DICT)
+    swagger_spec = client.swagger_spec
+    Pet = client.get_model('Pet')
+    model_spec = Pet._model_spec
+    rows = [{'id': i, 'name': f'pet{i}', 'photoUrls': [], 'status': 'sold'}
+            for i in range(ns.rows)]
+
+    def validated(model: Any) -> Any:
+        validate_object(swagger_spec, model_spec,
+                        marshal_model(swagger_spec, model_spec, model))
+        return model
+
+    methods: Dict[str, Callable[[], List[Any]]] = {
+        'constructor': lambda: [Pet(**row) for row in rows],
+        'build_many': lambda: client.build_many('Pet', rows),
+        'constructor+validate':
+            lambda: [validated(Pet(**row)) for row in rows],
+        'build_many+validate':
+            lambda: client.build_many('Pet', rows, validate=True),
+    }
+    expected = methods['constructor']()
+    for build in methods.values():
+        assert build() == expected
+
+    times: Dict[str, List[float]] = {name: [] for name in methods}
+    for _ in range(ns.repeat):
+        for name, build in methods.items():
+            times[name] += timeit.repeat(build, repeat=1, number=1)
+    best = {name: min(results) for name, results in times.items()}
+
+    print(f"rows={ns.rows}")
+    for name in methods:
+        print(f"{name:<20} {best[name] * 1e3:8.1f}ms "
+              f"{best[name] / ns.rows * 1e6:6.2f}us/instance")
+    for name in ['build_many', 'build_many+validate']:
+        base = name.replace('build_many', 'constructor')
+        print(f"{name} speed-up over {base}: "
+              f"{best[base] / best[name]:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark clients of several generated modules making calls to a local HTTP
+server, with clients created separately by from_url() and with clients
+created by a generated ClientFactory sharing one pooled HTTP client.
+
+Reports the time for creating the clients and making the calls, and the
+number of connections the server accepted.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Set
+
+from bravado.client import SwaggerClient
+
+from bravado_types import generate_client_factory, generate_module
+from bravado_types.config import Config
+
+
+def make_spec(name: str, host: str = None) -> Dict[str, Any]:
+    spec: Dict[str, Any] = {
+        'swagger': '2.0',
+        'info': {'title': name, 'version': '1.0'},
+        'schemes': ['http'],
+        'produces': ['application/json'],
+        'paths': {
+            '/item': {
+                'get': {
+                    'operationId': 'getItem',
+                    'tags': ['items'],
+                    'responses': {
+                        '200': {
+                            'description': 'Success',
+                            'schema': {
+                                'type': 'object',
+                                'properties': {'id': {'type': 'integer'}},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    }
+    if host:
+        spec['host'] = host
+        spec['basePath'] = f'/{name}'
+    return spec
+
+
+def serve() -> ThreadingHTTPServer:
+    """Start an HTTP server which records the port of each connection."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self.server.connections.add(  # type: ignore
+                self.client_address[1])
+            if self.path.endswith('.json'):
+                data = make_spec(self.path[1:-5], self.headers['Host'])
+            else:
+                data = {'id': 1}
+            body = json.dumps(data).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.connections: Set[int] = set()  # type: ignore
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--services', type=int, default=10,
+                        help="Number of generated modules. Default 10.")
+    parser.add_argument('--calls', type=int, default=50,
+                        help="Number of calls per client. Default 50.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    server = serve()
+    names = [f'service{i}' for i in range(ns.services)]
+    with tempfile.TemporaryDirectory() as directory:
+        clients = []
+        for name in names:
+            config = Config(name=name.title(), path=f'{directory}/{name}.py')
+            generate_module(SwaggerClient.from_spec(make_spec(name)), config)
+            clients.append((name, config))
+        generate_client_factory(clients, f'{directory}/clients.py')
+        sys.path.insert(0, directory)
+        client_types = [
+            getattr(importlib.import_module(name), config.client_type)
+            for name, config in clients]
+        factory = importlib.import_module('clients').ClientFactory()
+
+    def run(create: Callable[[Any, str], Any]) -> None:
+        created: List[Any] = [
+            create(client_type,
+                   f'http://127.0.0.1:{server.server_port}/{name}.json')
+            for client_type, name in zip(client_types, names)]
+        for _ in range(ns.calls):
+            for client in created:
+                client.items.getItem().result()
+
+    print(f"services={ns.services} calls={ns.calls}")
+    for label, create in [
+        ('from_url', lambda client_type, url: client_type.from_url(url)),
+        ('factory', factory.create),
+    ]:
+        server.connections.clear()  # type: ignore
+        start = time.perf_counter()
+        run(create)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<9} {elapsed:.3f}s, "
+              f"{len(server.connections)} connections")  # type: ignore
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
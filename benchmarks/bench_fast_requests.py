@@ -0,0 +1,155 @@
+"""
+Benchmark operation calls to a local HTTP server, with clients generated with
+and without the fast_requests option.
+
+Also reports the time spent building the request of a call, without the HTTP
+round trip, with bravado's construct_request() and with the generated request
+builder.
+"""
+
+import argparse
+import importlib.util
+import tempfile
+import threading
+import timeit
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+from typing import Any, Dict
+
+from bravado.client import SwaggerClient, construct_request
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT: Dict[str, Any] = {
+    'swagger': '2.0',
+    'info': {'title': 'Fast requests benchmark', 'version': '1.0'},
+    'schemes': ['http'],
+    'paths': {
+        '/items/{id}': {
+            'put': {
+                'operationId': 'updateItem',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer', 'format': 'int64'},
+                    {'name': 'fields', 'in': 'query', 'type': 'array',
+                     'items': {'type': 'string'}},
+                    {'name': 'dryRun', 'in': 'query', 'type': 'boolean'},
+                    {'name': 'X-Request-Id', 'in': 'header',
+                     'type': 'string'},
+                    {'name': 'item', 'in': 'body', 'required': True,
+                     'schema': {'$ref': '#/definitions/Item'}},
+                ],
+                'responses': {'204': {'description': 'Success'}},
+            },
+        },
+    },
+    'definitions': {
+        'Item': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+                'count': {'type': 'integer'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+            },
+        },
+    },
+}
+
+KWARGS: Dict[str, Any] = {
+    'id': 1,
+    'fields': ['name', 'count'],
+    'dryRun': False,
+    'X_Request_Id': 'abc',
+    'item': {'name': 'item', 'count': 3, 'tags': ['a', 'b']},
+}
+
+
+def generate(directory: str, name: str, fast_requests: bool) -> ModuleType:
+    """Generate and import a client module."""
+    path = f'{directory}/{name}.py'
+    config = Config(name='Bench', path=path, fast_requests=fast_requests)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    module_spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def serve() -> ThreadingHTTPServer:
+    """Start an HTTP server which accepts every request."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_PUT(self) -> None:
+            self.rfile.read(int(self.headers['Content-Length']))
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=1000,
+                        help="Number of operation calls. Default 1000.")
+    parser.add_argument('--builds', type=int, default=10000,
+                        help="Number of requests built without calls. "
+                        "Default 10000.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timed runs. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    server = serve()
+    with tempfile.TemporaryDirectory() as directory:
+        default = generate(directory, 'bench_default', False)
+        fast = generate(directory, 'bench_fast', True)
+    spec_dict = dict(SPEC_DICT, host=f'127.0.0.1:{server.server_port}')
+    clients = {
+        'default': default.BenchSwaggerClient.from_spec(
+            spec_dict, http_client=RequestsClient()),
+        'fast_requests': fast.BenchSwaggerClient.from_spec(
+            spec_dict, http_client=RequestsClient()),
+    }
+
+    print(f"calls={ns.calls}")
+    for name, client in clients.items():
+        def call() -> None:
+            for _ in range(ns.calls):
+                client.items.updateItem(**KWARGS).result()
+
+        best = min(timeit.repeat(call, repeat=ns.repeat, number=1))
+        print(f"{name:<14} {ns.calls / best:8.0f} calls/s")
+
+    operation = clients['fast_requests'].swagger_spec.resources[
+        'items'].operations['updateItem']
+    context = fast._request_context(operation)
+    builders = {
+        'construct_request': lambda: construct_request(operation, {},
+                                                       **KWARGS),
+        'request builder': lambda: context.build(context, {}, KWARGS),
+    }
+
+    print(f"\nbuilds={ns.builds}")
+    for name, build in builders.items():
+        best = min(timeit.repeat(build, repeat=ns.repeat, number=ns.builds))
+        print(f"{name:<18} {best / ns.builds * 1e6:8.1f}us/request")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark generating modules for many schemas served over HTTP with
+artificial latency, with generate_module() in a loop and with
+generate_modules_async().
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import timeit
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+from bravado.client import SwaggerClient
+
+from bravado_types import generate_module, generate_modules_async
+from bravado_types.config import Config
+
+
+def make_documents(num_schemas: int, num_models: int) -> Dict[str, Any]:
+    """
+    Create `num_schemas` schemas with `num_models` models each, which all
+    reference a shared document.
+    """
+    documents: Dict[str, Any] = {
+        '/common.json': {
+            'definitions': {
+                'Id': {'type': 'integer'},
+            },
+        },
+    }
+    for i in range(num_schemas):
+        documents[f'/service{i}.json'] = {
+            'swagger': '2.0',
+            'info': {'title': f'Service {i}', 'version': '1.0'},
+            'paths': {
+                f'/model{j}': {
+                    'get': {
+                        'operationId': f'getModel{j}',
+                        'tags': ['models'],
+                        'responses': {
+                            '200': {
+                                'description': 'Success',
+                                'schema': {
+                                    '$ref': f'#/definitions/Model{j}',
+                                },
+                            },
+                        },
+                    },
+                }
+                for j in range(num_models)
+            },
+            'definitions': {
+                f'Model{j}': {
+                    'type': 'object',
+                    'properties': {
+                        'id': {'$ref': 'common.json#/definitions/Id'},
+                        'name': {'type': 'string'},
+                    },
+                }
+                for j in range(num_models)
+            },
+        }
+    return documents
+
+
+def serve(documents: Dict[str, Any], latency: float) -> ThreadingHTTPServer:
+    """Start an HTTP server which serves documents after a delay."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            body = json.dumps(documents[self.path]).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--schemas', type=int, default=20,
+                        help="Number of schemas. Default 20.")
+    parser.add_argument('--models', type=int, default=50,
+                        help="Number of models per schema. Default 50.")
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help="Response delay in seconds. Default 0.05.")
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help="Maximum number of schemas fetched at a time. "
+                        "Default 8.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timed runs. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    server = serve(make_documents(ns.schemas, ns.models), ns.latency)
+
+    with tempfile.TemporaryDirectory() as directory:
+        sources: List[Tuple[str, Config]] = [
+            (f'http://127.0.0.1:{server.server_port}/service{i}.json',
+             Config(name=f'Service{i}', path=f'{directory}/service{i}.py'))
+            for i in range(ns.schemas)
+        ]
+
+        def sequential() -> None:
+            for url, config in sources:
+                generate_module(SwaggerClient.from_url(url), config)
+
+        def threads() -> None:
+            asyncio.run(generate_modules_async(
+                sources, max_concurrency=ns.concurrency))
+
+        def processes() -> None:
+            with ProcessPoolExecutor() as executor:
+                asyncio.run(generate_modules_async(
+                    sources, max_concurrency=ns.concurrency,
+                    executor=executor))
+
+        print(f"schemas={ns.schemas} models={ns.models} "
+              f"latency={ns.latency}s concurrency={ns.concurrency}")
+        for name, func in [
+            ('sequential', sequential),
+            ('async, threads', threads),
+            ('async, processes', processes),
+        ]:
+            times = timeit.repeat(func, repeat=ns.repeat, number=1)
+            print(f"{name}: best {min(times):.3f}s, "
+                  f"mean {sum(times) / len(times):.3f}s")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark model extraction for large model inheritance hierarchies."""
+
+import argparse
+import timeit
+import warnings
+from typing import Any, Dict
+
+from bravado_core.spec import Spec
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+
+
+def make_spec_dict(num_models: int, depth: int) -> Dict[str, Any]:
+    """
+    Create a spec with `num_models` models, arranged in inheritance chains of
+    length `depth`. Each model adds one property to those of its parent.
+    """
+    definitions: Dict[str, Any] = {}
+    for i in range(num_models):
+        level = i % depth
+        properties = {f'prop{level}': {'type': 'string'}}
+        required = [f'prop{level}'] if level % 2 else []
+        if level == 0:
+            definitions[f'Model{i}'] = {
+                'type': 'object',
+                'properties': properties,
+                'required': required,
+            }
+        else:
+            definitions[f'Model{i}'] = {
+                'allOf': [
+                    {'$ref': f'#/definitions/Model{i - 1}'},
+                    {
+                        'type': 'object',
+                        'properties': properties,
+                        'required': required,
+                    },
+                ],
+            }
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'Inheritance benchmark', 'version': '1.0'},
+        'paths': {},
+        'definitions': definitions,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--models', type=int, default=1000,
+                        help="Total number of models. Default 1000.")
+    parser.add_argument('--depth', type=int, default=100,
+                        help="Length of each inheritance chain. Default 100.")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Number of timed runs. Default 5.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    spec = Spec.from_dict(make_spec_dict(ns.models, ns.depth),
+                          config={'validate_swagger_spec': False})
+    config = Config(name='Benchmark', path='benchmark.py')
+
+    times = timeit.repeat(lambda: get_spec_info(spec, config),
+                          repeat=ns.repeat, number=1)
+    print(f"models={ns.models} depth={ns.depth}")
+    print(f"get_spec_info: best {min(times):.3f}s, "
+          f"mean {sum(times) / len(times):.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark the per-call overhead of the instrumentation option of a generated
+client, using an HTTP client which returns canned responses without network
+I/O.
+
+Compares a client generated without instrumentation, an instrumented client
+with no hooks registered, and an instrumented client with a single hook.
+"""
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import timeit
+import warnings
+from types import ModuleType
+from typing import Any, Dict, List
+
+import requests
+from bravado.client import SwaggerClient
+from bravado.http_client import HttpClient
+from bravado.http_future import HttpFuture
+from bravado.requests_client import RequestsResponseAdapter
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT: Dict[str, Any] = {
+    'swagger': '2.0',
+    'info': {'title': 'Instrumentation benchmark', 'version': '1.0'},
+    'paths': {
+        '/items/{id}': {
+            'get': {
+                'operationId': 'getItem',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {'$ref': '#/definitions/Item'},
+                    },
+                },
+            },
+        },
+    },
+    'definitions': {
+        'Item': {
+            'type': 'object',
+            'properties': {'id': {'type': 'integer'}},
+        },
+    },
+}
+
+
+class FakeFutureAdapter:
+    timeout_errors = ()
+    connection_errors = ()
+
+    def __init__(self, response: requests.Response) -> None:
+        self.response = response
+
+    def result(self, timeout: float = None) -> requests.Response:
+        return self.response
+
+    def cancel(self) -> None:
+        pass
+
+
+class FakeHttpClient(HttpClient):
+    """HTTP client which returns the same response for every request."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def request(self, request_params: Any, operation: Any = None,
+                request_config: Any = None) -> HttpFuture:
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = self.content
+        return HttpFuture(FakeFutureAdapter(response),  # type: ignore
+                          RequestsResponseAdapter, operation, request_config)
+
+
+def generate(directory: str, name: str, instrumentation: bool) -> ModuleType:
+    """Generate and import a client module."""
+    path = f'{directory}/{name}.py'
+    config = Config(name='Bench', path=path, instrumentation=instrumentation)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    module_spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=10000,
+                        help="Number of operation calls. Default 10000.")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Number of timed runs. Default 5.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    with tempfile.TemporaryDirectory() as directory:
+        default = generate(directory, 'bench_default', False)
+        instrumented = generate(directory, 'bench_instrumented', True)
+    http_client = FakeHttpClient(json.dumps({'id': 1}).encode('utf-8'))
+    spec_config = {'validate_responses': False}
+    clients = {
+        'default': default.BenchSwaggerClient.from_spec(
+            SPEC_DICT, http_client=http_client, config=spec_config),
+        'no hooks': instrumented.BenchSwaggerClient.from_spec(
+            SPEC_DICT, http_client=http_client, config=spec_config),
+        'one hook': instrumented.BenchSwaggerClient.from_spec(
+            SPEC_DICT, http_client=http_client, config=spec_config),
+    }
+    calls: List[Any] = []
+    clients['one hook'].add_operation_hook(calls.append)
+
+    print(f"calls={ns.calls}")
+    baseline = None
+    for name, client in clients.items():
+        def call() -> None:
+            client.items.getItem(id=1).result()
+
+        best = min(timeit.repeat(call, repeat=ns.repeat, number=ns.calls))
+        per_call = best / ns.calls * 1e6
+        if baseline is None:
+            baseline = per_call
+        calls.clear()
+        print(f"{name:<10} {per_call:8.1f}us/call "
+              f"({per_call - baseline:+.1f}us)")
+
+
+if __name__ == '__main__':
+    main()
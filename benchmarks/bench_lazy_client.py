@@ -0,0 +1,126 @@
+"""
+Benchmark client creation for a large schema with the default generated
+client class and with the lazy client class, which builds resources and
+operations on first access.
+
+Reports the time and memory allocated to create a client, and the time of
+the first access to an operation. Schema validation, which does not depend on
+the client class, is disabled.
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import os.path
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from types import ModuleType
+from typing import Any, Dict, Tuple
+
+from bravado.client import SwaggerClient
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_typecheck import make_spec_dict  # noqa: E402
+
+
+def generate(directory: str, name: str, spec_dict: Dict[str, Any],
+             lazy_client: bool) -> ModuleType:
+    """Generate and import a client module."""
+    path = f'{directory}/{name}.py'
+    config = Config(name='Bench', path=path, lazy_client=lazy_client)
+    spec = SwaggerClient.from_spec(
+        copy.deepcopy(spec_dict),
+        config={'validate_swagger_spec': False}).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    module_spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def measure(client_class: Any, spec_dict: Dict[str, Any],
+            operation: Tuple[str, str]) -> Tuple[float, int, float]:
+    """
+    :return: Client creation time, memory allocated by client creation, and
+        time of first operation access.
+    """
+    def create() -> Any:
+        return client_class.from_spec(
+            copied_spec_dict, http_client=RequestsClient(),
+            config={'validate_swagger_spec': False})
+
+    copied_spec_dict = copy.deepcopy(spec_dict)
+    start = time.perf_counter()
+    client = create()
+    elapsed = time.perf_counter() - start
+
+    resource_name, operation_name = operation
+    start = time.perf_counter()
+    getattr(getattr(client, resource_name), operation_name)
+    first_access = time.perf_counter() - start
+
+    # Measure memory separately, as tracing slows down client creation
+    copied_spec_dict = copy.deepcopy(spec_dict)
+    tracemalloc.start()
+    create()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, memory, first_access
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=500,
+                        help="Number of models in a synthetic schema. Each "
+                        "model has two operations. Default 500.")
+    parser.add_argument('--schema',
+                        help="Path of a real-world JSON schema to use instead "
+                        "of a synthetic schema.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of runs for each client class. "
+                        "Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    if ns.schema:
+        with open(ns.schema) as f:
+            spec_dict = json.load(f)
+    else:
+        spec_dict = make_spec_dict(ns.models)
+    with tempfile.TemporaryDirectory() as directory:
+        modules = {
+            'default': generate(directory, 'bench_default', spec_dict, False),
+            'lazy': generate(directory, 'bench_lazy', spec_dict, True),
+        }
+        # Access the first operation of the first resource
+        client = modules['default'].BenchSwaggerClient.from_spec(
+            copy.deepcopy(spec_dict), http_client=RequestsClient(),
+            config={'validate_swagger_spec': False})
+        resource_name, resource = next(iter(
+            client.swagger_spec.resources.items()))
+        operation = resource_name, next(iter(resource.operations))
+
+        for name, module in modules.items():
+            results = [measure(module.BenchSwaggerClient, spec_dict,
+                               operation)
+                       for _ in range(ns.repeat)]
+            elapsed, memory, first_access = min(results)
+            print(f"{name:<7} create {elapsed * 1000:8.1f}ms "
+                  f"{memory / 2**20:7.1f} MB  "
+                  f"first access {first_access * 1000:6.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
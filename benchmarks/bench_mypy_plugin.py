@@ -0,0 +1,153 @@
+"""
+Benchmark MyPy type checking with full stubs and with lazy stubs checked by
+the bravado-types MyPy plugin.
+"""
+
+import argparse
+import glob
+import os
+import os.path
+import tempfile
+import time
+import warnings
+from typing import Any, Dict
+
+import mypy.api
+from bravado.client import SwaggerClient
+
+from bravado_types import Config, generate_module
+
+EXAMPLE = """\
+from {module} import {client}
+
+client: {client}
+Model0 = client.get_model('Model0')
+model = Model0(prop0='a', prop1=1)
+future = client.resource0.getModel0(id=1, body=model)
+result = future.response().result
+if result is not None:
+    print(result.prop0.upper())
+"""
+
+
+def make_spec_dict(num_models: int, num_props: int,
+                   resources: int) -> Dict[str, Any]:
+    """
+    Create a spec with `num_models` models with `num_props` properties each,
+    and two operations per model spread over `resources` resources.
+    """
+    definitions = {}
+    paths = {}
+    for i in range(num_models):
+        properties: Dict[str, Any] = {}
+        for j in range(num_props):
+            if j % 2:
+                properties[f'prop{j}'] = {'type': 'integer'}
+            else:
+                properties[f'prop{j}'] = {'type': 'string'}
+        if i:
+            properties['parent'] = {'$ref': f'#/definitions/Model{i - 1}'}
+        definitions[f'Model{i}'] = {
+            'type': 'object',
+            'properties': properties,
+            'required': ['prop0'],
+        }
+        ref = {'$ref': f'#/definitions/Model{i}'}
+        tag = f'resource{i % resources}'
+        paths[f'/model{i}/{{id}}'] = {
+            'get': {
+                'operationId': f'getModel{i}',
+                'tags': [tag],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                    {'name': 'body', 'in': 'body', 'schema': ref},
+                ],
+                'responses': {
+                    '200': {'description': 'Success', 'schema': ref},
+                },
+            },
+            'delete': {
+                'operationId': f'deleteModel{i}',
+                'tags': [tag],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                ],
+                'responses': {'204': {'description': 'Deleted'}},
+            },
+        }
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'MyPy plugin benchmark', 'version': '1.0'},
+        'paths': paths,
+        'definitions': definitions,
+    }
+
+
+def run_mypy(directory: str) -> float:
+    """
+    Type check the example module, and return the elapsed time.
+
+    The MyPy cache is kept for other modules, so that the time is dominated
+    by analysis of the generated stub file and the example module.
+    """
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        for path in glob.glob('.mypy_cache/*/bench.*') + \
+                glob.glob('.mypy_cache/*/example.*'):
+            os.unlink(path)
+        start = time.perf_counter()
+        out, err, status = mypy.api.run(['example.py'])
+        elapsed = time.perf_counter() - start
+    finally:
+        os.chdir(cwd)
+    if status != 0:
+        raise RuntimeError(f"MyPy failed:\n{out}{err}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--models', type=int, default=1000,
+                        help="Number of models. Default 1000.")
+    parser.add_argument('--props', type=int, default=20,
+                        help="Number of properties per model. Default 20.")
+    parser.add_argument('--resources', type=int, default=20,
+                        help="Number of resources. Default 20.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timed runs. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    with tempfile.TemporaryDirectory() as directory:
+        spec_dict = make_spec_dict(ns.models, ns.props, ns.resources)
+        client = SwaggerClient.from_spec(
+            spec_dict, config={'validate_swagger_spec': False})
+        print(f"models={ns.models} props={ns.props} "
+              f"resources={ns.resources}")
+
+        for lazy_stubs in False, True:
+            name = 'lazy' if lazy_stubs else 'full'
+            subdir = os.path.join(directory, name)
+            os.mkdir(subdir)
+            config = Config(name='Bench', path=f'{subdir}/bench.py',
+                            lazy_stubs=lazy_stubs)
+            generate_module(client, config)
+            with open(f'{subdir}/example.py', 'w') as f:
+                f.write(EXAMPLE.format(module='bench',
+                                       client=config.client_type))
+            if lazy_stubs:
+                with open(f'{subdir}/mypy.ini', 'w') as f:
+                    f.write('[mypy]\nplugins = bravado_types.mypy_plugin\n')
+
+            run_mypy(subdir)  # Populate the cache for other modules
+            times = [run_mypy(subdir) for _ in range(ns.repeat)]
+            print(f"{name}: stub {os.path.getsize(config.pyi_path)} bytes, "
+                  f"mypy best {min(times):.3f}s, "
+                  f"mean {sum(times) / len(times):.3f}s")
+
+
+if __name__ == '__main__':
+    main()
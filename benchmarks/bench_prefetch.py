@@ -0,0 +1,115 @@
+"""Benchmark loading multi-file schemas over HTTP with artificial latency."""
+
+import argparse
+import json
+import threading
+import time
+import timeit
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+from bravado.client import SwaggerClient
+
+from bravado_types.prefetch import load_client
+
+
+def make_documents(num_files: int) -> Dict[str, Any]:
+    """
+    Create a schema split across `num_files` model files, each of which
+    references a shared document.
+    """
+    documents: Dict[str, Any] = {
+        '/common.json': {
+            'definitions': {
+                'Id': {'type': 'integer'},
+            },
+        },
+    }
+    paths = {}
+    for i in range(num_files):
+        documents[f'/models/model{i}.json'] = {
+            'definitions': {
+                f'Model{i}': {
+                    'type': 'object',
+                    'x-model': f'Model{i}',
+                    'properties': {
+                        'id': {'$ref': '../common.json#/definitions/Id'},
+                    },
+                },
+            },
+        }
+        paths[f'/model{i}'] = {
+            'get': {
+                'operationId': f'getModel{i}',
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {
+                            '$ref': f'models/model{i}.json'
+                                    f'#/definitions/Model{i}',
+                        },
+                    },
+                },
+            },
+        }
+    documents['/api.json'] = {
+        'swagger': '2.0',
+        'info': {'title': 'Prefetch benchmark', 'version': '1.0'},
+        'paths': paths,
+    }
+    return documents
+
+
+def serve(documents: Dict[str, Any], latency: float) -> ThreadingHTTPServer:
+    """Start an HTTP server which serves documents after a delay."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            body = json.dumps(documents[self.path]).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=50,
+                        help="Number of model files. Default 50.")
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help="Response delay in seconds. Default 0.05.")
+    parser.add_argument('--workers', type=int, default=8,
+                        help="Number of concurrent workers. Default 8.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timed runs. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    server = serve(make_documents(ns.files), ns.latency)
+    url = f'http://127.0.0.1:{server.server_port}/api.json'
+
+    print(f"files={ns.files} latency={ns.latency}s workers={ns.workers}")
+    for name, func in [
+        ('sequential', lambda: SwaggerClient.from_url(url)),
+        ('prefetch', lambda: load_client(url, max_workers=ns.workers)),
+    ]:
+        times = timeit.repeat(func, repeat=ns.repeat, number=1)
+        print(f"{name}: best {min(times):.3f}s, "
+              f"mean {sum(times) / len(times):.3f}s")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark rendering of module and stub files for large schemas, with Mako
+templates and with the built-in emitter, sequentially and with each output
+file rendered in a separate process.
+"""
+
+import argparse
+import itertools
+import os.path
+import sys
+import tempfile
+import time
+import warnings
+
+from bravado.client import SwaggerClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import TEMPLATES_DIR, render
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_typecheck import make_spec_dict  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--models', type=int, default=500,
+                        help="Number of models in the schema. Default 500.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of runs for each mode. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    client = SwaggerClient.from_spec(make_spec_dict(ns.models),
+                                     config={'validate_swagger_spec': False})
+    metadata = get_metadata(client.swagger_spec)
+    with tempfile.TemporaryDirectory() as directory:
+        for lazy_stubs, parallel_render, engine in itertools.product(
+                [False, True], [False, True], ['mako', 'emitter']):
+            # Configuring the default templates directory as a custom
+            # templates directory forces rendering with Mako.
+            config = Config(name='Bench', path=f'{directory}/bench.py',
+                            lazy_stubs=lazy_stubs,
+                            parallel_render=parallel_render,
+                            custom_templates_dir=(TEMPLATES_DIR
+                                                  if engine == 'mako'
+                                                  else None))
+            spec_info = get_spec_info(client.swagger_spec, config)
+            times = []
+            for _ in range(ns.repeat):
+                start = time.perf_counter()
+                render(metadata, spec_info, config)
+                times.append(time.perf_counter() - start)
+            print(f"lazy_stubs={lazy_stubs!s:<5} "
+                  f"parallel_render={parallel_render!s:<5} "
+                  f"{engine:<7} {min(times) * 1000:7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
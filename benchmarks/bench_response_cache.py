@@ -0,0 +1,143 @@
+"""
+Benchmark repeated operation calls to a local HTTP server with artificial
+latency, with a client generated without the response cache and with a
+client caching the operation's results.
+
+Calls are made with parameters drawn at random from a fixed set of keys, so
+that most calls of the cached client are cache hits.
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import tempfile
+import threading
+import time
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+from typing import Any, Dict
+
+from bravado.client import SwaggerClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT: Dict[str, Any] = {
+    'swagger': '2.0',
+    'info': {'title': 'Response cache benchmark', 'version': '1.0'},
+    'schemes': ['http'],
+    'paths': {
+        '/items/{id}': {
+            'get': {
+                'operationId': 'getItem',
+                'tags': ['items'],
+                'produces': ['application/json'],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {'$ref': '#/definitions/Item'},
+                    },
+                },
+            },
+        },
+    },
+    'definitions': {
+        'Item': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                'name': {'type': 'string'},
+            },
+        },
+    },
+}
+
+
+def serve(latency: float) -> ThreadingHTTPServer:
+    """Start an HTTP server which returns items after a delay."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            self.server.requests += 1  # type: ignore
+            item_id = int(self.path.rsplit('/', 1)[1])
+            body = json.dumps({'id': item_id, 'name': f'item{item_id}'}
+                              ).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.requests = 0  # type: ignore
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def generate(directory: str, name: str, response_cache: bool) -> ModuleType:
+    """Generate and import a client module."""
+    path = f'{directory}/{name}.py'
+    config = Config(name='Bench', path=path, response_cache=response_cache)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    module_spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=500,
+                        help="Number of operation calls. Default 500.")
+    parser.add_argument('--keys', type=int, default=50,
+                        help="Number of distinct parameter values. "
+                        "Default 50.")
+    parser.add_argument('--latency', type=float, default=0.005,
+                        help="Response delay in seconds. Default 0.005.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    server = serve(ns.latency)
+    spec_dict = {**SPEC_DICT, 'host': f'127.0.0.1:{server.server_port}'}
+    with tempfile.TemporaryDirectory() as directory:
+        default = generate(directory, 'bench_default', False)
+        cached = generate(directory, 'bench_cached', True)
+    clients = {
+        'default': default.BenchSwaggerClient.from_spec(spec_dict),
+        'cached': cached.BenchSwaggerClient.from_spec(spec_dict),
+    }
+    clients['cached'].configure_cache('getItem')
+    rng = random.Random(0)
+    ids = [rng.randrange(ns.keys) for _ in range(ns.calls)]
+
+    print(f"calls={ns.calls} keys={ns.keys} latency={ns.latency}s")
+    for name, client in clients.items():
+        server.requests = 0  # type: ignore
+        start = time.perf_counter()
+        for item_id in ids:
+            client.items.getItem(id=item_id).result()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} {elapsed / ns.calls * 1e6:8.1f}us/call, "
+              f"{server.requests} requests")  # type: ignore
+    info = clients['cached'].cache_info('getItem')
+    print(f"cache: {info}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
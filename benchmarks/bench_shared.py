@@ -0,0 +1,131 @@
+"""
+Benchmark stubs for several schemas which share most of their model
+definitions, generated separately and with a common stub module for the
+shared models.
+
+Reports the total size of the generated stub files, and the MyPy check time
+and peak memory for a module which imports every generated module, with a
+cold cache.
+"""
+
+import argparse
+import json
+import os
+import os.path
+import shutil
+import subprocess
+import sys
+import tempfile
+import warnings
+from typing import Any, Dict, List, Tuple
+
+from bravado.client import SwaggerClient
+
+from bravado_types.config import Config
+from bravado_types.data_model import SpecInfo
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import Metadata, get_metadata
+from bravado_types.render import render, render_shared
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_typecheck import MYPY_RUNNER, make_spec_dict  # noqa: E402
+
+_Output = Tuple[Metadata, SpecInfo, Config]
+
+
+def make_outputs(directory: str, num_schemas: int, num_shared: int,
+                 num_own: int) -> List[_Output]:
+    """Extract type information for schemas with shared definitions."""
+    outputs = []
+    for i in range(num_schemas):
+        # Shared definitions only, with operations for the schema's own models
+        spec_dict = make_spec_dict(num_shared)
+        spec_dict['paths'] = {}
+        for j in range(num_own):
+            name = f'Service{i}Item{j}'
+            spec_dict['definitions'][name] = {
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'integer'},
+                    'value': {'$ref': '#/definitions/Model0'},
+                },
+            }
+            spec_dict['paths'][f'/items{j}/{{id}}'] = {
+                'get': {
+                    'operationId': f'getItem{j}',
+                    'tags': ['items'],
+                    'parameters': [
+                        {'name': 'id', 'in': 'path', 'required': True,
+                         'type': 'integer'},
+                    ],
+                    'responses': {
+                        '200': {'description': 'Success',
+                                'schema': {'$ref': f'#/definitions/{name}'}},
+                    },
+                },
+            }
+        spec = SwaggerClient.from_spec(
+            spec_dict, config={'validate_swagger_spec': False}).swagger_spec
+        config = Config(name=f'Service{i}',
+                        path=f'{directory}/service{i}.py')
+        outputs.append((get_metadata(spec), get_spec_info(spec, config),
+                        config))
+    return outputs
+
+
+def run_mypy(directory: str, num_schemas: int) -> Dict[str, Any]:
+    """Type check a module which imports every generated module."""
+    with open(f'{directory}/usage.py', 'w') as f:
+        for i in range(num_schemas):
+            f.write(f'import service{i}\n')
+        f.write('\n')
+        for i in range(num_schemas):
+            f.write(f'model{i}: service{i}.Model0Model\n')
+    shutil.rmtree(f'{directory}/.mypy_cache', ignore_errors=True)
+    result = subprocess.run(
+        [sys.executable, '-c', MYPY_RUNNER, 'usage.py'],
+        cwd=directory, check=True, stdout=subprocess.PIPE,
+        universal_newlines=True)
+    data: Dict[str, Any] = json.loads(result.stdout)
+    if data['status'] != 0:
+        raise RuntimeError(f"MyPy failed in {directory}:\n{data['out']}")
+    return data
+
+
+def stub_size(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(directory, name))
+               for name in os.listdir(directory) if name.endswith('.pyi'))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--schemas', type=int, default=10,
+                        help="Number of schemas. Default 10.")
+    parser.add_argument('--shared-models', type=int, default=50,
+                        help="Number of models defined by every schema. "
+                        "Default 50.")
+    parser.add_argument('--own-models', type=int, default=10,
+                        help="Number of models defined by only one schema. "
+                        "Default 10.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in 'separate', 'shared':
+            mode_dir = f'{directory}/{mode}'
+            os.mkdir(mode_dir)
+            outputs = make_outputs(mode_dir, ns.schemas, ns.shared_models,
+                                   ns.own_models)
+            if mode == 'shared':
+                render_shared(outputs, 'common', f'{mode_dir}/common.pyi')
+            else:
+                for metadata, spec_info, config in outputs:
+                    render(metadata, spec_info, config)
+            result = run_mypy(mode_dir, ns.schemas)
+            print(f"{mode:<9} stubs {stub_size(mode_dir) / 1024:8.1f} KiB  "
+                  f"mypy {result['time']:6.2f}s  "
+                  f"{result['maxrss_kb'] / 1024:6.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark client creation for a large schema with from_url() and with
+from_cached_spec(), which loads the built spec from a cache file.
+
+Reports the time to create a client with from_url(), with from_cached_spec()
+when the cache file is written, and with from_cached_spec() when the cache
+file is loaded, along with the size of the cache file. Schema validation is
+disabled unless --validate is given.
+"""
+
+import argparse
+import importlib.util
+import json
+import os.path
+import sys
+import tempfile
+import time
+import warnings
+from types import ModuleType
+from typing import Any, Callable
+
+from bravado.client import SwaggerClient
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_typecheck import make_spec_dict  # noqa: E402
+
+
+def generate(directory: str, spec_url: str, config: Any) -> ModuleType:
+    """Generate and import a client module."""
+    path = f'{directory}/bench.py'
+    bt_config = Config(name='Bench', path=path, spec_cache=True)
+    spec = SwaggerClient.from_url(spec_url, config=dict(config)).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, bt_config), bt_config)
+    module_spec = importlib.util.spec_from_file_location('bench', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+    # Unpickling requires the generated module to be importable
+    sys.modules['bench'] = module
+    return module
+
+
+def measure(func: Callable[[], Any], repeat: int,
+            setup: Callable[[], Any] = None) -> float:
+    """Return the minimum run time of a function."""
+    results = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        results.append(time.perf_counter() - start)
+    return min(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=500,
+                        help="Number of models in a synthetic schema. Each "
+                        "model has two operations. Default 500.")
+    parser.add_argument('--schema',
+                        help="Path of a real-world JSON schema to use instead "
+                        "of a synthetic schema.")
+    parser.add_argument('--validate', action='store_true',
+                        help="Enable schema validation. Validation of the "
+                        "synthetic schema is very slow for large numbers of "
+                        "models.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of runs for each method. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    config = {'validate_swagger_spec': ns.validate}
+    with tempfile.TemporaryDirectory() as directory:
+        if ns.schema:
+            spec_url = f'file://{os.path.abspath(ns.schema)}'
+        else:
+            spec_path = f'{directory}/spec.json'
+            with open(spec_path, 'w') as f:
+                json.dump(make_spec_dict(ns.models), f)
+            spec_url = f'file://{spec_path}'
+        client_class = generate(directory, spec_url, config).BenchSwaggerClient
+        cache_path = f'{directory}/bench.spec'
+
+        def remove_cache() -> None:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+
+        def from_cached_spec() -> None:
+            client_class.from_cached_spec(cache_path, spec_url,
+                                          http_client=RequestsClient(),
+                                          config=config)
+
+        results = {
+            'from_url': measure(
+                lambda: client_class.from_url(spec_url,
+                                              http_client=RequestsClient(),
+                                              config=dict(config)),
+                ns.repeat),
+            'cache write': measure(from_cached_spec, ns.repeat, remove_cache),
+            'cache load': measure(from_cached_spec, ns.repeat),
+        }
+        for name, elapsed in results.items():
+            print(f"{name:<12} {elapsed * 1000:8.1f}ms")
+        print(f"cache file {os.path.getsize(cache_path) / 2**20:8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Benchmark peak memory and time for an operation call with a large array
+response served by a local HTTP server, resolving the future with result()
+and iterating over the items with the stream() helper of a generated client.
+
+Peak memory is measured with tracemalloc, in separate runs from the timing.
+"""
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import threading
+import time
+import tracemalloc
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+from typing import Any, Callable, Dict
+
+from bravado.client import SwaggerClient
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT: Dict[str, Any] = {
+    'swagger': '2.0',
+    'info': {'title': 'Streaming benchmark', 'version': '1.0'},
+    'schemes': ['http'],
+    'paths': {
+        '/items': {
+            'get': {
+                'operationId': 'listItems',
+                'tags': ['items'],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {
+                            'type': 'array',
+                            'items': {'$ref': '#/definitions/Item'},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'definitions': {
+        'Item': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                'name': {'type': 'string'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+                'score': {'type': 'number'},
+            },
+        },
+    },
+}
+
+
+def generate(directory: str) -> ModuleType:
+    """Generate and import a client module."""
+    path = f'{directory}/bench.py'
+    config = Config(name='Bench', path=path, stream_helper=True)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    module_spec = importlib.util.spec_from_file_location('bench', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def serve(body: bytes) -> ThreadingHTTPServer:
+    """Start an HTTP server which serves the same body for every request."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def peak_memory(func: Callable[[], None]) -> int:
+    """Get the peak memory allocated while running a function."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=100000,
+                        help="Number of items in the response. "
+                        "Default 100000.")
+    parser.add_argument('--chunk-size', type=int, default=65536,
+                        help="Chunk size for stream(). Default 65536.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timed runs. Default 3.")
+    ns = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    body = json.dumps([
+        {'id': i, 'name': f'Item {i}', 'tags': ['a', 'b', 'c'],
+         'score': i / 7}
+        for i in range(ns.items)
+    ]).encode('utf-8')
+    server = serve(body)
+    with tempfile.TemporaryDirectory() as directory:
+        module = generate(directory)
+    client = module.BenchSwaggerClient.from_spec(
+        dict(SPEC_DICT, host=f'127.0.0.1:{server.server_port}'),
+        http_client=RequestsClient())
+
+    def result() -> None:
+        count = 0
+        for _ in client.items.listItems().result():
+            count += 1
+        assert count == ns.items
+
+    def stream() -> None:
+        count = 0
+        for _ in client.stream(client.items.listItems(),
+                               chunk_size=ns.chunk_size):
+            count += 1
+        assert count == ns.items
+
+    print(f"items={ns.items} body={len(body) / 2**20:.1f}MiB "
+          f"chunk_size={ns.chunk_size}")
+    for name, func in [('result', result), ('stream', stream)]:
+        times = []
+        for _ in range(ns.repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        peak = peak_memory(func)
+        print(f"{name:<7} peak {peak / 2**20:8.1f}MiB, "
+              f"best {min(times):.3f}s ({ns.items / min(times):.0f} items/s)")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,310 @@
+"""
+Benchmark the cost of generated stubs for downstream type checking.
+
+For each schema, generates stubs under a range of configuration options, then
+runs MyPy against generated usage code and reports the check time and peak
+memory with a cold cache and with a warm cache, along with the size of the
+generated type information.
+
+By default, each option is varied in turn from the default configuration.
+Use --matrix to benchmark every combination of options instead.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import os.path
+import shutil
+import subprocess
+import sys
+import tempfile
+import warnings
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bravado.client import SwaggerClient
+
+from bravado_types.config import ArrayTypes, Config, ResponseTypes
+from bravado_types.data_model import SpecInfo
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+from bravado_types.type_strings import render_type
+
+# Options which can be varied, with their default values first.
+OPTIONS: Dict[str, List[Any]] = {
+    'array_types': list(ArrayTypes),
+    'response_types': list(ResponseTypes),
+    'model_inheritance': [False, True],
+    'lazy_stubs': [False, True],
+}
+
+# Run MyPy in a child process so that peak memory can be measured.
+MYPY_RUNNER = """\
+import json, resource, sys, time
+import mypy.api
+start = time.perf_counter()
+out, err, status = mypy.api.run(sys.argv[1:])
+elapsed = time.perf_counter() - start
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'time': elapsed, 'maxrss_kb': maxrss, 'status': status,
+                  'out': out + err}))
+"""
+
+
+def make_spec_dict(num_models: int) -> Dict[str, Any]:
+    """
+    Create a spec with `num_models` models. Every fifth model extends the
+    previous one, and each model has a get and a list operation.
+    """
+    definitions: Dict[str, Any] = {}
+    paths: Dict[str, Any] = {}
+    for i in range(num_models):
+        properties: Dict[str, Any] = {
+            'id': {'type': 'integer'},
+            'name': {'type': 'string'},
+            'created': {'type': 'string', 'format': 'date-time'},
+            'tags': {'type': 'array', 'items': {'type': 'string'}},
+            'attributes': {
+                'type': 'object',
+                'additionalProperties': {'type': 'string'},
+            },
+        }
+        if i % 5 == 4:
+            definitions[f'Model{i}'] = {
+                'allOf': [
+                    {'$ref': f'#/definitions/Model{i - 1}'},
+                    {
+                        'type': 'object',
+                        'properties': {f'extra{i}': {'type': 'string'}},
+                    },
+                ],
+            }
+        else:
+            if i:
+                properties['related'] = {
+                    '$ref': f'#/definitions/Model{i - 1}',
+                }
+            definitions[f'Model{i}'] = {
+                'type': 'object',
+                'properties': properties,
+                'required': ['id', 'name'],
+            }
+
+        ref = {'$ref': f'#/definitions/Model{i}'}
+        tag = f'resource{i % 10}'
+        paths[f'/model{i}'] = {
+            'get': {
+                'operationId': f'listModel{i}',
+                'tags': [tag],
+                'parameters': [
+                    {'name': 'limit', 'in': 'query', 'type': 'integer'},
+                    {'name': 'names', 'in': 'query', 'type': 'array',
+                     'items': {'type': 'string'}},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {'type': 'array', 'items': ref},
+                    },
+                    'default': {'description': 'Error'},
+                },
+            },
+        }
+        paths[f'/model{i}/{{id}}'] = {
+            'get': {
+                'operationId': f'getModel{i}',
+                'tags': [tag],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                ],
+                'responses': {
+                    '200': {'description': 'Success', 'schema': ref},
+                    '404': {'description': 'Not found'},
+                },
+            },
+        }
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'Type checking benchmark', 'version': '1.0'},
+        'paths': paths,
+        'definitions': definitions,
+    }
+
+
+def make_usage_code(spec: SpecInfo, config: Config, module: str,
+                    num_uses: int) -> str:
+    """
+    Create a module which uses up to `num_uses` operations and models of the
+    generated client, in the way application code typically would.
+    """
+    lines = [
+        'import datetime',
+        'import typing',
+        '',
+        f'from {module} import *',
+        '',
+        f'client: {config.client_type}',
+        '',
+    ]
+    for resource in spec.resources:
+        for operation in resource.operations:
+            if num_uses <= 0:
+                break
+            required = [p for p in operation.params if p.required]
+            if not all(p.name.isidentifier() for p in required):
+                continue
+            num_uses -= 1
+            args = ', '.join(f'{p.name}: {render_type(p.type, config)}'
+                             for p in required)
+            kwargs = ', '.join(f'{p.name}={p.name}' for p in required)
+            lines += [
+                '',
+                f'def use_{operation.name}({args}) -> typing.Any:',
+                f'    future = client.{resource.name}.{operation.name}('
+                f'{kwargs})',
+                '    return future.response().result',
+                '',
+            ]
+
+    for model in spec.models[:num_uses]:
+        required = [p for p in model.props if p.required]
+        if not all(p.name.isidentifier() for p in model.props):
+            continue
+        args = ', '.join(f'{p.name}: {render_type(p.type, config)}'
+                         for p in required)
+        kwargs = ', '.join(f'{p.name}={p.name}' for p in required)
+        model_type = config.model_type(model.name)
+        lines += [
+            '',
+            f'def use_{model.name}({args}) -> {model_type}:',
+            f'    model = client.get_model({model.name!r})({kwargs})',
+        ]
+        lines += [f'    model.{p.name}' for p in model.props]
+        lines += ['    return model', '']
+    return '\n'.join(lines)
+
+
+def configurations(matrix: bool) -> Iterator[Dict[str, Any]]:
+    """Yield the option combinations to benchmark."""
+    if matrix:
+        for values in itertools.product(*OPTIONS.values()):
+            yield dict(zip(OPTIONS, values))
+    else:
+        defaults = {name: values[0] for name, values in OPTIONS.items()}
+        yield defaults
+        for name, values in OPTIONS.items():
+            for value in values[1:]:
+                yield {**defaults, name: value}
+
+
+def label(options: Dict[str, Any]) -> str:
+    defaults = {name: values[0] for name, values in OPTIONS.items()}
+    changed = [f'{name}={getattr(value, "value", value)}'
+               for name, value in options.items() if value != defaults[name]]
+    return ','.join(changed) or 'default'
+
+
+def run_mypy(directory: str) -> Dict[str, Any]:
+    result = subprocess.run(
+        [sys.executable, '-c', MYPY_RUNNER, 'usage.py'],
+        cwd=directory, check=True, stdout=subprocess.PIPE,
+        universal_newlines=True)
+    data: Dict[str, Any] = json.loads(result.stdout)
+    if data['status'] != 0:
+        raise RuntimeError(f"MyPy failed in {directory}:\n{data['out']}")
+    return data
+
+
+def benchmark(directory: str, client: SwaggerClient,
+              options: Dict[str, Any], num_uses: int, spec_info: SpecInfo
+              ) -> Optional[Tuple[int, Dict[str, Any], Dict[str, Any]]]:
+    """
+    Generate stubs with the given options and type check usage code. The
+    type information of the schema is extracted once and rendered with each
+    configuration.
+
+    :return: Tuple of type information size in bytes and cold and warm MyPy
+        results, or None if the options cannot be combined.
+    """
+    config_dir = os.path.join(directory, label(options))
+    os.mkdir(config_dir)
+    try:
+        config = Config(name='Bench', path=f'{config_dir}/bench.py',
+                        **options)
+    except ValueError:
+        return None
+
+    render(get_metadata(client.swagger_spec), spec_info, config)
+    size = os.path.getsize(config.pyi_path)
+    if config.lazy_stubs:
+        size += os.path.getsize(config.index_path)
+        with open(f'{config_dir}/mypy.ini', 'w') as f:
+            f.write('[mypy]\nplugins = bravado_types.mypy_plugin\n')
+
+    usage_path = f'{config_dir}/usage.py'
+    with open(usage_path, 'w') as f:
+        f.write(make_usage_code(spec_info, config, 'bench', num_uses))
+
+    shutil.rmtree(f'{config_dir}/.mypy_cache', ignore_errors=True)
+    cold = run_mypy(config_dir)
+    # Warm run: the usage code changes, everything else is cached.
+    with open(usage_path, 'a') as f:
+        f.write('\n\nCHANGED = True\n')
+    warm = run_mypy(config_dir)
+    return size, cold, warm
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, action='append',
+                        help="Number of models in a synthetic schema. May be "
+                        "given more than once. Default 100 if no --schema "
+                        "is given.")
+    parser.add_argument('--schema', action='append', default=[],
+                        help="Path or URL of a real-world schema. May be "
+                        "given more than once.")
+    parser.add_argument('--uses', type=int, default=20,
+                        help="Number of operations and models used by the "
+                        "generated usage code. Default 20.")
+    parser.add_argument('--matrix', action='store_true',
+                        help="Benchmark every combination of options.")
+    ns = parser.parse_args()
+    if not ns.models and not ns.schema:
+        ns.models = [100]
+
+    warnings.simplefilter('ignore')
+    schemas: List[Tuple[str, SwaggerClient]] = []
+    for num_models in ns.models or []:
+        schemas.append((f'synthetic-{num_models}', SwaggerClient.from_spec(
+            make_spec_dict(num_models),
+            config={'validate_swagger_spec': False})))
+    for schema in ns.schema:
+        url = schema if ':' in schema else f'file://{os.path.abspath(schema)}'
+        schemas.append((os.path.basename(schema),
+                        SwaggerClient.from_url(url)))
+
+    print(f"{'schema':<24} {'config':<32} {'size':>10} "
+          f"{'cold':>8} {'cold mem':>9} {'warm':>8} {'warm mem':>9}")
+    for name, client in schemas:
+        spec_info = get_spec_info(client.swagger_spec,
+                                  Config(name='Bench', path='bench.py'))
+        with tempfile.TemporaryDirectory() as directory:
+            for options in configurations(ns.matrix):
+                result = benchmark(directory, client, options, ns.uses,
+                                   spec_info)
+                if result is None:
+                    continue
+                size, cold, warm = result
+                print(f"{name:<24} {label(options):<32} {size:>10} "
+                      f"{cold['time']:>7.2f}s "
+                      f"{cold['maxrss_kb'] // 1024:>6} MB "
+                      f"{warm['time']:>7.2f}s "
+                      f"{warm['maxrss_kb'] // 1024:>6} MB", flush=True)
+
+
+if __name__ == '__main__':
+    main()
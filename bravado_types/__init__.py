@@ -1,27 +1,92 @@
-from typing import Iterable, Union
-
-from bravado.client import SwaggerClient
-from bravado_core.spec import Spec
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, Tuple, Union
 
 from bravado_types.config import Config
-from bravado_types.extract import get_spec_info
 from bravado_types.metadata import get_metadata
-from bravado_types.render import render
+from bravado_types.render import render, render_client_factory, render_shared
+from bravado_types.sinks import OutputSink
+
+if TYPE_CHECKING:
+    from bravado.client import SwaggerClient
+    from bravado_core.spec import Spec
 
+# The asyncio API is imported on first use, so that importing the package
+# does not load asyncio and the HTTP fetching code. Module __getattr__ is not
+# supported by Python 3.6.
+if TYPE_CHECKING or sys.version_info < (3, 7, 0):
+    from bravado_types.aio import generate_modules_async  # noqa: F401
+else:
+    def __getattr__(name: str) -> Any:
+        if name == 'generate_modules_async':
+            from bravado_types import aio
+            return aio.generate_modules_async
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def generate_module(client_or_spec: Union[SwaggerClient, Spec],
-                    config: Config, *, _cli_args: Iterable[str] = None
-                    ) -> None:
+
+def generate_module(client_or_spec: Union['SwaggerClient', 'Spec'],
+                    config: Config, *, sink: OutputSink = None,
+                    _cli_args: Iterable[str] = None) -> None:
     """
     Convenience function for extracting spec info and rendering files.
 
     :param client_or_spec: Swagger client or spec.
     :param config: Configuration parameters.
+    :param sink: Optional output sink to write the files to, such as a
+        MemorySink or ZipSink. Defaults to writing them to the filesystem.
     """
+    # Bravado is imported lazily so that rendering from an intermediate
+    # representation file does not require loading it.
+    from bravado.client import SwaggerClient
+    from bravado_types.extract import get_spec_info
+
     if isinstance(client_or_spec, SwaggerClient):
         spec = client_or_spec.swagger_spec
     else:
         spec = client_or_spec
     metadata = get_metadata(spec, _cli_args)
     spec_info = get_spec_info(spec, config)
-    render(metadata, spec_info, config)
+    render(metadata, spec_info, config, sink=sink)
+
+
+def generate_shared_modules(
+    clients_or_specs: Iterable[Tuple[Union['SwaggerClient', 'Spec'], Config]],
+    common_module: str, common_path: str, sink: OutputSink = None
+) -> None:
+    """
+    Convenience function for extracting spec info for several schemas and
+    rendering files with a common stub module for their shared models.
+
+    :param clients_or_specs: Pairs of Swagger client or spec and
+        configuration parameters.
+    :param common_module: Import name of the common stub module.
+    :param common_path: Path of the common stub file. Must end with '.pyi'.
+    :param sink: Optional output sink to write the files to. Defaults to
+        writing them to the filesystem.
+    """
+    from bravado.client import SwaggerClient
+    from bravado_types.extract import get_spec_info
+
+    outputs = []
+    for client_or_spec, config in clients_or_specs:
+        if isinstance(client_or_spec, SwaggerClient):
+            spec = client_or_spec.swagger_spec
+        else:
+            spec = client_or_spec
+        outputs.append((get_metadata(spec), get_spec_info(spec, config),
+                        config))
+    render_shared(outputs, common_module, common_path, sink)
+
+
+def generate_client_factory(clients: Iterable[Tuple[str, Config]], path: str,
+                            sink: OutputSink = None) -> None:
+    """
+    Convenience function for rendering a client factory module, which creates
+    clients of several generated modules sharing a pooled HTTP client.
+
+    :param clients: Pairs of import name of a generated module and the
+        configuration it was generated with.
+    :param path: Path of the factory module. Must end with '.py'.
+    :param sink: Optional output sink to write the files to. Defaults to
+        writing them to the filesystem.
+    """
+    render_client_factory(list(clients), path, sink)
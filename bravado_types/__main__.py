@@ -1,24 +1,42 @@
+import json
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
-from typing import Dict, NoReturn, Optional, Sequence, Tuple
-
-from bravado.client import SwaggerClient
+from typing import (TYPE_CHECKING, Dict, NoReturn, Optional, Sequence,
+                    Tuple)
 
 from bravado_types import generate_module
 from bravado_types.config import (
     DEFAULT_ARRAY_TYPES,
+    DEFAULT_ASYNC_CLIENT,
+    DEFAULT_BATCH_HELPER,
+    DEFAULT_BUILD_HELPER,
     DEFAULT_CLIENT_TYPE_FORMAT,
+    DEFAULT_FAST_REQUESTS,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_LAZY_CLIENT,
+    DEFAULT_LAZY_STUBS,
     DEFAULT_MODEL_INHERITANCE,
     DEFAULT_MODEL_TYPE_FORMAT,
     DEFAULT_OPERATION_TYPE_FORMAT,
+    DEFAULT_PARALLEL_RENDER,
     DEFAULT_RESOURCE_TYPE_FORMAT,
+    DEFAULT_RESPONSE_CACHE,
     DEFAULT_RESPONSE_TYPES,
+    DEFAULT_SPEC_CACHE,
+    DEFAULT_STREAM_HELPER,
     ArrayTypes,
     Config,
     CustomFormats,
     ResponseTypes,
 )
+from bravado_types.ir import dump_ir, load_ir
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render, render_shared
+from bravado_types.report import SORT_KEYS, format_report, get_report
+
+if TYPE_CHECKING:
+    from bravado.client import SwaggerClient
 
 
 class _ArgumentParser(ArgumentParser):
@@ -40,28 +58,254 @@ class _ArgumentParser(ArgumentParser):
 
 def main(args: Optional[Sequence[str]] = None, exit: bool = True) -> None:
     """CLI entry point"""
+    cli_args = sys.argv[1:] if args is None else args
+    if cli_args and cli_args[0] == 'extract':
+        _extract(cli_args, exit)
+    elif cli_args and cli_args[0] == 'render':
+        _render(cli_args, exit)
+    elif cli_args and cli_args[0] == 'render-shared':
+        _render_shared(cli_args, exit)
+    elif cli_args and cli_args[0] == 'report':
+        _report(cli_args, exit)
+    else:
+        _generate(cli_args, exit)
+
+
+def _generate(args: Sequence[str], exit: bool) -> None:
+    """Load a schema and render the module and stub files."""
     parser = _ArgumentParser(
         prog='bravado-types', exit=exit,
         description="Create a module and stub file for Bravado classes "
-        "generated from a Swagger schema.")
+        "generated from a Swagger schema. To save the extracted type "
+        "information and render it separately, use the 'extract' and "
+        "'render' subcommands.")
+    _add_url_argument(parser)
+    _add_output_arguments(parser, required=True)
+    _add_type_format_arguments(parser)
+    _add_extract_arguments(parser)
+    _add_render_arguments(parser)
+    ns = parser.parse_args(args)
+    _check_cache_args(parser, ns)
 
+    generate_module(_load_client(ns), _config(ns), _cli_args=args)
+
+
+def _extract(args: Sequence[str], exit: bool) -> None:
+    """Load a schema and write the extracted type information to a file."""
+    parser = _ArgumentParser(
+        prog='bravado-types extract', exit=exit,
+        description="Extract type information from a Swagger schema and save "
+        "it to an intermediate representation file, which can then be "
+        "rendered with the 'render' subcommand.")
+    _add_url_argument(parser)
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Path of the intermediate representation file to write.",
+    )
+    _add_output_arguments(parser, required=True)
+    _add_type_format_arguments(parser)
+    _add_extract_arguments(parser)
+    _add_render_arguments(parser)
+    ns = parser.parse_args(args[1:])
+    _check_cache_args(parser, ns)
+
+    from bravado_types.extract import get_spec_info
+
+    config = _config(ns)
+    spec = _load_client(ns).swagger_spec
+    metadata = get_metadata(spec, args)
+    spec_info = get_spec_info(spec, config)
+    with open(ns.output, 'w') as f:
+        dump_ir(f, metadata, spec_info, config)
+
+
+def _render(args: Sequence[str], exit: bool) -> None:
+    """Render the module and stub files from an IR file."""
+    parser = _ArgumentParser(
+        prog='bravado-types render', exit=exit,
+        description="Create a module and stub file from an intermediate "
+        "representation file written by the 'extract' subcommand. Options "
+        "not specified default to the values used for extraction.")
+    parser.add_argument(
+        "--input",
+        required=True,
+        help="Path of the intermediate representation file to read.",
+    )
+    _add_output_arguments(parser, required=False)
+    _add_type_format_arguments(parser)
+    _add_render_arguments(parser)
+    ns = parser.parse_args(args[1:])
+
+    overrides = {
+        'name': ns.name,
+        'path': ns.path,
+        'client_type_format': ns.client_type_format,
+        'resource_type_format': ns.resource_type_format,
+        'operation_type_format': ns.operation_type_format,
+        'model_type_format': ns.model_type_format,
+        'array_types': (ArrayTypes(ns.array_types)
+                        if ns.array_types else None),
+        'response_types': (ResponseTypes(ns.response_types)
+                           if ns.response_types else None),
+        'model_inheritance': ns.model_inheritance,
+        'async_client': ns.async_client,
+        'lazy_stubs': ns.lazy_stubs,
+        'lazy_client': ns.lazy_client,
+        'spec_cache': ns.spec_cache,
+        'batch_helper': ns.batch_helper,
+        'stream_helper': ns.stream_helper,
+        'instrumentation': ns.instrumentation,
+        'fast_requests': ns.fast_requests,
+        'response_cache': ns.response_cache,
+        'build_helper': ns.build_helper,
+        'custom_templates_dir': ns.custom_templates_dir,
+        'parallel_render': ns.parallel_render,
+    }
+    with open(ns.input) as f:
+        metadata, spec_info, config = load_ir(
+            f, {k: v for k, v in overrides.items() if v is not None})
+    render(metadata, spec_info, config)
+
+
+def _render_shared(args: Sequence[str], exit: bool) -> None:
+    """Render files for several IR files with a common stub module."""
+    parser = _ArgumentParser(
+        prog='bravado-types render-shared', exit=exit,
+        description="Create module and stub files from several intermediate "
+        "representation files written by the 'extract' subcommand. Models "
+        "which are identical in two or more schemas are written once to a "
+        "common stub module, which the other stub files import.")
+    parser.add_argument(
+        "--input",
+        action='append',
+        required=True,
+        help="Path of an intermediate representation file to read. May be "
+        "given multiple times.",
+    )
+    parser.add_argument(
+        "--common-module",
+        required=True,
+        help="Import name of the common stub module, e.g. 'services.common'.",
+    )
+    parser.add_argument(
+        "--common-path",
+        required=True,
+        help="Path of the common stub file. Must end with '.pyi'.",
+    )
+    ns = parser.parse_args(args[1:])
+
+    outputs = []
+    for path in ns.input:
+        with open(path) as f:
+            outputs.append(load_ir(f))
+    render_shared(outputs, ns.common_module, ns.common_path)
+
+
+def _report(args: Sequence[str], exit: bool) -> None:
+    """Load a schema and print the footprint of the stub file."""
+    parser = _ArgumentParser(
+        prog='bravado-types report', exit=exit,
+        description="Report the lines and bytes of the stub file taken up by "
+        "each model, operation and resource of a Swagger schema, along with "
+        "the largest type expressions, widest response unions and longest "
+        "model signatures. Takes the same options as generating the module. "
+        "No files are written.")
+    _add_url_argument(parser)
+    _add_output_arguments(parser, required=True)
+    _add_type_format_arguments(parser)
+    _add_extract_arguments(parser)
+    _add_render_arguments(parser)
+    parser.add_argument(
+        "--format",
+        choices=['text', 'json'],
+        default='text',
+        help="Report format. Default 'text'.",
+    )
+    parser.add_argument(
+        "--sort",
+        choices=list(SORT_KEYS),
+        default='bytes',
+        help="Sort key for the stub file elements. Default 'bytes'.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        metavar="N",
+        help="Show the first N entries of each list, or all entries if 0. "
+        "Default 20.",
+    )
+    ns = parser.parse_args(args[1:])
+    _check_cache_args(parser, ns)
+    if ns.top < 0:
+        parser.error("--top must not be negative")
+    if ns.lazy_stubs:
+        parser.error("report does not support --lazy-stubs")
+
+    from bravado_types.extract import get_spec_info
+
+    config = _config(ns)
+    spec = _load_client(ns).swagger_spec
+    report = get_report(get_metadata(spec, args),
+                        get_spec_info(spec, config), config)
+    if ns.format == 'json':
+        print(json.dumps(report.to_dict(ns.sort, ns.top), indent=2))
+    else:
+        print(format_report(report, ns.sort, ns.top), end='')
+
+
+def _add_url_argument(parser: ArgumentParser) -> None:
     parser.add_argument(
         "--url",
         required=True,
         help="Schema url or path",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for caching schema documents fetched over HTTP, "
+        "including documents referenced by remote $refs. Cached documents "
+        "are revalidated using ETag and Last-Modified headers.",
+    )
+    parser.add_argument(
+        "--offline",
+        action='store_true',
+        help="Only use cached schema documents. Requires --cache-dir.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Timeout in seconds for HTTP requests for schema documents "
+        "fetched through the schema cache or by fetch workers. Default 30.",
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Discover documents referenced by external $refs up front and "
+        "fetch them using N concurrent workers. By default, referenced "
+        "documents are fetched one at a time.",
+    )
+
 
+def _add_output_arguments(parser: ArgumentParser, required: bool) -> None:
     parser.add_argument(
         "--name",
-        required=True,
+        required=required,
         help="Schema name. Should be a valid Python identifier.",
     )
     parser.add_argument(
         "--path",
-        required=True,
+        required=required,
         help="Path of generated module file. Must end with '.py'.",
     )
 
+
+def _add_type_format_arguments(parser: ArgumentParser) -> None:
     parser.add_argument(
         "--client-type-format",
         default=None,
@@ -87,6 +331,26 @@ def main(args: Optional[Sequence[str]] = None, exit: bool = True) -> None:
         f"Default {DEFAULT_MODEL_TYPE_FORMAT!r}",
     )
 
+
+def _add_extract_arguments(parser: ArgumentParser) -> None:
+    """Add arguments for options which affect type extraction."""
+    parser.add_argument(
+        "--custom-format",
+        action='append',
+        default=[],
+        help="Type definition for custom format, given in the format "
+        "<schema_type>:<schema_format>:<python_type>",
+    )
+    parser.add_argument(
+        "--custom-format-package",
+        action='append',
+        default=[],
+        help="Package to import for custom formats",
+    )
+
+
+def _add_render_arguments(parser: ArgumentParser) -> None:
+    """Add arguments for options which only affect rendering."""
     parser.add_argument(
         "--array-types",
         choices=[at.value for at in ArrayTypes],
@@ -94,7 +358,6 @@ def main(args: Optional[Sequence[str]] = None, exit: bool = True) -> None:
         help="Option for how array types should be represented."
         f"Default {DEFAULT_ARRAY_TYPES.value!r}"
     )
-
     parser.add_argument(
         "--response-types",
         choices=[rt.value for rt in ResponseTypes],
@@ -123,18 +386,186 @@ def main(args: Optional[Sequence[str]] = None, exit: bool = True) -> None:
         f"{ '' if DEFAULT_MODEL_INHERITANCE else ' Enabled by default.'}"
     )
 
-    parser.add_argument(
-        "--custom-format",
-        action='append',
-        default=[],
-        help="Type definition for custom format, given in the format "
-        "<schema_type>:<schema_format>:<python_type>",
+    ac_group = parser.add_mutually_exclusive_group()
+    ac_group.add_argument(
+        "--async-client",
+        action='store_true',
+        default=None,
+        help="Type operations as returning awaitable futures, for use with "
+        "asyncio-based HTTP clients such as bravado-asyncio."
+        f"{ ' Enabled by default.' if DEFAULT_ASYNC_CLIENT else ''}"
     )
-    parser.add_argument(
-        "--custom-format-package",
-        action='append',
-        default=[],
-        help="Package to import for custom formats",
+    ac_group.add_argument(
+        "--no-async-client",
+        action='store_false',
+        dest='async_client',
+        default=None,
+        help="Type operations as returning synchronous HTTP futures."
+        f"{ '' if DEFAULT_ASYNC_CLIENT else ' Enabled by default.'}"
+    )
+
+    ls_group = parser.add_mutually_exclusive_group()
+    ls_group.add_argument(
+        "--lazy-stubs",
+        action='store_true',
+        default=None,
+        help="Generate a compact stub file and a type index file for use with "
+        "the bravado_types.mypy_plugin MyPy plugin, instead of a full stub "
+        "file."
+        f"{ ' Enabled by default.' if DEFAULT_LAZY_STUBS else ''}"
+    )
+    ls_group.add_argument(
+        "--no-lazy-stubs",
+        action='store_false',
+        dest='lazy_stubs',
+        default=None,
+        help="Generate a full stub file."
+        f"{ '' if DEFAULT_LAZY_STUBS else ' Enabled by default.'}"
+    )
+
+    lc_group = parser.add_mutually_exclusive_group()
+    lc_group.add_argument(
+        "--lazy-client",
+        action='store_true',
+        default=None,
+        help="Generate a client class which builds resources and operations "
+        "on first access."
+        f"{ ' Enabled by default.' if DEFAULT_LAZY_CLIENT else ''}"
+    )
+    lc_group.add_argument(
+        "--no-lazy-client",
+        action='store_false',
+        dest='lazy_client',
+        default=None,
+        help="Generate a client class which builds all resources and "
+        "operations when the client is created."
+        f"{ '' if DEFAULT_LAZY_CLIENT else ' Enabled by default.'}"
+    )
+
+    sc_group = parser.add_mutually_exclusive_group()
+    sc_group.add_argument(
+        "--spec-cache",
+        action='store_true',
+        default=None,
+        help="Generate a from_cached_spec() client method which caches the "
+        "built spec in a file."
+        f"{ ' Enabled by default.' if DEFAULT_SPEC_CACHE else ''}"
+    )
+    sc_group.add_argument(
+        "--no-spec-cache",
+        action='store_false',
+        dest='spec_cache',
+        default=None,
+        help="Do not generate a from_cached_spec() client method."
+        f"{ '' if DEFAULT_SPEC_CACHE else ' Enabled by default.'}"
+    )
+
+    bh_group = parser.add_mutually_exclusive_group()
+    bh_group.add_argument(
+        "--batch-helper",
+        action='store_true',
+        default=None,
+        help="Generate a batch() client method for making operation calls "
+        "concurrently in a thread pool."
+        f"{ ' Enabled by default.' if DEFAULT_BATCH_HELPER else ''}"
+    )
+    bh_group.add_argument(
+        "--no-batch-helper",
+        action='store_false',
+        dest='batch_helper',
+        default=None,
+        help="Do not generate a batch() client method."
+        f"{ '' if DEFAULT_BATCH_HELPER else ' Enabled by default.'}"
+    )
+
+    sh_group = parser.add_mutually_exclusive_group()
+    sh_group.add_argument(
+        "--stream-helper",
+        action='store_true',
+        default=None,
+        help="Generate a stream() client method for iterating over the items "
+        "of array responses as they are received."
+        f"{ ' Enabled by default.' if DEFAULT_STREAM_HELPER else ''}"
+    )
+    sh_group.add_argument(
+        "--no-stream-helper",
+        action='store_false',
+        dest='stream_helper',
+        default=None,
+        help="Do not generate a stream() client method."
+        f"{ '' if DEFAULT_STREAM_HELPER else ' Enabled by default.'}"
+    )
+
+    in_group = parser.add_mutually_exclusive_group()
+    in_group.add_argument(
+        "--instrumentation",
+        action='store_true',
+        default=None,
+        help="Generate client methods for registering hooks which receive "
+        "timing and response information for operation calls."
+        f"{ ' Enabled by default.' if DEFAULT_INSTRUMENTATION else ''}"
+    )
+    in_group.add_argument(
+        "--no-instrumentation",
+        action='store_false',
+        dest='instrumentation',
+        default=None,
+        help="Do not generate operation hook methods."
+        f"{ '' if DEFAULT_INSTRUMENTATION else ' Enabled by default.'}"
+    )
+
+    fr_group = parser.add_mutually_exclusive_group()
+    fr_group.add_argument(
+        "--fast-requests",
+        action='store_true',
+        default=None,
+        help="Generate a request-building function for each operation, "
+        "used instead of bravado's generic request construction."
+        f"{ ' Enabled by default.' if DEFAULT_FAST_REQUESTS else ''}"
+    )
+    fr_group.add_argument(
+        "--no-fast-requests",
+        action='store_false',
+        dest='fast_requests',
+        default=None,
+        help="Use bravado's generic request construction."
+        f"{ '' if DEFAULT_FAST_REQUESTS else ' Enabled by default.'}"
+    )
+
+    rc_group = parser.add_mutually_exclusive_group()
+    rc_group.add_argument(
+        "--response-cache",
+        action='store_true',
+        default=None,
+        help="Generate client methods for caching the results of GET "
+        "operations in memory."
+        f"{ ' Enabled by default.' if DEFAULT_RESPONSE_CACHE else ''}"
+    )
+    rc_group.add_argument(
+        "--no-response-cache",
+        action='store_false',
+        dest='response_cache',
+        default=None,
+        help="Do not generate response cache methods."
+        f"{ '' if DEFAULT_RESPONSE_CACHE else ' Enabled by default.'}"
+    )
+
+    bld_group = parser.add_mutually_exclusive_group()
+    bld_group.add_argument(
+        "--build-helper",
+        action='store_true',
+        default=None,
+        help="Generate a client method for creating many model instances "
+        "from dicts of property values."
+        f"{ ' Enabled by default.' if DEFAULT_BUILD_HELPER else ''}"
+    )
+    bld_group.add_argument(
+        "--no-build-helper",
+        action='store_false',
+        dest='build_helper',
+        default=None,
+        help="Do not generate the model build helper."
+        f"{ '' if DEFAULT_BUILD_HELPER else ' Enabled by default.'}"
     )
 
     parser.add_argument(
@@ -143,11 +574,26 @@ def main(args: Optional[Sequence[str]] = None, exit: bool = True) -> None:
         help="Directory containing custom Mako templates.",
     )
 
-    ns = parser.parse_args(args)
+    pr_group = parser.add_mutually_exclusive_group()
+    pr_group.add_argument(
+        "--parallel-render",
+        action='store_true',
+        default=None,
+        help="Render the module and stub files in separate processes."
+        f"{ ' Enabled by default.' if DEFAULT_PARALLEL_RENDER else ''}"
+    )
+    pr_group.add_argument(
+        "--no-parallel-render",
+        action='store_false',
+        dest='parallel_render',
+        default=None,
+        help="Render output files sequentially."
+        f"{ '' if DEFAULT_PARALLEL_RENDER else ' Enabled by default.'}"
+    )
 
-    url = _normalize_url(ns.url)
-    client = SwaggerClient.from_url(url)
 
+def _config(ns: Namespace) -> Config:
+    """Create a config object from parsed arguments."""
     array_types = ArrayTypes(ns.array_types) if ns.array_types else None
     response_types = (ResponseTypes(ns.response_types) if ns.response_types
                       else None)
@@ -155,7 +601,7 @@ def main(args: Optional[Sequence[str]] = None, exit: bool = True) -> None:
     custom_formats = _custom_formats(ns.custom_format,
                                      ns.custom_format_package)
 
-    config = Config(
+    return Config(
         name=ns.name,
         path=ns.path,
         client_type_format=ns.client_type_format,
@@ -165,12 +611,56 @@ def main(args: Optional[Sequence[str]] = None, exit: bool = True) -> None:
         array_types=array_types,
         response_types=response_types,
         model_inheritance=ns.model_inheritance,
+        async_client=ns.async_client,
+        lazy_stubs=ns.lazy_stubs,
+        lazy_client=ns.lazy_client,
+        spec_cache=ns.spec_cache,
+        batch_helper=ns.batch_helper,
+        stream_helper=ns.stream_helper,
+        instrumentation=ns.instrumentation,
+        fast_requests=ns.fast_requests,
+        response_cache=ns.response_cache,
+        build_helper=ns.build_helper,
         custom_formats=custom_formats,
         custom_templates_dir=ns.custom_templates_dir,
+        parallel_render=ns.parallel_render,
     )
 
-    generate_module(client, config,
-                    _cli_args=sys.argv[1:] if args is None else args)
+
+def _check_cache_args(parser: ArgumentParser, ns: Namespace) -> None:
+    if ns.offline and not ns.cache_dir:
+        parser.error("--offline requires --cache-dir")
+    if ns.fetch_workers is not None and ns.fetch_workers < 1:
+        parser.error("--fetch-workers must be positive")
+    if ns.timeout is not None and ns.timeout <= 0:
+        parser.error("--timeout must be positive")
+
+
+def _load_client(ns: Namespace) -> 'SwaggerClient':
+    """Load a client for the schema given by the parsed arguments."""
+    from bravado.client import SwaggerClient
+
+    from bravado_types.http_cache import (DEFAULT_TIMEOUT, CachingHttpClient,
+                                          SchemaCache)
+
+    url = _normalize_url(ns.url)
+    timeout = DEFAULT_TIMEOUT if ns.timeout is None else ns.timeout
+    cache = None
+    if ns.cache_dir:
+        cache = SchemaCache(ns.cache_dir, offline=ns.offline, timeout=timeout)
+
+    if ns.fetch_workers:
+        from bravado_types.prefetch import load_client
+        return load_client(url, max_workers=ns.fetch_workers, cache=cache,
+                           timeout=timeout)
+
+    http_client = None
+    if cache is not None:
+        http_client = CachingHttpClient(cache)
+
+    client: SwaggerClient = SwaggerClient.from_url(url,
+                                                   http_client=http_client)
+    return client
 
 
 def _normalize_url(url_or_path: str) -> str:
@@ -0,0 +1,133 @@
+"""
+Asyncio API for generating modules for many schemas concurrently.
+
+Calling generate_module() in a loop fetches one schema at a time. The
+functions in this module fetch the documents of several schemas concurrently,
+sharing one HTTP connection pool, and extract type information and render
+files in an executor, so that fetching the remaining schemas is not blocked
+by the CPU-bound work.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+from bravado_types.config import Config
+
+if TYPE_CHECKING:
+    import requests
+
+    from bravado_types.http_cache import CachedDocument, SchemaCache
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_TIMEOUT = 30.0
+
+
+async def generate_modules_async(
+    sources: Iterable[Tuple[str, Config]], *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    fetch_workers: int = DEFAULT_FETCH_WORKERS,
+    cache: 'SchemaCache' = None,
+    executor: Executor = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+) -> None:
+    """
+    Fetch several schemas concurrently and render module and stub files for
+    each of them.
+
+    Documents are fetched in worker threads with a shared requests session,
+    or through the given schema cache. Type extraction and rendering run in
+    the given executor, or in the event loop's default executor. The work
+    for each schema is done by a module-level function, so a
+    ProcessPoolExecutor can be used to extract and render schemas in
+    parallel, provided that the configurations, including any postprocessor
+    functions, can be pickled.
+
+    If generating files for a schema fails, files for the other schemas are
+    still generated, and the exception for the first failed schema in the
+    order of the sources is raised once all schemas are done.
+
+    :param sources: Pairs of schema URL and configuration parameters. The
+        output paths of the configurations must be distinct.
+    :param max_concurrency: Maximum number of schemas to fetch at a time.
+    :param fetch_workers: Maximum number of concurrent requests for the
+        documents of each schema, including documents referenced through
+        external $refs.
+    :param cache: Optional schema cache to fetch documents through.
+    :param executor: Optional executor for type extraction and rendering.
+    :param timeout: Timeout in seconds for HTTP requests made without a
+        cache, or None to wait indefinitely.
+    """
+    sources = list(sources)
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive")
+    if fetch_workers < 1:
+        raise ValueError("fetch_workers must be positive")
+    paths = set()
+    for _, config in sources:
+        if config.py_path in paths:
+            raise ValueError(f"Duplicate output path: {config.py_path}")
+        paths.add(config.py_path)
+
+    session = None
+    if cache is None:
+        session = _session(max_concurrency * fetch_workers)
+    # get_running_loop() is not available in Python 3.6
+    loop = asyncio.get_event_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def generate(url: str, config: Config) -> None:
+        async with semaphore:
+            documents = await loop.run_in_executor(
+                fetch_executor, _fetch, url, fetch_workers, cache, session,
+                timeout)
+        await loop.run_in_executor(executor, _generate, url, documents,
+                                   config)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as fetch_executor:
+        try:
+            results = await asyncio.gather(
+                *(generate(url, config) for url, config in sources),
+                return_exceptions=True)
+        finally:
+            if session is not None:
+                session.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+def _session(pool_size: int) -> 'requests.Session':
+    """Create a requests session with a connection pool of a given size."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _fetch(url: str, fetch_workers: int, cache: 'SchemaCache' = None,
+           session: 'requests.Session' = None,
+           timeout: Optional[float] = DEFAULT_TIMEOUT
+           ) -> Dict[str, 'CachedDocument']:
+    from bravado_types.prefetch import prefetch_documents
+
+    return prefetch_documents(url, max_workers=fetch_workers, cache=cache,
+                              session=session, timeout=timeout)
+
+
+def _generate(url: str, documents: Dict[str, 'CachedDocument'],
+              config: Config) -> None:
+    """Build a spec from prefetched documents and render its files."""
+    from bravado.client import SwaggerClient
+
+    from bravado_types import generate_module
+    from bravado_types.prefetch import PrefetchedHttpClient
+
+    client = SwaggerClient.from_url(
+        url, http_client=PrefetchedHttpClient(documents))
+    generate_module(client, config)
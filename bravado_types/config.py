@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import Any, Callable, Iterable, Mapping, Tuple
 
+from bravado_types.postprocess import postprocessor_key
+
 DEFAULT_CLIENT_TYPE_FORMAT = "{}SwaggerClient"
 DEFAULT_RESOURCE_TYPE_FORMAT = "{}Resource"
 DEFAULT_OPERATION_TYPE_FORMAT = "{}Operation"
@@ -8,6 +10,21 @@ DEFAULT_MODEL_TYPE_FORMAT = "{}Model"
 
 DEFAULT_MODEL_INHERITANCE = False
 
+DEFAULT_ASYNC_CLIENT = False
+
+DEFAULT_LAZY_STUBS = False
+
+DEFAULT_LAZY_CLIENT = False
+DEFAULT_SPEC_CACHE = False
+DEFAULT_BATCH_HELPER = False
+DEFAULT_STREAM_HELPER = False
+DEFAULT_INSTRUMENTATION = False
+DEFAULT_FAST_REQUESTS = False
+DEFAULT_RESPONSE_CACHE = False
+DEFAULT_BUILD_HELPER = False
+
+DEFAULT_PARALLEL_RENDER = False
+
 
 class ArrayTypes(str, Enum):
     list = 'list'
@@ -57,9 +74,23 @@ class Config:
         array_types: ArrayTypes = None,
         response_types: ResponseTypes = None,
         model_inheritance: bool = None,
+        async_client: bool = None,
+        lazy_stubs: bool = None,
+        lazy_client: bool = None,
+        spec_cache: bool = None,
+        batch_helper: bool = None,
+        stream_helper: bool = None,
+        instrumentation: bool = None,
+        fast_requests: bool = None,
+        response_cache: bool = None,
+        build_helper: bool = None,
         custom_formats: CustomFormats = None,
         custom_templates_dir: str = None,
+        parallel_render: bool = None,
         postprocessor: Callable[[str, str], Any] = None,
+        file_postprocessor: Callable[[str], Any] = None,
+        postprocess_cache_dir: str = None,
+        postprocess_cache_key: str = None,
     ):
         """
         :param name: Schema name. Should be a valid Python identifier.
@@ -85,12 +116,77 @@ class Config:
             reflect model inheritance relationships as expressed by the allOf
             schema property. If False, model types will only inherit from
             bravado_core.model.Model.
+        :param async_client: If True, operations will be typed as returning
+            awaitable futures, for use with asyncio-based HTTP clients such as
+            bravado-asyncio. The generated client's from_url() and
+            from_spec() methods will default to a bravado-asyncio client.
+        :param lazy_stubs: If True, generate a compact stub file and a type
+            index file instead of a full stub file. Resource, operation and
+            model types are then built on demand by the
+            bravado_types.mypy_plugin MyPy plugin. Cannot be combined with
+            model_inheritance.
+        :param lazy_client: If True, the generated client class builds
+            resources and operations on first access instead of when the
+            client is created.
+        :param spec_cache: If True, the generated client class has a
+            from_cached_spec() method which saves the built spec to a cache
+            file and loads it from the file on later calls, as long as the
+            schema matches the one the types were generated from.
+        :param batch_helper: If True, the generated client class has a
+            batch() method which returns a thread pool for resolving the
+            futures of operation calls concurrently, preserving their result
+            types. Cannot be combined with async_client.
+        :param stream_helper: If True, the generated client class has a
+            stream() method which sends the request of an operation call and
+            iterates over the unmarshalled items of its array response as
+            they are received. Requires bravado's RequestsClient, and cannot
+            be combined with async_client.
+        :param instrumentation: If True, the generated client class has
+            add_operation_hook() and remove_operation_hook() methods for
+            registering functions which are called with the timing, status
+            and response size of each operation call. Cannot be combined with
+            async_client.
+        :param fast_requests: If True, the generated module contains a
+            request-building function for each operation, specialized for its
+            parameters, which the generated client uses instead of bravado's
+            generic request construction for operations whose parameters
+            match the ones the types were generated from.
+        :param response_cache: If True, the generated client class has
+            configure_cache(), invalidate_cache() and cache_info() methods
+            for caching the results of GET operations in memory, per
+            operation, keyed by their parameters. Cached results are copied
+            on each hit, so callers may change them. Cannot be combined with
+            async_client.
+        :param build_helper: If True, the generated client class has a
+            build_many() method which creates many instances of a model from
+            dicts of property values, checking them against the property
+            names of the model the types were generated from.
         :param custom_formats: Custom format type information.
         :param custom_templates_dir: Optional directory containing custom Mako
-            templates.
+            templates. Templates not found in this directory are loaded from
+            the default templates. If not set, output is generated by a
+            built-in emitter equivalent to the default templates.
+        :param parallel_render: If True, render each output file in a
+            separate worker process. Templates receive type information
+            without references to bravado objects, as when rendering from an
+            intermediate representation file.
         :param postprocessor: Optional postprocessing function to call after
             rendering templates. This function should accept two string
             arguments (py_path, pyi_path) indicating the output file paths.
+        :param file_postprocessor: Optional postprocessing function to call
+            on each generated module and stub file, before postprocessor.
+            This function should accept the file path as a string argument
+            and modify the file in place. Files are postprocessed
+            concurrently in separate threads.
+        :param postprocess_cache_dir: Optional directory in which to cache
+            the results of file_postprocessor, keyed by a hash of the file
+            content before postprocessing. Files whose generated content is
+            found in the cache are not postprocessed again.
+        :param postprocess_cache_key: Optional key identifying
+            file_postprocessor in the cache. By default, the key is derived
+            from the function, see postprocess.PostprocessCache. Required if
+            the derived key would contain an object address, which differs
+            between runs.
         """
         self.name = name
 
@@ -98,6 +194,7 @@ class Config:
             raise ValueError("Path must end with '.py'")
         self.py_path = path
         self.pyi_path = f"{path}i"
+        self.index_path = f"{path[:-3]}.types.json"
 
         self.client_type_format = \
             client_type_format or DEFAULT_CLIENT_TYPE_FORMAT
@@ -114,11 +211,77 @@ class Config:
             model_inheritance = DEFAULT_MODEL_INHERITANCE
         self.model_inheritance = model_inheritance
 
+        if async_client is None:
+            async_client = DEFAULT_ASYNC_CLIENT
+        self.async_client = async_client
+
+        if lazy_stubs is None:
+            lazy_stubs = DEFAULT_LAZY_STUBS
+        if lazy_stubs and model_inheritance:
+            raise ValueError("Lazy stubs do not support model inheritance")
+        self.lazy_stubs = lazy_stubs
+
+        if lazy_client is None:
+            lazy_client = DEFAULT_LAZY_CLIENT
+        self.lazy_client = lazy_client
+
+        if spec_cache is None:
+            spec_cache = DEFAULT_SPEC_CACHE
+        self.spec_cache = spec_cache
+
+        if batch_helper is None:
+            batch_helper = DEFAULT_BATCH_HELPER
+        if batch_helper and async_client:
+            raise ValueError("Batch helper does not support async clients")
+        self.batch_helper = batch_helper
+
+        if stream_helper is None:
+            stream_helper = DEFAULT_STREAM_HELPER
+        if stream_helper and async_client:
+            raise ValueError("Stream helper does not support async clients")
+        self.stream_helper = stream_helper
+
+        if instrumentation is None:
+            instrumentation = DEFAULT_INSTRUMENTATION
+        if instrumentation and async_client:
+            raise ValueError("Instrumentation does not support async clients")
+        self.instrumentation = instrumentation
+
+        if fast_requests is None:
+            fast_requests = DEFAULT_FAST_REQUESTS
+        self.fast_requests = fast_requests
+
+        if response_cache is None:
+            response_cache = DEFAULT_RESPONSE_CACHE
+        if response_cache and async_client:
+            raise ValueError("Response cache does not support async clients")
+        self.response_cache = response_cache
+
+        if build_helper is None:
+            build_helper = DEFAULT_BUILD_HELPER
+        self.build_helper = build_helper
+
         self.custom_formats = custom_formats
 
         self.custom_templates_dir = custom_templates_dir
+
+        if parallel_render is None:
+            parallel_render = DEFAULT_PARALLEL_RENDER
+        self.parallel_render = parallel_render
+
         self.postprocessor = postprocessor
 
+        if postprocess_cache_dir and not file_postprocessor:
+            raise ValueError(
+                "postprocess_cache_dir requires file_postprocessor")
+        if (file_postprocessor and postprocess_cache_dir
+                and postprocess_cache_key is None):
+            # Fail before rendering if no stable key can be derived
+            postprocessor_key(file_postprocessor)
+        self.file_postprocessor = file_postprocessor
+        self.postprocess_cache_dir = postprocess_cache_dir
+        self.postprocess_cache_key = postprocess_cache_key
+
     @property
     def client_type(self) -> str:
         """Get the client type name."""
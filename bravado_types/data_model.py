@@ -1,21 +1,96 @@
-"""Classes representing typing metadata about a Swagger spec."""
+"""
+Classes representing typing metadata about a Swagger spec.
+
+The bravado-core objects referenced by these classes are only available when
+the type information was extracted from a live spec. They are None when the
+type information was loaded from an intermediate representation file.
+
+Types are extracted as TypeInfo objects, which do not depend on the
+configuration options that determine how types are written, such as the array
+types and model type format. They are rendered to type strings for a given
+configuration when the files are rendered, so the same type information can
+be rendered with several configurations.
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Type
+
+if TYPE_CHECKING:
+    from bravado_core.model import Model
+    from bravado_core.operation import Operation
+    from bravado_core.param import Param
+    from bravado_core.resource import Resource
+    from bravado_core.spec import Spec
+
+
+class TypeWrapper(str, Enum):
+    """Kind of type which wraps another type."""
+    array = 'array'
+    optional = 'optional'
+
+
+class TypeInfo:
+    """
+    Structured type of a schema.
+
+    Types form a tree whose inner nodes are array and Optional types, each
+    wrapping a single type, so a type is stored as its leaf type and the path
+    of wrappers above it. Comparing, hashing and rendering a type does not
+    recurse, however deeply it is nested. TypeInfo objects are immutable.
+
+    Converting a TypeInfo to a string raises a TypeError, so that templates
+    written for type strings fail instead of writing the repr into the
+    generated files. Templates look up the type string of a type in the
+    types dict they receive, e.g. ${types[prop.type]}.
+    """
+
+    def __init__(self, name: str, model: bool = False,
+                 wrappers: Iterable[TypeWrapper] = ()):
+        """
+        :param name: Type expression of the leaf type, e.g. 'int' or
+            'typing.Any', or the model name if the leaf type is a model type.
+        :param model: Whether the leaf type is a model type.
+        :param wrappers: Types wrapping the leaf type, outermost first.
+        """
+        self.name = name
+        self.model = model
+        self.wrappers = tuple(TypeWrapper(wrapper) for wrapper in wrappers)
+        # Types are used as keys when rendering, so the hash is computed once
+        self._hash = hash((name, model, self.wrappers))
+
+    def __eq__(self, other: Any) -> bool:
+        return self is other or (isinstance(other, TypeInfo)
+                                 and self._hash == other._hash
+                                 and self.name == other.name
+                                 and self.model == other.model
+                                 and self.wrappers == other.wrappers)
 
-from typing import Any, List, NewType, Type
+    def __hash__(self) -> int:
+        return self._hash
 
-from bravado_core.model import Model
-from bravado_core.operation import Operation
-from bravado_core.param import Param
-from bravado_core.resource import Resource
-from bravado_core.spec import Spec
+    def __reduce__(self) -> Any:
+        # String hashes differ between processes, so the hash is not pickled
+        return TypeInfo, (self.name, self.model, self.wrappers)
 
+    def __repr__(self) -> str:
+        return (f'TypeInfo({self.name!r}, {self.model!r}, '
+                f'{[wrapper.value for wrapper in self.wrappers]!r})')
 
-TypeInfo = NewType('TypeInfo', str)
+    def __str__(self) -> str:
+        raise TypeError(f"{self!r} is not a type string. Templates must "
+                        f"look up type strings in the types dict, e.g. "
+                        f"${{types[prop.type]}} instead of ${{prop.type}}")
 
 
 class PropertyInfo:
     """Type information about a Swagger model property."""
 
     def __init__(self, name: str, type: TypeInfo, required: bool):
+        """
+        :param name: Property name.
+        :param type: Property type.
+        :param required: Whether the property is required.
+        """
         self.name = name
         self.type = type
         self.required = required
@@ -34,8 +109,8 @@ class PropertyInfo:
 class ModelInfo:
     """Type information about a Swagger model."""
 
-    def __init__(self, mclass: Type[Model], name: str, parents: List[str],
-                 props: List[PropertyInfo]):
+    def __init__(self, mclass: Optional[Type['Model']], name: str,
+                 parents: List[str], props: List[PropertyInfo]):
         self.mclass = mclass
         self.name = name
         self.parents = parents
@@ -56,29 +131,52 @@ class ModelInfo:
 class ParameterInfo:
     """Type information about a Swagger operation parameter."""
 
-    def __init__(self, param: Param, name: str, type: TypeInfo,
-                 required: bool):
+    def __init__(self, param: Optional['Param'], name: str, type: TypeInfo,
+                 required: bool, location: str, wire_name: str,
+                 schema: Dict[str, Any]):
+        """
+        :param param: bravado-core parameter object.
+        :param name: Parameter name, as passed to the operation.
+        :param type: Parameter type.
+        :param required: Whether the parameter is required.
+        :param location: Parameter location, e.g. 'path' or 'query'.
+        :param wire_name: Parameter name in the request, which may differ
+            from the sanitized name passed to the operation.
+        :param schema: The type, format, items and collectionFormat keys of
+            the parameter schema, which determine how values are sent.
+        """
         self.param = param
         self.name = name
         self.type = type
         self.required = required
+        self.location = location
+        self.wire_name = wire_name
+        self.schema = schema
 
     def __eq__(self, other: Any) -> bool:
         return (isinstance(other, ParameterInfo)
                 and self.param == other.param
                 and self.name == other.name
                 and self.type == other.type
-                and self.required == other.required)
+                and self.required == other.required
+                and self.location == other.location
+                and self.wire_name == other.wire_name
+                and self.schema == other.schema)
 
     def __repr__(self) -> str:
         return (f'ParameterInfo({self.param!r}, {self.name!r}, {self.type!r}, '
-                f'{self.required!r})')
+                f'{self.required!r}, {self.location!r}, {self.wire_name!r}, '
+                f'{self.schema!r})')
 
 
 class ResponseInfo:
     """Type information about a Swagger operation response."""
 
     def __init__(self, status: str, type: TypeInfo):
+        """
+        :param status: Response status code, or 'default'.
+        :param type: Response type.
+        """
         self.status = status
         self.type = type
 
@@ -98,29 +196,43 @@ class ResponseInfo:
 class OperationInfo:
     """Type information about a Swagger operation."""
 
-    def __init__(self, operation: Operation, name: str,
-                 params: List[ParameterInfo], responses: List[ResponseInfo]):
+    def __init__(self, operation: Optional['Operation'], name: str,
+                 params: List[ParameterInfo], responses: List[ResponseInfo],
+                 http_method: str, path_name: str):
+        """
+        :param operation: bravado-core operation object.
+        :param name: Operation name.
+        :param params: Parameter information, sorted by name.
+        :param responses: Response information, sorted by status.
+        :param http_method: HTTP method, in lower case.
+        :param path_name: Path template, e.g. '/pet/{petId}'.
+        """
         self.operation = operation
         self.name = name
         self.params = params
         self.responses = responses
+        self.http_method = http_method
+        self.path_name = path_name
 
     def __eq__(self, other: Any) -> bool:
         return (isinstance(other, OperationInfo)
                 and self.operation == other.operation
                 and self.name == other.name
                 and self.params == other.params
-                and self.responses == other.responses)
+                and self.responses == other.responses
+                and self.http_method == other.http_method
+                and self.path_name == other.path_name)
 
     def __repr__(self) -> str:
         return (f'OperationInfo({self.operation!r}, {self.name!r}, '
-                f'{self.params!r}, {self.responses!r})')
+                f'{self.params!r}, {self.responses!r}, '
+                f'{self.http_method!r}, {self.path_name!r})')
 
 
 class ResourceInfo:
     """Type information about a Swagger resource."""
 
-    def __init__(self, resource: Resource, name: str,
+    def __init__(self, resource: Optional['Resource'], name: str,
                  operations: List[OperationInfo]):
         self.resource = resource
         self.name = name
@@ -140,7 +252,7 @@ class ResourceInfo:
 class SpecInfo:
     """Type information about a Swagger spec."""
 
-    def __init__(self, spec: Spec, models: List[ModelInfo],
+    def __init__(self, spec: Optional['Spec'], models: List[ModelInfo],
                  resources: List[ResourceInfo],
                  operations: List[OperationInfo]):
         self.spec = spec
@@ -0,0 +1,2400 @@
+"""
+Built-in emitter for the default templates.
+
+The functions in this module write the same output as the default Mako
+templates, byte for byte, without the overhead of the template engine. They
+are used by bravado_types.render.render() unless a custom templates directory
+is configured. Any change to a default template must be mirrored here; the
+equivalence is checked by tests/test_emit.py.
+"""
+
+import io
+import os.path
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Sequence, TextIO, Tuple
+
+from bravado_types.config import Config
+from bravado_types.data_model import (ModelInfo, OperationInfo, ResourceInfo,
+                                      SpecInfo, TypeInfo)
+from bravado_types.metadata import Metadata
+from bravado_types.request_builders import (request_builder_body,
+                                            request_signature)
+from bravado_types.shared import SharedModels
+
+# Static fragments of module.py.mako
+
+_MODULE_ASYNC_IMPORTS = '''\
+from bravado.requests_client import RequestsClient
+from bravado.swagger_model import Loader
+'''
+
+_MODULE_PLACEHOLDERS = '''\
+
+_TYPE_ERROR = "Generated types cannot be used for runtime type checks"
+_RUNTIME_ERROR = "Generated types cannot be instantiated at runtime."
+
+
+if sys.version_info >= (3, 7, 0):
+    class _PlaceholderMeta(type):
+        def __instancecheck__(self, instance):
+            raise TypeError(_TYPE_ERROR)
+
+        def __subclasscheck__(self, subclass):
+            raise TypeError(_TYPE_ERROR)
+
+    class _Placeholder(metaclass=_PlaceholderMeta):
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError(_RUNTIME_ERROR)
+
+    _PLACEHOLDER = _Placeholder
+else:
+    def _placeholder(*args, **kwargs):
+        raise RuntimeError(_RUNTIME_ERROR)
+
+    _PLACEHOLDER = _placeholder
+
+
+# Client type
+
+'''
+
+_MODULE_LAZY_CLIENT = '''\
+class _LazyResources(bravado_core.util.AliasKeyDict):
+    """
+    Mapping of resource names to resources which builds each resource and its
+    operations on first access.
+    """
+
+    def __init__(self, swagger_spec):
+        super().__init__()
+        self._swagger_spec = swagger_spec
+        self._index = None
+        self._operations = {}
+
+    def _get_index(self):
+        # Map resource names to operation paths and methods in the same way
+        # as bravado_core.resource.build_resources(), without building the
+        # operations.
+        if self._index is None:
+            deref = self._swagger_spec.deref
+            spec_dict = deref(self._swagger_spec._internal_spec_dict)
+            index = {}
+            for path_name, path_spec in deref(
+                    spec_dict.get('paths', {})).items():
+                for http_method, op_spec in deref(path_spec).items():
+                    if (http_method.startswith('x-')
+                            or http_method == 'parameters'):
+                        continue
+                    tags = deref(deref(op_spec).get('tags', [])) or [
+                        bravado_core.resource.convert_path_to_resource(
+                            path_name)]
+                    for tag in tags:
+                        tag = deref(tag)
+                        key = bravado_core.util.sanitize_name(tag)
+                        index.setdefault(key, []).append(
+                            (path_name, http_method))
+                        self.add_alias(tag, key)
+            self._index = index
+        return self._index
+
+    def _build(self, key):
+        deref = self._swagger_spec.deref
+        spec_dict = deref(self._swagger_spec._internal_spec_dict)
+        paths = deref(spec_dict['paths'])
+        ops = {}
+        for path_name, http_method in self._get_index()[key]:
+            op = self._operations.get((path_name, http_method))
+            if op is None:
+                op = bravado_core.operation.Operation.from_spec(
+                    self._swagger_spec, path_name, http_method,
+                    deref(deref(paths[path_name])[http_method]))
+                self._operations[path_name, http_method] = op
+            ops[op.operation_id] = op
+        resource = bravado_core.resource.Resource(key, ops)
+        dict.__setitem__(self, key, resource)
+        return resource
+
+    def _build_all(self):
+        for key in self._get_index():
+            if not dict.__contains__(self, key):
+                self._build(key)
+
+    def determine_key(self, key):
+        self._get_index()
+        return super().determine_key(key)
+
+    def __getitem__(self, key):
+        key = self.determine_key(key)
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key in self._index:
+            return self._build(key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return self.determine_key(key) in self._index
+
+    def __iter__(self):
+        return iter(self._get_index())
+
+    def __len__(self):
+        return len(self._get_index())
+
+    def keys(self):
+        return self._get_index().keys()
+
+    def values(self):
+        self._build_all()
+        return super().values()
+
+    def items(self):
+        self._build_all()
+        return super().items()
+
+    def copy(self):
+        self._build_all()
+        copied = bravado_core.util.AliasKeyDict(super().items())
+        copied.alias_to_key = self.alias_to_key.copy()
+        return copied
+
+
+class _LazySpec(bravado_core.spec.Spec):
+    """Spec which builds resources and operations on first access."""
+
+    def build(self):
+        if self.config['internally_dereference_refs']:
+            # Resources are built from the dereferenced spec in this mode.
+            super().build()
+            return
+
+        # Hide the paths while building the spec so that no resources are
+        # built, then restore them for use by _LazyResources.
+        spec_dict = self._internal_spec_dict
+        self._internal_spec_dict = {key: value
+                                    for key, value in spec_dict.items()
+                                    if key != 'paths'}
+        try:
+            super().build()
+        finally:
+            self._internal_spec_dict = spec_dict
+        self.resources = _LazyResources(self)
+
+
+class _LazySwaggerClient(SwaggerClient):
+    @classmethod
+    def from_spec(cls, spec_dict, origin_url=None, http_client=None,
+                  config=None):
+        # Same as SwaggerClient.from_spec(), except that the spec is a
+        # _LazySpec.
+        http_client = http_client or bravado.requests_client.RequestsClient()
+        config = dict(config or {})
+
+        bravado_config = bravado.config.bravado_config_from_config_dict(
+            config)
+        for key in set(bravado_config._fields).intersection(set(config)):
+            del config[key]
+        config['bravado'] = bravado_config
+
+        swagger_spec = _LazySpec.from_dict(spec_dict, origin_url, http_client,
+                                           config)
+        return cls(swagger_spec,
+                   also_return_response=bravado_config.also_return_response)
+
+
+'''
+
+_MODULE_ASYNC_CLIENT_BODY = '''\
+    @classmethod
+    def from_url(cls, spec_url, http_client=None, request_headers=None,
+                 config=None):
+        """
+        Create a client from the spec at a URL.
+
+        The spec is always loaded synchronously with bravado's default
+        RequestsClient, not with http_client, which is only used for
+        operation calls. To load the spec with another client, load it
+        separately and call from_spec().
+        """
+        loader = Loader(RequestsClient(), request_headers=request_headers)
+        spec_dict = loader.load_spec(spec_url)
+        return cls.from_spec(spec_dict, spec_url, http_client, config)
+
+    @classmethod
+    def from_spec(cls, spec_dict, origin_url=None, http_client=None,
+                  config=None):
+        if http_client is None:
+            from bravado_asyncio.definitions import RunMode
+            from bravado_asyncio.http_client import AsyncioClient
+            http_client = AsyncioClient(run_mode=RunMode.FULL_ASYNCIO)
+        return super().from_spec(spec_dict, origin_url, http_client, config)
+'''
+
+_MODULE_SPEC_FINGERPRINT = '''\
+def _spec_fingerprint(swagger_spec):
+    # Same as bravado_types.metadata.spec_fingerprint()
+    spec_dict = bravado_core.spec.strip_xscope(swagger_spec.spec_dict)
+    data = json.dumps(spec_dict, sort_keys=True, separators=(',', ':'),
+                      default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+'''
+
+_MODULE_SPEC_CACHE = '''\
+def _load_spec_cache(cache_path, key):
+    try:
+        with open(cache_path, 'rb') as f:
+            # The key is stored separately so that the spec is only loaded
+            # if it was cached by the same bravado-core version.
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible cache files are rewritten.
+        return None
+
+
+def _save_spec_cache(cache_path, key, swagger_spec):
+    # The HTTP client is provided when loading the spec, and may not be
+    # picklable.
+    http_client = swagger_spec.http_client
+    swagger_spec.http_client = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(cache_path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(key, f)
+                pickle.dump(swagger_spec, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        warnings.warn(f"Failed to write spec cache {cache_path}: {e}")
+    finally:
+        swagger_spec.http_client = http_client
+
+
+'''
+
+_MODULE_FROM_CACHED_SPEC = '''\
+    @classmethod
+    def from_cached_spec(cls, cache_path, spec_url, http_client=None,
+                         request_headers=None, config=None):
+        """
+        Create a client, loading the built spec from a cache file.
+
+        The cache file is used if it was written for the schema these types
+        were generated from, by the installed bravado and bravado-core
+        versions, with the same spec_url and config. Otherwise the client is
+        created with from_url() and its spec is written to the cache file.
+        """
+        config = dict(config or {})
+        key = (_SPEC_FINGERPRINT, bravado.version, bravado_core.version,
+               spec_url, config)
+        swagger_spec = _load_spec_cache(cache_path, key)
+        if swagger_spec is None:
+            client = cls.from_url(spec_url, http_client, request_headers,
+                                  dict(config))
+            if _spec_fingerprint(client.swagger_spec) == _SPEC_FINGERPRINT:
+                _save_spec_cache(cache_path, key, client.swagger_spec)
+            else:
+                warnings.warn(f"Schema at {spec_url} does not match the "
+                              "generated types, not caching spec")
+            return client
+
+        if http_client is None:
+'''
+
+_MODULE_FROM_CACHED_SPEC_HTTP_CLIENT = '''\
+            http_client = bravado.requests_client.RequestsClient()
+        if request_headers is not None:
+            # As in SwaggerClient.from_url(), for remote refs
+            http_client.request = inject_headers_for_remote_refs(
+                http_client.request, request_headers)
+'''
+
+_MODULE_FROM_CACHED_SPEC_ASYNC_HTTP_CLIENT = '''\
+            from bravado_asyncio.definitions import RunMode
+            from bravado_asyncio.http_client import AsyncioClient
+            http_client = AsyncioClient(run_mode=RunMode.FULL_ASYNCIO)
+'''
+
+_MODULE_FROM_CACHED_SPEC_RETURN = '''\
+        swagger_spec.http_client = http_client
+        return cls(swagger_spec, also_return_response=swagger_spec.config[
+            'bravado'].also_return_response)
+'''
+
+_MODULE_BATCH = '''\
+class _Batch:
+    """Thread pool for resolving the futures of operation calls."""
+
+    def __init__(self, max_workers, timeout):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self._timeout = timeout
+
+    def submit(self, future):
+        """
+        Resolve the future of an operation call in the thread pool.
+
+        :param future: HttpFuture returned by an operation call.
+        :return: concurrent.futures.Future for the result of the call.
+        """
+        return self._executor.submit(future.result, timeout=self._timeout)
+
+    def submit_all(self, futures):
+        """
+        Resolve the futures of operation calls in the thread pool.
+
+        :param futures: HttpFutures returned by operation calls.
+        :return: List of concurrent.futures.Future objects for the results
+            of the calls, in the same order.
+        """
+        return [self.submit(future) for future in futures]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+'''
+
+_MODULE_BATCH_METHOD = '''\
+    def batch(self, max_workers=None, timeout=None):
+        """
+        Create a thread pool for making operation calls concurrently.
+
+        :param max_workers: Maximum number of concurrent calls. Defaults to
+            the concurrent.futures.ThreadPoolExecutor default.
+        :param timeout: Timeout in seconds for each call.
+        """
+        return _Batch(max_workers, timeout)
+'''
+
+_MODULE_STREAMING = '''\
+_JSON_WHITESPACE = re.compile(r'[ \\t\\n\\r]*')
+# Characters which may continue a number at the end of a chunk
+_JSON_NUMBER_END = re.compile(r'[0-9.eE+-]*\\Z')
+
+
+class _ResponseStream:
+    """Iterator over the unmarshalled items of an array response."""
+
+    def __init__(self, future, chunk_size, timeout):
+        if not isinstance(future.future,
+                          bravado.requests_client.RequestsFutureAdapter):
+            raise TypeError("Streaming responses require bravado's "
+                            "RequestsClient")
+        self._items = _iter_response_items(future, chunk_size, timeout)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    def close(self):
+        """Close the response, discarding any remaining items."""
+        self._items.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _iter_response_items(future, chunk_size, timeout):
+    adapter = future.future
+    try:
+        response = _send_streaming(adapter, timeout)
+        try:
+            yield from _unmarshal_items(future, response, chunk_size)
+        finally:
+            response.close()
+    except adapter.connection_errors as e:
+        adapter._raise_connection_error(e)
+    except adapter.timeout_errors as e:
+        adapter._raise_timeout_error(e)
+
+
+def _send_streaming(adapter, timeout):
+    # Same as RequestsFutureAdapter.result(), without reading the body
+    request = adapter.request
+    request.headers = {
+        k: str(v) if not isinstance(v, bytes) else v
+        for k, v in request.headers.items()
+    }
+    prepared_request = adapter.session.prepare_request(request)
+    settings = adapter.session.merge_environment_settings(
+        prepared_request.url,
+        proxies={},
+        stream=True,
+        verify=adapter.misc_options['ssl_verify'],
+        cert=adapter.misc_options['ssl_cert'],
+    )
+    return adapter.session.send(
+        prepared_request,
+        timeout=adapter.build_timeout(timeout),
+        allow_redirects=adapter.misc_options['follow_redirects'],
+        **settings
+    )
+
+
+def _unmarshal_items(future, response, chunk_size):
+    operation = future.operation
+    swagger_spec = operation.swagger_spec
+    incoming_response = future.response_adapter(response)
+    schema = _array_response_schema(operation, incoming_response)
+    if schema is None:
+        # Error responses and responses which are not JSON arrays are read
+        # in full, as by HttpFuture.result(). Streamed calls are not
+        # instrumented, so the method of the class is used.
+        result = bravado.http_future.HttpFuture._get_swagger_result(
+            future, incoming_response)
+        if result is None:
+            return
+        if not isinstance(result, list):
+            raise TypeError(f"Response of {operation.operation_id} is not "
+                            "an array")
+        yield from result
+        return
+
+    for response_callback in future.request_config.response_callbacks:
+        response_callback(incoming_response, operation)
+    item_schema = swagger_spec.deref(schema.get('items', {}))
+    validate = swagger_spec.config['validate_responses']
+    for item in _iter_json_array(response.iter_content(chunk_size)):
+        if validate:
+            bravado_core.validate.validate_schema_object(
+                swagger_spec, item_schema, item)
+        yield bravado_core.unmarshal.unmarshal_schema_object(
+            swagger_spec, item_schema, item)
+
+
+def _array_response_schema(operation, incoming_response):
+    """
+    Get the array schema of a successful JSON response, or None if the
+    response is not streamed.
+    """
+    if not 200 <= incoming_response.status_code < 300:
+        return None
+    content_type = incoming_response.headers.get('content-type', '')
+    if not content_type.lower().startswith('application/json'):
+        return None
+    try:
+        response_spec = bravado_core.response.get_response_spec(
+            incoming_response.status_code, operation)
+    except bravado_core.exception.MatchingResponseNotFound:
+        return None
+    deref = operation.swagger_spec.deref
+    schema = deref(response_spec.get('schema'))
+    if schema is None or deref(schema.get('type')) != 'array':
+        return None
+    return schema
+
+
+def _iter_json_array(chunks):
+    """Parse the items of a JSON array from chunks of UTF-8 bytes."""
+    decoder = json.JSONDecoder()
+    text = _decode_chunks(chunks)
+    buf = ''
+    pos = 0
+    eof = False
+    # Expected token: '[', a value or ']', a value, ',' or ']', or the end
+    state = 'start'
+    while True:
+        pos = _JSON_WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                if state != 'end':
+                    raise json.JSONDecodeError("Incomplete JSON array", buf,
+                                               pos)
+                return
+            buf, pos, eof = _read_text(text, buf, pos)
+        elif state == 'start':
+            if buf[pos] != '[':
+                raise json.JSONDecodeError("Expecting '['", buf, pos)
+            pos += 1
+            state = 'first'
+        elif state == 'first' and buf[pos] == ']':
+            pos += 1
+            state = 'end'
+        elif state in ('first', 'value'):
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buf, pos, eof = _read_text(text, buf, pos)
+                continue
+            if not eof and _JSON_NUMBER_END.match(buf, end):
+                # A number may continue in the next chunk
+                buf, pos, eof = _read_text(text, buf, pos)
+                continue
+            pos = end
+            state = 'separator'
+            yield item
+        elif state == 'separator' and buf[pos] in ',]':
+            state = 'value' if buf[pos] == ',' else 'end'
+            pos += 1
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter"
+                                       if state == 'separator'
+                                       else "Extra data", buf, pos)
+
+
+def _decode_chunks(chunks):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def _read_text(text, buf, pos):
+    """Append the next chunk of text to the unparsed part of a buffer."""
+    for chunk in text:
+        if chunk:
+            return buf[pos:] + chunk, 0, False
+    return buf[pos:], 0, True
+
+
+'''
+
+_MODULE_STREAM_METHOD = '''\
+    def stream(self, future, chunk_size=65536, timeout=None):
+        """
+        Send the request of an operation call, and iterate over the items
+        of its array response as they are received.
+
+        :param future: HttpFuture returned by an operation call of a client
+            using bravado's RequestsClient, which has not been resolved.
+        :param chunk_size: Number of bytes of the response body to read at
+            a time.
+        :param timeout: Timeout in seconds for the request.
+        :return: Iterator over the unmarshalled items of the response.
+        """
+        return _ResponseStream(future, chunk_size, timeout)
+'''
+
+_MODULE_FAST_REQUESTS = '''\
+_MISSING = object()
+
+# Formats which the request builders assume have the default marshaling
+_BUILDER_FORMATS = ('int32', 'int64', 'float', 'double')
+
+# Parameter object keys which do not affect how values are validated and sent
+_IGNORED_PARAM_KEYS = {'name', 'in', 'description', 'required', 'default',
+                       'items'}
+
+_log = logging.getLogger('bravado.client')
+
+
+class _RequestContext:
+    \"\"\"Operation data used by a request builder.\"\"\"
+
+    __slots__ = ('operation', 'build', 'swagger_spec', 'method', 'url',
+                 'params', 'schemas', 'validate')
+
+    def __init__(self, operation, build):
+        swagger_spec = operation.swagger_spec
+        self.operation = operation
+        self.build = build
+        self.swagger_spec = swagger_spec
+        self.method = str(operation.http_method.upper())
+        self.url = swagger_spec.api_url.rstrip('/') + operation.path_name
+        self.params = operation.params
+        self.schemas = {
+            name: swagger_spec.deref(
+                bravado_core.param.get_param_type_spec(param))
+            for name, param in operation.params.items()
+        }
+        self.validate = swagger_spec.config['validate_requests']
+
+
+# Request contexts of operations, or None for operations which use bravado's
+# request construction
+_request_contexts = weakref.WeakKeyDictionary()
+# Whether the request builders can be used with each spec
+_builder_specs = weakref.WeakKeyDictionary()
+
+
+def _request_context(operation):
+    try:
+        return _request_contexts[operation]
+    except KeyError:
+        pass
+    context = None
+    builder = _REQUEST_BUILDERS.get(operation.operation_id)
+    if builder is not None and _use_builders(operation.swagger_spec):
+        build, signature = builder
+        if _request_signature(operation) == signature:
+            context = _RequestContext(operation, build)
+        else:
+            warnings.warn(f"Parameters of {operation.operation_id} do not "
+                          "match the generated types, using bravado request "
+                          "construction")
+    _request_contexts[operation] = context
+    return context
+
+
+def _use_builders(swagger_spec):
+    try:
+        return _builder_specs[swagger_spec]
+    except KeyError:
+        pass
+    result = not any(name in swagger_spec.user_defined_formats
+                     for name in _BUILDER_FORMATS)
+    _builder_specs[swagger_spec] = result
+    return result
+
+
+def _request_signature(operation):
+    # Same as bravado_types.request_builders.request_signature(), with the
+    # parameter schemas of bravado_types.extract._get_wire_schema()
+    swagger_spec = operation.swagger_spec
+    data = {}
+    for name, param in operation.params.items():
+        wire_schema = {}
+        if param.location != 'body':
+            schema = swagger_spec.deref(
+                bravado_core.param.get_param_type_spec(param))
+            wire_schema = _schema_keys(swagger_spec, schema)
+            if 'items' in schema:
+                wire_schema['items'] = _schema_keys(
+                    swagger_spec, swagger_spec.deref(schema['items']))
+        data[name] = [param.location, param.name, param.required,
+                      wire_schema]
+    text = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _schema_keys(swagger_spec, schema):
+    return {key: swagger_spec.deref(value) for key, value in schema.items()
+            if key not in _IGNORED_PARAM_KEYS and not key.startswith('x-')}
+
+
+def _new_request(context, request_options):
+    # Same as bravado.client.construct_request(), before adding parameters
+    request = {
+        'method': context.method,
+        'url': context.url,
+        'params': {},
+        'headers': (request_options['headers'].copy()
+                    if 'headers' in request_options else {}),
+    }
+    if request_options.get('use_msgpack', False):
+        request['headers']['Accept'] = 'application/msgpack'
+    for request_option in ('connect_timeout', 'timeout'):
+        if request_option in request_options:
+            request[request_option] = request_options[request_option]
+    return request
+
+
+def _check_params(context, op_kwargs):
+    # Parameters may also be passed by their names in the schema, which
+    # differ from the sanitized names for header parameters
+    if context.params.keys() >= op_kwargs.keys():
+        return op_kwargs
+    kwargs = {}
+    for name, value in op_kwargs.items():
+        key = context.params.determine_key(name)
+        if key not in context.params or key in kwargs:
+            raise bravado_core.exception.SwaggerMappingError(
+                f"{context.operation.operation_id} does not have "
+                f"parameter {name}")
+        kwargs[key] = value
+    return kwargs
+
+
+def _missing_param(name):
+    return bravado_core.exception.SwaggerMappingError(
+        f"{name} is a required parameter")
+
+
+def _msgpack_body(request):
+    content_type = request['headers'].get('Content-Type', '')
+    return content_type.lower() == 'application/msgpack'
+
+
+def _marshal_param(context, name, value, request):
+    bravado_core.param.marshal_param(context.params[name], value, request)
+
+
+def _marshal(context, name, value):
+    return bravado_core.marshal.marshal_schema_object(
+        context.swagger_spec, context.schemas[name], value)
+
+
+def _validate(context, name, value):
+    bravado_core.validate.validate_schema_object(
+        context.swagger_spec, context.schemas[name], value)
+
+
+'''
+
+_MODULE_FAST_OPERATION = '''\
+class _FastCallableOperation(bravado.client.CallableOperation):
+    def __call__(self, **op_kwargs):
+        context = _request_context(self.operation)
+        if context is None:
+            return super().__call__(**op_kwargs)
+
+        # Same as CallableOperation.__call__(), using the request builder
+        # instead of bravado.client.construct_request()
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug('%s(%s)', self.operation.operation_id,
+                       self._sanitize_kwargs_for_logging(op_kwargs))
+        bravado.warning.warn_for_deprecated_op(self.operation)
+        request_options = op_kwargs.pop('_request_options', {})
+        request_config = bravado.config.RequestConfig(
+            request_options, self.also_return_response)
+        request_params = context.build(context, request_options, op_kwargs)
+        return context.swagger_spec.http_client.request(
+            request_params,
+            operation=self.operation,
+            request_config=request_config,
+        )
+
+
+class _FastResourceDecorator(bravado.client.ResourceDecorator):
+    def __getattr__(self, name):
+        return _FastCallableOperation(getattr(self.resource, name),
+                                      self.also_return_response)
+
+
+'''
+
+_MODULE_FAST_REQUESTS_METHOD = '''\
+    def _get_resource(self, item):
+        decorator = super()._get_resource(item)
+        return _FastResourceDecorator(decorator.resource,
+                                      decorator.also_return_response)
+'''
+
+_MODULE_RESPONSE_CACHE = '''\
+class _CacheInfo:
+    \"\"\"Hit and miss statistics of the response cache of an operation.\"\"\"
+
+    __slots__ = ('hits', 'misses', 'maxsize', 'currsize')
+
+    def __init__(self, hits, misses, maxsize, currsize):
+        self.hits = hits
+        self.misses = misses
+        self.maxsize = maxsize
+        self.currsize = currsize
+
+    def __repr__(self):
+        return (f'_CacheInfo(hits={self.hits}, misses={self.misses}, '
+                f'maxsize={self.maxsize}, currsize={self.currsize})')
+
+
+class _OperationCache:
+    \"\"\"LRU cache of the results of an operation's calls.\"\"\"
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Map of cache keys to (expiry time, result, incoming response)
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Incremented when entries are invalidated, so that responses of
+        # calls made before are not cached
+        self.generation = 0
+
+
+class _ResponseCache:
+    \"\"\"Response caches of the operations of a client.\"\"\"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._caches = {}
+        self._operations = {}
+
+    def __contains__(self, name):
+        return name in self._caches
+
+    def configure(self, name, maxsize, ttl):
+        with self._lock:
+            self._caches[name] = _OperationCache(maxsize, ttl)
+
+    def get(self, operation, key):
+        \"\"\"
+        Look up the cached result of a call.
+
+        :return: Tuple of the cache entry, or None on a miss, and the
+            generation of the operation's cache.
+        \"\"\"
+        name = operation.operation_id
+        with self._lock:
+            self._operations[name] = operation
+            cache = self._caches.get(name)
+            if cache is None:
+                return None, None
+            entry = cache.entries.get(key)
+            if (entry is not None and entry[0] is not None
+                    and entry[0] <= time.monotonic()):
+                del cache.entries[key]
+                entry = None
+            if entry is None:
+                cache.misses += 1
+            else:
+                cache.hits += 1
+                cache.entries.move_to_end(key)
+            return entry, cache.generation
+
+    def put(self, name, key, generation, result, incoming_response):
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None or cache.generation != generation:
+                return
+            ttl = _response_ttl(incoming_response.headers, cache.ttl)
+            if cache.maxsize == 0 or (ttl is not None and ttl <= 0):
+                return
+            expires = None if ttl is None else time.monotonic() + ttl
+            cache.entries[key] = (expires, result, incoming_response)
+            cache.entries.move_to_end(key)
+            if cache.maxsize is not None:
+                while len(cache.entries) > cache.maxsize:
+                    cache.entries.popitem(last=False)
+
+    def invalidate(self, name, params):
+        with self._lock:
+            names = list(self._caches) if name is None else [name]
+            for name in names:
+                cache = self._caches.get(name)
+                if cache is None:
+                    continue
+                cache.generation += 1
+                if not params:
+                    cache.entries.clear()
+                elif name in self._operations:
+                    key = _cache_key(self._operations[name], params)
+                    cache.entries.pop(key, None)
+
+    def info(self, name):
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                raise ValueError(f"Response cache of {name} is not "
+                                 "configured")
+            return _CacheInfo(cache.hits, cache.misses, cache.maxsize,
+                              len(cache.entries))
+
+
+def _cache_key(operation, op_kwargs):
+    \"\"\"
+    Get the cache key of an operation call, or None if the call is not
+    cached.
+    \"\"\"
+    # Parameters are normalized as by bravado.client.construct_params(),
+    # where None is the same as a missing value.
+    params = operation.params
+    values = {}
+    for name, value in op_kwargs.items():
+        if name == '_request_options':
+            continue
+        key = params.determine_key(name)
+        if key not in params or key in values:
+            # Invalid calls are left to bravado to report
+            return None
+        if value is not None:
+            values[key] = value
+    for key, param in params.items():
+        if key not in values and param.has_default():
+            values[key] = param.default
+    headers = op_kwargs.get('_request_options', {}).get('headers', {})
+    try:
+        return json.dumps(
+            [values, {k.lower(): v for k, v in headers.items()}],
+            sort_keys=True, separators=(',', ':'), default=_key_default)
+    except (TypeError, ValueError):
+        return None
+
+
+def _key_default(value):
+    if isinstance(value, bravado_core.model.Model):
+        return value._as_dict()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f"Cannot use {type(value).__name__} in cache key")
+
+
+def _response_ttl(headers, ttl):
+    \"\"\"
+    Get the time in seconds for which to cache a response, from its
+    Cache-Control or Expires header and the configured time to live.
+    \"\"\"
+    headers = {k.lower(): v for k, v in headers.items()}
+    max_age = None
+    for directive in headers.get('cache-control', '').lower().split(','):
+        name, _, value = directive.strip().partition('=')
+        if name in ('no-store', 'no-cache'):
+            return 0
+        if name == 'max-age':
+            try:
+                max_age = int(value.strip('"'))
+            except ValueError:
+                return 0
+    if max_age is not None:
+        try:
+            max_age -= int(headers.get('age', 0))
+        except ValueError:
+            pass
+    elif 'expires' in headers:
+        try:
+            expires = email.utils.parsedate_to_datetime(headers['expires'])
+            if 'date' in headers:
+                now = email.utils.parsedate_to_datetime(
+                    headers['date']).timestamp()
+            else:
+                now = time.time()
+            max_age = expires.timestamp() - now
+        except (TypeError, ValueError):
+            # Invalid dates, such as '0', mean that the response is expired
+            return 0
+    if max_age is None:
+        return ttl
+    return max_age if ttl is None else min(ttl, max_age)
+
+
+class _CachedHttpFuture(bravado.http_future.HttpFuture):
+    \"\"\"
+    Future for an operation call answered from the response cache. Each
+    call returns a copy of the cached result, so that changes to it do not
+    affect later calls.
+    \"\"\"
+
+    def __init__(self, operation, request_config, result, incoming_response):
+        super().__init__(None, None, operation, request_config)
+        self._result = result
+        self._incoming_response = incoming_response
+
+    def cancel(self):
+        pass
+
+    def _get_incoming_response(self, timeout=None):
+        return self._incoming_response
+
+    def _get_swagger_result(self, incoming_response):
+        return copy.deepcopy(self._result)
+
+
+def _cache_future(future, cache, name, key, generation):
+    # Cache a copy of the result once the response is unmarshalled without
+    # errors, as the caller may change the result
+    get_swagger_result = future._get_swagger_result
+
+    def _get_swagger_result(incoming_response):
+        result = get_swagger_result(incoming_response)
+        cache.put(name, key, generation, copy.deepcopy(result),
+                  incoming_response)
+        return result
+
+    future._get_swagger_result = _get_swagger_result
+    return future
+
+
+'''
+
+_MODULE_CACHING_OPERATION = '''\
+    def __init__(self, operation, also_return_response, cache):
+        super().__init__(operation, also_return_response)
+        self._cache = cache
+
+    def __call__(self, **op_kwargs):
+        name = self.operation.operation_id
+        if name not in self._cache:
+            return super().__call__(**op_kwargs)
+        key = _cache_key(self.operation, op_kwargs)
+        if key is None:
+            return super().__call__(**op_kwargs)
+        entry, generation = self._cache.get(self.operation, key)
+        if entry is not None:
+            request_config = bravado.config.RequestConfig(
+                op_kwargs.get('_request_options', {}),
+                self.also_return_response)
+            return _CachedHttpFuture(self.operation, request_config,
+                                     entry[1], entry[2])
+        return _cache_future(super().__call__(**op_kwargs), self._cache,
+                             name, key, generation)
+
+
+class _CachingResourceDecorator(bravado.client.ResourceDecorator):
+    def __init__(self, resource, also_return_response, cache):
+        super().__init__(resource, also_return_response)
+        self._cache = cache
+
+    def __getattr__(self, name):
+        return _CachingCallableOperation(
+            getattr(self.resource, name), self.also_return_response,
+            self._cache)
+
+
+'''
+
+_MODULE_RESPONSE_CACHE_METHODS = '''\
+    def configure_cache(self, operation, maxsize=128, ttl=None):
+        \"\"\"
+        Cache the results of a GET operation. Reconfiguring the cache of an
+        operation discards its cached results.
+
+        :param operation: Name of the operation.
+        :param maxsize: Maximum number of cached results, or None for no
+            limit. The least recently used result is discarded first.
+        :param ttl: Time in seconds for which results are cached, or None
+            for no limit. Results are cached for less time, or not at all,
+            if the Cache-Control or Expires header of the response says so.
+
+        Calls answered from the cache return a copy of the cached result, so
+        results can be changed without affecting later calls.
+        \"\"\"
+        if operation not in _CACHEABLE_OPERATIONS:
+            raise ValueError(f"Cannot cache results of {operation}")
+        self._response_cache.configure(operation, maxsize, ttl)
+
+    def invalidate_cache(self, operation=None, **params):
+        \"\"\"
+        Discard cached results.
+
+        :param operation: Name of the operation whose results to discard.
+            Defaults to all operations.
+        :param params: Parameters of the call whose result to discard, as
+            passed to the operation. Defaults to all calls.
+        \"\"\"
+        self._response_cache.invalidate(operation, params)
+
+    def cache_info(self, operation):
+        \"\"\"Get hit and miss statistics of the cache of an operation.\"\"\"
+        return self._response_cache.info(operation)
+'''
+
+_MODULE_RESPONSE_CACHE_CLIENT = '''\
+    def __init__(self, swagger_spec, also_return_response=False):
+        super().__init__(swagger_spec, also_return_response)
+        self._response_cache = _ResponseCache()
+
+    def _get_resource(self, item):
+        decorator = super()._get_resource(item)
+        return _CachingResourceDecorator(
+            decorator.resource, decorator.also_return_response,
+            self._response_cache)
+
+'''
+
+_MODULE_INSTRUMENTATION = '''\
+class _OperationCall:
+    \"\"\"Timing and response information for an operation call.\"\"\"
+
+    __slots__ = ('operation', 'start_time', 'request_time', 'unmarshal_time',
+                 'status_code', 'response_size', 'exception')
+
+    def __init__(self, operation, start_time):
+        self.operation = operation
+        self.start_time = start_time
+        self.request_time = None
+        self.unmarshal_time = None
+        self.status_code = None
+        self.response_size = None
+        self.exception = None
+
+
+def _instrument_future(future, call, hooks):
+    # Wrap the methods which wait for and unmarshal the response, which are
+    # used by both HttpFuture.response() and HttpFuture.result().
+    get_incoming_response = future._get_incoming_response
+    get_swagger_result = future._get_swagger_result
+
+    def _get_incoming_response(timeout=None):
+        try:
+            incoming_response = get_incoming_response(timeout)
+        except BaseException as e:
+            call.request_time = time.monotonic() - call.start_time
+            call.exception = e
+            for hook in hooks:
+                hook(call)
+            raise
+        call.request_time = time.monotonic() - call.start_time
+        call.status_code = incoming_response.status_code
+        call.response_size = len(incoming_response.raw_bytes)
+        return incoming_response
+
+    def _get_swagger_result(incoming_response):
+        start_time = time.monotonic()
+        try:
+            return get_swagger_result(incoming_response)
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            call.unmarshal_time = time.monotonic() - start_time
+            for hook in hooks:
+                hook(call)
+
+    future._get_incoming_response = _get_incoming_response
+    future._get_swagger_result = _get_swagger_result
+    return future
+
+
+'''
+
+_MODULE_INSTRUMENTED_OPERATION_INIT = '''\
+    def __init__(self, operation, also_return_response, hooks):
+        super().__init__(operation, also_return_response)
+'''
+
+_MODULE_INSTRUMENTED_CACHING_OPERATION_INIT = '''\
+    def __init__(self, operation, also_return_response, hooks, cache):
+        super().__init__(operation, also_return_response, cache)
+'''
+
+_MODULE_INSTRUMENTED_OPERATION = '''\
+        self._hooks = hooks
+
+    def __call__(self, **op_kwargs):
+        if not self._hooks:
+            return super().__call__(**op_kwargs)
+        name = self.operation.operation_id
+        hooks = [hook for hook, operations in self._hooks
+                 if operations is None or name in operations]
+        if not hooks:
+            return super().__call__(**op_kwargs)
+        call = _OperationCall(name, time.monotonic())
+        return _instrument_future(super().__call__(**op_kwargs), call, hooks)
+
+
+class _InstrumentedResourceDecorator(bravado.client.ResourceDecorator):
+'''
+
+_MODULE_INSTRUMENTED_DECORATOR = '''\
+    def __init__(self, resource, also_return_response, hooks):
+        super().__init__(resource, also_return_response)
+        self._hooks = hooks
+
+    def __getattr__(self, name):
+        return _InstrumentedCallableOperation(
+            getattr(self.resource, name), self.also_return_response,
+            self._hooks)
+
+
+'''
+
+_MODULE_INSTRUMENTED_CACHING_DECORATOR = '''\
+    def __init__(self, resource, also_return_response, hooks, cache):
+        super().__init__(resource, also_return_response)
+        self._hooks = hooks
+        self._cache = cache
+
+    def __getattr__(self, name):
+        return _InstrumentedCallableOperation(
+            getattr(self.resource, name), self.also_return_response,
+            self._hooks, self._cache)
+
+
+'''
+
+_MODULE_INSTRUMENTATION_INIT = '''\
+    def __init__(self, swagger_spec, also_return_response=False):
+        super().__init__(swagger_spec, also_return_response)
+        self._operation_hooks = []
+'''
+
+_MODULE_INSTRUMENTATION_GET_RESOURCE = '''\
+
+    def _get_resource(self, item):
+        decorator = super()._get_resource(item)
+        return _InstrumentedResourceDecorator(
+            decorator.resource, decorator.also_return_response,
+'''
+
+_MODULE_INSTRUMENTATION_METHODS = '''\
+
+    def add_operation_hook(self, hook, operations=None):
+        \"\"\"
+        Register a function to call when operation calls complete.
+
+        :param hook: Function which accepts an _OperationCall object. It is
+            called in the thread which waits for the response, after the
+            response is unmarshalled or an exception is raised.
+        :param operations: Names of the operations to call the function for.
+            Defaults to all operations.
+        \"\"\"
+        self._operation_hooks.append(
+            (hook, None if operations is None else frozenset(operations)))
+
+    def remove_operation_hook(self, hook):
+        \"\"\"Unregister a function registered with add_operation_hook().\"\"\"
+        self._operation_hooks[:] = [
+            (h, operations) for h, operations in self._operation_hooks
+            if h != hook]
+'''
+
+_MODULE_BUILD_HELPER = '''\
+def _build_many(swagger_spec, model_name, rows, validate):
+    try:
+        props, required = _MODEL_PROPERTIES[model_name]
+    except KeyError:
+        raise ValueError(f"Unknown model: {model_name}") from None
+    mclass = swagger_spec.definitions[model_name]
+    model_spec = mclass._model_spec
+    # Same checks and property values, in the same order, as
+    # bravado_core.model.Model.__init__(), with the property names looked up
+    # once for all rows. Instances are initialized by setting the attribute
+    # dict of bravado-core's Model class directly.
+    properties = tuple(mclass._properties)
+    names = frozenset(properties)
+    include_missing = swagger_spec.config['include_missing_properties']
+    if model_spec.get('additionalProperties') is False:
+        known = frozenset(props)
+    else:
+        known = None
+    new = object.__new__
+    set_dict = object.__setattr__
+    models = []
+    for index, row in enumerate(rows):
+        keys = row.keys()
+        if not required <= keys:
+            raise ValueError(f"Row {index} of {model_name} is missing "
+                             f"properties: {sorted(required - keys)}")
+        if known is not None and not keys <= known:
+            raise ValueError(f"Row {index} of {model_name} has unknown "
+                             f"properties: {sorted(keys - known)}")
+        if include_missing:
+            values = {name: row.get(name) for name in properties}
+        else:
+            values = {name: row[name] for name in properties if name in row}
+        if not keys <= names:
+            # Additional properties follow the properties of the model
+            for name in keys - names:
+                values[name] = row[name]
+        model = new(mclass)
+        set_dict(model, '_Model__dict', values)
+        if validate:
+            bravado_core.validate.validate_object(
+                swagger_spec, model_spec, bravado_core.marshal.marshal_model(
+                    swagger_spec, model_spec, model))
+        models.append(model)
+    return models
+
+
+'''
+
+_MODULE_BUILD_METHOD = '''\
+    def build_many(self, model_name, rows, validate=False):
+        \"\"\"
+        Create instances of a model from dicts of property values.
+
+        Creates the same instances as calling the model type with each dict
+        as keyword arguments, and also checks for required properties.
+
+        :param model_name: Name of the model.
+        :param rows: Iterable of dicts of property values.
+        :param validate: Whether to validate each instance against the model
+            schema, which is much slower than creating the instances.
+        :return: List of model instances.
+        :raises ValueError: If a dict is missing required properties, or
+            has properties which the model does not define and its schema
+            does not allow additional properties.
+        :raises jsonschema.exceptions.ValidationError: If validate is True
+            and an instance is not valid.
+        \"\"\"
+        return _build_many(self.swagger_spec, model_name, rows, validate)
+'''
+
+# Static fragments of client_factory.py.mako and client_factory.pyi.mako
+
+_FACTORY_IMPORTS = '''\
+\"\"\"Factory for generated clients sharing a pooled HTTP client.\"\"\"
+
+import copy
+import socket
+
+import bravado.requests_client
+import requests.adapters
+import urllib3.connection
+
+'''
+
+_FACTORY_ALL = '''\
+__all__ = ['ClientFactory']
+
+_CLIENT_TYPES = (
+'''
+
+_FACTORY_BODY = '''\
+)
+
+
+class _HTTPAdapter(requests.adapters.HTTPAdapter):
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ['socket_options']
+
+    def __init__(self, socket_options, **kwargs):
+        # Set before HTTPAdapter.__init__() calls init_poolmanager()
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _socket_options(tcp_keepalive):
+    if tcp_keepalive is None:
+        return None
+    options = list(urllib3.connection.HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE is not available on all platforms
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE,
+                        max(1, int(tcp_keepalive))))
+    return options
+
+
+class ClientFactory:
+    \"\"\"Create generated clients which share a pooled HTTP client.\"\"\"
+
+    def __init__(self, pool_connections=10, pool_maxsize=10,
+                 pool_block=False, host_limits=None, keep_alive=True,
+                 tcp_keepalive=None, max_retries=0):
+        \"\"\"
+        :param pool_connections: Number of hosts for which to keep a
+            connection pool.
+        :param pool_maxsize: Maximum number of connections to keep open to
+            each host.
+        :param pool_block: If True, requests to a host whose connections are
+            all in use wait for a free connection. Otherwise a new connection
+            is opened and discarded after use.
+        :param host_limits: Mapping of hosts, e.g. 'api.example.com' or
+            'localhost:8080', to the maximum number of connections to keep
+            open to them, instead of pool_maxsize.
+        :param keep_alive: If False, connections are closed after each
+            request instead of being reused.
+        :param tcp_keepalive: Time in seconds after which idle connections
+            send TCP keep-alive probes. Defaults to the system setting.
+        :param max_retries: Number of retries for failed connections.
+        \"\"\"
+        self.http_client = bravado.requests_client.RequestsClient()
+        session = self.http_client.session
+        socket_options = _socket_options(tcp_keepalive)
+        adapter = _HTTPAdapter(
+            socket_options, pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize, max_retries=max_retries,
+            pool_block=pool_block)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for host, maxsize in (host_limits or {}).items():
+            adapter = _HTTPAdapter(
+                socket_options, pool_connections=1, pool_maxsize=maxsize,
+                max_retries=max_retries, pool_block=pool_block)
+            session.mount(f'http://{host}/', adapter)
+            session.mount(f'https://{host}/', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+
+    def create(self, client_type, spec_url, request_headers=None,
+               config=None):
+        \"\"\"
+        Create a client by loading its spec from a URL with the shared HTTP
+        client.
+
+        :param client_type: Generated client type.
+        \"\"\"
+        return client_type.from_url(spec_url, self._http_client(client_type),
+                                    request_headers, config)
+
+    def create_from_spec(self, client_type, spec_dict, origin_url=None,
+                         config=None):
+        \"\"\"
+        Create a client from a spec dict.
+
+        :param client_type: Generated client type.
+        \"\"\"
+        return client_type.from_spec(spec_dict, origin_url,
+                                     self._http_client(client_type), config)
+
+    def close(self):
+        \"\"\"Close the pooled connections.\"\"\"
+        self.http_client.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _http_client(self, client_type):
+        if not issubclass(client_type, _CLIENT_TYPES):
+            raise TypeError(f"Not a client type of this factory: "
+                            f"{client_type.__name__}")
+        # Each client gets a copy sharing the session and its connection
+        # pools, as from_url() modifies the HTTP client to send the request
+        # headers, and as authentication is set per HTTP client.
+        return copy.copy(self.http_client)
+'''
+
+_FACTORY_STUB_IMPORTS = '''\
+import typing
+
+import bravado.requests_client
+
+'''
+
+_FACTORY_STUB_ALL = '''\
+__all__ = ['ClientFactory']
+
+_C = typing.TypeVar('_C', bound=typing.Union[
+'''
+
+_FACTORY_STUB_BODY = '''\
+])
+
+class ClientFactory:
+    http_client: bravado.requests_client.RequestsClient
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 host_limits: typing.Mapping[str, int] = None,
+                 keep_alive: bool = True, tcp_keepalive: float = None,
+                 max_retries: int = 0) -> None: ...
+
+    def create(self, client_type: typing.Type[_C], spec_url: str,
+               request_headers: typing.Mapping = None,
+               config: typing.Mapping = None) -> _C: ...
+
+    def create_from_spec(self, client_type: typing.Type[_C],
+                         spec_dict: typing.Mapping[str, typing.Any],
+                         origin_url: str = None,
+                         config: typing.Mapping = None) -> _C: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> ClientFactory: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
+'''
+
+# Static fragments of module.pyi.mako and module_lazy.pyi.mako
+
+_STUB_IMPORTS = '''\
+import datetime
+import typing
+import typing_extensions
+
+import bravado.client
+import bravado.http_client
+import bravado.http_future
+import bravado.response
+import bravado_core.model
+import bravado_core.operation
+import bravado_core.resource
+import bravado_core.spec
+
+'''
+
+_STUB_CLIENT_INIT = '''\
+    def __init__(self, swagger_spec: bravado_core.spec.Spec,
+                 also_return_response: bool = False) -> None:
+'''
+
+_LAZY_CLIENT_INIT = '''\
+    def __init__(self, swagger_spec: bravado_core.spec.Spec,
+                 also_return_response: bool = False) -> None: ...
+'''
+
+_STUB_FROM_URL = '''\
+    @classmethod
+    def from_url(cls, spec_url: str,
+                 http_client: bravado.http_client.HttpClient = None,
+                 request_headers: typing.Mapping = None,
+                 config: typing.Mapping = None
+                ) -> {client_type}: ...
+'''
+
+_STUB_FROM_SPEC = '''\
+    @classmethod
+    def from_spec(cls, spec_dict: typing.Mapping[str, typing.Any],
+                  origin_url: str = None,
+                  http_client: bravado.http_client.HttpClient = None,
+                  config: typing.Mapping = None
+                 ) -> {client_type}: ...
+'''
+
+_STUB_FROM_CACHED_SPEC = '''\
+    @classmethod
+    def from_cached_spec(cls, cache_path: str, spec_url: str,
+                         http_client: bravado.http_client.HttpClient = None,
+                         request_headers: typing.Mapping = None,
+                         config: typing.Mapping = None
+                        ) -> {client_type}: ...
+'''
+
+_STUB_BATCH_METHOD = '''\
+    def batch(self, max_workers: int = None, timeout: float = None
+              ) -> _Batch: ...
+'''
+
+_STUB_BATCH = '''\
+_R = typing.TypeVar('_R')
+
+class _Batch:
+    def submit(self, future: bravado.http_future.HttpFuture[_R]
+               ) -> concurrent.futures.Future[_R]: ...
+
+    def submit_all(
+        self, futures: typing.Iterable[bravado.http_future.HttpFuture[_R]]
+    ) -> typing.List[concurrent.futures.Future[_R]]: ...
+
+    def shutdown(self, wait: bool = True) -> None: ...
+
+    def __enter__(self) -> _Batch: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
+
+'''
+
+_STUB_STREAM_METHOD = '''\
+    def stream(
+        self,
+        future: bravado.http_future.HttpFuture[typing.Union[
+            {array_type}, typing.Any]],
+        chunk_size: int = 65536,
+        timeout: float = None,
+    ) -> _ResponseStream[_S]: ...
+'''
+
+_STUB_STREAM = '''\
+_S = typing.TypeVar('_S')
+
+class _ResponseStream(typing.Iterator[_S]):
+    def __next__(self) -> _S: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> _ResponseStream[_S]: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
+
+'''
+
+_STUB_INSTRUMENTATION_METHODS = '''\
+    def add_operation_hook(
+        self, hook: typing.Callable[[_OperationCall], typing.Any],
+        operations: typing.Iterable[_OperationName] = None) -> None: ...
+
+    def remove_operation_hook(
+        self, hook: typing.Callable[[_OperationCall], typing.Any]
+    ) -> None: ...
+'''
+
+_STUB_RESPONSE_CACHE_METHODS = '''\
+    def configure_cache(self, operation: _CacheableOperationName,
+                        maxsize: typing.Optional[int] = 128,
+                        ttl: float = None) -> None: ...
+
+    def invalidate_cache(self, operation: _CacheableOperationName = None,
+                         **params: typing.Any) -> None: ...
+
+    def cache_info(self, operation: _CacheableOperationName
+                   ) -> _CacheInfo: ...
+'''
+
+_STUB_CACHE_INFO = '''\
+class _CacheInfo:
+    hits: int
+    misses: int
+    maxsize: typing.Optional[int]
+    currsize: int
+
+'''
+
+_STUB_NO_MODEL_BUILD_METHOD = '''\
+    def build_many(
+        self, model_name: typing.NoReturn,
+        rows: typing.Iterable[typing.Mapping[str, typing.Any]],
+        validate: bool = False,
+    ) -> typing.List[typing.NoReturn]: ...
+'''
+
+_LAZY_BUILD_METHOD = '''\
+    def build_many(
+        self, model_name: str,
+        rows: typing.Iterable[typing.Mapping[str, typing.Any]],
+        validate: bool = False,
+    ) -> typing.List[bravado_core.model.Model]: ...
+'''
+
+_STUB_OPERATION_CALL = '''\
+class _OperationCall:
+    operation: _OperationName
+    start_time: float
+    request_time: typing.Optional[float]
+    unmarshal_time: typing.Optional[float]
+    status_code: typing.Optional[int]
+    response_size: typing.Optional[int]
+    exception: typing.Optional[BaseException]
+
+'''
+
+_STUB_RESOURCE_BASE = '''\
+    @typing.no_type_check
+    def __getattr__(self, attr): ...
+
+class _Resource(bravado_core.resource.Resource):
+    @typing.no_type_check
+    def __getattr__(self, attr): ...
+
+'''
+
+_STUB_ASYNC_FUTURE = '''\
+_T = typing.TypeVar('_T')
+
+class _AsyncHttpFuture(typing.Generic[_T]):
+    def response(
+        self,
+        timeout: float = None,
+        fallback_result: typing.Union[
+            _T, typing.Callable[[BaseException], _T]] = ...,
+        exceptions_to_catch: typing.Tuple[
+            typing.Type[BaseException], ...] = ...,
+    ) -> typing.Awaitable[bravado.response.BravadoResponse[_T]]: ...
+
+    def result(self, timeout: float = None) -> typing.Awaitable[_T]: ...
+
+    def cancel(self) -> None: ...
+
+'''
+
+_STUB_MODEL_BASE = '''\
+class _Model(bravado_core.model.Model):
+    @typing.no_type_check
+    def __getattr__(self, attr): ...
+
+    @typing.no_type_check
+    def __setattr__(self, attr, value): ...
+
+    @typing.no_type_check
+    def __delattr__(self, attr, value): ...
+
+'''
+
+_COMMON_STUB_IMPORTS = '''\
+import datetime
+import typing
+
+import bravado_core.model
+
+'''
+
+_LAZY_BASES = '''\
+_N = typing.TypeVar('_N', bound=str)
+
+class _LazyClient(bravado.client.SwaggerClient):
+    def get_model(self, model_name: str
+                  ) -> typing.Type[bravado_core.model.Model]: ...
+
+    def __getattr__(self, attr: str) -> typing.Any: ...
+
+'''
+
+_LAZY_OPERATION_BASES = '''\
+class _LazyResource(bravado_core.resource.Resource, typing.Generic[_N]):
+    def __getattr__(self, attr: str) -> typing.Any: ...
+
+class _LazyOperation(bravado_core.operation.Operation, typing.Generic[_N]):
+    def __call__(self, **kwargs: typing.Any) -> typing.Any: ...
+
+'''
+
+_LAZY_MODEL_BASE = '''\
+class _LazyModel(bravado_core.model.Model, typing.Generic[_N]):
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None: ...
+
+    def __getattr__(self, attr: str) -> typing.Any: ...
+
+    @typing.no_type_check
+    def __setattr__(self, attr, value): ...
+
+    @typing.no_type_check
+    def __delattr__(self, attr, value): ...
+
+'''
+
+
+def emit_module(f: TextIO, metadata: Metadata, spec: SpecInfo,
+                config: Config) -> None:
+    """Write the module file, as rendered by module.py.mako."""
+    write = f.write
+    _emit_header(write, metadata)
+    write(f'"""{config.name} types."""\n')
+    _emit_module_imports(write, config)
+    _emit_all(write, spec, config)
+    write(_MODULE_PLACEHOLDERS)
+    if config.lazy_client:
+        write(_MODULE_LAZY_CLIENT)
+        client_base = '_LazySwaggerClient'
+    else:
+        client_base = 'SwaggerClient'
+    if config.spec_cache:
+        write(f'_SPEC_FINGERPRINT = {metadata.schema_fingerprint!r}\n\n\n')
+        write(_MODULE_SPEC_FINGERPRINT)
+        write(_MODULE_SPEC_CACHE)
+    if config.batch_helper:
+        write(_MODULE_BATCH)
+    if config.stream_helper:
+        write(_MODULE_STREAMING)
+    if config.fast_requests:
+        _emit_request_builders(write, spec)
+    callable_base = ('_FastCallableOperation' if config.fast_requests
+                     else 'bravado.client.CallableOperation')
+    if config.response_cache:
+        _emit_response_cache(write, spec, callable_base)
+        callable_base = '_CachingCallableOperation'
+    if config.instrumentation:
+        write(_MODULE_INSTRUMENTATION)
+        write(f'class _InstrumentedCallableOperation({callable_base}):\n')
+        if config.response_cache:
+            write(_MODULE_INSTRUMENTED_CACHING_OPERATION_INIT)
+        else:
+            write(_MODULE_INSTRUMENTED_OPERATION_INIT)
+        write(_MODULE_INSTRUMENTED_OPERATION)
+        if config.response_cache:
+            write(_MODULE_INSTRUMENTED_CACHING_DECORATOR)
+        else:
+            write(_MODULE_INSTRUMENTED_DECORATOR)
+    if config.build_helper:
+        _emit_model_properties(write, spec)
+        write(_MODULE_BUILD_HELPER)
+    write(f'class {config.client_type}({client_base}):\n')
+    if config.async_client:
+        write(_MODULE_ASYNC_CLIENT_BODY)
+    if config.spec_cache:
+        if config.async_client:
+            write('\n')
+        write(_MODULE_FROM_CACHED_SPEC)
+        if config.async_client:
+            write(_MODULE_FROM_CACHED_SPEC_ASYNC_HTTP_CLIENT)
+        else:
+            write(_MODULE_FROM_CACHED_SPEC_HTTP_CLIENT)
+        write(_MODULE_FROM_CACHED_SPEC_RETURN)
+    if config.batch_helper:
+        if config.spec_cache:
+            write('\n')
+        write(_MODULE_BATCH_METHOD)
+    if config.stream_helper:
+        if config.spec_cache or config.batch_helper:
+            write('\n')
+        write(_MODULE_STREAM_METHOD)
+    if config.instrumentation:
+        if config.spec_cache or config.batch_helper or config.stream_helper:
+            write('\n')
+        write(_MODULE_INSTRUMENTATION_INIT)
+        if config.response_cache:
+            write('        self._response_cache = _ResponseCache()\n')
+        write(_MODULE_INSTRUMENTATION_GET_RESOURCE)
+        if config.response_cache:
+            write('            self._operation_hooks, self._response_cache)\n')
+        else:
+            write('            self._operation_hooks)\n')
+        write(_MODULE_INSTRUMENTATION_METHODS)
+    if config.response_cache:
+        if (config.spec_cache or config.batch_helper or config.stream_helper
+                or config.instrumentation):
+            write('\n')
+        if not config.instrumentation:
+            write(_MODULE_RESPONSE_CACHE_CLIENT)
+        write(_MODULE_RESPONSE_CACHE_METHODS)
+    if (config.fast_requests and not config.instrumentation
+            and not config.response_cache):
+        if (config.async_client or config.spec_cache or config.batch_helper
+                or config.stream_helper):
+            write('\n')
+        write(_MODULE_FAST_REQUESTS_METHOD)
+    has_methods = (config.async_client or config.spec_cache
+                   or config.batch_helper or config.stream_helper
+                   or config.instrumentation or config.response_cache
+                   or config.fast_requests)
+    if config.build_helper:
+        if has_methods:
+            write('\n')
+        write(_MODULE_BUILD_METHOD)
+    if not (has_methods or config.build_helper):
+        write('    pass\n')
+
+    write('\n# Resource types\n\n')
+    for resource in spec.resources:
+        write(f'{config.resource_type(resource.name)} = _PLACEHOLDER\n')
+    write('\n# Operation types\n\n')
+    for operation in spec.operations:
+        write(f'{config.operation_type(operation.name)} = _PLACEHOLDER\n')
+    write('\n# Model types\n\n')
+    for model in spec.models:
+        write(f'{config.model_type(model.name)} = _PLACEHOLDER\n')
+
+
+def emit_stub(f: TextIO, metadata: Metadata, spec: SpecInfo,
+              config: Config, types: Dict[TypeInfo, str],
+              shared: SharedModels = None) -> None:
+    """Write the stub file, as rendered by module.pyi.mako."""
+    write = f.write
+    _emit_header(write, metadata)
+    if config.batch_helper:
+        write('import concurrent.futures\n')
+    write(_STUB_IMPORTS)
+    _emit_custom_format_imports(write, config)
+    if shared and shared.names:
+        write('# Models shared with other schemas\n'
+              f'from {shared.module} import (\n')
+        for model in spec.models:
+            if model.name in shared.names:
+                model_type = config.model_type(model.name)
+                write(f'    {model_type} as {model_type},\n')
+        write(')\n\n')
+    _emit_all(write, spec, config)
+
+    client_type = config.client_type
+    write(f'\nclass {client_type}(bravado.client.SwaggerClient):\n')
+    write(_STUB_CLIENT_INIT)
+    for resource in spec.resources:
+        write(f'        self.{resource.name}: '
+              f'{config.resource_type(resource.name)}\n')
+    write('        self.swagger_spec = swagger_spec\n\n')
+    write(_STUB_FROM_URL.format(client_type=client_type))
+    write('\n')
+    write(_STUB_FROM_SPEC.format(client_type=client_type))
+    write('\n')
+    if config.spec_cache:
+        write(_STUB_FROM_CACHED_SPEC.format(client_type=client_type))
+        write('\n')
+    if config.batch_helper:
+        write(_STUB_BATCH_METHOD)
+        write('\n')
+    if config.stream_helper:
+        write(_STUB_STREAM_METHOD.format(
+            array_type=config.array_type_template.format('_S')))
+        write('\n')
+    if config.instrumentation:
+        write(_STUB_INSTRUMENTATION_METHODS)
+        write('\n')
+    if config.response_cache:
+        write(_STUB_RESPONSE_CACHE_METHODS)
+        write('\n')
+    if config.build_helper:
+        _emit_build_many(write, spec, config)
+    if spec.models:
+        _emit_get_model(write, spec, config)
+    write(_STUB_RESOURCE_BASE)
+    if config.batch_helper:
+        write(_STUB_BATCH)
+    if config.stream_helper:
+        write(_STUB_STREAM)
+    if config.instrumentation:
+        _emit_operation_call(write, spec)
+    if config.response_cache:
+        _emit_cache_info(write, spec)
+    if config.build_helper:
+        for model in spec.models:
+            _emit_row(write, model, config, types)
+
+    for resource in spec.resources:
+        _emit_resource(write, resource, config)
+
+    write('_Operation = bravado_core.operation.Operation\n\n')
+    if config.async_client:
+        write(_STUB_ASYNC_FUTURE)
+    for operation in spec.operations:
+        _emit_operation(write, operation, config, types)
+
+    _emit_models(write, [model for model in spec.models
+                         if not (shared and model.name in shared.names)],
+                 config, types)
+
+
+def stub_elements(spec: SpecInfo, config: Config, types: Dict[TypeInfo, str]
+                  ) -> Iterator[Tuple[str, str, str]]:
+    """
+    Render the parts of the stub file for each element of a spec separately.
+
+    :return: Iterator of (kind, name, text) tuples, where kind is one of
+        'get_model', 'resource', 'operation' or 'model'.
+    """
+    if spec.models:
+        buf = io.StringIO()
+        _emit_get_model(buf.write, spec, config)
+        yield 'get_model', 'get_model', buf.getvalue()
+    for resource in spec.resources:
+        buf = io.StringIO()
+        _emit_resource(buf.write, resource, config)
+        yield 'resource', resource.name, buf.getvalue()
+    for operation in spec.operations:
+        buf = io.StringIO()
+        _emit_operation(buf.write, operation, config, types)
+        yield 'operation', operation.name, buf.getvalue()
+    for model in spec.models:
+        buf = io.StringIO()
+        _emit_model(buf.write, model, config, types)
+        yield 'model', model.name, buf.getvalue()
+
+
+def emit_common_stub(f: TextIO, metadata: Metadata, models: List[ModelInfo],
+                     config: Config, types: Dict[TypeInfo, str],
+                     schemas: Sequence[str]) -> None:
+    """Write the common stub file, as rendered by common.pyi.mako."""
+    write = f.write
+    write(f'# Generated by bravado-types {metadata.bravado_types_version}\n'
+          f'# Timestamp: {metadata.timestamp}\n'
+          f'# Models shared by schemas: {", ".join(schemas)}\n'
+          f'# Bravado version: {metadata.bravado_version}\n'
+          f'# Bravado-core version: {metadata.bravado_core_version}\n')
+    write(_COMMON_STUB_IMPORTS)
+    _emit_custom_format_imports(write, config)
+    write('__all__ = [\n')
+    for model in models:
+        write(f'    {config.model_type(model.name)!r},\n')
+    write(']\n\n')
+    _emit_models(write, models, config, types)
+
+
+def emit_client_factory(f: TextIO, clients: Sequence[Tuple[str, str]],
+                        bravado_types_version: str, bravado_version: str,
+                        timestamp: datetime) -> None:
+    """
+    Write the client factory module, as rendered by client_factory.py.mako.
+    """
+    write = f.write
+    _emit_factory_header(write, clients, bravado_types_version,
+                         bravado_version, timestamp)
+    write(_FACTORY_IMPORTS)
+    _emit_factory_imports(write, clients)
+    write(_FACTORY_ALL)
+    for module, client_type in clients:
+        write(f'    {module}.{client_type},\n')
+    write(_FACTORY_BODY)
+
+
+def emit_client_factory_stub(f: TextIO, clients: Sequence[Tuple[str, str]],
+                             bravado_types_version: str, bravado_version: str,
+                             timestamp: datetime) -> None:
+    """
+    Write the client factory stub file, as rendered by
+    client_factory.pyi.mako.
+    """
+    write = f.write
+    _emit_factory_header(write, clients, bravado_types_version,
+                         bravado_version, timestamp)
+    write(_FACTORY_STUB_IMPORTS)
+    _emit_factory_imports(write, clients)
+    write(_FACTORY_STUB_ALL)
+    for module, client_type in clients:
+        write(f'    {module}.{client_type},\n')
+    write(_FACTORY_STUB_BODY)
+
+
+def _emit_factory_header(write: Callable[[str], object],
+                         clients: Sequence[Tuple[str, str]],
+                         bravado_types_version: str, bravado_version: str,
+                         timestamp: datetime) -> None:
+    client_types = ', '.join(f'{module}.{client_type}'
+                             for module, client_type in clients)
+    write(f'# Generated by bravado-types {bravado_types_version}\n'
+          f'# Timestamp: {timestamp}\n'
+          f'# Client types: {client_types}\n'
+          f'# Bravado version: {bravado_version}\n')
+
+
+def _emit_factory_imports(write: Callable[[str], object],
+                          clients: Sequence[Tuple[str, str]]) -> None:
+    for module in sorted({module for module, _ in clients}):
+        write(f'import {module}\n')
+    write('\n')
+
+
+def emit_lazy_stub(f: TextIO, metadata: Metadata, spec: SpecInfo,
+                   config: Config, index_digest: str) -> None:
+    """Write the compact stub file, as rendered by module_lazy.pyi.mako."""
+    write = f.write
+    _emit_header(write, metadata)
+    write('# Compact stub for use with the bravado_types.mypy_plugin MyPy '
+          'plugin. Type\n'
+          '# information is read from the type index file '
+          f'{os.path.basename(config.index_path)}.\n')
+    if config.batch_helper:
+        write('import concurrent.futures\n')
+    write(_STUB_IMPORTS)
+    _emit_custom_format_imports(write, config)
+    _emit_all(write, spec, config)
+    write('\n_TYPE_INDEX_DIGEST: typing_extensions.Final = '
+          f'{index_digest!r}\n\n')
+    write(_LAZY_BASES)
+
+    client_type = config.client_type
+    write(f'class {client_type}(_LazyClient):\n')
+    write(_LAZY_CLIENT_INIT)
+    write('\n')
+    write(_STUB_FROM_URL.format(client_type=client_type))
+    write('\n')
+    write(_STUB_FROM_SPEC.format(client_type=client_type))
+    write('\n')
+    if config.spec_cache:
+        write(_STUB_FROM_CACHED_SPEC.format(client_type=client_type))
+        write('\n')
+    if config.batch_helper:
+        write(_STUB_BATCH_METHOD)
+        write('\n')
+    if config.stream_helper:
+        write(_STUB_STREAM_METHOD.format(
+            array_type=config.array_type_template.format('_S')))
+        write('\n')
+    if config.instrumentation:
+        write(_STUB_INSTRUMENTATION_METHODS)
+        write('\n')
+    if config.response_cache:
+        write(_STUB_RESPONSE_CACHE_METHODS)
+        write('\n')
+    if config.build_helper:
+        write(_LAZY_BUILD_METHOD)
+        write('\n')
+    if config.batch_helper:
+        write(_STUB_BATCH)
+    if config.stream_helper:
+        write(_STUB_STREAM)
+    if config.instrumentation:
+        _emit_operation_call(write, spec)
+    if config.response_cache:
+        _emit_cache_info(write, spec)
+    write(_LAZY_OPERATION_BASES)
+    if config.async_client:
+        write(_STUB_ASYNC_FUTURE)
+    write(_LAZY_MODEL_BASE)
+
+    for resource in spec.resources:
+        write(f'{config.resource_type(resource.name)} = '
+              f'_LazyResource[typing_extensions.Literal[{resource.name!r}]]\n')
+    for operation in spec.operations:
+        write(f'{config.operation_type(operation.name)} = _LazyOperation['
+              f'typing_extensions.Literal[{operation.name!r}]]\n')
+    for model in spec.models:
+        write(f'{config.model_type(model.name)} = '
+              f'_LazyModel[typing_extensions.Literal[{model.name!r}]]\n')
+
+
+def _emit_module_imports(write: Callable[[str], object],
+                         config: Config) -> None:
+    stdlib = {'sys'}
+    modules = set()
+    if config.batch_helper:
+        stdlib.add('concurrent.futures')
+    if config.spec_cache:
+        stdlib |= {'hashlib', 'json', 'os', 'pickle', 'tempfile', 'warnings'}
+    if config.instrumentation:
+        stdlib.add('time')
+        modules.add('bravado.client')
+    if config.fast_requests:
+        stdlib |= {'hashlib', 'json', 'logging', 'urllib.parse', 'warnings',
+                   'weakref'}
+        modules |= {'bravado.client', 'bravado.config', 'bravado.warning',
+                    'bravado_core.exception', 'bravado_core.marshal',
+                    'bravado_core.param', 'bravado_core.validate',
+                    'simplejson'}
+    if config.lazy_client:
+        modules |= {'bravado.config', 'bravado_core.operation',
+                    'bravado_core.resource', 'bravado_core.util'}
+    if config.stream_helper:
+        stdlib |= {'codecs', 'json', 're'}
+        modules |= {'bravado.http_future', 'bravado.requests_client',
+                    'bravado_core.exception', 'bravado_core.response',
+                    'bravado_core.unmarshal', 'bravado_core.validate'}
+    if config.response_cache:
+        stdlib |= {'collections', 'copy', 'datetime', 'email.utils', 'json',
+                   'threading', 'time'}
+        modules |= {'bravado.client', 'bravado.config', 'bravado.http_future',
+                    'bravado_core.model'}
+    if config.build_helper:
+        modules |= {'bravado_core.marshal', 'bravado_core.validate'}
+    if config.lazy_client or config.spec_cache:
+        modules |= {'bravado.requests_client', 'bravado_core.spec'}
+    write('\n')
+    for name in sorted(stdlib):
+        write(f'import {name}\n')
+    write('\n')
+    for name in sorted(modules):
+        write(f'import {name}\n')
+    if config.spec_cache and not config.async_client:
+        write('from bravado.client import SwaggerClient, '
+              'inject_headers_for_remote_refs\n')
+    else:
+        write('from bravado.client import SwaggerClient\n')
+    if config.async_client:
+        write(_MODULE_ASYNC_IMPORTS)
+    write('\n')
+
+
+def _emit_request_builders(write: Callable[[str], object],
+                           spec: SpecInfo) -> None:
+    write(_MODULE_FAST_REQUESTS)
+    for operation in spec.operations:
+        write(f'def _build_{operation.name}(context, request_options, '
+              'op_kwargs):\n')
+        for line in request_builder_body(operation):
+            write(f'    {line}\n')
+        write('\n\n')
+    write('_REQUEST_BUILDERS = {\n')
+    for operation in spec.operations:
+        write(f'    {operation.name!r}: (\n'
+              f'        _build_{operation.name}, '
+              f'{request_signature(operation)!r}),\n')
+    write('}\n\n\n')
+    write(_MODULE_FAST_OPERATION)
+
+
+def _emit_response_cache(write: Callable[[str], object], spec: SpecInfo,
+                         callable_base: str) -> None:
+    write('_CACHEABLE_OPERATIONS = frozenset([\n')
+    for operation in spec.operations:
+        if operation.http_method == 'get':
+            write(f'    {operation.name!r},\n')
+    write('])\n\n')
+    write(_MODULE_RESPONSE_CACHE)
+    write(f'class _CachingCallableOperation({callable_base}):\n')
+    write(_MODULE_CACHING_OPERATION)
+
+
+def _emit_cache_info(write: Callable[[str], object], spec: SpecInfo) -> None:
+    operations = [operation for operation in spec.operations
+                  if operation.http_method == 'get']
+    if operations:
+        write('_CacheableOperationName = typing_extensions.Literal[\n')
+        for operation in operations:
+            write(f'    {operation.name!r},\n')
+        write(']\n')
+    else:
+        write('_CacheableOperationName = typing.NoReturn\n')
+    write('\n')
+    write(_STUB_CACHE_INFO)
+
+
+def _emit_model_properties(write: Callable[[str], object],
+                           spec: SpecInfo) -> None:
+    write('# Names of the properties and of the required properties of each '
+          'model\n'
+          '_MODEL_PROPERTIES = {\n')
+    for model in spec.models:
+        required = [prop.name for prop in model.props if prop.required]
+        write(f'    {model.name!r}: (\n'
+              f'        {tuple(prop.name for prop in model.props)!r},\n'
+              f'        frozenset({repr(required) if required else ""}),\n'
+              '    ),\n')
+    write('}\n\n\n')
+
+
+def _emit_build_many(write: Callable[[str], object], spec: SpecInfo,
+                     config: Config) -> None:
+    """Write the build_many() overloads of the client type."""
+    for model in spec.models:
+        model_type = config.model_type(model.name)
+        if len(spec.models) > 1:
+            write('    @typing.overload\n')
+        write('    def build_many(\n'
+              '        self, model_name: '
+              f'typing_extensions.Literal[{model.name!r}],\n'
+              f'        rows: typing.Iterable[_{model_type}Row],\n'
+              '        validate: bool = False,\n'
+              f'    ) -> typing.List[{model_type}]: ...\n')
+    if not spec.models:
+        write(_STUB_NO_MODEL_BUILD_METHOD)
+    write('\n')
+
+
+def _emit_row(write: Callable[[str], object], model: ModelInfo,
+              config: Config, types: Dict[TypeInfo, str]) -> None:
+    """Write the TypedDict of the property values of a model."""
+    model_type = config.model_type(model.name)
+    row_type = f'_{model_type}Row'
+    mixed = (any(prop.required for prop in model.props)
+             and not all(prop.required for prop in model.props))
+    if mixed:
+        write(f'class _{model_type}RequiredRow('
+              'typing_extensions.TypedDict):\n')
+        for prop in model.props:
+            if prop.required:
+                write(f'    {prop.name}: {types[prop.type]}\n')
+        write(f'\nclass {row_type}(_{model_type}RequiredRow, total=False):\n')
+    elif model.props and model.props[0].required:
+        write(f'class {row_type}(typing_extensions.TypedDict):\n')
+    else:
+        write(f'class {row_type}(typing_extensions.TypedDict, total=False):\n')
+    for prop in model.props:
+        if not prop.required:
+            write(f'    {prop.name}: typing.Optional[{types[prop.type]}]\n')
+        elif not mixed:
+            write(f'    {prop.name}: {types[prop.type]}\n')
+    if not model.props:
+        write('    ...\n')
+    write('\n')
+
+
+def _emit_operation_call(write: Callable[[str], object],
+                         spec: SpecInfo) -> None:
+    if spec.operations:
+        write('_OperationName = typing_extensions.Literal[\n')
+        for operation in spec.operations:
+            write(f'    {operation.name!r},\n')
+        write(']\n')
+    else:
+        write('_OperationName = typing.NoReturn\n')
+    write('\n')
+    write(_STUB_OPERATION_CALL)
+
+
+def _emit_models(write: Callable[[str], object], models: List[ModelInfo],
+                 config: Config, types: Dict[TypeInfo, str]) -> None:
+    """Write the model types, as rendered by models.mako."""
+    write(_STUB_MODEL_BASE)
+    last = len(models) - 1
+    for i, model in enumerate(models):
+        _emit_model(write, model, config, types)
+        if i != last:
+            write('\n')
+
+
+def _emit_get_model(write: Callable[[str], object], spec: SpecInfo,
+                    config: Config) -> None:
+    """Write the get_model() overloads of the client type."""
+    for model in spec.models:
+        write('    @typing.overload\n'
+              '    def get_model(self, model_name: '
+              f'typing_extensions.Literal[{model.name!r}]) -> '
+              f'typing.Type[{config.model_type(model.name)}]: ...\n')
+    write('    @typing.overload\n'
+          '    def get_model(self, model_name: str) -> typing.Union[\n')
+    for model in spec.models:
+        write(f'        typing.Type[{config.model_type(model.name)}],\n')
+    write('    ]: ...\n\n')
+
+
+def _emit_resource(write: Callable[[str], object], resource: ResourceInfo,
+                   config: Config) -> None:
+    write(f'class {config.resource_type(resource.name)}(_Resource):\n')
+    for operation in resource.operations:
+        write(f'    {operation.name}: '
+              f'{config.operation_type(operation.name)}\n')
+    write('\n')
+
+
+def _emit_operation(write: Callable[[str], object], operation: OperationInfo,
+                    config: Config, types: Dict[TypeInfo, str]) -> None:
+    if config.async_client:
+        future_type = '_AsyncHttpFuture'
+    else:
+        future_type = 'bravado.http_future.HttpFuture'
+    write(f'class {config.operation_type(operation.name)}(_Operation):\n'
+          '    def __call__(\n'
+          '        self,\n'
+          '        *,\n')
+    for param in operation.params:
+        if param.required:
+            write(f'        {param.name}: {types[param.type]},\n')
+        else:
+            write(f'        {param.name}: {types[param.type]} = None,\n')
+    write('        _request_options: typing.Mapping[str, typing.Any] '
+          '= None,\n'
+          f'    ) -> {future_type}[\n')
+    _emit_result_type(write, operation, config, types)
+    write('    ]: ...\n\n')
+
+
+def _emit_model(write: Callable[[str], object], model: ModelInfo,
+                config: Config, types: Dict[TypeInfo, str]) -> None:
+    model_type = config.model_type(model.name)
+    if config.model_inheritance:
+        write(f'class {model_type}(\n')
+        for parent in model.parents:
+            write(f'    {config.model_type(parent)},\n')
+        write('    _Model\n):\n')
+    else:
+        write(f'class {model_type}(_Model):\n')
+    write('    def __init__(\n'
+          '        self,\n')
+    if model.props:
+        write('        *,\n')
+    for prop in model.props:
+        if prop.required:
+            write(f'        {prop.name}: {types[prop.type]},\n')
+        else:
+            write(f'        {prop.name}: {types[prop.type]} = None,\n')
+    write('    ) -> None:\n')
+    if not model.props:
+        write('        ...\n')
+    for prop in model.props:
+        write(f'        self.{prop.name} = {prop.name}\n')
+
+
+def _emit_header(write: Callable[[str], object], metadata: Metadata) -> None:
+    """Write the header comment, as rendered by header.mako."""
+    write(f'# Generated by bravado-types {metadata.bravado_types_version}\n'
+          f'# Timestamp: {metadata.timestamp}\n')
+    if metadata.cli_args is not None:
+        write(f'# CLI args: {metadata.quoted_cli_args}\n')
+    write(f'# Schema version: {metadata.schema_version}\n')
+    if metadata.schema_origin_url:
+        write(f'# Schema origin url: {metadata.schema_origin_url}\n')
+    write(f'# Bravado version: {metadata.bravado_version}\n'
+          f'# Bravado-core version: {metadata.bravado_core_version}\n')
+
+
+def _emit_custom_format_imports(write: Callable[[str], object],
+                                config: Config) -> None:
+    if config.custom_formats and config.custom_formats.packages:
+        write('# Imports for custom formats\n')
+        for pkg in config.custom_formats.packages:
+            write(f'import {pkg}\n')
+        write('\n')
+
+
+def _emit_all(write: Callable[[str], object], spec: SpecInfo,
+              config: Config) -> None:
+    write(f'__all__ = [\n    {config.client_type!r},\n')
+    for resource in spec.resources:
+        write(f'    {config.resource_type(resource.name)!r},\n')
+    for operation in spec.operations:
+        write(f'    {config.operation_type(operation.name)!r},\n')
+    for model in spec.models:
+        write(f'    {config.model_type(model.name)!r},\n')
+    write(']\n')
+
+
+def _emit_result_type(write: Callable[[str], object],
+                      operation: OperationInfo, config: Config,
+                      types: Dict[TypeInfo, str]) -> None:
+    if config.response_types == 'success':
+        if any(response.success for response in operation.responses):
+            write('        typing.Union[\n')
+            for response in operation.responses:
+                if response.success:
+                    write(f'                {types[response.type]},  '
+                          f'# {response.status}\n')
+            write('        ]\n')
+        else:
+            write('        None  # No documented 2xx responses\n')
+    elif config.response_types == 'all':
+        write('        typing.Union[\n')
+        for response in operation.responses:
+            write(f'            {types[response.type]},  '
+                  f'# {response.status}\n')
+        write('        ]\n')
+    else:
+        write('        typing.Any\n')
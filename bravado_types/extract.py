@@ -1,6 +1,6 @@
 """Functions to extract typing metadata from a bravado-core spec."""
 
-from typing import Dict, List, Set, Tuple, Type
+from typing import Any, Dict, List, Tuple, Type
 
 from bravado_core.model import Model
 from bravado_core.operation import Operation
@@ -12,6 +12,7 @@ from bravado_types.config import Config
 from bravado_types.data_model import (ModelInfo, OperationInfo, ParameterInfo,
                                       PropertyInfo, ResourceInfo, ResponseInfo,
                                       SpecInfo)
+from bravado_types.inheritance import InheritanceGraph
 from bravado_types.types import get_type_info, get_response_type_info
 
 
@@ -23,44 +24,31 @@ def get_spec_info(spec: Spec, config: Config) -> SpecInfo:
 
 
 def _get_model_infos(spec: Spec, config: Config) -> List[ModelInfo]:
-    """Extract model type information for a given spec object."""
+    """
+    Extract model type information for a given spec object. Models are
+    ordered so that each model comes after the models it inherits from.
+    """
+    graph = InheritanceGraph(spec)
     return [
-        _get_model_info(spec, name, mclass, config)
-        for name, mclass in sorted(spec.definitions.items())
+        _get_model_info(spec, name, spec.definitions[name], graph, config)
+        for name in graph.topological_order()
     ]
 
 
-def _get_model_info(spec: Spec, name: str, mclass: Type[Model], config: Config
-                    ) -> ModelInfo:
+def _get_model_info(spec: Spec, name: str, mclass: Type[Model],
+                    graph: InheritanceGraph, config: Config) -> ModelInfo:
     """Extract type information for a given model class."""
-    required_props = _get_required_props(spec, mclass)
+    required_props = graph.required(name)
     return ModelInfo(
-        mclass, name, mclass._inherits_from,
+        mclass, name, graph.parents(name),
         [
             PropertyInfo(pname, get_type_info(spec, pschema, config),
                          required=pname in required_props)
-            for pname, pschema in sorted(mclass._properties.items())
+            for pname, pschema in sorted(graph.properties(name).items())
         ],
     )
 
 
-def _get_required_props(spec: Spec, mclass: Type[Model]) -> Set[str]:
-    mschema = spec.deref(mclass._model_spec)
-    required: Set[str] = set()
-    seen: Set[str] = set()
-    fringe = [mschema]
-    while fringe:
-        schema = spec.deref(fringe.pop())
-        name = schema.get('x-model')
-        if name:
-            if name in seen:
-                continue
-            seen.add(name)
-        required.update(schema.get("required", []))
-        fringe.extend(schema.get('allOf', []))
-    return required
-
-
 def _get_resource_infos(spec: Spec, config: Config
                         ) -> Tuple[List[ResourceInfo], List[OperationInfo]]:
     """Extract resource/operation type information for a given spec object."""
@@ -100,6 +88,7 @@ def _get_operation_info(spec: Spec, name: str, operation: Operation,
                 for pname, param in sorted(operation.params.items())
             ],
             _get_operation_response_infos(spec, operation, config),
+            operation.http_method, operation.path_name,
         )
     return oinfo
 
@@ -107,8 +96,36 @@ def _get_operation_info(spec: Spec, name: str, operation: Operation,
 def _get_parameter_info(spec: Spec, name: str, param: Param, config: Config
                         ) -> ParameterInfo:
     """Extract type information for a given parameter."""
-    ptype = get_type_info(spec, get_param_type_spec(param), config)
-    return ParameterInfo(param, name, ptype, param.required)
+    pschema = get_param_type_spec(param)
+    ptype = get_type_info(spec, pschema, config)
+    # Body values are marshalled by their schema at runtime
+    wire_schema = ({} if param.location == 'body'
+                   else _get_wire_schema(spec, pschema))
+    return ParameterInfo(param, name, ptype, param.required, param.location,
+                         param.name, wire_schema)
+
+
+# Parameter object keys which do not affect how values are validated and sent
+_IGNORED_PARAM_KEYS = {'name', 'in', 'description', 'required', 'default',
+                       'items'}
+
+
+def _get_wire_schema(spec: Spec, pschema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the keys of a parameter schema used to validate and encode its
+    values, including the schema of array items.
+    """
+    pschema = spec.deref(pschema)
+    wire_schema = _get_schema_keys(spec, pschema)
+    if 'items' in pschema:
+        wire_schema['items'] = _get_schema_keys(spec,
+                                                spec.deref(pschema['items']))
+    return wire_schema
+
+
+def _get_schema_keys(spec: Spec, schema: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: spec.deref(value) for key, value in schema.items()
+            if key not in _IGNORED_PARAM_KEYS and not key.startswith('x-')}
 
 
 def _get_operation_response_infos(spec: Spec, operation: Operation,
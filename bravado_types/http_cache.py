@@ -0,0 +1,179 @@
+"""On-disk HTTP cache for schema documents."""
+
+import hashlib
+import json
+import os
+import os.path
+import tempfile
+from typing import Any, Dict, Mapping, MutableMapping, Optional, Tuple
+
+import requests
+from bravado.requests_client import RequestsClient
+from requests.structures import CaseInsensitiveDict
+
+# Default timeout in seconds for HTTP requests for schema documents
+DEFAULT_TIMEOUT = 30.0
+
+
+class SchemaNotCachedError(RuntimeError):
+    """Raised when a document is not cached and offline mode is enabled."""
+
+
+class CachedDocument:
+    """A schema document fetched over HTTP."""
+
+    def __init__(self, url: str, content: bytes, headers: Mapping[str, str]):
+        self.url = url
+        self.content = content
+        self.headers: Mapping[str, str] = CaseInsensitiveDict(headers)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class SchemaCache:
+    """
+    On-disk cache of schema documents fetched over HTTP.
+
+    Cached documents are revalidated with conditional requests using the
+    ETag and Last-Modified headers sent by the server, so unchanged documents
+    are not downloaded again. In offline mode, cached documents are used
+    without contacting the server.
+    """
+
+    def __init__(self, directory: str, offline: bool = False,
+                 session: requests.Session = None,
+                 timeout: Optional[float] = DEFAULT_TIMEOUT):
+        """
+        :param directory: Cache directory. Created if it does not exist.
+        :param offline: If True, never make HTTP requests. Fetching a document
+            which is not in the cache raises SchemaNotCachedError.
+        :param session: Optional requests session to use for HTTP requests.
+        :param timeout: Timeout in seconds for HTTP requests, or None to wait
+            indefinitely.
+        """
+        self.directory = directory
+        self.offline = offline
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        os.makedirs(directory, exist_ok=True)
+
+    def fetch(self, url: str, headers: Mapping[str, str] = None
+              ) -> CachedDocument:
+        """
+        Fetch a document, using the cached copy if it is still valid.
+
+        :param url: Document URL.
+        :param headers: Extra request headers.
+        """
+        meta_path, content_path = self._paths(url)
+        meta = self._read_meta(meta_path)
+        if meta is not None and not os.path.exists(content_path):
+            meta = None
+
+        if self.offline:
+            if meta is None:
+                raise SchemaNotCachedError(
+                    f"Document not cached and offline mode enabled: {url}")
+            return self._read_document(url, meta, content_path)
+
+        request_headers: Dict[str, str] = dict(headers or {})
+        if meta is not None:
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        response = self.session.get(url, headers=request_headers,
+                                    timeout=self.timeout)
+        if meta is not None and response.status_code == 304:
+            return self._read_document(url, meta, content_path)
+        response.raise_for_status()
+
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+        }
+        # Write the content before the metadata, so that a partially written
+        # entry is never considered valid.
+        self._write(content_path, response.content)
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        return CachedDocument(url, response.content, response.headers)
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return f'{base}.meta.json', f'{base}.content'
+
+    @staticmethod
+    def _read_meta(meta_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(meta_path) as f:
+                meta: Dict[str, Any] = json.load(f)
+                return meta
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _read_document(url: str, meta: Dict[str, Any], content_path: str
+                       ) -> CachedDocument:
+        with open(content_path, 'rb') as f:
+            content = f.read()
+        headers = {}
+        if meta.get('content_type'):
+            headers['Content-Type'] = meta['content_type']
+        return CachedDocument(url, content, headers)
+
+    def _write(self, path: str, data: bytes) -> None:
+        """Atomically write a cache file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class _DocumentFuture:
+    """Minimal future wrapper for a cached document."""
+
+    def __init__(self, document: CachedDocument):
+        self.document = document
+
+    def result(self, *args: Any, **kwargs: Any) -> CachedDocument:
+        return self.document
+
+    def cancel(self) -> None:
+        pass
+
+
+class CachingHttpClient(RequestsClient):
+    """
+    Bravado HTTP client which fetches schema documents, including documents
+    referenced by remote $refs, through a SchemaCache. Requests for API
+    operations are not cached.
+    """
+
+    def __init__(self, cache: SchemaCache, **kwargs: Any):
+        """
+        :param cache: Schema cache.
+        :param kwargs: Arguments for RequestsClient.
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def request(self, request_params: MutableMapping[str, Any],
+                operation: Any = None, request_config: Any = None) -> Any:
+        if (operation is None
+                and request_params.get('method', 'GET').upper() == 'GET'):
+            return _DocumentFuture(self.cache.fetch(
+                request_params['url'], request_params.get('headers')))
+        return super().request(request_params, operation, request_config)
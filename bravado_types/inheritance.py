@@ -0,0 +1,167 @@
+"""Index of model inheritance relationships within a Swagger spec."""
+
+import heapq
+from typing import Any, Dict, FrozenSet, List, Mapping, Set, Tuple
+
+from bravado_core.spec import Spec
+
+Schema = Dict[str, Any]
+
+
+class InheritanceGraph:
+    """
+    Model inheritance graph for a Swagger spec, as expressed by the allOf
+    schema property.
+
+    The graph is built once per spec. Inherited properties and required
+    property names are computed at most once per model and shared by all of
+    its descendants, so deep or shared hierarchies are only traversed once.
+    """
+
+    def __init__(self, spec: Spec):
+        """
+        :param spec: Bravado-core spec object
+        """
+        self._spec = spec
+        self._schemas: Dict[str, Schema] = {
+            name: spec.deref(mclass._model_spec)
+            for name, mclass in spec.definitions.items()
+        }
+        self._parents: Dict[str, List[str]] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+        for name, schema in self._schemas.items():
+            self._parents[name] = self._get_parents(schema)
+            self._dependencies[name] = self._get_dependencies(schema)
+        self._properties: Dict[str, Dict[str, Schema]] = {}
+        self._required: Dict[str, FrozenSet[str]] = {}
+
+    def parents(self, name: str) -> List[str]:
+        """
+        Get the direct parents of a model, in the order they are listed in the
+        model's allOf property.
+        """
+        return self._parents[name]
+
+    def properties(self, name: str) -> Mapping[str, Schema]:
+        """
+        Get the property schemas of a model, including inherited properties.
+        """
+        self._collapse(name)
+        return self._properties[name]
+
+    def required(self, name: str) -> FrozenSet[str]:
+        """
+        Get the names of the required properties of a model, including
+        inherited required properties.
+        """
+        self._collapse(name)
+        return self._required[name]
+
+    def topological_order(self) -> List[str]:
+        """
+        Get the names of all models ordered so that each model comes after its
+        parents. Ties are broken by model name, so a spec without model
+        inheritance yields the models in sorted order.
+        """
+        children: Dict[str, List[str]] = {name: [] for name in self._schemas}
+        num_parents: Dict[str, int] = {}
+        for name in self._schemas:
+            parents = [p for p in self._parents[name] if p in self._schemas]
+            num_parents[name] = len(parents)
+            for parent in parents:
+                children[parent].append(name)
+
+        heap = [name for name, count in num_parents.items() if count == 0]
+        heapq.heapify(heap)
+        order: List[str] = []
+        while heap:
+            name = heapq.heappop(heap)
+            order.append(name)
+            for child in children[name]:
+                num_parents[child] -= 1
+                if num_parents[child] == 0:
+                    heapq.heappush(heap, child)
+
+        if len(order) != len(self._schemas):
+            cyclic = sorted(set(self._schemas) - set(order))
+            raise ValueError(f"Model inheritance cycle among: {cyclic!r}")
+        return order
+
+    def _get_parents(self, schema: Schema) -> List[str]:
+        """Get the names of the models listed directly in a schema's allOf."""
+        parents = []
+        for item in schema.get('allOf', []):
+            name = self._spec.deref(item).get('x-model')
+            if name is not None:
+                parents.append(name)
+        return parents
+
+    def _get_dependencies(self, schema: Schema) -> List[str]:
+        """
+        Get the names of the models whose properties are merged into a model
+        schema, including models nested within inline allOf items.
+        """
+        dependencies = []
+        fringe = list(reversed(schema.get('allOf', [])))
+        while fringe:
+            item = self._spec.deref(fringe.pop())
+            name = item.get('x-model')
+            if name in self._schemas:
+                dependencies.append(name)
+            else:
+                fringe.extend(reversed(item.get('allOf', [])))
+        return dependencies
+
+    def _collapse(self, name: str) -> None:
+        """
+        Compute the properties and required set of a model and all models it
+        depends on, without recursion.
+        """
+        if name in self._required:
+            return
+        in_progress: Set[str] = set()
+        stack: List[Tuple[str, bool]] = [(name, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in self._required:
+                continue
+            if expanded:
+                in_progress.discard(current)
+                self._collapse_model(current)
+                continue
+            if current in in_progress:
+                raise ValueError(
+                    f"Model inheritance cycle involving {current!r}")
+            in_progress.add(current)
+            stack.append((current, True))
+            for dependency in self._dependencies[current]:
+                if dependency not in self._required:
+                    stack.append((dependency, False))
+
+    def _collapse_model(self, name: str) -> None:
+        """
+        Compute the properties and required set of a model whose dependencies
+        have already been computed.
+        """
+        properties: Dict[str, Schema] = {}
+        required: Set[str] = set()
+        self._collapse_schema(self._schemas[name], properties, required)
+        self._properties[name] = properties
+        self._required[name] = frozenset(required)
+
+    def _collapse_schema(self, schema: Schema, properties: Dict[str, Schema],
+                         required: Set[str]) -> None:
+        """
+        Merge the properties and required names of an inline schema, following
+        the same precedence as bravado_core.schema.collapsed_properties.
+        """
+        properties.update(schema.get('properties', {}))
+        required.update(schema.get('required', []))
+        for item in schema.get('allOf', []):
+            item = self._spec.deref(item)
+            name = item.get('x-model')
+            if name in self._required:
+                properties.update(self._properties[name])
+                required.update(self._required[name])
+            else:
+                self._collapse_schema(item, properties, required)
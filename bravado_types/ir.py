@@ -0,0 +1,254 @@
+"""
+Serialization of extracted type information to an intermediate representation
+(IR) file.
+
+The IR contains everything needed to render the module and stub files for a
+schema, so templates and render-time configuration options can be changed
+without loading the schema again. It does not reference bravado objects, so
+loading it does not require importing bravado or bravado-core.
+"""
+
+import json
+from datetime import datetime
+from typing import IO, Any, Dict, List, Mapping, Optional, Tuple
+
+from bravado_types.config import (ArrayTypes, Config, CustomFormats,
+                                  ResponseTypes)
+from bravado_types.data_model import (ModelInfo, OperationInfo, ParameterInfo,
+                                      PropertyInfo, ResourceInfo, ResponseInfo,
+                                      SpecInfo, TypeInfo)
+from bravado_types.metadata import Metadata
+
+IR_FORMAT = 'bravado-types-ir'
+IR_VERSION = 2
+
+# Config parameters which affect the types computed during extraction. These
+# cannot be overridden when loading an IR file.
+EXTRACT_CONFIG_PARAMS = frozenset([
+    'custom_formats',
+])
+
+_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+
+def dump_ir(fp: IO[str], metadata: Metadata, spec: SpecInfo,
+            config: Config) -> None:
+    """
+    Write an IR file.
+
+    :param fp: Text file object to write to.
+    :param metadata: Code generation metadata.
+    :param spec: Extracted type information.
+    :param config: Configuration used for extraction.
+    """
+    json.dump({
+        'format': IR_FORMAT,
+        'version': IR_VERSION,
+        'metadata': _metadata_to_dict(metadata),
+        'config': config_to_dict(config),
+        'spec': spec_to_dict(spec),
+    }, fp, separators=(',', ':'), sort_keys=True)
+
+
+def load_ir(fp: IO[str], config_overrides: Mapping[str, Any] = None
+            ) -> Tuple[Metadata, SpecInfo, Config]:
+    """
+    Read an IR file.
+
+    :param fp: Text file object to read from.
+    :param config_overrides: Config parameters to use instead of the values
+        recorded in the IR file. Parameters in EXTRACT_CONFIG_PARAMS cannot be
+        overridden.
+    :return: Tuple of code generation metadata, type information and config.
+    """
+    data = json.load(fp)
+    if not isinstance(data, dict) or data.get('format') != IR_FORMAT:
+        raise ValueError("Not a bravado-types IR file")
+    if data.get('version') != IR_VERSION:
+        raise ValueError(f"Unsupported IR version: {data.get('version')!r}")
+
+    try:
+        config_kwargs = config_kwargs_from_dict(data['config'])
+        metadata = _metadata_from_dict(data['metadata'])
+        spec = spec_from_dict(data['spec'])
+    except KeyError as e:
+        raise ValueError(f"Invalid IR file, missing field {e}") from e
+    except ValueError as e:
+        raise ValueError(f"Invalid IR file: {e}") from e
+
+    if config_overrides:
+        invalid = EXTRACT_CONFIG_PARAMS.intersection(config_overrides)
+        if invalid:
+            raise ValueError("Cannot override extraction parameters: "
+                             f"{sorted(invalid)!r}")
+        config_kwargs.update(config_overrides)
+
+    return metadata, spec, Config(**config_kwargs)
+
+
+def _metadata_to_dict(metadata: Metadata) -> Dict[str, Any]:
+    return {
+        'timestamp': metadata.timestamp.strftime(_TIMESTAMP_FORMAT),
+        'bravado_version': metadata.bravado_version,
+        'bravado_core_version': metadata.bravado_core_version,
+        'bravado_types_version': metadata.bravado_types_version,
+        'schema_version': metadata.schema_version,
+        'schema_origin_url': metadata.schema_origin_url,
+        'cli_args': (None if metadata.cli_args is None
+                     else list(metadata.cli_args)),
+        'schema_fingerprint': metadata.schema_fingerprint,
+    }
+
+
+def _metadata_from_dict(data: Dict[str, Any]) -> Metadata:
+    return Metadata(
+        timestamp=datetime.strptime(data['timestamp'], _TIMESTAMP_FORMAT),
+        bravado_version=data['bravado_version'],
+        bravado_core_version=data['bravado_core_version'],
+        bravado_types_version=data['bravado_types_version'],
+        schema_version=data['schema_version'],
+        schema_origin_url=data['schema_origin_url'],
+        cli_args=data['cli_args'],
+        schema_fingerprint=data['schema_fingerprint'],
+    )
+
+
+def config_to_dict(config: Config) -> Dict[str, Any]:
+    """Convert a config to a JSON-serializable dict."""
+    custom_formats: Optional[Dict[str, Any]] = None
+    if config.custom_formats:
+        custom_formats = {
+            'formats': sorted(
+                [schema_type, schema_format, python_type]
+                for (schema_type, schema_format), python_type
+                in config.custom_formats.formats.items()
+            ),
+            'packages': config.custom_formats.packages,
+        }
+    return {
+        'name': config.name,
+        'path': config.py_path,
+        'client_type_format': config.client_type_format,
+        'resource_type_format': config.resource_type_format,
+        'operation_type_format': config.operation_type_format,
+        'model_type_format': config.model_type_format,
+        'array_types': config.array_types.value,
+        'response_types': config.response_types.value,
+        'model_inheritance': config.model_inheritance,
+        'async_client': config.async_client,
+        'lazy_stubs': config.lazy_stubs,
+        'lazy_client': config.lazy_client,
+        'spec_cache': config.spec_cache,
+        'batch_helper': config.batch_helper,
+        'stream_helper': config.stream_helper,
+        'instrumentation': config.instrumentation,
+        'fast_requests': config.fast_requests,
+        'response_cache': config.response_cache,
+        'build_helper': config.build_helper,
+        'custom_formats': custom_formats,
+        'custom_templates_dir': config.custom_templates_dir,
+        'parallel_render': config.parallel_render,
+    }
+
+
+def config_kwargs_from_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a dict created by config_to_dict() to Config arguments."""
+    kwargs = dict(data)
+    kwargs['array_types'] = ArrayTypes(data['array_types'])
+    kwargs['response_types'] = ResponseTypes(data['response_types'])
+    if data['custom_formats'] is not None:
+        kwargs['custom_formats'] = CustomFormats(
+            {(schema_type, schema_format): python_type
+             for schema_type, schema_format, python_type
+             in data['custom_formats']['formats']},
+            data['custom_formats']['packages'],
+        )
+    return kwargs
+
+
+def spec_to_dict(spec: SpecInfo) -> Dict[str, Any]:
+    """Convert type information to a JSON-serializable dict."""
+    return {
+        'models': [
+            {
+                'name': model.name,
+                'parents': model.parents,
+                'props': [[prop.name, _type_to_list(prop.type),
+                           prop.required]
+                          for prop in model.props],
+            }
+            for model in spec.models
+        ],
+        'operations': [
+            {
+                'name': operation.name,
+                'http_method': operation.http_method,
+                'path_name': operation.path_name,
+                'params': [[param.name, _type_to_list(param.type),
+                            param.required, param.location, param.wire_name,
+                            param.schema]
+                           for param in operation.params],
+                'responses': [[response.status,
+                               _type_to_list(response.type)]
+                              for response in operation.responses],
+            }
+            for operation in spec.operations
+        ],
+        # Operations may belong to more than one resource, so resources
+        # refer to operations by name.
+        'resources': [
+            {
+                'name': resource.name,
+                'operations': [operation.name
+                               for operation in resource.operations],
+            }
+            for resource in spec.resources
+        ],
+    }
+
+
+def spec_from_dict(data: Dict[str, Any]) -> SpecInfo:
+    """Convert a dict created by spec_to_dict() to type information."""
+    models = [
+        ModelInfo(None, model['name'], model['parents'], [
+            PropertyInfo(name, _type_from_list(type), required)
+            for name, type, required in model['props']
+        ])
+        for model in data['models']
+    ]
+    operations: List[OperationInfo] = [
+        OperationInfo(None, operation['name'], [
+            ParameterInfo(None, name, _type_from_list(type), required,
+                          location, wire_name, schema)
+            for name, type, required, location, wire_name, schema
+            in operation['params']
+        ], [
+            ResponseInfo(status, _type_from_list(type))
+            for status, type in operation['responses']
+        ], operation['http_method'], operation['path_name'])
+        for operation in data['operations']
+    ]
+    operations_by_name = {operation.name: operation
+                          for operation in operations}
+    resources = [
+        ResourceInfo(None, resource['name'], [
+            operations_by_name[name] for name in resource['operations']
+        ])
+        for resource in data['resources']
+    ]
+    return SpecInfo(None, models, resources, operations)
+
+
+def _type_to_list(type_info: TypeInfo) -> List[Any]:
+    """
+    Convert a type to a JSON-serializable list of the leaf type name,
+    whether it is a model, and the wrappers of the leaf type.
+    """
+    return [type_info.name, type_info.model,
+            *[wrapper.value for wrapper in type_info.wrappers]]
+
+
+def _type_from_list(data: List[Any]) -> TypeInfo:
+    """Convert a list created by _type_to_list() to a type."""
+    name, model, *wrappers = data
+    return TypeInfo(name, model, wrappers)
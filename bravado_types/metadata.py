@@ -1,9 +1,12 @@
+import functools
+import hashlib
+import json
 import shlex
 from datetime import datetime, timezone
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
-import pkg_resources
-from bravado_core.spec import Spec
+if TYPE_CHECKING:
+    from bravado_core.spec import Spec
 
 
 class Metadata:
@@ -15,7 +18,8 @@ class Metadata:
                  bravado_types_version: str,
                  schema_version: str,
                  schema_origin_url: Optional[str],
-                 cli_args: Optional[Iterable[str]]):
+                 cli_args: Optional[Iterable[str]],
+                 schema_fingerprint: str):
         self.timestamp = timestamp
         self.bravado_version = bravado_version
         self.bravado_core_version = bravado_core_version
@@ -23,6 +27,7 @@ class Metadata:
         self.schema_version = schema_version
         self.schema_origin_url = schema_origin_url
         self.cli_args = cli_args
+        self.schema_fingerprint = schema_fingerprint
 
     @property
     def quoted_cli_args(self) -> str:
@@ -31,17 +36,39 @@ class Metadata:
         return ' '.join(map(shlex.quote, self.cli_args))
 
 
-def get_metadata(spec: Spec, cli_args: Iterable[str] = None):
+def get_metadata(spec: 'Spec', cli_args: Iterable[str] = None):
     return Metadata(
         timestamp=datetime.now(timezone.utc),
-        bravado_version=_get_package_version('bravado'),
-        bravado_core_version=_get_package_version('bravado-core'),
-        bravado_types_version=_get_package_version('bravado-types'),
+        bravado_version=get_package_version('bravado'),
+        bravado_core_version=get_package_version('bravado-core'),
+        bravado_types_version=get_package_version('bravado-types'),
         schema_version=spec.spec_dict['info']['version'],
         schema_origin_url=spec.origin_url,
         cli_args=cli_args,
+        schema_fingerprint=spec_fingerprint(spec),
     )
 
 
-def _get_package_version(name: str) -> str:
+def spec_fingerprint(spec: 'Spec') -> str:
+    """
+    Compute a fingerprint of a built spec's schema.
+
+    Modules generated with the spec_cache option compute the same fingerprint
+    at runtime, so the two implementations must be kept in sync.
+    """
+    from bravado_core.spec import strip_xscope
+
+    data = json.dumps(strip_xscope(spec.spec_dict), sort_keys=True,
+                      separators=(',', ':'), default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+# Package versions are looked up once per process. lru_cache is safe to call
+# from several threads, e.g. when generating modules concurrently.
+@functools.lru_cache(maxsize=None)
+def get_package_version(name: str) -> str:
+    # Imported lazily as pkg_resources is slow to import and is not needed
+    # when rendering from an intermediate representation file.
+    import pkg_resources
+
     return pkg_resources.get_distribution(name).version
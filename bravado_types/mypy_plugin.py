@@ -0,0 +1,387 @@
+"""
+MyPy plugin for compact stubs generated with the lazy_stubs option.
+
+Compact stubs declare resource, operation and model types as aliases of
+generic placeholder classes, parameterized by a literal name. The plugin
+builds the attribute and call signatures for these types on demand from the
+type index file written alongside the stub, so MyPy only analyzes the parts
+of the schema that the checked code references.
+
+To enable the plugin, add it to the MyPy configuration file:
+
+    [mypy]
+    plugins = bravado_types.mypy_plugin
+
+The plugin uses MyPy internals which are not part of its plugin API, so it
+only supports the MyPy versions in the range declared by the "mypy" extra of
+the package.
+"""
+
+import hashlib
+import json
+import os.path
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Tuple, Type as TypingType)
+
+from mypy.nodes import (ARG_NAMED, ARG_NAMED_OPT, Context, StrExpr, TypeInfo,
+                        Var, type_aliases)
+from mypy.plugin import (AttributeContext, FunctionContext, MethodContext,
+                         MethodSigContext, Plugin)
+from mypy.types import (AnyType, CallableType, EllipsisType, Instance,
+                        LiteralType, NoneType, ProperType, TupleType, Type,
+                        TypeOfAny, TypeType, UnboundType, UnionType,
+                        get_proper_type)
+
+from bravado_types.type_index import TYPE_INDEX_FORMAT, TYPE_INDEX_VERSION
+
+# MyPy versions the plugin is tested with, as declared in setup.py
+MYPY_VERSIONS = '>=0.910,<0.920'
+
+# MyPy internals used by the plugin, which are not part of the plugin API
+try:
+    from mypy.checker import TypeChecker
+    from mypy.checkexpr import ExpressionChecker
+    from mypy.errorcodes import ATTR_DEFINED
+    from mypy.fastparse import parse_type_string
+    from mypy.messages import best_matches, pretty_seq
+except ImportError as e:
+    raise ImportError(f"Unsupported MyPy version for bravado_types.mypy_plugin"
+                      f" ({e}), supported versions: {MYPY_VERSIONS}") from e
+
+_CLIENT_CLASS = '_LazyClient'
+_RESOURCE_CLASS = '_LazyResource'
+_OPERATION_CLASS = '_LazyOperation'
+_MODEL_CLASS = '_LazyModel'
+_DIGEST_NAME = '_TYPE_INDEX_DIGEST'
+
+
+class _TypeIndex:
+    """Type index for a generated module."""
+
+    def __init__(self, module: str, data: Dict[str, Any]):
+        self.module = module
+        self.resources: Dict[str, Any] = data['resources']
+        self.operations: Dict[str, Any] = data['operations']
+        self.models: Dict[str, Any] = data['models']
+        self.model_names = {model['type']: name
+                            for name, model in self.models.items()}
+        self._types: Dict[str, Type] = {}
+
+    def type(self, api: TypeChecker, type_str: str) -> Type:
+        """Convert a type string from the index to a MyPy type."""
+        if type_str not in self._types:
+            parsed = parse_type_string(type_str, 'builtins.str', -1, -1)
+            self._types[type_str] = self._convert(api, parsed)
+        return self._types[type_str]
+
+    def instance(self, api: TypeChecker, class_name: str,
+                 name: str) -> Instance:
+        """Get an instance of a placeholder class for a given name."""
+        info = api.lookup_typeinfo(f'{self.module}.{class_name}')
+        literal = LiteralType(name, api.named_type('builtins.str'))
+        return Instance(info, [literal])
+
+    def signature(self, api: TypeChecker, name: str,
+                  params: Sequence[Tuple[str, str, bool]], ret_type: Type,
+                  fallback: Instance) -> CallableType:
+        """Build a signature with keyword-only parameters."""
+        arg_types: List[Type] = []
+        arg_kinds = []
+        arg_names: List[Optional[str]] = []
+        for param_name, type_str, required in params:
+            param_type = self.type(api, type_str)
+            if not required:
+                param_type = UnionType.make_union([param_type, NoneType()])
+            arg_types.append(param_type)
+            arg_kinds.append(ARG_NAMED if required else ARG_NAMED_OPT)
+            arg_names.append(param_name)
+        return CallableType(arg_types, arg_kinds, arg_names, ret_type,
+                            fallback, name=name)
+
+    def _convert(self, api: TypeChecker, typ: ProperType) -> Type:
+        if not isinstance(typ, UnboundType):
+            return AnyType(TypeOfAny.from_error)
+
+        name = typ.name
+        args = [self._convert(api, get_proper_type(arg)) for arg in typ.args]
+        if name == 'None':
+            return NoneType()
+        elif name == 'typing.Any':
+            return AnyType(TypeOfAny.explicit)
+        elif name == 'typing.Optional':
+            return UnionType.make_union([args[0], NoneType()])
+        elif name == 'typing.Union':
+            return UnionType.make_union(args)
+        elif name == 'typing.Tuple':
+            if len(typ.args) == 2 and isinstance(typ.args[1], EllipsisType):
+                return api.named_generic_type('builtins.tuple', args[:1])
+            return TupleType(args, api.named_type('builtins.tuple'))
+        elif name in self.model_names:
+            return self.instance(api, _MODEL_CLASS, self.model_names[name])
+
+        if '.' not in name:
+            module = api.modules[self.module]
+            if name in module.names:
+                name = f'{self.module}.{name}'
+            else:
+                name = f'builtins.{name}'
+        info = _lookup_typeinfo(api, type_aliases.get(name, name))
+        if info is None:
+            return AnyType(TypeOfAny.from_error)
+        if len(args) != len(info.type_vars):
+            args = [AnyType(TypeOfAny.from_error)] * len(info.type_vars)
+        return Instance(info, args)
+
+
+class BravadoTypesPlugin(Plugin):
+    def __init__(self, options: Any):
+        super().__init__(options)
+        self._indexes: Dict[str, Optional[_TypeIndex]] = {}
+
+    def get_attribute_hook(self, fullname: str
+                           ) -> Optional[Callable[[AttributeContext], Type]]:
+        class_fullname, _, attr = fullname.rpartition('.')
+        module, _, class_name = class_fullname.rpartition('.')
+        if class_name == _CLIENT_CLASS:
+            return lambda ctx: self._resource_type(ctx, module, attr)
+        elif class_name == _RESOURCE_CLASS:
+            return lambda ctx: self._operation_type(ctx, module, attr)
+        elif class_name == _MODEL_CLASS:
+            return lambda ctx: self._property_type(ctx, module, attr)
+        return None
+
+    def get_function_hook(self, fullname: str
+                          ) -> Optional[Callable[[FunctionContext], Type]]:
+        module, _, class_name = fullname.rpartition('.')
+        if class_name == _MODEL_CLASS:
+            return lambda ctx: self._construct_model(ctx, module)
+        return None
+
+    def get_method_hook(self, fullname: str
+                        ) -> Optional[Callable[[MethodContext], Type]]:
+        if fullname.endswith('.get_model'):
+            return self._model_class
+        if fullname.endswith('.build_many'):
+            return self._model_list
+        return None
+
+    def get_method_signature_hook(
+            self, fullname: str
+    ) -> Optional[Callable[[MethodSigContext], CallableType]]:
+        class_fullname, _, method = fullname.rpartition('.')
+        module, _, class_name = class_fullname.rpartition('.')
+        if class_name == _OPERATION_CLASS and method == '__call__':
+            return lambda ctx: self._operation_signature(ctx, module)
+        return None
+
+    def _resource_type(self, ctx: AttributeContext, module: str,
+                       attr: str) -> Type:
+        index = self._index(ctx.api, module, ctx.context)
+        if index is None:
+            return ctx.default_attr_type
+        if attr not in index.resources:
+            _no_attribute(ctx, _type_name(ctx.type), attr, index.resources)
+            return AnyType(TypeOfAny.from_error)
+        return index.instance(_checker(ctx), _RESOURCE_CLASS, attr)
+
+    def _operation_type(self, ctx: AttributeContext, module: str,
+                        attr: str) -> Type:
+        index = self._index(ctx.api, module, ctx.context)
+        name = _literal_arg(ctx.type)
+        if index is None or name not in index.resources:
+            return ctx.default_attr_type
+        resource = index.resources[name]
+        if attr not in resource['operations']:
+            _no_attribute(ctx, resource['type'], attr,
+                          resource['operations'])
+            return AnyType(TypeOfAny.from_error)
+        return index.instance(_checker(ctx), _OPERATION_CLASS, attr)
+
+    def _property_type(self, ctx: AttributeContext, module: str,
+                       attr: str) -> Type:
+        index = self._index(ctx.api, module, ctx.context)
+        name = _literal_arg(ctx.type)
+        if index is None or name not in index.models:
+            return ctx.default_attr_type
+        model = index.models[name]
+        for prop_name, type_str, required in model['props']:
+            if prop_name == attr:
+                prop_type = index.type(_checker(ctx), type_str)
+                if not required:
+                    prop_type = UnionType.make_union([prop_type, NoneType()])
+                return prop_type
+        _no_attribute(ctx, model['type'], attr,
+                      [prop[0] for prop in model['props']])
+        return AnyType(TypeOfAny.from_error)
+
+    def _operation_signature(self, ctx: MethodSigContext,
+                             module: str) -> CallableType:
+        index = self._index(ctx.api, module, ctx.context)
+        name = _literal_arg(ctx.type)
+        if index is None or name not in index.operations:
+            return ctx.default_signature
+        api = _checker(ctx)
+        operation = index.operations[name]
+        params = operation['params'] + [
+            ['_request_options', 'typing.Mapping[str, typing.Any]', False],
+        ]
+        return index.signature(
+            api, f"__call__ of {operation['type']}", params,
+            index.type(api, operation['returns']),
+            api.named_type('builtins.function'))
+
+    def _model_class(self, ctx: MethodContext) -> Type:
+        model = self._model_instance(ctx)
+        if model is None:
+            return ctx.default_return_type
+        return TypeType(model)
+
+    def _model_list(self, ctx: MethodContext) -> Type:
+        model = self._model_instance(ctx)
+        if model is None:
+            return ctx.default_return_type
+        return _checker(ctx).named_generic_type('builtins.list', [model])
+
+    def _model_instance(self, ctx: MethodContext) -> Optional[Instance]:
+        """Get the model type named by the first argument of a method."""
+        typ = get_proper_type(ctx.type)
+        if not isinstance(typ, Instance):
+            return None
+        client_info = next((info for info in typ.type.mro
+                            if info.name == _CLIENT_CLASS), None)
+        if client_info is None:
+            return None
+        index = self._index(ctx.api, client_info.module_name, ctx.context)
+        name = _str_arg(ctx)
+        if index is None or name not in index.models:
+            return None
+        return index.instance(_checker(ctx), _MODEL_CLASS, name)
+
+    def _construct_model(self, ctx: FunctionContext, module: str) -> Type:
+        # The placeholder class accepts any arguments, so check them against
+        # the model's constructor signature here.
+        index = self._index(ctx.api, module, ctx.context)
+        name = _literal_arg(ctx.default_return_type)
+        if index is None or name not in index.models:
+            return ctx.default_return_type
+        api = _checker(ctx)
+        model = index.models[name]
+        signature = index.signature(api, model['type'], model['props'],
+                                    ctx.default_return_type,
+                                    api.named_type('builtins.function'))
+        api.expr_checker.check_call(
+            signature,
+            [arg for args in ctx.args for arg in args],
+            [kind for kinds in ctx.arg_kinds for kind in kinds],
+            ctx.context,
+            [name for names in ctx.arg_names for name in names],
+        )
+        return ctx.default_return_type
+
+    def _index(self, api: Any, module: str,
+               context: Context) -> Optional[_TypeIndex]:
+        """Load the type index for a generated module."""
+        if module not in self._indexes:
+            self._indexes[module] = _load_index(api, module, context)
+        return self._indexes[module]
+
+
+def _load_index(api: TypeChecker, module: str,
+                context: Context) -> Optional[_TypeIndex]:
+    mypy_file = api.modules.get(module)
+    if mypy_file is None or _DIGEST_NAME not in mypy_file.names:
+        return None
+    path = f"{os.path.splitext(mypy_file.path)[0]}.types.json"
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except OSError:
+        api.fail(f'Cannot read type index file "{path}"', context)
+        return None
+
+    digest = mypy_file.names[_DIGEST_NAME].node
+    if (isinstance(digest, Var) and digest.final_value is not None
+            and digest.final_value != hashlib.sha256(content).hexdigest()):
+        api.fail(f'Type index file "{path}" does not match stub file', context)
+        return None
+
+    data = json.loads(content)
+    if (data.get('format') != TYPE_INDEX_FORMAT
+            or data.get('version') != TYPE_INDEX_VERSION):
+        api.fail(f'Unsupported type index file "{path}"', context)
+        return None
+    return _TypeIndex(module, data)
+
+
+def _lookup_typeinfo(api: TypeChecker, fullname: str) -> Optional[TypeInfo]:
+    """Look up a class by its full name."""
+    parts = fullname.split('.')
+    for i in range(len(parts) - 1, 0, -1):
+        module = api.modules.get('.'.join(parts[:i]))
+        if module is not None:
+            names = module.names
+            info = None
+            for part in parts[i:]:
+                sym = names.get(part)
+                if sym is None or not isinstance(sym.node, TypeInfo):
+                    return None
+                info = sym.node
+                names = info.names
+            return info
+    return None
+
+
+def _checker(ctx: Any) -> TypeChecker:
+    api: TypeChecker = ctx.api
+    return api
+
+
+def _literal_arg(typ: Type) -> Optional[str]:
+    """Get the name parameter of a placeholder type."""
+    typ = get_proper_type(typ)
+    if isinstance(typ, Instance) and typ.args:
+        arg = get_proper_type(typ.args[0])
+        if isinstance(arg, LiteralType) and isinstance(arg.value, str):
+            return arg.value
+    return None
+
+
+def _str_arg(ctx: MethodContext) -> Optional[str]:
+    """Get the value of the first argument, if it is a string literal."""
+    if not ctx.args or len(ctx.args[0]) != 1:
+        return None
+    expr = ctx.args[0][0]
+    if isinstance(expr, StrExpr):
+        return expr.value
+    arg_type = get_proper_type(ctx.arg_types[0][0])
+    if isinstance(arg_type, Instance) and arg_type.last_known_value:
+        value = arg_type.last_known_value.value
+        return value if isinstance(value, str) else None
+    return None
+
+
+def _type_name(typ: Type) -> str:
+    typ = get_proper_type(typ)
+    return typ.type.name if isinstance(typ, Instance) else str(typ)
+
+
+def _no_attribute(ctx: AttributeContext, type_name: str, attr: str,
+                  options: Iterable[str]) -> None:
+    """Report a missing attribute in the same format as MyPy."""
+    msg = f'"{type_name}" has no attribute "{attr}"'
+    matches = best_matches(attr, options)[:3]
+    if matches:
+        msg += f'; maybe {pretty_seq(matches, "or")}?'
+    ctx.api.fail(msg, ctx.context, code=ATTR_DEFINED)
+
+
+def plugin(version: str) -> TypingType[Plugin]:
+    for cls, method in [(TypeChecker, 'lookup_typeinfo'),
+                        (TypeChecker, 'named_type'),
+                        (ExpressionChecker, 'check_call')]:
+        if not hasattr(cls, method):
+            raise RuntimeError(
+                f"Unsupported MyPy version for bravado_types.mypy_plugin "
+                f"({version}, missing {cls.__name__}.{method}), supported "
+                f"versions: {MYPY_VERSIONS}")
+    return BravadoTypesPlugin
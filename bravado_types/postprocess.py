@@ -0,0 +1,179 @@
+"""
+Incremental postprocessing of generated files.
+
+Formatting tools such as black and isort can take longer than generating the
+files themselves for large schemas. The functions in this module postprocess
+each generated file concurrently, and can cache the postprocessed content of
+each file, keyed by a hash of its content before postprocessing. When a
+schema is regenerated, files whose generated content has not changed are
+restored from the cache instead of being postprocessed again.
+"""
+
+import functools
+import hashlib
+import os
+import os.path
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType, MethodType
+from typing import Any, Callable, List, Optional, Sequence
+
+# Object address in default reprs, which differs between runs
+_ADDRESS = re.compile(r' at 0x[0-9A-Fa-f]+')
+
+
+class PostprocessCache:
+    """On-disk cache of postprocessed file contents."""
+
+    def __init__(self, directory: str, postprocessor: Callable[[str], Any],
+                 key: str = None):
+        """
+        :param directory: Cache directory. Created if it does not exist.
+        :param postprocessor: Postprocessing function whose results are
+            cached. The cache should be cleared if the behavior of the
+            function changes, for example when upgrading formatting tools.
+        :param key: Key identifying the postprocessor, so that results of
+            different postprocessors are cached separately. By default, the
+            key is derived from the qualified name of the postprocessor, the
+            code and closure variables of functions, the function and
+            arguments of functools.partial objects, and the instance of bound
+            methods. Pass a key for callable objects whose results depend on
+            their attributes.
+        :raises ValueError: If key is not given and the derived key would
+            contain an object address, which differs between runs.
+        """
+        self.directory = directory
+        self.postprocessor_key = (postprocessor_key(postprocessor)
+                                  if key is None else key)
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, path: str, content: bytes) -> Optional[bytes]:
+        """
+        Get the cached postprocessed content of a file.
+
+        :param path: Path of the file.
+        :param content: Content of the file before postprocessing.
+        :return: Postprocessed content, or None if not cached.
+        """
+        try:
+            with open(self._cache_path(path, content), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, path: str, content: bytes, result: bytes) -> None:
+        """
+        Cache the postprocessed content of a file.
+
+        :param path: Path of the file.
+        :param content: Content of the file before postprocessing.
+        :param result: Content of the file after postprocessing.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(result)
+            os.replace(tmp_path, self._cache_path(path, content))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _cache_path(self, path: str, content: bytes) -> str:
+        # Tools may treat files differently by extension (e.g. black with
+        # .pyi files), so the extension is part of the key.
+        _, ext = os.path.splitext(path)
+        key = hashlib.sha256()
+        key.update(f"{self.postprocessor_key}\0{ext}\0".encode('utf-8'))
+        key.update(content)
+        return os.path.join(self.directory, key.hexdigest())
+
+
+def postprocessor_key(postprocessor: Callable[..., Any]) -> str:
+    """
+    Derive a cache key for a postprocessor, see PostprocessCache.
+
+    :raises ValueError: If the key would contain an object address, e.g.
+        from a closure variable or partial argument without a repr of its
+        own, so that it would differ between runs.
+    """
+    key = _postprocessor_key(postprocessor)
+    if _ADDRESS.search(key):
+        raise ValueError(f"Cannot derive a cache key for postprocessor "
+                         f"{postprocessor!r} which is the same in each run, "
+                         f"pass postprocess_cache_key: {key}")
+    return key
+
+
+def _postprocessor_key(postprocessor: Callable[..., Any]) -> str:
+    if isinstance(postprocessor, functools.partial):
+        keywords = sorted(postprocessor.keywords.items())
+        return (f"partial({_postprocessor_key(postprocessor.func)}, "
+                f"{postprocessor.args!r}, {keywords!r})")
+    if isinstance(postprocessor, MethodType):
+        # The repr of the instance stands in for its attributes
+        return (f"{_postprocessor_key(postprocessor.__func__)}"
+                f"@{postprocessor.__self__!r}")
+    # Callable objects have no qualified name of their own
+    named: Any = (postprocessor if hasattr(postprocessor, '__qualname__')
+                  else type(postprocessor))
+    key = f"{named.__module__}.{named.__qualname__}"
+    code = getattr(postprocessor, '__code__', None)
+    if isinstance(code, CodeType):
+        # Tell apart functions with the same qualified name, such as lambdas
+        # and functions defined in a loop.
+        key += f"#{_code_digest(code)}"
+        closure = getattr(postprocessor, '__closure__', None) or ()
+        if closure:
+            key += repr([cell.cell_contents for cell in closure])
+    return key
+
+
+def _code_digest(code: CodeType) -> str:
+    """Hash the bytecode and constants of a code object."""
+    digest = hashlib.sha256(code.co_code)
+    for const in code.co_consts:
+        # Nested code objects have a repr containing their address
+        value = (_code_digest(const) if isinstance(const, CodeType)
+                 else repr(const))
+        digest.update(f"\0{value}".encode('utf-8'))
+    digest.update(repr(code.co_names).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def postprocess_files(paths: Sequence[str],
+                      postprocessor: Callable[[str], Any],
+                      cache: PostprocessCache = None) -> List[str]:
+    """
+    Postprocess files concurrently, each in a separate thread.
+
+    :param paths: Paths of the files to postprocess.
+    :param postprocessor: Function to call with the path of each file. It
+        should modify the file in place.
+    :param cache: Optional cache of postprocessed file contents.
+    :return: Paths of the files which were postprocessed, i.e. not restored
+        from the cache.
+    """
+    def process(path: str) -> bool:
+        if cache is None:
+            postprocessor(path)
+            return True
+
+        with open(path, 'rb') as f:
+            content = f.read()
+        result = cache.get(path, content)
+        if result is not None:
+            with open(path, 'wb') as f:
+                f.write(result)
+            return False
+
+        postprocessor(path)
+        with open(path, 'rb') as f:
+            cache.put(path, content, f.read())
+        return True
+
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        processed = list(executor.map(process, paths))
+    return [path for path, p in zip(paths, processed) if p]
@@ -0,0 +1,169 @@
+"""
+Concurrent loading of multi-file schemas.
+
+Bravado-core downloads documents referenced by remote $refs one at a time,
+as it encounters them while building the spec. For schemas split across many
+files this makes load time proportional to the number of files. The
+functions in this module instead discover the graph of external references
+up front and fetch the documents concurrently, then serve them to bravado
+from memory.
+"""
+
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import (Any, Dict, Iterator, Mapping, MutableMapping, Optional,
+                    Set)
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.request import url2pathname
+
+import requests
+from bravado.client import SwaggerClient
+from bravado.requests_client import RequestsClient
+from bravado.swagger_model import Loader
+from bravado_core.spec import is_yaml
+from requests.adapters import HTTPAdapter
+
+from bravado_types.http_cache import (DEFAULT_TIMEOUT, CachedDocument,
+                                      SchemaCache, _DocumentFuture)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class PrefetchedHttpClient(RequestsClient):
+    """
+    Bravado HTTP client which serves schema documents from a mapping of
+    prefetched documents. Other requests are passed through to the network.
+    """
+
+    def __init__(self, documents: Mapping[str, CachedDocument],
+                 **kwargs: Any):
+        """
+        :param documents: Mapping from URL to document.
+        :param kwargs: Arguments for RequestsClient.
+        """
+        super().__init__(**kwargs)
+        self.documents = documents
+
+    def request(self, request_params: MutableMapping[str, Any],
+                operation: Any = None, request_config: Any = None) -> Any:
+        if (operation is None
+                and request_params.get('method', 'GET').upper() == 'GET'
+                and request_params['url'] in self.documents):
+            return _DocumentFuture(self.documents[request_params['url']])
+        return super().request(request_params, operation, request_config)
+
+
+def prefetch_documents(url: str, max_workers: int = DEFAULT_MAX_WORKERS,
+                       cache: SchemaCache = None,
+                       session: requests.Session = None,
+                       request_headers: Mapping[str, str] = None,
+                       timeout: Optional[float] = DEFAULT_TIMEOUT
+                       ) -> Dict[str, CachedDocument]:
+    """
+    Fetch a schema and all documents it references, directly or indirectly,
+    through external $refs.
+
+    Documents are fetched by a pool of worker threads sharing one HTTP
+    session, so connections to the same host are reused. Local files are read
+    by the same pool.
+
+    :param url: Schema URL.
+    :param max_workers: Maximum number of concurrent requests.
+    :param cache: Optional schema cache to fetch HTTP documents through.
+    :param session: Optional requests session to use for HTTP requests when
+        no cache is given.
+    :param request_headers: Extra headers for HTTP requests.
+    :param timeout: Timeout in seconds for HTTP requests made without a
+        cache, or None to wait indefinitely. Requests made through a cache
+        use the timeout of the cache.
+    :return: Mapping from URL to document. Referenced documents which could
+        not be fetched are omitted, so that bravado reports the error when
+        loading the schema.
+    """
+    if session is None and cache is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers,
+                              pool_maxsize=max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    def fetch(doc_url: str) -> CachedDocument:
+        if urlparse(doc_url).scheme == 'file':
+            with open(url2pathname(urlparse(doc_url).path), 'rb') as f:
+                return CachedDocument(doc_url, f.read(), {})
+        if cache is not None:
+            return cache.fetch(doc_url, request_headers)
+        assert session is not None
+        response = session.get(doc_url, headers=request_headers,
+                               timeout=timeout)
+        response.raise_for_status()
+        return CachedDocument(doc_url, response.content, response.headers)
+
+    url = urldefrag(url)[0]
+    documents: Dict[str, CachedDocument] = {}
+    seen: Set[str] = {url}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict['Future[CachedDocument]', str] = {
+            executor.submit(fetch, url): url,
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                doc_url = pending.pop(future)
+                try:
+                    document = future.result()
+                except Exception:
+                    if doc_url == url:
+                        raise
+                    continue
+                documents[doc_url] = document
+                for ref_url in _external_refs(doc_url, _parse(document)):
+                    if ref_url not in seen:
+                        seen.add(ref_url)
+                        pending[executor.submit(fetch, ref_url)] = ref_url
+    return documents
+
+
+def load_client(url: str, max_workers: int = DEFAULT_MAX_WORKERS,
+                cache: SchemaCache = None,
+                config: Dict[str, Any] = None,
+                timeout: Optional[float] = DEFAULT_TIMEOUT) -> SwaggerClient:
+    """
+    Create a bravado client for a schema, fetching referenced documents
+    concurrently.
+
+    :param url: Schema URL.
+    :param max_workers: Maximum number of concurrent requests.
+    :param cache: Optional schema cache to fetch HTTP documents through.
+    :param config: Bravado config dict.
+    :param timeout: Timeout in seconds for HTTP requests made without a
+        cache, or None to wait indefinitely.
+    """
+    documents = prefetch_documents(url, max_workers=max_workers, cache=cache,
+                                   timeout=timeout)
+    client: SwaggerClient = SwaggerClient.from_url(
+        url, http_client=PrefetchedHttpClient(documents), config=config)
+    return client
+
+
+def _parse(document: CachedDocument) -> Any:
+    content_type = document.headers.get('content-type', '').lower()
+    if is_yaml(document.url, content_type):
+        return Loader(http_client=None).load_yaml(document.text)
+    return document.json()
+
+
+def _external_refs(base_url: str, document: Any) -> Iterator[str]:
+    """Yield the URLs of documents referenced by a document."""
+    stack = [document]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            ref = value.get('$ref')
+            if isinstance(ref, str) and not ref.startswith('#'):
+                ref_url = urldefrag(urljoin(base_url, ref))[0]
+                if urlparse(ref_url).scheme in ('http', 'https', 'file'):
+                    yield ref_url
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
@@ -1,34 +1,323 @@
-import pkg_resources
+import io
+import os.path
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
 from mako.lookup import TemplateLookup
 
-from bravado_types.config import Config
+from bravado_types.config import Config, CustomFormats
 from bravado_types.data_model import SpecInfo
-from bravado_types.metadata import Metadata
+from bravado_types.emit import (emit_client_factory, emit_client_factory_stub,
+                                emit_common_stub, emit_lazy_stub, emit_module,
+                                emit_stub)
+from bravado_types.ir import (config_kwargs_from_dict, config_to_dict,
+                              spec_from_dict, spec_to_dict)
+from bravado_types.metadata import Metadata, get_package_version
+from bravado_types.postprocess import PostprocessCache, postprocess_files
+from bravado_types.shared import SharedModels, find_shared_models
+from bravado_types.sinks import FileSink, OutputSink
+from bravado_types.type_index import write_type_index
+from bravado_types.type_strings import render_model_types, render_spec_types
+
+# Directory containing the default templates. The package is not zip-safe, so
+# templates are always available on the filesystem.
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "templates")
+
+# Built-in emitters for the default templates, used when no custom templates
+# directory is configured.
+_EMITTERS: Dict[str, Callable[..., None]] = {
+    "module.py.mako": emit_module,
+    "module.pyi.mako": emit_stub,
+    "module_lazy.pyi.mako": emit_lazy_stub,
+}
 
+# Output file path, template name, and extra template arguments
+_Output = Tuple[str, str, Dict[str, Any]]
 
-def render(metadata: Metadata, spec: SpecInfo, config: Config) -> None:
+
+def render(metadata: Metadata, spec: SpecInfo, config: Config,
+           shared: SharedModels = None, sink: OutputSink = None) -> None:
     """
     Render module and stub files for a given Swagger schema.
+
+    Types are rendered to type strings for the configuration, which the stub
+    templates receive as a dict keyed by type, so the same SpecInfo can be
+    rendered with configurations which differ in any option other than the
+    custom formats, e.g. with list and sequence array types.
+
     :param metadata: Code generation metadata.
     :param spec: SpecInfo representing the schema.
     :param config: Code generation configuration.
+    :param shared: Models to import from a common stub module instead of
+        defining them in the stub file. Not supported with lazy stubs.
+    :param sink: Output sink to write the files to, keyed by the paths given
+        by the configuration. Defaults to writing them to the filesystem.
+    """
+    if shared and config.lazy_stubs:
+        raise ValueError("Lazy stubs do not support shared models")
+
+    if sink is None:
+        sink = FileSink()
+    template_dirs = _template_dirs(config)
+    types = render_spec_types(spec, config)
+
+    outputs: List[_Output] = [(config.py_path, "module.py.mako", {})]
+    if config.lazy_stubs:
+        index_digest = write_type_index(spec, config, types, sink)
+        outputs.append((config.pyi_path, "module_lazy.pyi.mako",
+                        {'index_digest': index_digest}))
+    elif shared:
+        outputs.append((config.pyi_path, "module.pyi.mako",
+                        {'types': types, 'shared': shared}))
+    else:
+        outputs.append((config.pyi_path, "module.pyi.mako",
+                        {'types': types}))
+
+    if config.parallel_render:
+        contents = _render_parallel(template_dirs, outputs, metadata, spec,
+                                    config)
+    else:
+        lookup = _lookup(template_dirs)
+        contents = [
+            _render_text(lookup, template_name, metadata, spec, config, kwargs)
+            for _, template_name, kwargs in outputs
+        ]
+
+    _write_files(sink, {path: content for (path, _, _), content
+                        in zip(outputs, contents)},
+                 config, config.postprocessor)
+
+
+def render_shared(outputs: Sequence[Tuple[Metadata, SpecInfo, Config]],
+                  common_module: str, common_path: str,
+                  sink: OutputSink = None) -> None:
+    """
+    Render module and stub files for several Swagger schemas, emitting models
+    which are structurally identical in two or more schemas into a common
+    stub file, which the stub files for each schema import.
+
+    All schemas must use the same model type format, array types and model
+    inheritance setting. The common stub file is rendered with the custom
+    templates directory and file postprocessor of the first schema's
+    configuration.
+
+    :param outputs: Code generation metadata, SpecInfo and configuration for
+        each schema.
+    :param common_module: Import name of the common stub module.
+    :param common_path: Path of the common stub file. Must end with '.pyi'.
+    :param sink: Output sink to write the files to. Defaults to writing them
+        to the filesystem.
+    """
+    if not outputs:
+        raise ValueError("No schemas to render")
+    if not common_path.endswith(".pyi"):
+        raise ValueError("Common stub path must end with '.pyi'")
+    if not all(part.isidentifier() for part in common_module.split('.')):
+        raise ValueError(f"Invalid module name: {common_module!r}")
+    configs = [config for _, _, config in outputs]
+    config = configs[0]
+    for other in configs:
+        if other.lazy_stubs:
+            raise ValueError("Lazy stubs do not support shared models")
+        if (other.model_type_format != config.model_type_format
+                or other.array_types != config.array_types
+                or other.model_inheritance != config.model_inheritance):
+            raise ValueError("Shared models require the same model type "
+                             "format, array types and model inheritance "
+                             "setting for all schemas")
+
+    models, names = find_shared_models([spec for _, spec, _ in outputs])
+
+    # Configuration for rendering the common stub file
+    packages = {pkg for other in configs if other.custom_formats
+                for pkg in other.custom_formats.packages}
+    common_config = Config(
+        name=common_module.rpartition('.')[2],
+        path=common_path[:-1],
+        model_type_format=config.model_type_format,
+        array_types=config.array_types,
+        model_inheritance=config.model_inheritance,
+        custom_formats=CustomFormats({}, packages) if packages else None,
+        custom_templates_dir=config.custom_templates_dir,
+    )
+    lookup = _lookup(_template_dirs(common_config))
+    kwargs: Dict[str, Any] = {
+        'metadata': outputs[0][0],
+        'models': models,
+        'config': common_config,
+        'types': render_model_types(models, common_config),
+        'schemas': [other.name for other in configs],
+    }
+    if lookup is None:
+        buf = io.StringIO()
+        emit_common_stub(buf, **kwargs)
+        content = buf.getvalue()
+    else:
+        content = lookup.get_template("common.pyi.mako").render(**kwargs)
+    # The common stub file is postprocessed with the file postprocessor of
+    # the first schema's configuration only.
+    _write_files(sink or FileSink(), {common_path: content}, config, None)
+
+    for (metadata, spec, other), spec_names in zip(outputs, names):
+        render(metadata, spec, other, SharedModels(common_module, spec_names),
+               sink)
+
+
+def render_client_factory(clients: Sequence[Tuple[str, Config]], path: str,
+                          sink: OutputSink = None) -> None:
+    """
+    Render a module and stub file defining a ClientFactory class, which
+    creates clients of the given generated client types sharing a pooled
+    HTTP client.
+
+    The files are rendered with the custom templates directory and file
+    postprocessor of the first client's configuration.
+
+    :param clients: Import name of the generated module and configuration
+        it was generated with, for each client type.
+    :param path: Path of the factory module. Must end with '.py'. The stub
+        file is written alongside it.
+    :param sink: Output sink to write the files to. Defaults to writing them
+        to the filesystem.
     """
+    if not clients:
+        raise ValueError("No client types for the client factory")
+    if not path.endswith(".py"):
+        raise ValueError("Client factory path must end with '.py'")
+    client_types = []
+    for module, config in clients:
+        if not all(part.isidentifier() for part in module.split('.')):
+            raise ValueError(f"Invalid module name: {module!r}")
+        if config.async_client:
+            raise ValueError("Client factory does not support async clients")
+        client_type = (module, config.client_type)
+        if client_type in client_types:
+            raise ValueError(f"Duplicate client type: "
+                             f"{module}.{config.client_type}")
+        client_types.append(client_type)
+
+    config = clients[0][1]
+    lookup = _lookup(_template_dirs(config))
+    kwargs: Dict[str, Any] = {
+        'clients': client_types,
+        'bravado_types_version': get_package_version('bravado-types'),
+        'bravado_version': get_package_version('bravado'),
+        'timestamp': datetime.now(timezone.utc),
+    }
+    files = {}
+    for file_path, template_name, emitter in [
+        (path, "client_factory.py.mako", emit_client_factory),
+        (f"{path}i", "client_factory.pyi.mako", emit_client_factory_stub),
+    ]:
+        if lookup is None:
+            buf = io.StringIO()
+            emitter(buf, **kwargs)
+            files[file_path] = buf.getvalue()
+        else:
+            files[file_path] = lookup.get_template(template_name).render(
+                **kwargs)
+    _write_files(sink or FileSink(), files, config, None)
+
+
+def _template_dirs(config: Config) -> List[str]:
     template_dirs = []
     if config.custom_templates_dir:
         template_dirs.append(config.custom_templates_dir)
-    template_dirs.append(
-        pkg_resources.resource_filename(__name__, "templates/"))
-    lookup = TemplateLookup(directories=template_dirs)
-
-    py_template = lookup.get_template("module.py.mako")
-    with open(config.py_path, "w") as f:
-        f.write(py_template.render(metadata=metadata, spec=spec,
-                                   config=config))
-
-    pyi_template = lookup.get_template("module.pyi.mako")
-    with open(config.pyi_path, "w") as f:
-        f.write(pyi_template.render(metadata=metadata, spec=spec,
-                                    config=config))
-
-    if config.postprocessor:
-        config.postprocessor(config.py_path, config.pyi_path)
+    template_dirs.append(TEMPLATES_DIR)
+    return template_dirs
+
+
+def _render_parallel(template_dirs: List[str], outputs: Sequence[_Output],
+                     metadata: Metadata, spec: SpecInfo,
+                     config: Config) -> List[str]:
+    """
+    Render each output file in a separate worker process, and return their
+    contents.
+    """
+    # Bravado objects referenced by the type information are not picklable,
+    # so workers receive the same representation used for IR files.
+    spec_data = spec_to_dict(spec)
+    config_data = config_to_dict(config)
+    with ProcessPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = [
+            executor.submit(_render_worker, template_dirs, template_name,
+                            metadata, spec_data, config_data, kwargs)
+            for _, template_name, kwargs in outputs
+        ]
+        return [future.result() for future in futures]
+
+
+def _render_worker(template_dirs: List[str], template_name: str,
+                   metadata: Metadata, spec_data: Dict[str, Any],
+                   config_data: Dict[str, Any],
+                   kwargs: Dict[str, Any]) -> str:
+    config = Config(**config_kwargs_from_dict(config_data))
+    return _render_text(_lookup(template_dirs), template_name, metadata,
+                        spec_from_dict(spec_data), config, kwargs)
+
+
+def _lookup(template_dirs: List[str]) -> Optional[TemplateLookup]:
+    """Get a template lookup, or None to use the built-in emitters."""
+    if template_dirs == [TEMPLATES_DIR]:
+        return None
+    return TemplateLookup(directories=template_dirs)
+
+
+def _render_text(lookup: Optional[TemplateLookup], template_name: str,
+                 metadata: Metadata, spec: SpecInfo, config: Config,
+                 kwargs: Dict[str, Any]) -> str:
+    if lookup is None:
+        buf = io.StringIO()
+        _EMITTERS[template_name](buf, metadata, spec, config, **kwargs)
+        return buf.getvalue()
+
+    template = lookup.get_template(template_name)
+    text: str = template.render(metadata=metadata, spec=spec, config=config,
+                                **kwargs)
+    return text
+
+
+def _write_files(sink: OutputSink, files: Dict[str, str], config: Config,
+                 postprocessor: Optional[Callable[[str, str], Any]]) -> None:
+    """
+    Write files to a sink, then postprocess them with the file postprocessor
+    of a configuration and the given postprocessor, if any.
+    """
+    if not config.file_postprocessor and not postprocessor:
+        for path, content in files.items():
+            sink.write(path, content)
+    elif isinstance(sink, FileSink):
+        for path, content in files.items():
+            sink.write(path, content)
+        _postprocess(list(files), config, postprocessor)
+    else:
+        # Postprocessors modify files in place, so files for other sinks are
+        # postprocessed in a temporary directory. File names are kept, as
+        # tools may treat files differently by extension.
+        with tempfile.TemporaryDirectory() as directory:
+            tmp_paths = {path: os.path.join(directory, os.path.basename(path))
+                         for path in files}
+            file_sink = FileSink()
+            for path, content in files.items():
+                file_sink.write(tmp_paths[path], content)
+            _postprocess(list(tmp_paths.values()), config, postprocessor)
+            for path, tmp_path in tmp_paths.items():
+                with open(tmp_path) as f:
+                    sink.write(path, f.read())
+
+
+def _postprocess(paths: List[str], config: Config,
+                 postprocessor: Optional[Callable[[str, str], Any]]) -> None:
+    if config.file_postprocessor:
+        cache = None
+        if config.postprocess_cache_dir:
+            cache = PostprocessCache(config.postprocess_cache_dir,
+                                     config.file_postprocessor,
+                                     config.postprocess_cache_key)
+        postprocess_files(paths, config.file_postprocessor, cache)
+
+    if postprocessor:
+        postprocessor(*paths)
@@ -0,0 +1,296 @@
+"""
+Footprint report for generated stub files.
+
+Lists the lines and bytes of the stub file taken up by each model, operation
+and resource of a spec, along with the type expressions, response unions and
+model signatures which are most expensive to type check.
+"""
+
+import io
+from typing import Any, Callable, Dict, List, Sequence, TypeVar
+
+from bravado_types.config import Config, ResponseTypes
+from bravado_types.data_model import OperationInfo, SpecInfo, TypeInfo
+from bravado_types.emit import emit_stub, stub_elements
+from bravado_types.metadata import Metadata
+from bravado_types.type_strings import render_spec_types
+
+_T = TypeVar('_T')
+
+
+class ElementFootprint:
+    """Size of the part of the stub file for an element of a spec."""
+
+    def __init__(self, kind: str, name: str, lines: int, size: int):
+        """
+        :param kind: 'get_model', 'resource', 'operation' or 'model'.
+        :param name: Element name.
+        :param lines: Number of lines.
+        :param size: Number of bytes.
+        """
+        self.kind = kind
+        self.name = name
+        self.lines = lines
+        self.size = size
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'kind': self.kind, 'name': self.name, 'lines': self.lines,
+                'bytes': self.size}
+
+
+class TypeExpression:
+    """A type expression used in the stub file."""
+
+    def __init__(self, location: str, type: str):
+        """
+        :param location: Model property, operation parameter or operation
+            response which has the type, e.g. 'Pet.tags', 'addPet(body)' or
+            'getPetById -> 200'.
+        :param type: Type expression.
+        """
+        self.location = location
+        self.type = type
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'location': self.location, 'type': self.type,
+                'length': len(self.type)}
+
+
+class ResponseUnion:
+    """Members of the result type of an operation."""
+
+    def __init__(self, operation: str, types: List[str]):
+        self.operation = operation
+        self.types = types
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'operation': self.operation, 'members': len(self.types),
+                'types': self.types}
+
+
+class ModelSignature:
+    """Size of the __init__ signature of a model type."""
+
+    def __init__(self, model: str, params: int, lines: int, size: int):
+        self.model = model
+        self.params = params
+        self.lines = lines
+        self.size = size
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'model': self.model, 'params': self.params,
+                'lines': self.lines, 'bytes': self.size}
+
+
+class StubReport:
+    """Footprint report for a stub file."""
+
+    def __init__(self, lines: int, size: int,
+                 elements: List[ElementFootprint],
+                 types: List[TypeExpression], unions: List[ResponseUnion],
+                 signatures: List[ModelSignature]):
+        """
+        :param lines: Number of lines of the stub file.
+        :param size: Number of bytes of the stub file.
+        :param elements: Footprint of each element, in stub file order.
+        :param types: Type expressions, longest first.
+        :param unions: Operation result types, widest first.
+        :param signatures: Model __init__ signatures, largest first.
+        """
+        self.lines = lines
+        self.size = size
+        self.elements = elements
+        self.types = types
+        self.unions = unions
+        self.signatures = signatures
+
+    @property
+    def get_model(self) -> ElementFootprint:
+        """Footprint of the get_model() overloads of the client type."""
+        for element in self.elements:
+            if element.kind == 'get_model':
+                return element
+        return ElementFootprint('get_model', 'get_model', 0, 0)
+
+    def to_dict(self, sort: str = 'bytes', top: int = 0) -> Dict[str, Any]:
+        """
+        Convert the report to a JSON-serializable dict.
+        :param sort: Sort key for elements, one of SORT_KEYS.
+        :param top: Maximum number of entries in each list, or 0 for all.
+        """
+        return {
+            'lines': self.lines,
+            'bytes': self.size,
+            'elements': [e.to_dict() for e in
+                         _top(sort_elements(self.elements, sort), top)],
+            'get_model': self.get_model.to_dict(),
+            'types': [t.to_dict() for t in _top(self.types, top)],
+            'unions': [u.to_dict() for u in _top(self.unions, top)],
+            'signatures': [s.to_dict() for s in _top(self.signatures, top)],
+        }
+
+
+# Sort keys for elements. Sizes sort largest first.
+SORT_KEYS: Dict[str, Callable[[ElementFootprint], Any]] = {
+    'bytes': lambda e: (-e.size, e.kind, e.name),
+    'lines': lambda e: (-e.lines, e.kind, e.name),
+    'name': lambda e: (e.name, e.kind),
+    'kind': lambda e: (e.kind, -e.size, e.name),
+}
+
+
+def get_report(metadata: Metadata, spec: SpecInfo, config: Config
+               ) -> StubReport:
+    """
+    Compute the footprint report for the stub file of a spec.
+
+    The report describes the full stub file, as rendered by the default
+    templates. It does not support lazy stubs, whose size does not depend on
+    the individual elements of the spec.
+
+    :param metadata: Code generation metadata.
+    :param spec: SpecInfo representing the schema.
+    :param config: Code generation configuration.
+    """
+    if config.lazy_stubs:
+        raise ValueError("Report does not support lazy stubs")
+
+    types = render_spec_types(spec, config)
+    buf = io.StringIO()
+    emit_stub(buf, metadata, spec, config, types)
+    stub = buf.getvalue()
+
+    elements = []
+    signatures = []
+    for kind, name, text in stub_elements(spec, config, types):
+        elements.append(ElementFootprint(kind, name, text.count('\n'),
+                                         _size(text)))
+        if kind == 'model':
+            start = text.index('    def __init__(')
+            end = text.index(') -> None:', start) + len(') -> None:')
+            signature = text[start:end]
+            model = next(m for m in spec.models if m.name == name)
+            signatures.append(ModelSignature(name, len(model.props),
+                                             signature.count('\n') + 1,
+                                             _size(signature)))
+
+    expressions = []
+    for model in spec.models:
+        for prop in model.props:
+            expressions.append(TypeExpression(f'{model.name}.{prop.name}',
+                                              types[prop.type]))
+    for operation in spec.operations:
+        for param in operation.params:
+            expressions.append(TypeExpression(
+                f'{operation.name}({param.name})', types[param.type]))
+        for response in operation.responses:
+            expressions.append(TypeExpression(
+                f'{operation.name} -> {response.status}',
+                types[response.type]))
+
+    unions = [ResponseUnion(operation.name,
+                            _result_types(operation, config, types))
+              for operation in spec.operations]
+
+    return StubReport(
+        lines=stub.count('\n'),
+        size=_size(stub),
+        elements=elements,
+        types=sorted(expressions,
+                     key=lambda t: (-len(t.type), t.location)),
+        unions=sorted(unions, key=lambda u: (-len(u.types), u.operation)),
+        signatures=sorted(signatures, key=lambda s: (-s.size, s.model)),
+    )
+
+
+def sort_elements(elements: Sequence[ElementFootprint], sort: str
+                  ) -> List[ElementFootprint]:
+    """Sort element footprints by one of SORT_KEYS."""
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort!r}")
+    return sorted(elements, key=SORT_KEYS[sort])
+
+
+def format_report(report: StubReport, sort: str = 'bytes', top: int = 20
+                  ) -> str:
+    """
+    Format a report as text tables.
+    :param report: Report to format.
+    :param sort: Sort key for elements, one of SORT_KEYS.
+    :param top: Maximum number of rows in each table, or 0 for all.
+    """
+    out = [f"Stub file: {report.lines} lines, {report.size} bytes", ""]
+
+    elements = sort_elements(report.elements, sort)
+    out.append(f"Elements by {sort}{_shown(elements, top)}:")
+    out += _table(
+        ['kind', 'name', 'lines', 'bytes', '%'],
+        [[e.kind, e.name, e.lines, e.size,
+          f'{100 * e.size / report.size:.1f}' if report.size else '0.0']
+         for e in _top(elements, top)])
+    out.append("")
+
+    out.append(f"Largest type expressions{_shown(report.types, top)}:")
+    out += _table(['length', 'location', 'type'],
+                  [[len(t.type), t.location, t.type]
+                   for t in _top(report.types, top)])
+    out.append("")
+
+    out.append(f"Widest response unions{_shown(report.unions, top)}:")
+    out += _table(['members', 'operation'],
+                  [[len(u.types), u.operation]
+                   for u in _top(report.unions, top)])
+    out.append("")
+
+    get_model = report.get_model
+    out.append(f"get_model overloads: {get_model.lines} lines, "
+               f"{get_model.size} bytes")
+    out.append("")
+
+    out.append("Longest model __init__ signatures"
+               f"{_shown(report.signatures, top)}:")
+    out += _table(['params', 'lines', 'bytes', 'model'],
+                  [[s.params, s.lines, s.size, s.model]
+                   for s in _top(report.signatures, top)])
+    return '\n'.join(out) + '\n'
+
+
+def _result_types(operation: OperationInfo, config: Config,
+                  types: Dict[TypeInfo, str]) -> List[str]:
+    """Get the members of the result type of an operation."""
+    if config.response_types == ResponseTypes.success:
+        return [types[r.type] for r in operation.responses if r.success]
+    elif config.response_types == ResponseTypes.all:
+        return [types[r.type] for r in operation.responses]
+    return []
+
+
+def _size(text: str) -> int:
+    return len(text.encode('utf-8'))
+
+
+def _top(items: Sequence[_T], top: int) -> Sequence[_T]:
+    return items[:top] if top else items
+
+
+def _shown(items: Sequence[Any], top: int) -> str:
+    if top and len(items) > top:
+        return f" (top {top} of {len(items)})"
+    return ""
+
+
+def _table(headers: List[str], rows: List[List[Any]]) -> List[str]:
+    """Format rows as a table, right-aligning numeric columns."""
+    if not rows:
+        return ["  (none)"]
+    widths = [max(len(str(value)) for value in column)
+              for column in zip(headers, *rows)]
+    numeric = [all(isinstance(row[i], int) or header == '%'
+                   for row in rows)
+               for i, header in enumerate(headers)]
+    lines = []
+    for row in [headers] + rows:
+        cells = [str(value).rjust(width) if num else str(value).ljust(width)
+                 for value, width, num in zip(row, widths, numeric)]
+        lines.append('  ' + '  '.join(cells).rstrip())
+    return lines
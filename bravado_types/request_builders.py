@@ -0,0 +1,219 @@
+"""
+Generated request builders for the fast_requests option.
+
+For each operation, the generated module contains a function which builds
+the request dict for a call in the same way as
+bravado.client.construct_request(), with the encoding of each parameter
+specialized for its location and schema. Parameter values which the builder
+cannot handle directly, such as values with custom formats, model values of
+non-body parameters and files, are passed to
+bravado_core.param.marshal_param().
+
+Each builder is used only if the parameters of the operation at runtime have
+the same request_signature() as when the module was generated, so a module
+can be used with a different version of the schema.
+
+The body lines returned by request_builder_body() are used by both the
+module.py.mako template and the built-in emitter.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from bravado_types.data_model import OperationInfo, ParameterInfo
+
+# Types whose values are sent as str(value) when they have no format
+_PRIMITIVE_TYPES = {'string', 'integer', 'number', 'boolean'}
+
+# Formats whose default marshaling returns values of these types unchanged
+_FORMAT_CHECKS = {
+    'int32': 'type(value) is int',
+    'int64': 'type(value) is int',
+    'float': 'type(value) is float',
+    'double': 'type(value) is float',
+}
+
+_COLLECTION_SEPARATORS = {'csv': ',', 'ssv': ' ', 'tsv': '\t', 'pipes': '|'}
+
+# Checks for values which are valid for a schema of each type without other
+# constraints
+_TYPE_CHECKS = {
+    'string': 'type({}) is str',
+    'integer': 'type({}) is int',
+    'number': 'type({}) in (int, float)',
+    'boolean': 'type({}) is bool',
+}
+
+# Schema keys which do not constrain the values of a type
+_UNCONSTRAINED_KEYS = {'type', 'format', 'collectionFormat',
+                       'allowEmptyValue', 'items'}
+
+
+def request_signature(operation: OperationInfo) -> str:
+    """
+    Get a digest of the parameter information used by the request builder
+    of an operation. The generated module computes the same digest from the
+    parameters of the operation at runtime.
+    """
+    data = {param.name: [param.location, param.wire_name, param.required,
+                         param.schema]
+            for param in operation.params}
+    text = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def request_builder_body(operation: OperationInfo) -> List[str]:
+    """
+    Get the lines of the body of the request builder for an operation,
+    without indentation. The builder takes the arguments context,
+    request_options and op_kwargs.
+    """
+    lines = ['request = _new_request(context, request_options)',
+             'op_kwargs = _check_params(context, op_kwargs)']
+    for param in operation.params:
+        lines += _param_lines(param)
+    lines.append('return request')
+    return lines
+
+
+def _param_lines(param: ParameterInfo) -> List[str]:
+    """Get the lines which add a parameter value to the request."""
+    name = repr(param.name)
+    marshal = f'_marshal_param(context, {name}, value, request)'
+    fast = _fast_path(param)
+
+    if param.location == 'header' or param.required:
+        lines = [f'value = op_kwargs.get({name}, _MISSING)',
+                 'if value is _MISSING:']
+        if param.location == 'header':
+            # As in bravado, a header passed in the request options is
+            # marshalled as the parameter value
+            wire_name = repr(param.wire_name)
+            lines += [f"    if {wire_name} in request['headers']:",
+                      f"        value = request['headers'][{wire_name}]",
+                      f'        {marshal}']
+            if param.required:
+                lines.append('    else:')
+                lines += _indent(_required_lines(param), 2)
+        else:
+            lines += _indent(_required_lines(param), 1)
+        if fast is None:
+            lines += ['else:', f'    {marshal}']
+        else:
+            check, statements = fast
+            lines.append(f'elif {check or "value is not None"}:')
+            lines += _indent(statements, 1)
+            lines += ['else:', f'    {marshal}']
+        return lines
+
+    # Optional parameters which are missing or None are left out
+    lines = [f'value = op_kwargs.get({name})',
+             'if value is not None:']
+    if fast is None:
+        lines.append(f'    {marshal}')
+    elif fast[0] is None:
+        lines += _indent(fast[1], 1)
+    else:
+        check, statements = fast
+        lines.append(f'    if {check}:')
+        lines += _indent(statements, 2)
+        lines += ['    else:', f'        {marshal}']
+    return lines
+
+
+def _required_lines(param: ParameterInfo) -> List[str]:
+    return [f'raise _missing_param({param.wire_name!r})']
+
+
+def _fast_path(param: ParameterInfo
+               ) -> Optional[Tuple[Optional[str], List[str]]]:
+    """
+    Get the code which adds a non-None parameter value to the request
+    without marshal_param().
+
+    :return: A condition on the value for using the code, or None if the
+        code handles all values other than None, and the statements. None if
+        all values are passed to marshal_param().
+    """
+    schema = param.schema or {}
+    name = repr(param.name)
+    validate = ['if context.validate:',
+                f'    _validate(context, {name}, value)']
+
+    if param.location == 'body':
+        return ('not _msgpack_body(request)', [
+            f'value = _marshal(context, {name}, value)',
+            *validate,
+            "request['headers']['Content-Type'] = 'application/json'",
+            "request['data'] = simplejson.dumps(value)",
+        ])
+
+    ptype = schema.get('type')
+    if ptype in _PRIMITIVE_TYPES:
+        if 'format' not in schema:
+            check = None
+        elif schema['format'] in _FORMAT_CHECKS:
+            check = _FORMAT_CHECKS[schema['format']]
+        else:
+            return None
+        if param.location == 'formData':
+            encoded = 'value'
+        elif ptype == 'boolean' and param.location != 'path':
+            encoded = 'str(value).lower()'
+        else:
+            encoded = 'str(value)'
+        if _is_unconstrained(schema):
+            # Values which pass the check are valid, so validation is skipped
+            return (check or _TYPE_CHECKS[ptype].format('value'),
+                    _add_value_lines(param, encoded))
+        return check, validate + _add_value_lines(param, encoded)
+
+    if ptype == 'array':
+        items = schema.get('items', {})
+        if items.get('type') not in _PRIMITIVE_TYPES or 'format' in items:
+            return None
+        collection_format = schema.get('collectionFormat', 'csv')
+        if collection_format == 'multi':
+            if param.location not in ('query', 'formData'):
+                return None
+            encoded = 'list(value)'
+        else:
+            separator = _COLLECTION_SEPARATORS[collection_format]
+            encoded = f'{separator!r}.join([str(item) for item in value])'
+        if _is_unconstrained(schema) and _is_unconstrained(items):
+            item_check = _TYPE_CHECKS[items['type']].format('item')
+            return ('isinstance(value, (list, tuple)) and '
+                    f'all({item_check} for item in value)',
+                    _add_value_lines(param, encoded))
+        return ('isinstance(value, (list, tuple)) and None not in value', [
+            'if context.validate:',
+            f'    _validate(context, {name}, list(value))',
+            *_add_value_lines(param, encoded),
+        ])
+
+    return None
+
+
+def _is_unconstrained(schema: Dict[str, Any]) -> bool:
+    """Check whether a schema has no validation keywords besides its type."""
+    return schema.keys() <= _UNCONSTRAINED_KEYS
+
+
+def _add_value_lines(param: ParameterInfo, encoded: str) -> List[str]:
+    """Get the statements which add an encoded value to the request."""
+    wire_name = repr(param.wire_name)
+    if param.location == 'path':
+        token = repr(f'{{{param.wire_name}}}')
+        return ["request['url'] = request['url'].replace(",
+                f"    {token}, urllib.parse.quote({encoded}, safe=','))"]
+    elif param.location == 'query':
+        return [f"request['params'][{wire_name}] = {encoded}"]
+    elif param.location == 'header':
+        return [f"request['headers'][{wire_name}] = {encoded}"]
+    else:
+        return [f"request.setdefault('data', {{}})[{wire_name}] = {encoded}"]
+
+
+def _indent(lines: List[str], level: int) -> List[str]:
+    return ['    ' * level + line for line in lines]
@@ -0,0 +1,111 @@
+"""
+Detection of models shared between schemas.
+
+Schemas for related services often reuse the same definitions. When stubs for
+several schemas are rendered together with render_shared(), models which are
+structurally identical in two or more schemas are emitted once into a common
+stub module, which the stubs for each schema import.
+"""
+
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+from bravado_types.data_model import ModelInfo, SpecInfo, TypeInfo
+
+_ModelKey = Tuple[str, Tuple[str, ...], Tuple[Tuple[str, TypeInfo, bool], ...]]
+
+
+class SharedModels:
+    """Models which a stub file imports from a common stub module."""
+
+    def __init__(self, module: str, names: FrozenSet[str]):
+        """
+        :param module: Import name of the common stub module.
+        :param names: Names of the models to import.
+        """
+        self.module = module
+        self.names = names
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, SharedModels)
+                and self.module == other.module
+                and self.names == other.names)
+
+    def __repr__(self) -> str:
+        return f'SharedModels({self.module!r}, {sorted(self.names)!r})'
+
+
+def find_shared_models(specs: Sequence[SpecInfo]
+                       ) -> Tuple[List[ModelInfo], List[FrozenSet[str]]]:
+    """
+    Find models which are structurally identical in two or more schemas.
+
+    Models are compared by name, parents and properties. If schemas define
+    different models with the same name, the most common definition is
+    shared. A model is only shared by a schema if all models it references
+    are also shared by that schema, so that the common stub module refers to
+    the same types as the schema.
+
+    :param specs: Type information for each schema.
+    :return: The shared models, in the order in which they are first defined,
+        and the names of the shared models used by each schema.
+    """
+    # Schemas defining each variant of each model name
+    variants: Dict[str, Dict[_ModelKey, List[int]]] = {}
+    first: Dict[_ModelKey, ModelInfo] = {}
+    for i, spec in enumerate(specs):
+        for model in spec.models:
+            key = _model_key(model)
+            variants.setdefault(model.name, {}).setdefault(key, []).append(i)
+            first.setdefault(key, model)
+
+    # Pick the most common variant of each name, preferring the first
+    chosen: Dict[str, _ModelKey] = {}
+    for name, keys in variants.items():
+        key = max(keys, key=lambda k: len(keys[k]))
+        if len(keys[key]) > 1:
+            chosen[name] = key
+
+    refs = {name: _model_refs(first[key]) & variants.keys()
+            for name, key in chosen.items()}
+    used: List[Set[str]] = [
+        {model.name for model in spec.models
+         if chosen.get(model.name) == _model_key(model)}
+        for spec in specs
+    ]
+
+    changed = True
+    while changed:
+        changed = False
+        # Unshare models whose references are not shared by the schema
+        for names in used:
+            for name in list(names):
+                if not refs[name] <= names:
+                    names.discard(name)
+                    changed = True
+        # Unshare models used by fewer than two schemas
+        for name in list(chosen):
+            if sum(name in names for names in used) < 2:
+                del chosen[name]
+                for names in used:
+                    names.discard(name)
+                changed = True
+
+    models = [first[key] for key in first
+              if chosen.get(first[key].name) == key]
+    return models, [frozenset(names) for names in used]
+
+
+def _model_key(model: ModelInfo) -> _ModelKey:
+    """Get a hashable key representing the structure of a model."""
+    return (model.name, tuple(model.parents),
+            tuple((prop.name, prop.type, prop.required)
+                  for prop in model.props))
+
+
+def _model_refs(model: ModelInfo) -> Set[str]:
+    """Get the names of the models referenced by a model."""
+    refs = set(model.parents)
+    for prop in model.props:
+        if prop.type.model:
+            refs.add(prop.type.name)
+    return refs
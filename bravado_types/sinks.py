@@ -0,0 +1,100 @@
+"""
+Output sinks for generated files.
+
+By default, generated files are written to the paths given by the
+configuration. Passing a different sink to generate_module() or render()
+sends the content of each file elsewhere, such as to an in-memory mapping or
+a zip archive, keyed by the same paths.
+"""
+
+import abc
+import os.path
+import posixpath
+import zipfile
+from typing import IO, Callable, Dict
+
+
+class OutputSink(abc.ABC):
+    """Destination for generated files."""
+
+    @abc.abstractmethod
+    def write(self, path: str, content: str) -> None:
+        """
+        Write a generated file.
+
+        :param path: Path of the file, as given by the configuration.
+        :param content: Content of the file.
+        """
+
+
+class FileSink(OutputSink):
+    """Sink which writes files to the filesystem. This is the default."""
+
+    def write(self, path: str, content: str) -> None:
+        with open(path, 'w') as f:
+            f.write(content)
+
+
+class MemorySink(OutputSink):
+    """Sink which keeps the content of each file in a dict."""
+
+    def __init__(self) -> None:
+        self.files: Dict[str, str] = {}
+
+    def write(self, path: str, content: str) -> None:
+        self.files[path] = content
+
+
+class WriterSink(OutputSink):
+    """
+    Sink which writes each file to a file object returned by a function, for
+    example a build tool's output stream.
+    """
+
+    def __init__(self, opener: Callable[[str], IO[str]], close: bool = True):
+        """
+        :param opener: Function which returns a writable text file object
+            for the path of a file.
+        :param close: Whether to close each file object after writing to it.
+        """
+        self.opener = opener
+        self.close = close
+
+    def write(self, path: str, content: str) -> None:
+        f = self.opener(path)
+        try:
+            f.write(content)
+        finally:
+            if self.close:
+                f.close()
+
+
+class ZipSink(OutputSink):
+    """
+    Sink which adds files to a zip archive, such as a wheel being built.
+    Files are encoded as UTF-8.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, root: str = None):
+        """
+        :param archive: Zip archive open for writing.
+        :param root: Directory to which the archive names of files are
+            relative. If not given, paths are used as archive names, without
+            any leading separator. Paths outside the root directory are
+            rejected.
+        """
+        self.archive = archive
+        self.root = root
+
+    def write(self, path: str, content: str) -> None:
+        self.archive.writestr(self.archive_name(path),
+                              content.encode('utf-8'))
+
+    def archive_name(self, path: str) -> str:
+        """Get the archive name of a file."""
+        if self.root is not None:
+            path = os.path.relpath(path, self.root)
+        name = posixpath.normpath(path.replace(os.sep, '/')).lstrip('/')
+        if name == '..' or name.startswith('../'):
+            raise ValueError(f"Path outside of archive root: {path}")
+        return name
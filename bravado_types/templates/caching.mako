@@ -0,0 +1,259 @@
+<%page args="callable_base" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
+class _CacheInfo:
+    """Hit and miss statistics of the response cache of an operation."""
+
+    __slots__ = ('hits', 'misses', 'maxsize', 'currsize')
+
+    def __init__(self, hits, misses, maxsize, currsize):
+        self.hits = hits
+        self.misses = misses
+        self.maxsize = maxsize
+        self.currsize = currsize
+
+    def __repr__(self):
+        return (f'_CacheInfo(hits={self.hits}, misses={self.misses}, '
+                f'maxsize={self.maxsize}, currsize={self.currsize})')
+
+
+class _OperationCache:
+    """LRU cache of the results of an operation's calls."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Map of cache keys to (expiry time, result, incoming response)
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Incremented when entries are invalidated, so that responses of
+        # calls made before are not cached
+        self.generation = 0
+
+
+class _ResponseCache:
+    """Response caches of the operations of a client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._caches = {}
+        self._operations = {}
+
+    def __contains__(self, name):
+        return name in self._caches
+
+    def configure(self, name, maxsize, ttl):
+        with self._lock:
+            self._caches[name] = _OperationCache(maxsize, ttl)
+
+    def get(self, operation, key):
+        """
+        Look up the cached result of a call.
+
+        :return: Tuple of the cache entry, or None on a miss, and the
+            generation of the operation's cache.
+        """
+        name = operation.operation_id
+        with self._lock:
+            self._operations[name] = operation
+            cache = self._caches.get(name)
+            if cache is None:
+                return None, None
+            entry = cache.entries.get(key)
+            if (entry is not None and entry[0] is not None
+                    and entry[0] <= time.monotonic()):
+                del cache.entries[key]
+                entry = None
+            if entry is None:
+                cache.misses += 1
+            else:
+                cache.hits += 1
+                cache.entries.move_to_end(key)
+            return entry, cache.generation
+
+    def put(self, name, key, generation, result, incoming_response):
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None or cache.generation != generation:
+                return
+            ttl = _response_ttl(incoming_response.headers, cache.ttl)
+            if cache.maxsize == 0 or (ttl is not None and ttl <= 0):
+                return
+            expires = None if ttl is None else time.monotonic() + ttl
+            cache.entries[key] = (expires, result, incoming_response)
+            cache.entries.move_to_end(key)
+            if cache.maxsize is not None:
+                while len(cache.entries) > cache.maxsize:
+                    cache.entries.popitem(last=False)
+
+    def invalidate(self, name, params):
+        with self._lock:
+            names = list(self._caches) if name is None else [name]
+            for name in names:
+                cache = self._caches.get(name)
+                if cache is None:
+                    continue
+                cache.generation += 1
+                if not params:
+                    cache.entries.clear()
+                elif name in self._operations:
+                    key = _cache_key(self._operations[name], params)
+                    cache.entries.pop(key, None)
+
+    def info(self, name):
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                raise ValueError(f"Response cache of {name} is not "
+                                 "configured")
+            return _CacheInfo(cache.hits, cache.misses, cache.maxsize,
+                              len(cache.entries))
+
+
+def _cache_key(operation, op_kwargs):
+    """
+    Get the cache key of an operation call, or None if the call is not
+    cached.
+    """
+    # Parameters are normalized as by bravado.client.construct_params(),
+    # where None is the same as a missing value.
+    params = operation.params
+    values = {}
+    for name, value in op_kwargs.items():
+        if name == '_request_options':
+            continue
+        key = params.determine_key(name)
+        if key not in params or key in values:
+            # Invalid calls are left to bravado to report
+            return None
+        if value is not None:
+            values[key] = value
+    for key, param in params.items():
+        if key not in values and param.has_default():
+            values[key] = param.default
+    headers = op_kwargs.get('_request_options', {}).get('headers', {})
+    try:
+        return json.dumps(
+            [values, {k.lower(): v for k, v in headers.items()}],
+            sort_keys=True, separators=(',', ':'), default=_key_default)
+    except (TypeError, ValueError):
+        return None
+
+
+def _key_default(value):
+    if isinstance(value, bravado_core.model.Model):
+        return value._as_dict()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f"Cannot use {type(value).__name__} in cache key")
+
+
+def _response_ttl(headers, ttl):
+    """
+    Get the time in seconds for which to cache a response, from its
+    Cache-Control or Expires header and the configured time to live.
+    """
+    headers = {k.lower(): v for k, v in headers.items()}
+    max_age = None
+    for directive in headers.get('cache-control', '').lower().split(','):
+        name, _, value = directive.strip().partition('=')
+        if name in ('no-store', 'no-cache'):
+            return 0
+        if name == 'max-age':
+            try:
+                max_age = int(value.strip('"'))
+            except ValueError:
+                return 0
+    if max_age is not None:
+        try:
+            max_age -= int(headers.get('age', 0))
+        except ValueError:
+            pass
+    elif 'expires' in headers:
+        try:
+            expires = email.utils.parsedate_to_datetime(headers['expires'])
+            if 'date' in headers:
+                now = email.utils.parsedate_to_datetime(
+                    headers['date']).timestamp()
+            else:
+                now = time.time()
+            max_age = expires.timestamp() - now
+        except (TypeError, ValueError):
+            # Invalid dates, such as '0', mean that the response is expired
+            return 0
+    if max_age is None:
+        return ttl
+    return max_age if ttl is None else min(ttl, max_age)
+
+
+class _CachedHttpFuture(bravado.http_future.HttpFuture):
+    """
+    Future for an operation call answered from the response cache. Each
+    call returns a copy of the cached result, so that changes to it do not
+    affect later calls.
+    """
+
+    def __init__(self, operation, request_config, result, incoming_response):
+        super().__init__(None, None, operation, request_config)
+        self._result = result
+        self._incoming_response = incoming_response
+
+    def cancel(self):
+        pass
+
+    def _get_incoming_response(self, timeout=None):
+        return self._incoming_response
+
+    def _get_swagger_result(self, incoming_response):
+        return copy.deepcopy(self._result)
+
+
+def _cache_future(future, cache, name, key, generation):
+    # Cache a copy of the result once the response is unmarshalled without
+    # errors, as the caller may change the result
+    get_swagger_result = future._get_swagger_result
+
+    def _get_swagger_result(incoming_response):
+        result = get_swagger_result(incoming_response)
+        cache.put(name, key, generation, copy.deepcopy(result),
+                  incoming_response)
+        return result
+
+    future._get_swagger_result = _get_swagger_result
+    return future
+
+
+class _CachingCallableOperation(${callable_base}):
+    def __init__(self, operation, also_return_response, cache):
+        super().__init__(operation, also_return_response)
+        self._cache = cache
+
+    def __call__(self, **op_kwargs):
+        name = self.operation.operation_id
+        if name not in self._cache:
+            return super().__call__(**op_kwargs)
+        key = _cache_key(self.operation, op_kwargs)
+        if key is None:
+            return super().__call__(**op_kwargs)
+        entry, generation = self._cache.get(self.operation, key)
+        if entry is not None:
+            request_config = bravado.config.RequestConfig(
+                op_kwargs.get('_request_options', {}),
+                self.also_return_response)
+            return _CachedHttpFuture(self.operation, request_config,
+                                     entry[1], entry[2])
+        return _cache_future(super().__call__(**op_kwargs), self._cache,
+                             name, key, generation)
+
+
+class _CachingResourceDecorator(bravado.client.ResourceDecorator):
+    def __init__(self, resource, also_return_response, cache):
+        super().__init__(resource, also_return_response)
+        self._cache = cache
+
+    def __getattr__(self, name):
+        return _CachingCallableOperation(
+            getattr(self.resource, name), self.also_return_response,
+            self._cache)
+
+
@@ -0,0 +1,134 @@
+<%page args="clients, bravado_types_version, bravado_version, timestamp" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
+# Generated by bravado-types ${bravado_types_version}
+# Timestamp: ${timestamp}
+# Client types: ${', '.join(f'{module}.{client_type}' for module, client_type in clients)}
+# Bravado version: ${bravado_version}
+"""Factory for generated clients sharing a pooled HTTP client."""
+
+import copy
+import socket
+
+import bravado.requests_client
+import requests.adapters
+import urllib3.connection
+
+% for module in sorted({module for module, _ in clients}):
+import ${module}
+% endfor
+
+__all__ = ['ClientFactory']
+
+_CLIENT_TYPES = (
+% for module, client_type in clients:
+    ${module}.${client_type},
+% endfor
+)
+
+
+class _HTTPAdapter(requests.adapters.HTTPAdapter):
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ['socket_options']
+
+    def __init__(self, socket_options, **kwargs):
+        # Set before HTTPAdapter.__init__() calls init_poolmanager()
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _socket_options(tcp_keepalive):
+    if tcp_keepalive is None:
+        return None
+    options = list(urllib3.connection.HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE is not available on all platforms
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE,
+                        max(1, int(tcp_keepalive))))
+    return options
+
+
+class ClientFactory:
+    """Create generated clients which share a pooled HTTP client."""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10,
+                 pool_block=False, host_limits=None, keep_alive=True,
+                 tcp_keepalive=None, max_retries=0):
+        """
+        :param pool_connections: Number of hosts for which to keep a
+            connection pool.
+        :param pool_maxsize: Maximum number of connections to keep open to
+            each host.
+        :param pool_block: If True, requests to a host whose connections are
+            all in use wait for a free connection. Otherwise a new connection
+            is opened and discarded after use.
+        :param host_limits: Mapping of hosts, e.g. 'api.example.com' or
+            'localhost:8080', to the maximum number of connections to keep
+            open to them, instead of pool_maxsize.
+        :param keep_alive: If False, connections are closed after each
+            request instead of being reused.
+        :param tcp_keepalive: Time in seconds after which idle connections
+            send TCP keep-alive probes. Defaults to the system setting.
+        :param max_retries: Number of retries for failed connections.
+        """
+        self.http_client = bravado.requests_client.RequestsClient()
+        session = self.http_client.session
+        socket_options = _socket_options(tcp_keepalive)
+        adapter = _HTTPAdapter(
+            socket_options, pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize, max_retries=max_retries,
+            pool_block=pool_block)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for host, maxsize in (host_limits or {}).items():
+            adapter = _HTTPAdapter(
+                socket_options, pool_connections=1, pool_maxsize=maxsize,
+                max_retries=max_retries, pool_block=pool_block)
+            session.mount(f'http://{host}/', adapter)
+            session.mount(f'https://{host}/', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+
+    def create(self, client_type, spec_url, request_headers=None,
+               config=None):
+        """
+        Create a client by loading its spec from a URL with the shared HTTP
+        client.
+
+        :param client_type: Generated client type.
+        """
+        return client_type.from_url(spec_url, self._http_client(client_type),
+                                    request_headers, config)
+
+    def create_from_spec(self, client_type, spec_dict, origin_url=None,
+                         config=None):
+        """
+        Create a client from a spec dict.
+
+        :param client_type: Generated client type.
+        """
+        return client_type.from_spec(spec_dict, origin_url,
+                                     self._http_client(client_type), config)
+
+    def close(self):
+        """Close the pooled connections."""
+        self.http_client.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _http_client(self, client_type):
+        if not issubclass(client_type, _CLIENT_TYPES):
+            raise TypeError(f"Not a client type of this factory: "
+                            f"{client_type.__name__}")
+        # Each client gets a copy sharing the session and its connection
+        # pools, as from_url() modifies the HTTP client to send the request
+        # headers, and as authentication is set per HTTP client.
+        return copy.copy(self.http_client)
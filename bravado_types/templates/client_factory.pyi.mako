@@ -0,0 +1,45 @@
+<%page args="clients, bravado_types_version, bravado_version, timestamp" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
+# Generated by bravado-types ${bravado_types_version}
+# Timestamp: ${timestamp}
+# Client types: ${', '.join(f'{module}.{client_type}' for module, client_type in clients)}
+# Bravado version: ${bravado_version}
+import typing
+
+import bravado.requests_client
+
+% for module in sorted({module for module, _ in clients}):
+import ${module}
+% endfor
+
+__all__ = ['ClientFactory']
+
+_C = typing.TypeVar('_C', bound=typing.Union[
+% for module, client_type in clients:
+    ${module}.${client_type},
+% endfor
+])
+
+class ClientFactory:
+    http_client: bravado.requests_client.RequestsClient
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 host_limits: typing.Mapping[str, int] = None,
+                 keep_alive: bool = True, tcp_keepalive: float = None,
+                 max_retries: int = 0) -> None: ...
+
+    def create(self, client_type: typing.Type[_C], spec_url: str,
+               request_headers: typing.Mapping = None,
+               config: typing.Mapping = None) -> _C: ...
+
+    def create_from_spec(self, client_type: typing.Type[_C],
+                         spec_dict: typing.Mapping[str, typing.Any],
+                         origin_url: str = None,
+                         config: typing.Mapping = None) -> _C: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> ClientFactory: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
@@ -0,0 +1,26 @@
+<%page args="metadata, models, config, types, schemas" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
+# Generated by bravado-types ${metadata.bravado_types_version}
+# Timestamp: ${metadata.timestamp}
+# Models shared by schemas: ${', '.join(schemas)}
+# Bravado version: ${metadata.bravado_version}
+# Bravado-core version: ${metadata.bravado_core_version}
+import datetime
+import typing
+
+import bravado_core.model
+
+% if config.custom_formats and config.custom_formats.packages:
+# Imports for custom formats
+    % for pkg in config.custom_formats.packages:
+import ${pkg}
+    % endfor
+
+% endif
+__all__ = [
+% for model in models:
+    ${repr(config.model_type(model.name))},
+% endfor
+]
+
+<%include file="models.mako" args="models=models, config=config, types=types" />\
@@ -1,4 +1,5 @@
 <%page args="metadata" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
 # Generated by bravado-types ${metadata.bravado_types_version}
 # Timestamp: ${metadata.timestamp}
 % if metadata.cli_args is not None:
@@ -0,0 +1,46 @@
+<%page args="models, config, types" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
+class _Model(bravado_core.model.Model):
+    @typing.no_type_check
+    def __getattr__(self, attr): ...
+
+    @typing.no_type_check
+    def __setattr__(self, attr, value): ...
+
+    @typing.no_type_check
+    def __delattr__(self, attr, value): ...
+
+% for model in models:
+    % if config.model_inheritance:
+class ${config.model_type(model.name)}(
+        % for parent in model.parents:
+    ${config.model_type(parent)},
+        % endfor
+    _Model
+):
+    % else:
+class ${config.model_type(model.name)}(_Model):
+    % endif
+    def __init__(
+        self,
+    % if model.props:
+        *,
+    % endif
+    % for prop in model.props:
+        % if prop.required:
+        ${prop.name}: ${types[prop.type]},
+        % else:
+        ${prop.name}: ${types[prop.type]} = None,
+        % endif
+    % endfor
+    ) -> None:
+    % if not model.props:
+        ...
+    % endif
+    % for prop in model.props:
+        self.${prop.name} = ${prop.name}
+    % endfor
+    % if not loop.last:
+
+    % endif
+% endfor
@@ -1,10 +1,118 @@
 <%page args="metadata, spec, config" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
 <%include file="header.mako" args="metadata=metadata" />\
 """${config.name} types."""
 
+% if config.stream_helper:
+import codecs
+% endif
+% if config.response_cache:
+import collections
+% endif
+% if config.batch_helper:
+import concurrent.futures
+% endif
+% if config.response_cache:
+import copy
+import datetime
+import email.utils
+% endif
+% if config.spec_cache or config.fast_requests:
+import hashlib
+% endif
+% if config.spec_cache or config.fast_requests or config.stream_helper or config.response_cache:
+import json
+% endif
+% if config.fast_requests:
+import logging
+% endif
+% if config.spec_cache:
+import os
+import pickle
+% endif
+% if config.stream_helper:
+import re
+% endif
 import sys
+% if config.spec_cache:
+import tempfile
+% endif
+% if config.response_cache:
+import threading
+% endif
+% if config.instrumentation or config.response_cache:
+import time
+% endif
+% if config.fast_requests:
+import urllib.parse
+% endif
+% if config.spec_cache or config.fast_requests:
+import warnings
+% endif
+% if config.fast_requests:
+import weakref
+% endif
 
+% if config.instrumentation or config.fast_requests or config.response_cache:
+import bravado.client
+% endif
+% if config.lazy_client or config.fast_requests or config.response_cache:
+import bravado.config
+% endif
+% if config.stream_helper or config.response_cache:
+import bravado.http_future
+% endif
+% if config.lazy_client or config.spec_cache or config.stream_helper:
+import bravado.requests_client
+% endif
+% if config.fast_requests:
+import bravado.warning
+% endif
+% if config.fast_requests or config.stream_helper:
+import bravado_core.exception
+% endif
+% if config.fast_requests or config.build_helper:
+import bravado_core.marshal
+% endif
+% if config.response_cache:
+import bravado_core.model
+% endif
+% if config.lazy_client:
+import bravado_core.operation
+% endif
+% if config.fast_requests:
+import bravado_core.param
+% endif
+% if config.lazy_client:
+import bravado_core.resource
+% endif
+% if config.stream_helper:
+import bravado_core.response
+% endif
+% if config.lazy_client or config.spec_cache:
+import bravado_core.spec
+% endif
+% if config.stream_helper:
+import bravado_core.unmarshal
+% endif
+% if config.lazy_client:
+import bravado_core.util
+% endif
+% if config.fast_requests or config.stream_helper or config.build_helper:
+import bravado_core.validate
+% endif
+% if config.fast_requests:
+import simplejson
+% endif
+% if config.spec_cache and not config.async_client:
+from bravado.client import SwaggerClient, inject_headers_for_remote_refs
+% else:
 from bravado.client import SwaggerClient
+% endif
+% if config.async_client:
+from bravado.requests_client import RequestsClient
+from bravado.swagger_model import Loader
+% endif
 
 __all__ = [
     ${repr(config.client_type)},
@@ -45,8 +153,652 @@ else:
 
 # Client type
 
-class ${config.client_type}(SwaggerClient):
+% if config.lazy_client:
+class _LazyResources(bravado_core.util.AliasKeyDict):
+    """
+    Mapping of resource names to resources which builds each resource and its
+    operations on first access.
+    """
+
+    def __init__(self, swagger_spec):
+        super().__init__()
+        self._swagger_spec = swagger_spec
+        self._index = None
+        self._operations = {}
+
+    def _get_index(self):
+        # Map resource names to operation paths and methods in the same way
+        # as bravado_core.resource.build_resources(), without building the
+        # operations.
+        if self._index is None:
+            deref = self._swagger_spec.deref
+            spec_dict = deref(self._swagger_spec._internal_spec_dict)
+            index = {}
+            for path_name, path_spec in deref(
+                    spec_dict.get('paths', {})).items():
+                for http_method, op_spec in deref(path_spec).items():
+                    if (http_method.startswith('x-')
+                            or http_method == 'parameters'):
+                        continue
+                    tags = deref(deref(op_spec).get('tags', [])) or [
+                        bravado_core.resource.convert_path_to_resource(
+                            path_name)]
+                    for tag in tags:
+                        tag = deref(tag)
+                        key = bravado_core.util.sanitize_name(tag)
+                        index.setdefault(key, []).append(
+                            (path_name, http_method))
+                        self.add_alias(tag, key)
+            self._index = index
+        return self._index
+
+    def _build(self, key):
+        deref = self._swagger_spec.deref
+        spec_dict = deref(self._swagger_spec._internal_spec_dict)
+        paths = deref(spec_dict['paths'])
+        ops = {}
+        for path_name, http_method in self._get_index()[key]:
+            op = self._operations.get((path_name, http_method))
+            if op is None:
+                op = bravado_core.operation.Operation.from_spec(
+                    self._swagger_spec, path_name, http_method,
+                    deref(deref(paths[path_name])[http_method]))
+                self._operations[path_name, http_method] = op
+            ops[op.operation_id] = op
+        resource = bravado_core.resource.Resource(key, ops)
+        dict.__setitem__(self, key, resource)
+        return resource
+
+    def _build_all(self):
+        for key in self._get_index():
+            if not dict.__contains__(self, key):
+                self._build(key)
+
+    def determine_key(self, key):
+        self._get_index()
+        return super().determine_key(key)
+
+    def __getitem__(self, key):
+        key = self.determine_key(key)
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key in self._index:
+            return self._build(key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return self.determine_key(key) in self._index
+
+    def __iter__(self):
+        return iter(self._get_index())
+
+    def __len__(self):
+        return len(self._get_index())
+
+    def keys(self):
+        return self._get_index().keys()
+
+    def values(self):
+        self._build_all()
+        return super().values()
+
+    def items(self):
+        self._build_all()
+        return super().items()
+
+    def copy(self):
+        self._build_all()
+        copied = bravado_core.util.AliasKeyDict(super().items())
+        copied.alias_to_key = self.alias_to_key.copy()
+        return copied
+
+
+class _LazySpec(bravado_core.spec.Spec):
+    """Spec which builds resources and operations on first access."""
+
+    def build(self):
+        if self.config['internally_dereference_refs']:
+            # Resources are built from the dereferenced spec in this mode.
+            super().build()
+            return
+
+        # Hide the paths while building the spec so that no resources are
+        # built, then restore them for use by _LazyResources.
+        spec_dict = self._internal_spec_dict
+        self._internal_spec_dict = {key: value
+                                    for key, value in spec_dict.items()
+                                    if key != 'paths'}
+        try:
+            super().build()
+        finally:
+            self._internal_spec_dict = spec_dict
+        self.resources = _LazyResources(self)
+
+
+class _LazySwaggerClient(SwaggerClient):
+    @classmethod
+    def from_spec(cls, spec_dict, origin_url=None, http_client=None,
+                  config=None):
+        # Same as SwaggerClient.from_spec(), except that the spec is a
+        # _LazySpec.
+        http_client = http_client or bravado.requests_client.RequestsClient()
+        config = dict(config or {})
+
+        bravado_config = bravado.config.bravado_config_from_config_dict(
+            config)
+        for key in set(bravado_config._fields).intersection(set(config)):
+            del config[key]
+        config['bravado'] = bravado_config
+
+        swagger_spec = _LazySpec.from_dict(spec_dict, origin_url, http_client,
+                                           config)
+        return cls(swagger_spec,
+                   also_return_response=bravado_config.also_return_response)
+
+
+% endif
+% if config.spec_cache:
+_SPEC_FINGERPRINT = ${repr(metadata.schema_fingerprint)}
+
+
+def _spec_fingerprint(swagger_spec):
+    # Same as bravado_types.metadata.spec_fingerprint()
+    spec_dict = bravado_core.spec.strip_xscope(swagger_spec.spec_dict)
+    data = json.dumps(spec_dict, sort_keys=True, separators=(',', ':'),
+                      default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _load_spec_cache(cache_path, key):
+    try:
+        with open(cache_path, 'rb') as f:
+            # The key is stored separately so that the spec is only loaded
+            # if it was cached by the same bravado-core version.
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible cache files are rewritten.
+        return None
+
+
+def _save_spec_cache(cache_path, key, swagger_spec):
+    # The HTTP client is provided when loading the spec, and may not be
+    # picklable.
+    http_client = swagger_spec.http_client
+    swagger_spec.http_client = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(cache_path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(key, f)
+                pickle.dump(swagger_spec, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        warnings.warn(f"Failed to write spec cache {cache_path}: {e}")
+    finally:
+        swagger_spec.http_client = http_client
+
+
+% endif
+% if config.batch_helper:
+class _Batch:
+    """Thread pool for resolving the futures of operation calls."""
+
+    def __init__(self, max_workers, timeout):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self._timeout = timeout
+
+    def submit(self, future):
+        """
+        Resolve the future of an operation call in the thread pool.
+
+        :param future: HttpFuture returned by an operation call.
+        :return: concurrent.futures.Future for the result of the call.
+        """
+        return self._executor.submit(future.result, timeout=self._timeout)
+
+    def submit_all(self, futures):
+        """
+        Resolve the futures of operation calls in the thread pool.
+
+        :param futures: HttpFutures returned by operation calls.
+        :return: List of concurrent.futures.Future objects for the results
+            of the calls, in the same order.
+        """
+        return [self.submit(future) for future in futures]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+% endif
+% if config.stream_helper:
+<%include file="streaming.mako" />\
+% endif
+% if config.fast_requests:
+<%include file="requests.mako" args="spec=spec" />\
+% endif
+% if config.response_cache:
+_CACHEABLE_OPERATIONS = frozenset([
+    % for operation in spec.operations:
+        % if operation.http_method == 'get':
+    ${repr(operation.name)},
+        % endif
+    % endfor
+])
+
+<% callable_base = '_FastCallableOperation' if config.fast_requests else 'bravado.client.CallableOperation' %>\
+<%include file="caching.mako" args="callable_base=callable_base" />\
+% endif
+% if config.instrumentation:
+class _OperationCall:
+    """Timing and response information for an operation call."""
+
+    __slots__ = ('operation', 'start_time', 'request_time', 'unmarshal_time',
+                 'status_code', 'response_size', 'exception')
+
+    def __init__(self, operation, start_time):
+        self.operation = operation
+        self.start_time = start_time
+        self.request_time = None
+        self.unmarshal_time = None
+        self.status_code = None
+        self.response_size = None
+        self.exception = None
+
+
+def _instrument_future(future, call, hooks):
+    # Wrap the methods which wait for and unmarshal the response, which are
+    # used by both HttpFuture.response() and HttpFuture.result().
+    get_incoming_response = future._get_incoming_response
+    get_swagger_result = future._get_swagger_result
+
+    def _get_incoming_response(timeout=None):
+        try:
+            incoming_response = get_incoming_response(timeout)
+        except BaseException as e:
+            call.request_time = time.monotonic() - call.start_time
+            call.exception = e
+            for hook in hooks:
+                hook(call)
+            raise
+        call.request_time = time.monotonic() - call.start_time
+        call.status_code = incoming_response.status_code
+        call.response_size = len(incoming_response.raw_bytes)
+        return incoming_response
+
+    def _get_swagger_result(incoming_response):
+        start_time = time.monotonic()
+        try:
+            return get_swagger_result(incoming_response)
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            call.unmarshal_time = time.monotonic() - start_time
+            for hook in hooks:
+                hook(call)
+
+    future._get_incoming_response = _get_incoming_response
+    future._get_swagger_result = _get_swagger_result
+    return future
+
+
+<% callable_base = '_CachingCallableOperation' if config.response_cache else '_FastCallableOperation' if config.fast_requests else 'bravado.client.CallableOperation' %>\
+class _InstrumentedCallableOperation(${callable_base}):
+    % if config.response_cache:
+    def __init__(self, operation, also_return_response, hooks, cache):
+        super().__init__(operation, also_return_response, cache)
+    % else:
+    def __init__(self, operation, also_return_response, hooks):
+        super().__init__(operation, also_return_response)
+    % endif
+        self._hooks = hooks
+
+    def __call__(self, **op_kwargs):
+        if not self._hooks:
+            return super().__call__(**op_kwargs)
+        name = self.operation.operation_id
+        hooks = [hook for hook, operations in self._hooks
+                 if operations is None or name in operations]
+        if not hooks:
+            return super().__call__(**op_kwargs)
+        call = _OperationCall(name, time.monotonic())
+        return _instrument_future(super().__call__(**op_kwargs), call, hooks)
+
+
+class _InstrumentedResourceDecorator(bravado.client.ResourceDecorator):
+    % if config.response_cache:
+    def __init__(self, resource, also_return_response, hooks, cache):
+        super().__init__(resource, also_return_response)
+        self._hooks = hooks
+        self._cache = cache
+
+    def __getattr__(self, name):
+        return _InstrumentedCallableOperation(
+            getattr(self.resource, name), self.also_return_response,
+            self._hooks, self._cache)
+    % else:
+    def __init__(self, resource, also_return_response, hooks):
+        super().__init__(resource, also_return_response)
+        self._hooks = hooks
+
+    def __getattr__(self, name):
+        return _InstrumentedCallableOperation(
+            getattr(self.resource, name), self.also_return_response,
+            self._hooks)
+    % endif
+
+
+% endif
+% if config.build_helper:
+# Names of the properties and of the required properties of each model
+_MODEL_PROPERTIES = {
+    % for model in spec.models:
+<% required = [prop.name for prop in model.props if prop.required] %>\
+    ${repr(model.name)}: (
+        ${repr(tuple(prop.name for prop in model.props))},
+        frozenset(${repr(required) if required else ''}),
+    ),
+    % endfor
+}
+
+
+def _build_many(swagger_spec, model_name, rows, validate):
+    try:
+        props, required = _MODEL_PROPERTIES[model_name]
+    except KeyError:
+        raise ValueError(f"Unknown model: {model_name}") from None
+    mclass = swagger_spec.definitions[model_name]
+    model_spec = mclass._model_spec
+    # Same checks and property values, in the same order, as
+    # bravado_core.model.Model.__init__(), with the property names looked up
+    # once for all rows. Instances are initialized by setting the attribute
+    # dict of bravado-core's Model class directly.
+    properties = tuple(mclass._properties)
+    names = frozenset(properties)
+    include_missing = swagger_spec.config['include_missing_properties']
+    if model_spec.get('additionalProperties') is False:
+        known = frozenset(props)
+    else:
+        known = None
+    new = object.__new__
+    set_dict = object.__setattr__
+    models = []
+    for index, row in enumerate(rows):
+        keys = row.keys()
+        if not required <= keys:
+            raise ValueError(f"Row {index} of {model_name} is missing "
+                             f"properties: {sorted(required - keys)}")
+        if known is not None and not keys <= known:
+            raise ValueError(f"Row {index} of {model_name} has unknown "
+                             f"properties: {sorted(keys - known)}")
+        if include_missing:
+            values = {name: row.get(name) for name in properties}
+        else:
+            values = {name: row[name] for name in properties if name in row}
+        if not keys <= names:
+            # Additional properties follow the properties of the model
+            for name in keys - names:
+                values[name] = row[name]
+        model = new(mclass)
+        set_dict(model, '_Model__dict', values)
+        if validate:
+            bravado_core.validate.validate_object(
+                swagger_spec, model_spec, bravado_core.marshal.marshal_model(
+                    swagger_spec, model_spec, model))
+        models.append(model)
+    return models
+
+
+% endif
+<% client_base = '_LazySwaggerClient' if config.lazy_client else 'SwaggerClient' %>\
+class ${config.client_type}(${client_base}):
+% if config.async_client:
+    @classmethod
+    def from_url(cls, spec_url, http_client=None, request_headers=None,
+                 config=None):
+        """
+        Create a client from the spec at a URL.
+
+        The spec is always loaded synchronously with bravado's default
+        RequestsClient, not with http_client, which is only used for
+        operation calls. To load the spec with another client, load it
+        separately and call from_spec().
+        """
+        loader = Loader(RequestsClient(), request_headers=request_headers)
+        spec_dict = loader.load_spec(spec_url)
+        return cls.from_spec(spec_dict, spec_url, http_client, config)
+
+    @classmethod
+    def from_spec(cls, spec_dict, origin_url=None, http_client=None,
+                  config=None):
+        if http_client is None:
+            from bravado_asyncio.definitions import RunMode
+            from bravado_asyncio.http_client import AsyncioClient
+            http_client = AsyncioClient(run_mode=RunMode.FULL_ASYNCIO)
+        return super().from_spec(spec_dict, origin_url, http_client, config)
+% endif
+% if config.spec_cache:
+    % if config.async_client:
+
+    % endif
+    @classmethod
+    def from_cached_spec(cls, cache_path, spec_url, http_client=None,
+                         request_headers=None, config=None):
+        """
+        Create a client, loading the built spec from a cache file.
+
+        The cache file is used if it was written for the schema these types
+        were generated from, by the installed bravado and bravado-core
+        versions, with the same spec_url and config. Otherwise the client is
+        created with from_url() and its spec is written to the cache file.
+        """
+        config = dict(config or {})
+        key = (_SPEC_FINGERPRINT, bravado.version, bravado_core.version,
+               spec_url, config)
+        swagger_spec = _load_spec_cache(cache_path, key)
+        if swagger_spec is None:
+            client = cls.from_url(spec_url, http_client, request_headers,
+                                  dict(config))
+            if _spec_fingerprint(client.swagger_spec) == _SPEC_FINGERPRINT:
+                _save_spec_cache(cache_path, key, client.swagger_spec)
+            else:
+                warnings.warn(f"Schema at {spec_url} does not match the "
+                              "generated types, not caching spec")
+            return client
+
+        if http_client is None:
+    % if config.async_client:
+            from bravado_asyncio.definitions import RunMode
+            from bravado_asyncio.http_client import AsyncioClient
+            http_client = AsyncioClient(run_mode=RunMode.FULL_ASYNCIO)
+    % else:
+            http_client = bravado.requests_client.RequestsClient()
+        if request_headers is not None:
+            # As in SwaggerClient.from_url(), for remote refs
+            http_client.request = inject_headers_for_remote_refs(
+                http_client.request, request_headers)
+    % endif
+        swagger_spec.http_client = http_client
+        return cls(swagger_spec, also_return_response=swagger_spec.config[
+            'bravado'].also_return_response)
+% endif
+% if config.batch_helper:
+    % if config.spec_cache:
+
+    % endif
+    def batch(self, max_workers=None, timeout=None):
+        """
+        Create a thread pool for making operation calls concurrently.
+
+        :param max_workers: Maximum number of concurrent calls. Defaults to
+            the concurrent.futures.ThreadPoolExecutor default.
+        :param timeout: Timeout in seconds for each call.
+        """
+        return _Batch(max_workers, timeout)
+% endif
+% if config.stream_helper:
+    % if config.spec_cache or config.batch_helper:
+
+    % endif
+    def stream(self, future, chunk_size=65536, timeout=None):
+        """
+        Send the request of an operation call, and iterate over the items
+        of its array response as they are received.
+
+        :param future: HttpFuture returned by an operation call of a client
+            using bravado's RequestsClient, which has not been resolved.
+        :param chunk_size: Number of bytes of the response body to read at
+            a time.
+        :param timeout: Timeout in seconds for the request.
+        :return: Iterator over the unmarshalled items of the response.
+        """
+        return _ResponseStream(future, chunk_size, timeout)
+% endif
+% if config.instrumentation:
+    % if config.spec_cache or config.batch_helper or config.stream_helper:
+
+    % endif
+    def __init__(self, swagger_spec, also_return_response=False):
+        super().__init__(swagger_spec, also_return_response)
+        self._operation_hooks = []
+    % if config.response_cache:
+        self._response_cache = _ResponseCache()
+    % endif
+
+    def _get_resource(self, item):
+        decorator = super()._get_resource(item)
+        return _InstrumentedResourceDecorator(
+            decorator.resource, decorator.also_return_response,
+    % if config.response_cache:
+            self._operation_hooks, self._response_cache)
+    % else:
+            self._operation_hooks)
+    % endif
+
+    def add_operation_hook(self, hook, operations=None):
+        """
+        Register a function to call when operation calls complete.
+
+        :param hook: Function which accepts an _OperationCall object. It is
+            called in the thread which waits for the response, after the
+            response is unmarshalled or an exception is raised.
+        :param operations: Names of the operations to call the function for.
+            Defaults to all operations.
+        """
+        self._operation_hooks.append(
+            (hook, None if operations is None else frozenset(operations)))
+
+    def remove_operation_hook(self, hook):
+        """Unregister a function registered with add_operation_hook()."""
+        self._operation_hooks[:] = [
+            (h, operations) for h, operations in self._operation_hooks
+            if h != hook]
+% endif
+% if config.response_cache:
+    % if config.spec_cache or config.batch_helper or config.stream_helper or config.instrumentation:
+
+    % endif
+    % if not config.instrumentation:
+    def __init__(self, swagger_spec, also_return_response=False):
+        super().__init__(swagger_spec, also_return_response)
+        self._response_cache = _ResponseCache()
+
+    def _get_resource(self, item):
+        decorator = super()._get_resource(item)
+        return _CachingResourceDecorator(
+            decorator.resource, decorator.also_return_response,
+            self._response_cache)
+
+    % endif
+    def configure_cache(self, operation, maxsize=128, ttl=None):
+        """
+        Cache the results of a GET operation. Reconfiguring the cache of an
+        operation discards its cached results.
+
+        :param operation: Name of the operation.
+        :param maxsize: Maximum number of cached results, or None for no
+            limit. The least recently used result is discarded first.
+        :param ttl: Time in seconds for which results are cached, or None
+            for no limit. Results are cached for less time, or not at all,
+            if the Cache-Control or Expires header of the response says so.
+
+        Calls answered from the cache return a copy of the cached result, so
+        results can be changed without affecting later calls.
+        """
+        if operation not in _CACHEABLE_OPERATIONS:
+            raise ValueError(f"Cannot cache results of {operation}")
+        self._response_cache.configure(operation, maxsize, ttl)
+
+    def invalidate_cache(self, operation=None, **params):
+        """
+        Discard cached results.
+
+        :param operation: Name of the operation whose results to discard.
+            Defaults to all operations.
+        :param params: Parameters of the call whose result to discard, as
+            passed to the operation. Defaults to all calls.
+        """
+        self._response_cache.invalidate(operation, params)
+
+    def cache_info(self, operation):
+        """Get hit and miss statistics of the cache of an operation."""
+        return self._response_cache.info(operation)
+% endif
+% if config.fast_requests and not config.instrumentation and not config.response_cache:
+    % if config.async_client or config.spec_cache or config.batch_helper or config.stream_helper:
+
+    % endif
+    def _get_resource(self, item):
+        decorator = super()._get_resource(item)
+        return _FastResourceDecorator(decorator.resource,
+                                      decorator.also_return_response)
+% endif
+% if config.build_helper:
+    % if config.async_client or config.spec_cache or config.batch_helper or config.stream_helper or config.instrumentation or config.response_cache or config.fast_requests:
+
+    % endif
+    def build_many(self, model_name, rows, validate=False):
+        """
+        Create instances of a model from dicts of property values.
+
+        Creates the same instances as calling the model type with each dict
+        as keyword arguments, and also checks for required properties.
+
+        :param model_name: Name of the model.
+        :param rows: Iterable of dicts of property values.
+        :param validate: Whether to validate each instance against the model
+            schema, which is much slower than creating the instances.
+        :return: List of model instances.
+        :raises ValueError: If a dict is missing required properties, or
+            has properties which the model does not define and its schema
+            does not allow additional properties.
+        :raises jsonschema.exceptions.ValidationError: If validate is True
+            and an instance is not valid.
+        """
+        return _build_many(self.swagger_spec, model_name, rows, validate)
+% endif
+% if not (config.async_client or config.spec_cache or config.batch_helper or config.stream_helper or config.instrumentation or config.response_cache or config.fast_requests or config.build_helper):
     pass
+% endif
 
 # Resource types
 
@@ -1,5 +1,9 @@
-<%page args="metadata, spec, config" />\
+<%page args="metadata, spec, config, types, shared=None" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
 <%include file="header.mako" args="metadata=metadata" />\
+% if config.batch_helper:
+import concurrent.futures
+% endif
 import datetime
 import typing
 import typing_extensions
@@ -7,6 +11,7 @@ import typing_extensions
 import bravado.client
 import bravado.http_client
 import bravado.http_future
+import bravado.response
 import bravado_core.model
 import bravado_core.operation
 import bravado_core.resource
@@ -18,6 +23,17 @@ import bravado_core.spec
 import ${pkg}
     % endfor
 
+% endif
+% if shared and shared.names:
+# Models shared with other schemas
+from ${shared.module} import (
+    % for model in spec.models:
+        % if model.name in shared.names:
+    ${config.model_type(model.name)} as ${config.model_type(model.name)},
+        % endif
+    % endfor
+)
+
 % endif
 __all__ = [
     ${repr(config.client_type)},
@@ -54,6 +70,72 @@ class ${config.client_type}(bravado.client.SwaggerClient):
                   config: typing.Mapping = None
                  ) -> ${config.client_type}: ...
 
+% if config.spec_cache:
+    @classmethod
+    def from_cached_spec(cls, cache_path: str, spec_url: str,
+                         http_client: bravado.http_client.HttpClient = None,
+                         request_headers: typing.Mapping = None,
+                         config: typing.Mapping = None
+                        ) -> ${config.client_type}: ...
+
+% endif
+% if config.batch_helper:
+    def batch(self, max_workers: int = None, timeout: float = None
+              ) -> _Batch: ...
+
+% endif
+% if config.stream_helper:
+    def stream(
+        self,
+        future: bravado.http_future.HttpFuture[typing.Union[
+            ${config.array_type_template.format('_S')}, typing.Any]],
+        chunk_size: int = 65536,
+        timeout: float = None,
+    ) -> _ResponseStream[_S]: ...
+
+% endif
+% if config.instrumentation:
+    def add_operation_hook(
+        self, hook: typing.Callable[[_OperationCall], typing.Any],
+        operations: typing.Iterable[_OperationName] = None) -> None: ...
+
+    def remove_operation_hook(
+        self, hook: typing.Callable[[_OperationCall], typing.Any]
+    ) -> None: ...
+
+% endif
+% if config.response_cache:
+    def configure_cache(self, operation: _CacheableOperationName,
+                        maxsize: typing.Optional[int] = 128,
+                        ttl: float = None) -> None: ...
+
+    def invalidate_cache(self, operation: _CacheableOperationName = None,
+                         **params: typing.Any) -> None: ...
+
+    def cache_info(self, operation: _CacheableOperationName
+                   ) -> _CacheInfo: ...
+
+% endif
+% if config.build_helper:
+    % for model in spec.models:
+        % if len(spec.models) > 1:
+    @typing.overload
+        % endif
+    def build_many(
+        self, model_name: typing_extensions.Literal[${repr(model.name)}],
+        rows: typing.Iterable[_${config.model_type(model.name)}Row],
+        validate: bool = False,
+    ) -> typing.List[${config.model_type(model.name)}]: ...
+    % endfor
+    % if not spec.models:
+    def build_many(
+        self, model_name: typing.NoReturn,
+        rows: typing.Iterable[typing.Mapping[str, typing.Any]],
+        validate: bool = False,
+    ) -> typing.List[typing.NoReturn]: ...
+    % endif
+
+% endif
 % if spec.models:
     % for model in spec.models:
     @typing.overload
@@ -74,6 +156,109 @@ class _Resource(bravado_core.resource.Resource):
     @typing.no_type_check
     def __getattr__(self, attr): ...
 
+% if config.batch_helper:
+_R = typing.TypeVar('_R')
+
+class _Batch:
+    def submit(self, future: bravado.http_future.HttpFuture[_R]
+               ) -> concurrent.futures.Future[_R]: ...
+
+    def submit_all(
+        self, futures: typing.Iterable[bravado.http_future.HttpFuture[_R]]
+    ) -> typing.List[concurrent.futures.Future[_R]]: ...
+
+    def shutdown(self, wait: bool = True) -> None: ...
+
+    def __enter__(self) -> _Batch: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
+
+% endif
+% if config.stream_helper:
+_S = typing.TypeVar('_S')
+
+class _ResponseStream(typing.Iterator[_S]):
+    def __next__(self) -> _S: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> _ResponseStream[_S]: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
+
+% endif
+% if config.instrumentation:
+    % if spec.operations:
+_OperationName = typing_extensions.Literal[
+        % for operation in spec.operations:
+    ${repr(operation.name)},
+        % endfor
+]
+    % else:
+_OperationName = typing.NoReturn
+    % endif
+
+class _OperationCall:
+    operation: _OperationName
+    start_time: float
+    request_time: typing.Optional[float]
+    unmarshal_time: typing.Optional[float]
+    status_code: typing.Optional[int]
+    response_size: typing.Optional[int]
+    exception: typing.Optional[BaseException]
+
+% endif
+% if config.response_cache:
+    % if any(operation.http_method == 'get' for operation in spec.operations):
+_CacheableOperationName = typing_extensions.Literal[
+        % for operation in spec.operations:
+            % if operation.http_method == 'get':
+    ${repr(operation.name)},
+            % endif
+        % endfor
+]
+    % else:
+_CacheableOperationName = typing.NoReturn
+    % endif
+
+class _CacheInfo:
+    hits: int
+    misses: int
+    maxsize: typing.Optional[int]
+    currsize: int
+
+% endif
+% if config.build_helper:
+    % for model in spec.models:
+<% row_type = f'_{config.model_type(model.name)}Row' %>\
+<% mixed = any(prop.required for prop in model.props) and not all(prop.required for prop in model.props) %>\
+        % if mixed:
+class _${config.model_type(model.name)}RequiredRow(typing_extensions.TypedDict):
+            % for prop in model.props:
+                % if prop.required:
+    ${prop.name}: ${types[prop.type]}
+                % endif
+            % endfor
+
+class ${row_type}(_${config.model_type(model.name)}RequiredRow, total=False):
+        % elif model.props and model.props[0].required:
+class ${row_type}(typing_extensions.TypedDict):
+        % else:
+class ${row_type}(typing_extensions.TypedDict, total=False):
+        % endif
+        % for prop in model.props:
+            % if not prop.required:
+    ${prop.name}: typing.Optional[${types[prop.type]}]
+            % elif not mixed:
+    ${prop.name}: ${types[prop.type]}
+            % endif
+        % endfor
+        % if not model.props:
+    ...
+        % endif
+
+    % endfor
+% endif
 % for resource in spec.resources:
 class ${config.resource_type(resource.name)}(_Resource):
     % for operation in resource.operations:
@@ -83,6 +268,24 @@ class ${config.resource_type(resource.name)}(_Resource):
 % endfor
 _Operation = bravado_core.operation.Operation
 
+% if config.async_client:
+_T = typing.TypeVar('_T')
+
+class _AsyncHttpFuture(typing.Generic[_T]):
+    def response(
+        self,
+        timeout: float = None,
+        fallback_result: typing.Union[
+            _T, typing.Callable[[BaseException], _T]] = ...,
+        exceptions_to_catch: typing.Tuple[
+            typing.Type[BaseException], ...] = ...,
+    ) -> typing.Awaitable[bravado.response.BravadoResponse[_T]]: ...
+
+    def result(self, timeout: float = None) -> typing.Awaitable[_T]: ...
+
+    def cancel(self) -> None: ...
+
+% endif
 % for operation in spec.operations:
 class ${config.operation_type(operation.name)}(_Operation):
     def __call__(
@@ -90,19 +293,23 @@ class ${config.operation_type(operation.name)}(_Operation):
         *,
         % for param in operation.params:
             % if param.required:
-        ${param.name}: ${param.type},
+        ${param.name}: ${types[param.type]},
             %else:
-        ${param.name}: ${param.type} = None,
+        ${param.name}: ${types[param.type]} = None,
             % endif
         % endfor
         _request_options: typing.Mapping[str, typing.Any] = None,
+    % if config.async_client:
+    ) -> _AsyncHttpFuture[
+    % else:
     ) -> bravado.http_future.HttpFuture[
+    % endif
         % if config.response_types == 'success':
             % if any(response.success for response in operation.responses):
         typing.Union[
                 % for response in operation.responses:
                     % if response.success:
-                ${response.type},  # ${response.status}
+                ${types[response.type]},  # ${response.status}
                     % endif
                 % endfor
         ]
@@ -112,7 +319,7 @@ class ${config.operation_type(operation.name)}(_Operation):
         % elif config.response_types == 'all':
         typing.Union[
             % for response in operation.responses:
-            ${response.type},  # ${response.status}
+            ${types[response.type]},  # ${response.status}
             % endfor
         ]
         % else:
@@ -121,47 +328,5 @@ class ${config.operation_type(operation.name)}(_Operation):
     ]: ...
 
 % endfor
-class _Model(bravado_core.model.Model):
-    @typing.no_type_check
-    def __getattr__(self, attr): ...
-
-    @typing.no_type_check
-    def __setattr__(self, attr, value): ...
-
-    @typing.no_type_check
-    def __delattr__(self, attr, value): ...
-
-% for model in spec.models:
-    % if config.model_inheritance:
-class ${config.model_type(model.name)}(
-        % for parent in model.parents:
-    ${config.model_type(parent)},
-        % endfor
-    _Model
-):
-    % else:
-class ${config.model_type(model.name)}(_Model):
-    % endif
-    def __init__(
-        self,
-    % if model.props:
-        *,
-    % endif
-    % for prop in model.props:
-        % if prop.required:
-        ${prop.name}: ${prop.type},
-        % else:
-        ${prop.name}: ${prop.type} = None,
-        % endif
-    % endfor
-    ) -> None:
-    % if not model.props:
-        ...
-    % endif
-    % for prop in model.props:
-        self.${prop.name} = ${prop.name}
-    % endfor
-    % if not loop.last:
-
-    % endif
-% endfor
+<% local_models = [model for model in spec.models if not (shared and model.name in shared.names)] %>\
+<%include file="models.mako" args="models=local_models, config=config, types=types" />\
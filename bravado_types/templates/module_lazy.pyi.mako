@@ -0,0 +1,240 @@
+<%page args="metadata, spec, config, index_digest" />\
+## Output must match the built-in emitter in bravado_types/emit.py.
+<%! import os.path %>\
+<%include file="header.mako" args="metadata=metadata" />\
+# Compact stub for use with the bravado_types.mypy_plugin MyPy plugin. Type
+# information is read from the type index file ${os.path.basename(config.index_path)}.
+% if config.batch_helper:
+import concurrent.futures
+% endif
+import datetime
+import typing
+import typing_extensions
+
+import bravado.client
+import bravado.http_client
+import bravado.http_future
+import bravado.response
+import bravado_core.model
+import bravado_core.operation
+import bravado_core.resource
+import bravado_core.spec
+
+% if config.custom_formats and config.custom_formats.packages:
+# Imports for custom formats
+    % for pkg in config.custom_formats.packages:
+import ${pkg}
+    % endfor
+
+% endif
+__all__ = [
+    ${repr(config.client_type)},
+% for resource in spec.resources:
+    ${repr(config.resource_type(resource.name))},
+% endfor
+% for operation in spec.operations:
+    ${repr(config.operation_type(operation.name))},
+% endfor
+% for model in spec.models:
+    ${repr(config.model_type(model.name))},
+% endfor
+]
+
+_TYPE_INDEX_DIGEST: typing_extensions.Final = ${repr(index_digest)}
+
+_N = typing.TypeVar('_N', bound=str)
+
+class _LazyClient(bravado.client.SwaggerClient):
+    def get_model(self, model_name: str
+                  ) -> typing.Type[bravado_core.model.Model]: ...
+
+    def __getattr__(self, attr: str) -> typing.Any: ...
+
+class ${config.client_type}(_LazyClient):
+    def __init__(self, swagger_spec: bravado_core.spec.Spec,
+                 also_return_response: bool = False) -> None: ...
+
+    @classmethod
+    def from_url(cls, spec_url: str,
+                 http_client: bravado.http_client.HttpClient = None,
+                 request_headers: typing.Mapping = None,
+                 config: typing.Mapping = None
+                ) -> ${config.client_type}: ...
+
+    @classmethod
+    def from_spec(cls, spec_dict: typing.Mapping[str, typing.Any],
+                  origin_url: str = None,
+                  http_client: bravado.http_client.HttpClient = None,
+                  config: typing.Mapping = None
+                 ) -> ${config.client_type}: ...
+
+% if config.spec_cache:
+    @classmethod
+    def from_cached_spec(cls, cache_path: str, spec_url: str,
+                         http_client: bravado.http_client.HttpClient = None,
+                         request_headers: typing.Mapping = None,
+                         config: typing.Mapping = None
+                        ) -> ${config.client_type}: ...
+
+% endif
+% if config.batch_helper:
+    def batch(self, max_workers: int = None, timeout: float = None
+              ) -> _Batch: ...
+
+% endif
+% if config.stream_helper:
+    def stream(
+        self,
+        future: bravado.http_future.HttpFuture[typing.Union[
+            ${config.array_type_template.format('_S')}, typing.Any]],
+        chunk_size: int = 65536,
+        timeout: float = None,
+    ) -> _ResponseStream[_S]: ...
+
+% endif
+% if config.instrumentation:
+    def add_operation_hook(
+        self, hook: typing.Callable[[_OperationCall], typing.Any],
+        operations: typing.Iterable[_OperationName] = None) -> None: ...
+
+    def remove_operation_hook(
+        self, hook: typing.Callable[[_OperationCall], typing.Any]
+    ) -> None: ...
+
+% endif
+% if config.response_cache:
+    def configure_cache(self, operation: _CacheableOperationName,
+                        maxsize: typing.Optional[int] = 128,
+                        ttl: float = None) -> None: ...
+
+    def invalidate_cache(self, operation: _CacheableOperationName = None,
+                         **params: typing.Any) -> None: ...
+
+    def cache_info(self, operation: _CacheableOperationName
+                   ) -> _CacheInfo: ...
+
+% endif
+% if config.build_helper:
+    def build_many(
+        self, model_name: str,
+        rows: typing.Iterable[typing.Mapping[str, typing.Any]],
+        validate: bool = False,
+    ) -> typing.List[bravado_core.model.Model]: ...
+
+% endif
+% if config.batch_helper:
+_R = typing.TypeVar('_R')
+
+class _Batch:
+    def submit(self, future: bravado.http_future.HttpFuture[_R]
+               ) -> concurrent.futures.Future[_R]: ...
+
+    def submit_all(
+        self, futures: typing.Iterable[bravado.http_future.HttpFuture[_R]]
+    ) -> typing.List[concurrent.futures.Future[_R]]: ...
+
+    def shutdown(self, wait: bool = True) -> None: ...
+
+    def __enter__(self) -> _Batch: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
+
+% endif
+% if config.stream_helper:
+_S = typing.TypeVar('_S')
+
+class _ResponseStream(typing.Iterator[_S]):
+    def __next__(self) -> _S: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> _ResponseStream[_S]: ...
+
+    def __exit__(self, *exc_info: typing.Any) -> None: ...
+
+% endif
+% if config.instrumentation:
+    % if spec.operations:
+_OperationName = typing_extensions.Literal[
+        % for operation in spec.operations:
+    ${repr(operation.name)},
+        % endfor
+]
+    % else:
+_OperationName = typing.NoReturn
+    % endif
+
+class _OperationCall:
+    operation: _OperationName
+    start_time: float
+    request_time: typing.Optional[float]
+    unmarshal_time: typing.Optional[float]
+    status_code: typing.Optional[int]
+    response_size: typing.Optional[int]
+    exception: typing.Optional[BaseException]
+
+% endif
+% if config.response_cache:
+    % if any(operation.http_method == 'get' for operation in spec.operations):
+_CacheableOperationName = typing_extensions.Literal[
+        % for operation in spec.operations:
+            % if operation.http_method == 'get':
+    ${repr(operation.name)},
+            % endif
+        % endfor
+]
+    % else:
+_CacheableOperationName = typing.NoReturn
+    % endif
+
+class _CacheInfo:
+    hits: int
+    misses: int
+    maxsize: typing.Optional[int]
+    currsize: int
+
+% endif
+class _LazyResource(bravado_core.resource.Resource, typing.Generic[_N]):
+    def __getattr__(self, attr: str) -> typing.Any: ...
+
+class _LazyOperation(bravado_core.operation.Operation, typing.Generic[_N]):
+    def __call__(self, **kwargs: typing.Any) -> typing.Any: ...
+
+% if config.async_client:
+_T = typing.TypeVar('_T')
+
+class _AsyncHttpFuture(typing.Generic[_T]):
+    def response(
+        self,
+        timeout: float = None,
+        fallback_result: typing.Union[
+            _T, typing.Callable[[BaseException], _T]] = ...,
+        exceptions_to_catch: typing.Tuple[
+            typing.Type[BaseException], ...] = ...,
+    ) -> typing.Awaitable[bravado.response.BravadoResponse[_T]]: ...
+
+    def result(self, timeout: float = None) -> typing.Awaitable[_T]: ...
+
+    def cancel(self) -> None: ...
+
+% endif
+class _LazyModel(bravado_core.model.Model, typing.Generic[_N]):
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None: ...
+
+    def __getattr__(self, attr: str) -> typing.Any: ...
+
+    @typing.no_type_check
+    def __setattr__(self, attr, value): ...
+
+    @typing.no_type_check
+    def __delattr__(self, attr, value): ...
+
+% for resource in spec.resources:
+${config.resource_type(resource.name)} = _LazyResource[typing_extensions.Literal[${repr(resource.name)}]]
+% endfor
+% for operation in spec.operations:
+${config.operation_type(operation.name)} = _LazyOperation[typing_extensions.Literal[${repr(operation.name)}]]
+% endfor
+% for model in spec.models:
+${config.model_type(model.name)} = _LazyModel[typing_extensions.Literal[${repr(model.name)}]]
+% endfor
@@ -0,0 +1,201 @@
+<%page args="spec" />\
+<%! from bravado_types.request_builders import request_builder_body, request_signature %>\
+## Output must match the built-in emitter in bravado_types/emit.py.
+_MISSING = object()
+
+# Formats which the request builders assume have the default marshaling
+_BUILDER_FORMATS = ('int32', 'int64', 'float', 'double')
+
+# Parameter object keys which do not affect how values are validated and sent
+_IGNORED_PARAM_KEYS = {'name', 'in', 'description', 'required', 'default',
+                       'items'}
+
+_log = logging.getLogger('bravado.client')
+
+
+class _RequestContext:
+    """Operation data used by a request builder."""
+
+    __slots__ = ('operation', 'build', 'swagger_spec', 'method', 'url',
+                 'params', 'schemas', 'validate')
+
+    def __init__(self, operation, build):
+        swagger_spec = operation.swagger_spec
+        self.operation = operation
+        self.build = build
+        self.swagger_spec = swagger_spec
+        self.method = str(operation.http_method.upper())
+        self.url = swagger_spec.api_url.rstrip('/') + operation.path_name
+        self.params = operation.params
+        self.schemas = {
+            name: swagger_spec.deref(
+                bravado_core.param.get_param_type_spec(param))
+            for name, param in operation.params.items()
+        }
+        self.validate = swagger_spec.config['validate_requests']
+
+
+# Request contexts of operations, or None for operations which use bravado's
+# request construction
+_request_contexts = weakref.WeakKeyDictionary()
+# Whether the request builders can be used with each spec
+_builder_specs = weakref.WeakKeyDictionary()
+
+
+def _request_context(operation):
+    try:
+        return _request_contexts[operation]
+    except KeyError:
+        pass
+    context = None
+    builder = _REQUEST_BUILDERS.get(operation.operation_id)
+    if builder is not None and _use_builders(operation.swagger_spec):
+        build, signature = builder
+        if _request_signature(operation) == signature:
+            context = _RequestContext(operation, build)
+        else:
+            warnings.warn(f"Parameters of {operation.operation_id} do not "
+                          "match the generated types, using bravado request "
+                          "construction")
+    _request_contexts[operation] = context
+    return context
+
+
+def _use_builders(swagger_spec):
+    try:
+        return _builder_specs[swagger_spec]
+    except KeyError:
+        pass
+    result = not any(name in swagger_spec.user_defined_formats
+                     for name in _BUILDER_FORMATS)
+    _builder_specs[swagger_spec] = result
+    return result
+
+
+def _request_signature(operation):
+    # Same as bravado_types.request_builders.request_signature(), with the
+    # parameter schemas of bravado_types.extract._get_wire_schema()
+    swagger_spec = operation.swagger_spec
+    data = {}
+    for name, param in operation.params.items():
+        wire_schema = {}
+        if param.location != 'body':
+            schema = swagger_spec.deref(
+                bravado_core.param.get_param_type_spec(param))
+            wire_schema = _schema_keys(swagger_spec, schema)
+            if 'items' in schema:
+                wire_schema['items'] = _schema_keys(
+                    swagger_spec, swagger_spec.deref(schema['items']))
+        data[name] = [param.location, param.name, param.required,
+                      wire_schema]
+    text = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _schema_keys(swagger_spec, schema):
+    return {key: swagger_spec.deref(value) for key, value in schema.items()
+            if key not in _IGNORED_PARAM_KEYS and not key.startswith('x-')}
+
+
+def _new_request(context, request_options):
+    # Same as bravado.client.construct_request(), before adding parameters
+    request = {
+        'method': context.method,
+        'url': context.url,
+        'params': {},
+        'headers': (request_options['headers'].copy()
+                    if 'headers' in request_options else {}),
+    }
+    if request_options.get('use_msgpack', False):
+        request['headers']['Accept'] = 'application/msgpack'
+    for request_option in ('connect_timeout', 'timeout'):
+        if request_option in request_options:
+            request[request_option] = request_options[request_option]
+    return request
+
+
+def _check_params(context, op_kwargs):
+    # Parameters may also be passed by their names in the schema, which
+    # differ from the sanitized names for header parameters
+    if context.params.keys() >= op_kwargs.keys():
+        return op_kwargs
+    kwargs = {}
+    for name, value in op_kwargs.items():
+        key = context.params.determine_key(name)
+        if key not in context.params or key in kwargs:
+            raise bravado_core.exception.SwaggerMappingError(
+                f"{context.operation.operation_id} does not have "
+                f"parameter {name}")
+        kwargs[key] = value
+    return kwargs
+
+
+def _missing_param(name):
+    return bravado_core.exception.SwaggerMappingError(
+        f"{name} is a required parameter")
+
+
+def _msgpack_body(request):
+    content_type = request['headers'].get('Content-Type', '')
+    return content_type.lower() == 'application/msgpack'
+
+
+def _marshal_param(context, name, value, request):
+    bravado_core.param.marshal_param(context.params[name], value, request)
+
+
+def _marshal(context, name, value):
+    return bravado_core.marshal.marshal_schema_object(
+        context.swagger_spec, context.schemas[name], value)
+
+
+def _validate(context, name, value):
+    bravado_core.validate.validate_schema_object(
+        context.swagger_spec, context.schemas[name], value)
+
+
+% for operation in spec.operations:
+def _build_${operation.name}(context, request_options, op_kwargs):
+    % for line in request_builder_body(operation):
+    ${line}
+    % endfor
+
+
+% endfor
+_REQUEST_BUILDERS = {
+% for operation in spec.operations:
+    ${repr(operation.name)}: (
+        _build_${operation.name}, ${repr(request_signature(operation))}),
+% endfor
+}
+
+
+class _FastCallableOperation(bravado.client.CallableOperation):
+    def __call__(self, **op_kwargs):
+        context = _request_context(self.operation)
+        if context is None:
+            return super().__call__(**op_kwargs)
+
+        # Same as CallableOperation.__call__(), using the request builder
+        # instead of bravado.client.construct_request()
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug('%s(%s)', self.operation.operation_id,
+                       self._sanitize_kwargs_for_logging(op_kwargs))
+        bravado.warning.warn_for_deprecated_op(self.operation)
+        request_options = op_kwargs.pop('_request_options', {})
+        request_config = bravado.config.RequestConfig(
+            request_options, self.also_return_response)
+        request_params = context.build(context, request_options, op_kwargs)
+        return context.swagger_spec.http_client.request(
+            request_params,
+            operation=self.operation,
+            request_config=request_config,
+        )
+
+
+class _FastResourceDecorator(bravado.client.ResourceDecorator):
+    def __getattr__(self, name):
+        return _FastCallableOperation(getattr(self.resource, name),
+                                      self.also_return_response)
+
+
@@ -0,0 +1,188 @@
+## Output must match the built-in emitter in bravado_types/emit.py.
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Characters which may continue a number at the end of a chunk
+_JSON_NUMBER_END = re.compile(r'[0-9.eE+-]*\Z')
+
+
+class _ResponseStream:
+    """Iterator over the unmarshalled items of an array response."""
+
+    def __init__(self, future, chunk_size, timeout):
+        if not isinstance(future.future,
+                          bravado.requests_client.RequestsFutureAdapter):
+            raise TypeError("Streaming responses require bravado's "
+                            "RequestsClient")
+        self._items = _iter_response_items(future, chunk_size, timeout)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    def close(self):
+        """Close the response, discarding any remaining items."""
+        self._items.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _iter_response_items(future, chunk_size, timeout):
+    adapter = future.future
+    try:
+        response = _send_streaming(adapter, timeout)
+        try:
+            yield from _unmarshal_items(future, response, chunk_size)
+        finally:
+            response.close()
+    except adapter.connection_errors as e:
+        adapter._raise_connection_error(e)
+    except adapter.timeout_errors as e:
+        adapter._raise_timeout_error(e)
+
+
+def _send_streaming(adapter, timeout):
+    # Same as RequestsFutureAdapter.result(), without reading the body
+    request = adapter.request
+    request.headers = {
+        k: str(v) if not isinstance(v, bytes) else v
+        for k, v in request.headers.items()
+    }
+    prepared_request = adapter.session.prepare_request(request)
+    settings = adapter.session.merge_environment_settings(
+        prepared_request.url,
+        proxies={},
+        stream=True,
+        verify=adapter.misc_options['ssl_verify'],
+        cert=adapter.misc_options['ssl_cert'],
+    )
+    return adapter.session.send(
+        prepared_request,
+        timeout=adapter.build_timeout(timeout),
+        allow_redirects=adapter.misc_options['follow_redirects'],
+        **settings
+    )
+
+
+def _unmarshal_items(future, response, chunk_size):
+    operation = future.operation
+    swagger_spec = operation.swagger_spec
+    incoming_response = future.response_adapter(response)
+    schema = _array_response_schema(operation, incoming_response)
+    if schema is None:
+        # Error responses and responses which are not JSON arrays are read
+        # in full, as by HttpFuture.result(). Streamed calls are not
+        # instrumented, so the method of the class is used.
+        result = bravado.http_future.HttpFuture._get_swagger_result(
+            future, incoming_response)
+        if result is None:
+            return
+        if not isinstance(result, list):
+            raise TypeError(f"Response of {operation.operation_id} is not "
+                            "an array")
+        yield from result
+        return
+
+    for response_callback in future.request_config.response_callbacks:
+        response_callback(incoming_response, operation)
+    item_schema = swagger_spec.deref(schema.get('items', {}))
+    validate = swagger_spec.config['validate_responses']
+    for item in _iter_json_array(response.iter_content(chunk_size)):
+        if validate:
+            bravado_core.validate.validate_schema_object(
+                swagger_spec, item_schema, item)
+        yield bravado_core.unmarshal.unmarshal_schema_object(
+            swagger_spec, item_schema, item)
+
+
+def _array_response_schema(operation, incoming_response):
+    """
+    Get the array schema of a successful JSON response, or None if the
+    response is not streamed.
+    """
+    if not 200 <= incoming_response.status_code < 300:
+        return None
+    content_type = incoming_response.headers.get('content-type', '')
+    if not content_type.lower().startswith('application/json'):
+        return None
+    try:
+        response_spec = bravado_core.response.get_response_spec(
+            incoming_response.status_code, operation)
+    except bravado_core.exception.MatchingResponseNotFound:
+        return None
+    deref = operation.swagger_spec.deref
+    schema = deref(response_spec.get('schema'))
+    if schema is None or deref(schema.get('type')) != 'array':
+        return None
+    return schema
+
+
+def _iter_json_array(chunks):
+    """Parse the items of a JSON array from chunks of UTF-8 bytes."""
+    decoder = json.JSONDecoder()
+    text = _decode_chunks(chunks)
+    buf = ''
+    pos = 0
+    eof = False
+    # Expected token: '[', a value or ']', a value, ',' or ']', or the end
+    state = 'start'
+    while True:
+        pos = _JSON_WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                if state != 'end':
+                    raise json.JSONDecodeError("Incomplete JSON array", buf,
+                                               pos)
+                return
+            buf, pos, eof = _read_text(text, buf, pos)
+        elif state == 'start':
+            if buf[pos] != '[':
+                raise json.JSONDecodeError("Expecting '['", buf, pos)
+            pos += 1
+            state = 'first'
+        elif state == 'first' and buf[pos] == ']':
+            pos += 1
+            state = 'end'
+        elif state in ('first', 'value'):
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buf, pos, eof = _read_text(text, buf, pos)
+                continue
+            if not eof and _JSON_NUMBER_END.match(buf, end):
+                # A number may continue in the next chunk
+                buf, pos, eof = _read_text(text, buf, pos)
+                continue
+            pos = end
+            state = 'separator'
+            yield item
+        elif state == 'separator' and buf[pos] in ',]':
+            state = 'value' if buf[pos] == ',' else 'end'
+            pos += 1
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter"
+                                       if state == 'separator'
+                                       else "Extra data", buf, pos)
+
+
+def _decode_chunks(chunks):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def _read_text(text, buf, pos):
+    """Append the next chunk of text to the unparsed part of a buffer."""
+    for chunk in text:
+        if chunk:
+            return buf[pos:] + chunk, 0, False
+    return buf[pos:], 0, True
+
+
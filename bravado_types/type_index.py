@@ -0,0 +1,110 @@
+"""
+Compact type index used by the bravado-types MyPy plugin.
+
+When the lazy_stubs option is enabled, the generated stub file only declares
+placeholder types, and the signatures of resources, operations and models
+are recorded in a JSON type index file instead. The MyPy plugin in
+bravado_types.mypy_plugin reads the index and builds types as they are
+referenced, so MyPy does not need to analyze the parts of the schema that
+the checked code does not use.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from bravado_types.config import Config
+from bravado_types.data_model import OperationInfo, SpecInfo, TypeInfo
+from bravado_types.sinks import FileSink, OutputSink
+
+TYPE_INDEX_FORMAT = 'bravado-types-index'
+TYPE_INDEX_VERSION = 1
+
+
+def get_type_index(spec: SpecInfo, config: Config,
+                   types: Dict[TypeInfo, str]) -> Dict[str, Any]:
+    """
+    Build the type index for a schema.
+
+    :param spec: Extracted type information.
+    :param config: Code generation configuration.
+    :param types: Type strings of the types of the spec, as returned by
+        bravado_types.type_strings.render_spec_types().
+    """
+    return {
+        'format': TYPE_INDEX_FORMAT,
+        'version': TYPE_INDEX_VERSION,
+        'resources': {
+            resource.name: {
+                'type': config.resource_type(resource.name),
+                'operations': [operation.name
+                               for operation in resource.operations],
+            }
+            for resource in spec.resources
+        },
+        'operations': {
+            operation.name: {
+                'type': config.operation_type(operation.name),
+                'params': [[param.name, types[param.type],
+                            param.required]
+                           for param in operation.params],
+                'returns': future_type(operation, config, types),
+            }
+            for operation in spec.operations
+        },
+        'models': {
+            model.name: {
+                'type': config.model_type(model.name),
+                'props': [[prop.name, types[prop.type],
+                           prop.required]
+                          for prop in model.props],
+            }
+            for model in spec.models
+        },
+    }
+
+
+def write_type_index(spec: SpecInfo, config: Config,
+                     types: Dict[TypeInfo, str],
+                     sink: OutputSink = None) -> str:
+    """
+    Write the type index file for a schema to config.index_path.
+
+    :param sink: Optional output sink to write the file to.
+    :return: SHA-256 digest of the file contents.
+    """
+    data = json.dumps(get_type_index(spec, config, types),
+                      separators=(',', ':'), sort_keys=True)
+    (sink or FileSink()).write(config.index_path, data)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def future_type(operation: OperationInfo, config: Config,
+                types: Dict[TypeInfo, str]) -> str:
+    """
+    Get the return type of an operation, as a type string.
+
+    Unqualified names other than builtins and model types refer to
+    definitions in the generated stub file.
+    """
+    members: List[str]
+    if config.response_types == 'success':
+        members = [types[response.type]
+                   for response in operation.responses if response.success]
+        result_type = _union(members) if members else 'None'
+    elif config.response_types == 'all':
+        members = [types[response.type] for response in operation.responses]
+        result_type = _union(members) if members else 'None'
+    else:
+        result_type = 'typing.Any'
+
+    if config.async_client:
+        return f'_AsyncHttpFuture[{result_type}]'
+    else:
+        return f'bravado.http_future.HttpFuture[{result_type}]'
+
+
+def _union(types: List[str]) -> str:
+    if len(types) == 1:
+        return types[0]
+    return f"typing.Union[{', '.join(types)}]"
@@ -0,0 +1,110 @@
+"""
+Rendering of extracted types to type strings.
+
+Types are extracted as TypeInfo objects and rendered to type strings for a
+configuration just before the files are rendered, applying its array types
+and model type format. Templates receive the type strings in a dict keyed by
+TypeInfo, so a single extraction can be rendered with several
+configurations.
+"""
+
+from typing import Dict, Iterable, Iterator, List
+
+from bravado_types.config import Config
+from bravado_types.data_model import ModelInfo, SpecInfo, TypeInfo, TypeWrapper
+
+# Placeholder used to split type templates into a prefix and suffix
+_HOLE = '\0'
+
+
+def render_type(type_info: TypeInfo, config: Config) -> str:
+    """Render a type to a type string for a configuration."""
+    if type_info.model:
+        result = config.model_type(type_info.name)
+    else:
+        result = type_info.name
+    templates = {
+        TypeWrapper.array: config.array_type_template,
+        TypeWrapper.optional: 'typing.Optional[{}]',
+    }
+    return _wrap_all(result, [templates[wrapper]
+                              for wrapper in type_info.wrappers])
+
+
+def render_spec_types(spec: SpecInfo, config: Config) -> Dict[TypeInfo, str]:
+    """
+    Render the types of the models, parameters and responses of a spec to
+    type strings for a configuration.
+
+    :return: Type string of each type, keyed by type.
+    """
+    return _render_all(_spec_types(spec), config)
+
+
+def render_model_types(models: Iterable[ModelInfo], config: Config
+                       ) -> Dict[TypeInfo, str]:
+    """
+    Render the property types of models to type strings for a
+    configuration.
+
+    :return: Type string of each type, keyed by type.
+    """
+    return _render_all(_model_types(models), config)
+
+
+def _render_all(types: Iterable[TypeInfo], config: Config
+                ) -> Dict[TypeInfo, str]:
+    """Render each distinct type once."""
+    result: Dict[TypeInfo, str] = {}
+    for type_info in types:
+        if type_info in result:
+            continue
+        elif not type_info.wrappers:
+            if type_info.model:
+                result[type_info] = config.model_type(type_info.name)
+            else:
+                result[type_info] = type_info.name
+        else:
+            result[type_info] = render_type(type_info, config)
+    return result
+
+
+def _spec_types(spec: SpecInfo) -> Iterator[TypeInfo]:
+    yield from _model_types(spec.models)
+    for operation in spec.operations:
+        for param in operation.params:
+            yield param.type
+        for response in operation.responses:
+            yield response.type
+
+
+def _model_types(models: Iterable[ModelInfo]) -> Iterator[TypeInfo]:
+    for model in models:
+        for prop in model.props:
+            yield prop.type
+
+
+def _wrap_all(type_str: str, templates: List[str]) -> str:
+    """
+    Apply a list of type templates to a type string, outermost first.
+
+    Runs of templates with a single placeholder are joined in one pass, so
+    the cost is linear in the length of the result.
+    """
+    result = type_str
+    prefixes: List[str] = []
+    suffixes: List[str] = []
+    parts_cache: Dict[str, List[str]] = {}
+    for fmt in reversed(templates):
+        parts = parts_cache.get(fmt)
+        if parts is None:
+            parts = parts_cache[fmt] = fmt.format(_HOLE).split(_HOLE)
+        if len(parts) == 2:
+            prefixes.append(parts[0])
+            suffixes.append(parts[1])
+        else:
+            result = fmt.format(''.join([*reversed(prefixes), result,
+                                         *suffixes]))
+            prefixes.clear()
+            suffixes.clear()
+    return ''.join([*reversed(prefixes), result, *suffixes])
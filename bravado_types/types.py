@@ -1,13 +1,13 @@
 """Functions for mapping Swagger definitions to Python types."""
 
 import warnings
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Set
 
 from bravado_core.schema import get_type_from_schema
 from bravado_core.spec import Spec
 
 from bravado_types.config import Config
-from bravado_types.data_model import TypeInfo
+from bravado_types.data_model import TypeInfo, TypeWrapper
 
 # Map of Swagger primitive types to Python types
 SWAGGER_PRIMITIVE_TYPES = {
@@ -35,42 +35,81 @@ def get_type_info(spec: Spec, schema: Dict[str, Any], config: Config
                   ) -> TypeInfo:
     """
     Get the type of a schema within a Swagger spec.
+
+    Array items and single-item allOf schemas are followed iteratively rather
+    than recursively, so the cost is linear in the nesting depth and deeply
+    nested schemas do not hit the recursion limit. A schema which is nested
+    within itself is typed as typing.Any at the point where it recurs.
+
+    The array types and model type format of the configuration are applied
+    when the type is rendered, not here.
+
     :param spec: Bravado-core spec object
     :param schema: Schema dict
     :return: A TypeInfo for the schema.
     """
-    schema = spec.deref(schema)
-    schema_type = get_type_from_schema(spec, schema)
-    if schema_type == "array":
-        type_info = _get_array_type_info(spec, schema, config)
-    elif schema_type == "object":
-        type_info = _get_object_type_info(spec, schema, config)
+    # Types wrapping the innermost type, outermost first
+    wrappers: List[TypeWrapper] = []
+    seen: Set[int] = set()
+    while True:
+        schema = spec.deref(schema)
+        if id(schema) in seen:
+            warnings.warn("Recursive schema nested within itself")
+            type_info = TypeInfo("typing.Any")
+            break
+        seen.add(id(schema))
+
+        if schema.get("x-nullable", False):
+            wrappers.append(TypeWrapper.optional)
+        schema_type = get_type_from_schema(spec, schema)
+        if schema_type == "array":
+            wrappers.append(TypeWrapper.array)
+            schema = schema["items"]
+        elif schema_type == "object" and _is_single_all_of(schema):
+            schema = schema["allOf"][0]
+        else:
+            type_info = _get_simple_type_info(spec, schema, schema_type,
+                                              config)
+            break
+
+    return TypeInfo(type_info.name, type_info.model, wrappers)
+
+
+def _get_simple_type_info(spec: Spec, schema: Dict[str, Any],
+                          schema_type: Optional[str], config: Config
+                          ) -> TypeInfo:
+    """
+    Get the type of a schema which does not wrap a nested schema.
+    :param spec: Bravado-core spec object
+    :param schema: Schema dict
+    :param schema_type: Swagger type of the schema
+    :return: A TypeInfo for the schema.
+    """
+    if schema_type == "object":
+        return _get_object_type_info(spec, schema, config)
     elif schema_type in SWAGGER_PRIMITIVE_TYPES:
-        type_info = _get_primitive_type_info(spec, schema, config)
+        return _get_primitive_type_info(spec, schema, config)
     elif schema_type == "file":
-        type_info = TypeInfo("typing.Any")
+        return TypeInfo("typing.Any")
     elif schema_type is None:
-        type_info = TypeInfo("typing.Any")
+        return TypeInfo("typing.Any")
     else:
         warnings.warn(f"Unknown schema type: {schema_type!r}")
-        type_info = TypeInfo("typing.Any")
+        return TypeInfo("typing.Any")
 
-    if schema.get("x-nullable", False):
-        type_info = _wrap(type_info, "typing.Optional[{}]")
 
-    return type_info
+def _is_single_all_of(schema: Dict[str, Any]) -> bool:
+    """
+    Check whether an object schema is an allOf with a single item.
 
+    This may be used to specify a nullable ref, like this:
 
-def _get_array_type_info(spec: Spec, schema: Dict[str, Any], config: Config
-                         ) -> TypeInfo:
-    """
-    Get the type of an array schema.
-    :param spec: Bravado-core spec object
-    :param schema: Schema dict
-    :return: A TypeInfo for the schema.
+    x-nullable: true
+    allOf:
+      - $ref: '#/definitions/Model'
     """
-    item_type = get_type_info(spec, schema["items"], config)
-    return _wrap(item_type, config.array_type_template)
+    return ('x-model' not in schema and 'allOf' in schema
+            and len(schema['allOf']) == 1 and 'properties' not in schema)
 
 
 def _get_object_type_info(spec: Spec, schema: Dict[str, Any], config: Config
@@ -82,18 +121,7 @@ def _get_object_type_info(spec: Spec, schema: Dict[str, Any], config: Config
     :return: A TypeInfo for the schema.
     """
     if "x-model" in schema:
-        return TypeInfo(config.model_type(schema["x-model"]))
-
-    # Special case: allOf with a single item. This may be used to specify a
-    # nullable ref, like this:
-    #
-    # x-nullable: true
-    # allOf:
-    #   - $ref: '#/definitions/Model'
-    if ('allOf' in schema and len(schema['allOf']) == 1
-            and 'properties' not in schema):
-        return get_type_info(spec, schema['allOf'][0], config)
-
+        return TypeInfo(schema["x-model"], model=True)
     return TypeInfo("typing.Mapping[str, typing.Any]")
 
 
@@ -128,7 +156,3 @@ def get_response_type_info(spec: Spec, rschema: Dict[str, Any], config: Config
     if "schema" in rschema:
         return get_type_info(spec, rschema["schema"], config)
     return TypeInfo("None")
-
-
-def _wrap(type_info: TypeInfo, fmt: str) -> TypeInfo:
-    return TypeInfo(fmt.format(type_info))
@@ -47,6 +47,13 @@ setup(
         # Used for accessing package resources
         'setuptools',
     ],
+    extras_require={
+        # Default HTTP client of modules generated with async_client
+        'async': ['bravado-asyncio'],
+        # MyPy versions supported by bravado_types.mypy_plugin, which uses
+        # MyPy internals. Keep in sync with mypy_plugin.MYPY_VERSIONS.
+        'mypy': ['mypy>=0.910,<0.920'],
+    },
     entry_points={
         'console_scripts': [
             'bravado-types = bravado_types.__main__:main',
@@ -0,0 +1,23 @@
+import async_example, sync_example
+from bravado.http_client import HttpClient
+
+http_client: HttpClient
+
+async_example.ExampleSwaggerClient.from_spec({}, None, http_client)
+async_example.ExampleSwaggerClient.from_spec({}, http_client=http_client)
+
+aclient = async_example.ExampleSwaggerClient.from_url('...')
+reveal_type(aclient.foo.getFoo(id=1))  # note: Revealed type is "async_example._AsyncHttpFuture[async_example.FooModel]"
+
+async def get_foo_name(foo_id: int) -> str:
+    response = await aclient.foo.getFoo(id=foo_id).response()
+    reveal_type(response)  # note: Revealed type is "bravado.response.BravadoResponse*[async_example.FooModel*]"
+    foo = await aclient.foo.getFoo(id=foo_id).result()
+    reveal_type(foo)  # note: Revealed type is "async_example.FooModel*"
+    return foo.name
+
+def get_foo_sync(foo_id: int) -> None:
+    aclient.foo.getFoo(id=foo_id).response().result  # error: "Awaitable[BravadoResponse[FooModel]]" has no attribute "result"
+
+sclient = sync_example.ExampleSwaggerClient.from_url('...')
+reveal_type(sclient.foo.getFoo(id=1))  # note: Revealed type is "bravado.http_future.HttpFuture[sync_example.FooModel]"
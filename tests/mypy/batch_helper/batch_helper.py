@@ -0,0 +1,21 @@
+import concurrent.futures
+
+from example import ExampleSwaggerClient
+
+client = ExampleSwaggerClient.from_url('...')
+
+with client.batch(max_workers=4, timeout=10) as batch:
+    reveal_type(batch)  # note: Revealed type is "example._Batch"
+    foo = batch.submit(client.foo.getFoo(id=1))
+    bars = batch.submit(client.bar.listBars())
+    foos = batch.submit_all(client.foo.getFoo(id=i) for i in range(10))
+
+reveal_type(foo)  # note: Revealed type is "concurrent.futures._base.Future[example.FooModel*]"
+reveal_type(foo.result())  # note: Revealed type is "example.FooModel*"
+reveal_type(bars.result())  # note: Revealed type is "builtins.list*[example.BarModel]"
+reveal_type(foos)  # note: Revealed type is "builtins.list[concurrent.futures._base.Future[example.FooModel*]]"
+
+for future in concurrent.futures.as_completed(foos):
+    reveal_type(future.result())  # note: Revealed type is "example.FooModel*"
+
+batch.submit(client.foo.getFoo)  # error: Argument 1 to "submit" of "_Batch" has incompatible type "getFooOperation"; expected "HttpFuture[<nothing>]"
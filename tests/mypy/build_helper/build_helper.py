@@ -0,0 +1,9 @@
+from example import ExampleSwaggerClient
+
+client = ExampleSwaggerClient.from_url('...')
+
+items = client.build_many('Item', [{'name': 'a'}, {'name': 'b', 'id': 1}])
+reveal_type(items)  # note: Revealed type is "builtins.list[example.ItemModel]"
+client.build_many('Item', [{'name': 'a', 'id': None, 'tags': ['x']}])
+client.build_many('Point', ({'x': 1.0, 'y': 2.0} for _ in range(10)))
+client.build_many('Empty', [{}])
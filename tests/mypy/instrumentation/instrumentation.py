@@ -0,0 +1,19 @@
+from example import ExampleSwaggerClient, _OperationCall
+
+client = ExampleSwaggerClient.from_url('...')
+
+
+def log_call(call: _OperationCall) -> None:
+    reveal_type(call.operation)  # note: Revealed type is "Union[Literal['getFoo'], Literal['listBars']]"
+    reveal_type(call.request_time)  # note: Revealed type is "Union[builtins.float, None]"
+    reveal_type(call.status_code)  # note: Revealed type is "Union[builtins.int, None]"
+
+
+client.add_operation_hook(log_call)
+client.add_operation_hook(log_call, ['getFoo'])
+client.add_operation_hook(lambda call: print(call.unmarshal_time),
+                          operations=['listBars'])
+client.add_operation_hook(log_call, ['getBar'])  # error: List item 0 has incompatible type "Literal['getBar']"; expected "Union[Literal['getFoo'], Literal['listBars']]"
+client.remove_operation_hook(log_call)
+client.add_operation_hook(print)
+client.add_operation_hook(len)  # error: Argument 1 to "add_operation_hook" of "ExampleSwaggerClient" has incompatible type "Callable[[Sized], int]"; expected "Callable[[_OperationCall], Any]"
@@ -0,0 +1,43 @@
+import os.path
+from typing import Any
+
+from petstore import PetstoreSwaggerClient, PetModel
+
+client = PetstoreSwaggerClient.from_url('...')
+reveal_type(client)  # note: Revealed type is "petstore.PetstoreSwaggerClient"
+
+Pet = client.get_model("Pet")
+reveal_type(Pet)  # note: Revealed type is "Type[petstore._LazyModel[Literal['Pet']]]"
+
+frank = Pet(name="Frank", photoUrls=[])
+reveal_type(frank)  # note: Revealed type is "petstore._LazyModel[Literal['Pet']]"
+
+future = client.pet.addPet(body=frank)
+reveal_type(future)  # note: Revealed type is "bravado.http_future.HttpFuture[None]"
+
+reveal_type(client.pet)  # note: Revealed type is "petstore._LazyResource[Literal['pet']]"
+reveal_type(client.pet.getPetById)  # note: Revealed type is "petstore._LazyOperation[Literal['getPetById']]"
+
+pet123 = client.pet.getPetById(petId=123).response().result
+reveal_type(pet123)  # note: Revealed type is "Union[petstore._LazyModel*[Literal['Pet']], None]"
+
+client.pet.getPetById(petId=456, _request_options={
+    'headers': {'Example-Header': 'header value'}
+})
+
+def get_name(pet: PetModel) -> str:
+    reveal_type(pet)  # note: Revealed type is "petstore._LazyModel[Literal['Pet']]"
+    return pet.name
+
+
+def instance_check(model: Any):
+    if isinstance(model, Pet):
+        reveal_type(model)  # note: Revealed type is "petstore._LazyModel[Literal['Pet']]"
+
+
+with client.batch() as batch:
+    pet_future = batch.submit(client.pet.getPetById(petId=789))
+reveal_type(pet_future.result())  # note: Revealed type is "petstore._LazyModel*[Literal['Pet']]"
+
+pets = client.build_many("Pet", [{"name": "Rex", "photoUrls": []}])
+reveal_type(pets)  # note: Revealed type is "builtins.list[petstore._LazyModel[Literal['Pet']]]"
@@ -0,0 +1,11 @@
+from petstore_options import PetstoreOptionsSwaggerClient
+
+client: PetstoreOptionsSwaggerClient
+
+async def find_pets() -> None:
+    future = client.pet.findPetsByStatus(status=['available'])
+    pets = await future.result()
+    reveal_type(pets)  # note: Revealed type is "Union[builtins.list[petstore_options._LazyModel[Literal['Pet']]], builtins.tuple[petstore_options._LazyModel[Literal['Pet']]], None]"
+    assert pets is not None
+    reveal_type(pets[0].photoUrls)  # note: Revealed type is "Union[builtins.list[builtins.str], builtins.tuple[builtins.str]]"
+    reveal_type(pets[0].tags)  # note: Revealed type is "Union[builtins.list[petstore_options._LazyModel[Literal['Tag']]], builtins.tuple[petstore_options._LazyModel[Literal['Tag']]], None]"
@@ -0,0 +1,16 @@
+from example import ExampleSwaggerClient
+
+client = ExampleSwaggerClient.from_url('...')
+
+client.configure_cache('getFoo')
+client.configure_cache('getFoo', maxsize=None, ttl=30)
+client.configure_cache('createFoo')  # error: Argument 1 to "configure_cache" of "ExampleSwaggerClient" has incompatible type "Literal['createFoo']"; expected "Literal['getFoo']"
+client.configure_cache('getFoo', maxsize='1')  # error: Argument "maxsize" to "configure_cache" of "ExampleSwaggerClient" has incompatible type "str"; expected "Optional[int]"
+
+client.foo.getFoo(id=1).result()
+client.invalidate_cache('getFoo', id=1)
+client.invalidate_cache()
+
+info = client.cache_info('getFoo')
+reveal_type(info.hits)  # note: Revealed type is "builtins.int"
+reveal_type(info.maxsize)  # note: Revealed type is "Union[builtins.int, None]"
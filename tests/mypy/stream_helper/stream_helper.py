@@ -0,0 +1,24 @@
+import example, example_all, example_union
+
+client = example.ExampleSwaggerClient.from_url('...')
+
+with client.stream(client.bar.listBars(), chunk_size=1024) as bars:
+    reveal_type(bars)  # note: Revealed type is "example._ResponseStream[example.BarModel*]"
+    for bar in bars:
+        reveal_type(bar)  # note: Revealed type is "example.BarModel*"
+
+reveal_type(next(client.stream(client.bar.listBars())))  # note: Revealed type is "example.BarModel*"
+client.stream(client.foo.getFoo(id=1))  # error: Argument 1 to "stream" of "ExampleSwaggerClient" has incompatible type "HttpFuture[FooModel]"; expected "HttpFuture[Union[List[<nothing>], Any]]"
+
+union_client = example_union.ExampleSwaggerClient.from_url('...')
+for union_bar in union_client.stream(union_client.bar.listBars(), timeout=10):
+    reveal_type(union_bar)  # note: Revealed type is "example_union.BarModel*"
+
+reveal_type(client.bar.listBars())  # note: Revealed type is "bravado.http_future.HttpFuture[builtins.list[example.BarModel]]"
+reveal_type(client.baz.listBazs())  # note: Revealed type is "bravado.http_future.HttpFuture[Union[builtins.list[example.BarModel], None]]"
+reveal_type(next(client.stream(client.baz.listBazs())))  # note: Revealed type is "example.BarModel*"
+
+all_client = example_all.ExampleSwaggerClient.from_url('...')
+reveal_type(all_client.baz.listBazs())  # note: Revealed type is "bravado.http_future.HttpFuture[Union[builtins.list[example_all.BarModel], None, example_all.ErrorModel]]"
+reveal_type(next(all_client.stream(all_client.baz.listBazs())))  # note: Revealed type is "example_all.BarModel*"
+all_client.stream(all_client.foo.getFoo(id=1))  # error: Argument 1 to "stream" of "ExampleSwaggerClient" has incompatible type "HttpFuture[FooModel]"; expected "HttpFuture[Union[List[<nothing>], Any]]"
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from bravado_types import generate_modules_async
+from bravado_types.config import Config
+from bravado_types.http_cache import SchemaCache
+
+NUM_SCHEMAS = 6
+
+DOCUMENTS = {
+    '/common.json': {
+        'definitions': {
+            'Id': {'type': 'integer'},
+        },
+    },
+    **{
+        f'/service{i}.json': {
+            'swagger': '2.0',
+            'info': {'title': f'Service {i}', 'version': '1.0'},
+            'paths': {
+                '/item': {
+                    'get': {
+                        'operationId': 'getItem',
+                        'tags': ['items'],
+                        'responses': {
+                            '200': {
+                                'description': 'Success',
+                                'schema': {'$ref': '#/definitions/Item'},
+                            },
+                        },
+                    },
+                },
+            },
+            'definitions': {
+                'Item': {
+                    'type': 'object',
+                    'properties': {
+                        'id': {'$ref': 'common.json#/definitions/Id'},
+                    },
+                },
+            },
+        }
+        for i in range(NUM_SCHEMAS)
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight,
+                                       server.in_flight)
+        time.sleep(server.latency)
+        # Decremented before responding, so that the client cannot start its
+        # next request first
+        with server.lock:
+            server.in_flight -= 1
+        if self.path not in DOCUMENTS:
+            self.send_error(404)
+            return
+        body = json.dumps(DOCUMENTS[self.path]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.latency = 0.1
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _sources(server, tmp_path, paths):
+    return [
+        (f'http://127.0.0.1:{server.server_port}{path}',
+         Config(name=f'Service{i}', path=str(tmp_path / f'service{i}.py')))
+        for i, path in enumerate(paths)
+    ]
+
+
+def _schema_paths():
+    return [f'/service{i}.json' for i in range(NUM_SCHEMAS)]
+
+
+def _assert_generated(tmp_path, i):
+    with open(tmp_path / f'service{i}.pyi') as f:
+        stub = f.read()
+    assert 'class ItemModel(_Model):' in stub
+    assert 'id: int = None,' in stub
+    assert (tmp_path / f'service{i}.py').exists()
+
+
+def test_generate_modules_async(server, tmp_path):
+    asyncio.run(generate_modules_async(
+        _sources(server, tmp_path, _schema_paths())))
+    for i in range(NUM_SCHEMAS):
+        _assert_generated(tmp_path, i)
+    # Each schema fetches its own document and the common document
+    assert len(server.requests) == 2 * NUM_SCHEMAS
+    assert server.max_in_flight > 1
+
+
+def test_generate_modules_async_bounded(server, tmp_path):
+    asyncio.run(generate_modules_async(
+        _sources(server, tmp_path, _schema_paths()),
+        max_concurrency=2, fetch_workers=1))
+    for i in range(NUM_SCHEMAS):
+        _assert_generated(tmp_path, i)
+    assert server.max_in_flight == 2
+
+
+def test_generate_modules_async_error(server, tmp_path):
+    paths = ['/service0.json', '/missing.json', '/service2.json']
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(generate_modules_async(
+            _sources(server, tmp_path, paths)))
+    # Other schemas are still generated
+    _assert_generated(tmp_path, 0)
+    _assert_generated(tmp_path, 2)
+    assert not (tmp_path / 'service1.py').exists()
+
+
+def test_generate_modules_async_duplicate_path(server, tmp_path):
+    sources = _sources(server, tmp_path, _schema_paths()[:2])
+    sources[1] = (sources[1][0], sources[0][1])
+    with pytest.raises(ValueError, match='Duplicate output path'):
+        asyncio.run(generate_modules_async(sources))
+    assert server.requests == []
+
+
+def test_generate_modules_async_process_pool(server, tmp_path):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        asyncio.run(generate_modules_async(
+            _sources(server, tmp_path, _schema_paths()), executor=executor))
+    for i in range(NUM_SCHEMAS):
+        _assert_generated(tmp_path, i)
+
+
+def test_generate_modules_async_cache(server, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    sources = _sources(server, tmp_path, _schema_paths())
+    asyncio.run(generate_modules_async(sources, cache=SchemaCache(cache_dir)))
+    server.requests.clear()
+    asyncio.run(generate_modules_async(
+        sources, cache=SchemaCache(cache_dir, offline=True)))
+    assert server.requests == []
+    for i in range(NUM_SCHEMAS):
+        _assert_generated(tmp_path, i)
+
+
+def test_lazy_import():
+    subprocess.run([sys.executable, '-c', """\
+import sys
+import bravado_types
+assert 'bravado_types.aio' not in sys.modules, 'aio was imported'
+from bravado_types import generate_modules_async
+from bravado_types.aio import generate_modules_async as f
+assert generate_modules_async is f
+"""], check=True)
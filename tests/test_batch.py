@@ -0,0 +1,132 @@
+import concurrent.futures
+import importlib.util
+import json
+import os.path
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from bravado.client import SwaggerClient
+from bravado.exception import BravadoTimeoutError, HTTPNotFound
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+LATENCY = 0.1
+SLOW_PET_ID = 999
+
+
+@pytest.fixture(scope='module')
+def spec_dict():
+    with open(PETSTORE_SCHEMA) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='module')
+def module(spec_dict, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('batch') / 'petstore.py')
+    config = Config(name='Petstore', path=path, batch_helper=True)
+    spec = SwaggerClient.from_spec(spec_dict).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+
+    module_spec = importlib.util.spec_from_file_location('petstore', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def server():
+    """Serve pets by id after a delay. Pet ids of 100 or more are missing."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            pet_id = int(self.path.rsplit('/', 1)[1])
+            time.sleep(10 * LATENCY if pet_id == SLOW_PET_ID else LATENCY)
+            if pet_id < 100:
+                status = 200
+                body = json.dumps({'id': pet_id, 'name': f'Pet {pet_id}',
+                                   'photoUrls': []}).encode('utf-8')
+            else:
+                status = 404
+                body = b'{}'
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(module, spec_dict, server):
+    spec_dict = dict(spec_dict, host=f'127.0.0.1:{server.server_port}',
+                     schemes=['http'])
+    return module.PetstoreSwaggerClient.from_spec(
+        spec_dict, http_client=RequestsClient())
+
+
+def test_batch_results_in_order(client):
+    with client.batch(max_workers=10) as batch:
+        futures = batch.submit_all(client.pet.getPetById(petId=i)
+                                   for i in range(10))
+    assert [future.result().id for future in futures] == list(range(10))
+
+
+def test_batch_as_completed(client):
+    with client.batch(max_workers=10) as batch:
+        futures = [batch.submit(client.pet.getPetById(petId=SLOW_PET_ID)),
+                   batch.submit(client.pet.getPetById(petId=1))]
+        completed = list(concurrent.futures.as_completed(futures))
+    assert completed == futures[::-1]
+
+
+def test_batch_exceptions(client):
+    with client.batch(max_workers=10) as batch:
+        futures = batch.submit_all(client.pet.getPetById(petId=i)
+                                   for i in (1, 100, 2))
+    assert isinstance(futures[1].exception(), HTTPNotFound)
+    assert [futures[0].result().id, futures[2].result().id] == [1, 2]
+
+
+def test_batch_timeout(client):
+    with client.batch(max_workers=2, timeout=LATENCY * 5) as batch:
+        futures = batch.submit_all(client.pet.getPetById(petId=i)
+                                   for i in (1, SLOW_PET_ID))
+    assert futures[0].result().id == 1
+    assert isinstance(futures[1].exception(), BravadoTimeoutError)
+
+
+def test_batch_throughput(client):
+    num_calls = 20
+    start = time.perf_counter()
+    with client.batch(max_workers=10) as batch:
+        futures = batch.submit_all(client.pet.getPetById(petId=i)
+                                   for i in range(num_calls))
+    elapsed = time.perf_counter() - start
+    assert all(future.result() for future in futures)
+    # Sequential calls would take at least num_calls * LATENCY
+    assert elapsed < num_calls * LATENCY / 2
+
+
+def test_batch_async_client():
+    with pytest.raises(ValueError, match='async'):
+        Config(name='Petstore', path='petstore.py', batch_helper=True,
+               async_client=True)
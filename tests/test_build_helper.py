@@ -0,0 +1,234 @@
+import importlib.util
+import os
+from contextlib import contextmanager
+
+import mypy.api
+import pytest
+from bravado.client import SwaggerClient
+from bravado_core.model import Model
+from jsonschema.exceptions import ValidationError
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+ITEM = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer'},
+        'name': {'type': 'string'},
+        'tags': {'type': 'array', 'items': {'type': 'string'}},
+    },
+    'required': ['name'],
+}
+
+SPEC = {
+    'swagger': '2.0',
+    'info': {'title': 'Items', 'version': '1.0'},
+    'paths': {},
+    'definitions': {
+        'Item': ITEM,
+        'Closed': {
+            'type': 'object',
+            'properties': {'a': {'type': 'integer'},
+                           'b': {'type': 'integer'}},
+            'additionalProperties': False,
+        },
+        'Child': {
+            'allOf': [
+                {'$ref': '#/definitions/Item'},
+                {
+                    'type': 'object',
+                    'properties': {'color': {'type': 'string'}},
+                    'required': ['color'],
+                },
+            ],
+        },
+        'Empty': {'type': 'object'},
+    },
+}
+
+CHECK_MODULE = '''\
+from items import ItemsSwaggerClient
+
+client = ItemsSwaggerClient.from_url('...')
+client.build_many('Item', [{'id': 1}])
+client.build_many('Child', [{'name': 'a'}])
+client.build_many('Closed', [{'a': 1, 'c': 2}])
+client.build_many('Missing', [])
+'''
+
+
+@contextmanager
+def _chdir(path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+def _generate(directory, spec_dict, **options):
+    path = str(directory / 'items.py')
+    config = Config(name='Items', path=path, build_helper=True, **options)
+    spec = SwaggerClient.from_spec(spec_dict).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    return path
+
+
+@pytest.fixture(scope='module')
+def module(tmp_path_factory):
+    path = _generate(tmp_path_factory.mktemp('build_helper'), SPEC)
+    module_spec = importlib.util.spec_from_file_location('items', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client(module):
+    return module.ItemsSwaggerClient.from_spec(SPEC)
+
+
+@pytest.fixture(scope='module')
+def run_mypy(tmp_path_factory):
+    # Share the cache of the installed packages between MyPy runs
+    cache_dir = str(tmp_path_factory.mktemp('mypy_cache'))
+
+    def run_mypy(path, filename):
+        with _chdir(path):
+            return mypy.api.run(['--cache-dir', cache_dir, filename])
+    return run_mypy
+
+
+@pytest.mark.parametrize('include_missing_properties', [True, False])
+def test_same_as_constructor(module, include_missing_properties):
+    client = module.ItemsSwaggerClient.from_spec(SPEC, config={
+        'include_missing_properties': include_missing_properties})
+    Item = client.get_model('Item')
+    rows = [{'name': 'a'}, {'name': 'b', 'id': 2, 'tags': ['x']},
+            {'name': 'c', 'id': None, 'extra': True}]
+    models = client.build_many('Item', rows)
+    expected = [Item(**row) for row in rows]
+    assert models == expected
+    for model, other in zip(models, expected):
+        assert type(model) is Item
+        assert sorted(model) == sorted(other)
+        assert model._as_dict() == other._as_dict()
+
+
+@pytest.mark.parametrize('include_missing_properties', [True, False])
+def test_key_order(module, include_missing_properties):
+    client = module.ItemsSwaggerClient.from_spec(SPEC, config={
+        'include_missing_properties': include_missing_properties})
+    Item = client.get_model('Item')
+    rows = [{'tags': [], 'name': 'a'}, {'extra': 1, 'id': 2, 'name': 'b'}]
+    models = client.build_many('Item', rows)
+    for model, row in zip(models, rows):
+        assert list(model) == list(Item(**row))
+
+
+def test_model_dict(client):
+    # build_many() sets the attribute dict used by bravado-core's Model class
+    Item = client.get_model('Item')
+    assert Model.__slots__ == ('_Model__dict',)
+    assert object.__getattribute__(Item(name='a', id=1), '_Model__dict') == {
+        'id': 1, 'name': 'a', 'tags': None}
+
+
+def test_validate(client):
+    assert client.build_many('Item', [{'name': 'a'}],
+                             validate=True)[0].name == 'a'
+    with pytest.raises(ValidationError, match="1 is not of type 'string'"):
+        client.build_many('Item', [{'name': 'a'}, {'name': 1}],
+                          validate=True)
+
+
+def test_not_validated(module):
+    # As with the model type, instances are not validated by default, even
+    # if validate_requests is set
+    client = module.ItemsSwaggerClient.from_spec(SPEC, config={
+        'validate_requests': True})
+    Item = client.get_model('Item')
+    assert client.build_many('Item', [{'name': 1}]) == [Item(name=1)]
+
+
+def test_rows_copied(client):
+    rows = [{'name': 'a', 'tags': ['x']}]
+    models = client.build_many('Item', iter(rows))
+    rows[0]['name'] = 'b'
+    assert models[0].name == 'a'
+    # Property values are not copied, as with the model constructor
+    assert models[0].tags is rows[0]['tags']
+    models[0].id = 1
+    assert 'id' not in rows[0]
+
+
+def test_inherited_properties(client):
+    Child = client.get_model('Child')
+    child, = client.build_many('Child', [{'name': 'a', 'color': 'red'}])
+    assert child == Child(name='a', color='red')
+    assert isinstance(child, client.get_model('Item'))
+    with pytest.raises(ValueError, match=r"missing properties: \['name'\]"):
+        client.build_many('Child', [{'color': 'red'}])
+
+
+def test_missing_required(client):
+    with pytest.raises(ValueError,
+                       match=r"Row 1 of Item is missing properties: "
+                             r"\['name'\]"):
+        client.build_many('Item', [{'name': 'a'}, {'id': 1}])
+    assert client.build_many('Empty', [{}, {'x': 1}])[1].x == 1
+
+
+def test_additional_properties_not_allowed(client):
+    Closed = client.get_model('Closed')
+    assert client.build_many('Closed', [{'a': 1}]) == [Closed(a=1)]
+    with pytest.raises(ValueError,
+                       match=r"Row 0 of Closed has unknown properties: "
+                             r"\['c', 'd'\]"):
+        client.build_many('Closed', [{'a': 1, 'd': 2, 'c': 3}])
+    with pytest.raises(AttributeError):
+        Closed(a=1, c=2)
+
+
+def test_unknown_model(client):
+    with pytest.raises(ValueError, match='Unknown model: Missing'):
+        client.build_many('Missing', [])
+
+
+def test_stub_types(tmp_path, run_mypy):
+    _generate(tmp_path, SPEC)
+    (tmp_path / 'check.py').write_text(CHECK_MODULE)
+    normal_report, _, _ = run_mypy(tmp_path, 'check.py')
+    errors = [line for line in normal_report.splitlines()
+              if ': error: ' in line]
+    assert [line.split(':')[1] for line in errors] == ['4', '5', '6', '7']
+    assert all('No overload variant of "build_many"' in line
+               for line in errors)
+
+
+def test_stub_single_model(tmp_path, run_mypy):
+    _generate(tmp_path, {**SPEC, 'definitions': {'Item': ITEM}})
+    (tmp_path / 'check.py').write_text(
+        "from items import ItemsSwaggerClient\n"
+        "client = ItemsSwaggerClient.from_url('...')\n"
+        "reveal_type(client.build_many('Item', [{'name': 'a'}]))\n"
+        "client.build_many('Item', [{'id': 1}])\n"
+        "reveal_type(client.build_many('Item', [], validate=True))\n")
+    normal_report, _, _ = run_mypy(tmp_path, 'check.py')
+    lines = normal_report.splitlines()
+    assert lines[0] == ('check.py:3: note: Revealed type is '
+                        '"builtins.list[items.ItemModel]"')
+    assert lines[1].startswith('check.py:4: error: ')
+    assert '"_ItemModelRow"' in lines[1]
+    assert lines[2] == ('check.py:5: note: Revealed type is '
+                        '"builtins.list[items.ItemModel]"')
+
+
+def test_stub_no_models(tmp_path, run_mypy):
+    _generate(tmp_path, {**SPEC, 'definitions': {}})
+    normal_report, _, exit_status = run_mypy(tmp_path, 'items.pyi')
+    assert exit_status == 0, normal_report
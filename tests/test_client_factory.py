@@ -0,0 +1,279 @@
+import importlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mypy.api
+import pytest
+from bravado.client import SwaggerClient
+
+from bravado_types import generate_client_factory, generate_module
+from bravado_types.config import Config
+from bravado_types.sinks import MemorySink
+
+
+def _spec(name, host=None):
+    spec = {
+        'swagger': '2.0',
+        'info': {'title': name, 'version': '1.0'},
+        'schemes': ['http'],
+        'produces': ['application/json'],
+        'paths': {
+            f'/{name}': {
+                'get': {
+                    'operationId': f'get{name.title()}',
+                    'tags': [name],
+                    'responses': {
+                        '200': {'description': 'Success',
+                                'schema': {'$ref': '#/definitions/Item'}},
+                    },
+                },
+            },
+        },
+        'definitions': {
+            'Item': {
+                'type': 'object',
+                'properties': {'name': {'type': 'string'}},
+            },
+        },
+    }
+    if host:
+        spec['host'] = host
+    return spec
+
+
+CHECK_MODULE = '''\
+from bravado.client import SwaggerClient
+
+from cf_clients import ClientFactory
+from cf_first import FirstSwaggerClient
+
+factory = ClientFactory(pool_maxsize=4, host_limits={'localhost:8080': 2})
+reveal_type(factory.create(FirstSwaggerClient, 'http://localhost/first.json'))
+factory.create(SwaggerClient, 'http://localhost/first.json')
+'''
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.client_address[1],
+                                    dict(self.headers)))
+        time.sleep(server.latency)
+        name = self.path.strip('/').split('.')[0]
+        if self.path.endswith('.json'):
+            data = _spec(name, self.headers['Host'])
+        else:
+            data = {'name': name}
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.latency = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def _chdir(path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope='module')
+def generated(tmp_path_factory):
+    """Generate two client modules and a factory for them."""
+    directory = tmp_path_factory.mktemp('client_factory')
+    clients = []
+    for name in 'first', 'second':
+        config = Config(name=name.title(),
+                        path=str(directory / f'cf_{name}.py'))
+        generate_module(SwaggerClient.from_spec(_spec(name)), config)
+        clients.append((f'cf_{name}', config))
+    generate_client_factory(clients, str(directory / 'cf_clients.py'))
+    sys.path.insert(0, str(directory))
+    try:
+        yield directory
+    finally:
+        sys.path.remove(str(directory))
+        for name in 'cf_first', 'cf_second', 'cf_clients':
+            sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def modules(generated):
+    return [importlib.import_module(name)
+            for name in ('cf_first', 'cf_second', 'cf_clients')]
+
+
+def _url(server, path):
+    return f'http://127.0.0.1:{server.server_port}{path}'
+
+
+def _connections(server):
+    return {port for _, port, _ in server.requests}
+
+
+def test_shared_connections(server, modules):
+    first, second, clients = modules
+    with clients.ClientFactory() as factory:
+        a = factory.create(first.FirstSwaggerClient,
+                           _url(server, '/first.json'))
+        b = factory.create(second.SecondSwaggerClient,
+                           _url(server, '/second.json'))
+        assert isinstance(a, first.FirstSwaggerClient)
+        assert isinstance(b, second.SecondSwaggerClient)
+        for _ in range(3):
+            assert a.first.getFirst().result().name == 'first'
+            assert b.second.getSecond().result().name == 'second'
+    # Spec requests and operation calls of both clients use one connection
+    assert len(server.requests) == 8
+    assert len(_connections(server)) == 1
+
+
+def test_separate_connections(server, modules):
+    first, second, _ = modules
+    a = first.FirstSwaggerClient.from_url(_url(server, '/first.json'))
+    b = second.SecondSwaggerClient.from_url(_url(server, '/second.json'))
+    a.first.getFirst().result()
+    b.second.getSecond().result()
+    assert len(_connections(server)) == 2
+
+
+def test_create_from_spec(server, modules):
+    first, _, clients = modules
+    factory = clients.ClientFactory()
+    host = f'127.0.0.1:{server.server_port}'
+    a = factory.create_from_spec(first.FirstSwaggerClient,
+                                 _spec('first', host))
+    b = factory.create_from_spec(first.FirstSwaggerClient,
+                                 _spec('first', host))
+    a.first.getFirst().result()
+    b.first.getFirst().result()
+    assert len(_connections(server)) == 1
+    factory.close()
+
+
+def test_no_keep_alive(server, modules):
+    first, _, clients = modules
+    factory = clients.ClientFactory(keep_alive=False)
+    client = factory.create(first.FirstSwaggerClient,
+                            _url(server, '/first.json'))
+    client.first.getFirst().result()
+    client.first.getFirst().result()
+    assert len(_connections(server)) == 3
+
+
+@pytest.mark.parametrize('host_limits, max_connections', [
+    (None, 4),
+    ({'127.0.0.1:{port}': 1}, 1),
+])
+def test_host_limits(server, modules, host_limits, max_connections):
+    first, _, clients = modules
+    if host_limits:
+        host_limits = {host.format(port=server.server_port): limit
+                       for host, limit in host_limits.items()}
+    factory = clients.ClientFactory(pool_block=True, host_limits=host_limits)
+    client = factory.create(first.FirstSwaggerClient,
+                            _url(server, '/first.json'))
+    server.requests.clear()
+    server.latency = 0.1
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(client.first.getFirst().result)
+                   for _ in range(4)]
+        for future in futures:
+            assert future.result().name == 'first'
+    assert len(_connections(server)) == max_connections
+
+
+def test_tcp_keepalive(modules):
+    _, _, clients = modules
+    factory = clients.ClientFactory(tcp_keepalive=30)
+    adapter = factory.http_client.session.get_adapter('http://example.com/')
+    options = adapter.poolmanager.connection_pool_kw['socket_options']
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    default = clients.ClientFactory().http_client.session.get_adapter(
+        'http://example.com/')
+    assert 'socket_options' not in default.poolmanager.connection_pool_kw
+
+
+def test_request_headers_not_shared(server, modules):
+    first, second, clients = modules
+    factory = clients.ClientFactory()
+    a = factory.create(first.FirstSwaggerClient, _url(server, '/first.json'),
+                       request_headers={'X-Token': 'secret'})
+    factory.create(second.SecondSwaggerClient, _url(server, '/second.json'))
+    a.first.getFirst().result()
+    tokens = {path: headers.get('X-Token')
+              for path, _, headers in server.requests}
+    assert tokens == {'/first.json': 'secret', '/second.json': None,
+                      '/first': None}
+    assert len(_connections(server)) == 1
+
+
+def test_unknown_client_type(modules):
+    _, _, clients = modules
+    with pytest.raises(TypeError, match='Not a client type of this factory'):
+        clients.ClientFactory().create(SwaggerClient, 'http://localhost/')
+
+
+def test_stub_types(generated):
+    (generated / 'check.py').write_text(CHECK_MODULE)
+    with _chdir(generated):
+        normal_report, _, _ = mypy.api.run(['check.py'])
+    lines = normal_report.splitlines()
+    assert lines[0].startswith('check.py:7: note: Revealed type is '
+                               '"cf_first.FirstSwaggerClient')
+    assert lines[1].startswith('check.py:8: error: Value of type variable')
+    assert len(lines) == 3
+
+
+def test_generate_errors():
+    config = Config(name='First', path='first.py')
+    sink = MemorySink()
+    with pytest.raises(ValueError, match='No client types'):
+        generate_client_factory([], 'clients.py', sink)
+    with pytest.raises(ValueError, match="must end with '.py'"):
+        generate_client_factory([('first', config)], 'clients.pyi', sink)
+    with pytest.raises(ValueError, match='Invalid module name'):
+        generate_client_factory([('first-module', config)], 'clients.py',
+                                sink)
+    with pytest.raises(ValueError, match='Duplicate client type'):
+        generate_client_factory([('first', config), ('first', config)],
+                                'clients.py', sink)
+    with pytest.raises(ValueError, match='does not support async clients'):
+        generate_client_factory(
+            [('first', Config(name='First', path='first.py',
+                              async_client=True))], 'clients.py', sink)
+    assert sink.files == {}
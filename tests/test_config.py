@@ -33,3 +33,20 @@ def test_config_model_type():
 def test_config_type_array_types(array_types, expected):
     config = Config(name='Test', path='/tmp/test.py', array_types=array_types)
     assert expected == config.array_type_template.format('T')
+
+
+def test_config_index_path():
+    config = Config(name='Test', path='/tmp/test.py')
+    assert config.index_path == '/tmp/test.types.json'
+
+
+def test_config_lazy_stubs_model_inheritance():
+    with pytest.raises(ValueError, match='model inheritance'):
+        Config(name='Test', path='/tmp/test.py', lazy_stubs=True,
+               model_inheritance=True)
+
+
+def test_config_postprocess_cache_dir_requires_file_postprocessor():
+    with pytest.raises(ValueError, match='file_postprocessor'):
+        Config(name='Test', path='/tmp/test.py',
+               postprocess_cache_dir='/tmp/cache')
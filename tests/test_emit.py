@@ -0,0 +1,149 @@
+"""Tests that the built-in emitter matches the default Mako templates."""
+
+import glob
+import os.path
+
+import pytest
+from bravado.client import SwaggerClient
+
+from bravado_types.config import ArrayTypes, Config, CustomFormats
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import (TEMPLATES_DIR, render, render_client_factory,
+                                  render_shared)
+from bravado_types.sinks import MemorySink
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_FILES = sorted(
+    path for path in glob.glob(f"{TESTS_DIR}/mypy/*/*.*")
+    if path.endswith(('.json', '.yaml', '.yml'))
+    and not path.endswith('.types.json')
+)
+
+OPTIONS = {
+    'default': {},
+    'async': {'async_client': True, 'response_types': 'all',
+              'array_types': ArrayTypes.sequence},
+    'success': {'response_types': 'success',
+                'array_types': ArrayTypes.union},
+    'inheritance': {'model_inheritance': True,
+                    'custom_formats': CustomFormats(
+                        {('string', 'ipv4'): 'ipaddress.IPv4Address'},
+                        ['ipaddress'])},
+    'lazy': {'lazy_stubs': True},
+    'lazy_client': {'lazy_client': True},
+    'lazy_client_async': {'lazy_client': True, 'async_client': True},
+    'spec_cache': {'spec_cache': True},
+    'spec_cache_async': {'spec_cache': True, 'async_client': True,
+                         'lazy_client': True},
+    'spec_cache_lazy': {'spec_cache': True, 'lazy_stubs': True},
+    'batch_helper': {'batch_helper': True},
+    'batch_helper_lazy': {'batch_helper': True, 'spec_cache': True,
+                          'lazy_stubs': True},
+    'stream_helper': {'stream_helper': True},
+    'stream_helper_all': {'stream_helper': True, 'batch_helper': True,
+                          'spec_cache': True, 'instrumentation': True,
+                          'fast_requests': True,
+                          'array_types': ArrayTypes.union},
+    'stream_helper_lazy': {'stream_helper': True, 'lazy_stubs': True,
+                           'array_types': ArrayTypes.sequence},
+    'instrumentation': {'instrumentation': True},
+    'instrumentation_all': {'instrumentation': True, 'batch_helper': True,
+                            'spec_cache': True, 'lazy_client': True},
+    'instrumentation_lazy': {'instrumentation': True, 'lazy_stubs': True},
+    'fast_requests': {'fast_requests': True},
+    'fast_requests_async': {'fast_requests': True, 'async_client': True},
+    'fast_requests_all': {'fast_requests': True, 'instrumentation': True,
+                          'batch_helper': True, 'spec_cache': True,
+                          'lazy_client': True},
+    'response_cache': {'response_cache': True},
+    'response_cache_all': {'response_cache': True, 'instrumentation': True,
+                           'fast_requests': True, 'stream_helper': True,
+                           'lazy_client': True},
+    'response_cache_fast': {'response_cache': True, 'fast_requests': True,
+                            'spec_cache': True},
+    'response_cache_lazy': {'response_cache': True, 'lazy_stubs': True},
+    'build_helper': {'build_helper': True},
+    'build_helper_all': {'build_helper': True, 'fast_requests': True,
+                         'model_inheritance': True},
+    'build_helper_async': {'build_helper': True, 'async_client': True},
+    'build_helper_lazy': {'build_helper': True, 'lazy_stubs': True},
+    'lazy_async': {'lazy_stubs': True, 'async_client': True,
+                   'response_types': 'all'},
+}
+
+
+@pytest.fixture(scope='module', params=SCHEMA_FILES,
+                ids=lambda path: os.path.relpath(path, TESTS_DIR))
+def client(request):
+    return SwaggerClient.from_url(f"file://{request.param}")
+
+
+def _read_outputs(config):
+    outputs = []
+    for path in config.py_path, config.pyi_path:
+        with open(path, 'rb') as f:
+            outputs.append(f.read())
+    return outputs
+
+
+@pytest.mark.parametrize('cli_args', [None, ['--name', 'Test Name']])
+@pytest.mark.parametrize('options', OPTIONS.values(), ids=list(OPTIONS))
+def test_emitter_matches_templates(client, options, cli_args, tmp_path):
+    metadata = get_metadata(client.swagger_spec, cli_args)
+    outputs = []
+    # Configuring the default templates directory as a custom templates
+    # directory forces rendering with Mako.
+    for templates_dir in None, TEMPLATES_DIR:
+        directory = tmp_path / ('mako' if templates_dir else 'emit')
+        directory.mkdir()
+        config = Config(name='Test', path=str(directory / 'test.py'),
+                        custom_templates_dir=templates_dir, **options)
+        render(metadata, get_spec_info(client.swagger_spec, config), config)
+        outputs.append(_read_outputs(config))
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize('options', [OPTIONS['default'],
+                                     OPTIONS['inheritance']],
+                         ids=['default', 'inheritance'])
+def test_emitter_matches_templates_shared(client, options, tmp_path):
+    metadata = get_metadata(client.swagger_spec)
+    outputs = []
+    for templates_dir in None, TEMPLATES_DIR:
+        directory = tmp_path / ('mako' if templates_dir else 'emit')
+        directory.mkdir()
+        configs = [Config(name=name, path=str(directory / f'{name}.py'),
+                          custom_templates_dir=templates_dir, **options)
+                   for name in ('First', 'Second')]
+        common_path = str(directory / 'common.pyi')
+        render_shared([(metadata, get_spec_info(client.swagger_spec, config),
+                        config) for config in configs],
+                      'common', common_path)
+        with open(common_path, 'rb') as f:
+            files = [f.read()]
+        for config in configs:
+            files += _read_outputs(config)
+        outputs.append(files)
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize('modules', [['pkg.first'],
+                                     ['pkg.first', 'pkg.second', 'other']])
+def test_emitter_matches_templates_client_factory(modules):
+    outputs = []
+    for templates_dir in None, TEMPLATES_DIR:
+        clients = [(module, Config(name=module.rpartition('.')[2].title(),
+                                   path=f'{module}.py',
+                                   custom_templates_dir=templates_dir))
+                   for module in modules]
+        sink = MemorySink()
+        render_client_factory(clients, 'clients.py', sink)
+        # Files are rendered with different timestamps
+        outputs.append({
+            path: [line for line in content.splitlines(keepends=True)
+                   if not line.startswith('# Timestamp: ')]
+            for path, content in sink.files.items()
+        })
+    assert sorted(outputs[0]) == ['clients.py', 'clients.pyi']
+    assert outputs[0] == outputs[1]
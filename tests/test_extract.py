@@ -3,7 +3,7 @@ from bravado_core.spec import Spec
 from bravado_types.config import Config
 from bravado_types.data_model import (ModelInfo, OperationInfo, ParameterInfo,
                                       PropertyInfo, ResourceInfo, ResponseInfo,
-                                      SpecInfo)
+                                      SpecInfo, TypeInfo, TypeWrapper)
 from bravado_types.extract import get_spec_info
 
 
@@ -126,8 +126,8 @@ def test_extract_basic():
     assert spec_info.models == [
         ModelInfo(spec.definitions['Bar'], 'Bar', [], []),
         ModelInfo(spec.definitions['Foo'], 'Foo', [], [
-            PropertyInfo('foobar', 'str', False),
-            PropertyInfo('id', 'int', True),
+            PropertyInfo('foobar', TypeInfo('str'), False),
+            PropertyInfo('id', TypeInfo('int'), True),
         ]),
     ]
 
@@ -137,22 +137,24 @@ def test_extract_basic():
 
     assert spec_info.operations == [
         OperationInfo(createFoo, 'createFoo', [
-            ParameterInfo(createFoo.params['request'], 'request', 'FooModel',
-                          True),
+            ParameterInfo(createFoo.params['request'], 'request',
+                          TypeInfo('Foo', True), True, 'body', 'request', {}),
         ], [
-            ResponseInfo('204', 'None'),
-        ]),
+            ResponseInfo('204', TypeInfo('None')),
+        ], 'post', '/foo'),
         OperationInfo(getBar, 'getBar', [], [
-            ResponseInfo('200', 'typing.List[BarModel]'),
-        ]),
+            ResponseInfo('200', TypeInfo('Bar', True, [TypeWrapper.array])),
+        ], 'get', '/bar'),
         OperationInfo(getFoo, 'getFoo', [
-            ParameterInfo(getFoo.params['Header_Param'], 'Header_Param', 'str',
-                          False),
-            ParameterInfo(getFoo.params['id'], 'id', 'int', True),
+            ParameterInfo(getFoo.params['Header_Param'], 'Header_Param',
+                          TypeInfo('str'), False, 'header', 'Header-Param',
+                          {'type': 'string'}),
+            ParameterInfo(getFoo.params['id'], 'id', TypeInfo('int'), True,
+                          'path', 'id', {'type': 'integer'}),
         ], [
-            ResponseInfo('200', 'FooModel'),
-            ResponseInfo('404', 'typing.Any'),
-        ]),
+            ResponseInfo('200', TypeInfo('Foo', True)),
+            ResponseInfo('404', TypeInfo('typing.Any')),
+        ], 'get', '/foo/{id}'),
     ]
 
     assert spec_info.resources == [
@@ -0,0 +1,323 @@
+import datetime
+import importlib.util
+import io
+import json
+
+import pytest
+from bravado.client import SwaggerClient, construct_request
+from bravado.http_client import HttpClient
+from bravado_core.exception import SwaggerMappingError
+from jsonschema import ValidationError
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.ir import dump_ir, load_ir
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT = {
+    'swagger': '2.0',
+    'info': {'title': 'Fast requests', 'version': '1.0'},
+    'host': 'example.com',
+    'basePath': '/api/',
+    'schemes': ['https'],
+    'consumes': ['application/json', 'application/msgpack',
+                 'application/x-www-form-urlencoded'],
+    'paths': {
+        '/items/{id}/{name}': {
+            'get': {
+                'operationId': 'getItem',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer', 'format': 'int64'},
+                    {'name': 'name', 'in': 'path', 'required': True,
+                     'type': 'string'},
+                    {'name': 'verbose', 'in': 'query', 'type': 'boolean'},
+                    {'name': 'ratio', 'in': 'query', 'type': 'number',
+                     'format': 'double'},
+                    {'name': 'since', 'in': 'query', 'type': 'string',
+                     'format': 'date'},
+                    {'name': 'limit', 'in': 'query', 'type': 'integer',
+                     'minimum': 1},
+                    {'name': 'X-Trace-Id', 'in': 'header', 'type': 'string'},
+                    {'name': 'X-Tenant', 'in': 'header', 'required': True,
+                     'type': 'string'},
+                ],
+                'responses': {'200': {'description': 'Success'}},
+            },
+        },
+        '/items': {
+            'get': {
+                'operationId': 'listItems',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'tags', 'in': 'query', 'type': 'array',
+                     'items': {'type': 'string'}},
+                    {'name': 'ids', 'in': 'query', 'type': 'array',
+                     'items': {'type': 'integer'},
+                     'collectionFormat': 'multi'},
+                    {'name': 'sort', 'in': 'query', 'type': 'array',
+                     'items': {'type': 'string'},
+                     'collectionFormat': 'pipes'},
+                    {'name': 'dates', 'in': 'query', 'type': 'array',
+                     'items': {'type': 'string', 'format': 'date'}},
+                ],
+                'responses': {'200': {'description': 'Success'}},
+            },
+            'post': {
+                'operationId': 'createItem',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'item', 'in': 'body', 'required': True,
+                     'schema': {'$ref': '#/definitions/Item'}},
+                ],
+                'responses': {'201': {'description': 'Created'}},
+            },
+        },
+        '/items/{id}/rename': {
+            'post': {
+                'operationId': 'renameItem',
+                'tags': ['items'],
+                'consumes': ['application/x-www-form-urlencoded'],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                    {'name': 'name', 'in': 'formData', 'required': True,
+                     'type': 'string'},
+                    {'name': 'aliases', 'in': 'formData', 'type': 'array',
+                     'items': {'type': 'string'},
+                     'collectionFormat': 'ssv'},
+                ],
+                'responses': {'200': {'description': 'Success'}},
+            },
+        },
+        '/ping': {
+            'get': {
+                'operationId': 'ping',
+                'tags': ['misc'],
+                'responses': {'200': {'description': 'Success'}},
+            },
+        },
+    },
+    'definitions': {
+        'Item': {
+            'type': 'object',
+            'required': ['name'],
+            'properties': {
+                'name': {'type': 'string'},
+                'created': {'type': 'string', 'format': 'date-time'},
+            },
+        },
+    },
+}
+
+# Operation arguments and request options to check, by operation
+CALLS = {
+    'getItem': [
+        ({'id': 1, 'name': 'a b/c', 'X_Tenant': 't'}, {}),
+        # Header parameters passed by their names in the schema
+        ({'id': 1, 'name': 'n', 'X-Tenant': 't', 'X-Trace-Id': 'x'}, {}),
+        ({'id': 2, 'name': 'n', 'verbose': True, 'ratio': 0.5,
+          'since': datetime.date(2020, 1, 2), 'limit': 10,
+          'X_Trace_Id': 'abc', 'X_Tenant': 't'}, {}),
+        # Values handled by marshal_param()
+        ({'id': '3', 'name': 'n', 'ratio': 1, 'X_Tenant': 't'}, {}),
+        ({'id': 4, 'name': 'n', 'verbose': None, 'X_Tenant': 't'}, {}),
+        # Headers in the request options
+        ({'id': 5, 'name': 'n'},
+         {'headers': {'X-Tenant': 't', 'X-Trace-Id': 'x'}, 'timeout': 1,
+          'connect_timeout': 2, 'use_msgpack': True}),
+    ],
+    'listItems': [
+        ({}, {}),
+        ({'tags': ['a', 'b'], 'ids': (1, 2), 'sort': ['x', 'y'],
+          'dates': [datetime.date(2020, 1, 2)]}, {}),
+    ],
+    'createItem': [
+        ({'item': {'name': 'a'}}, {}),
+        ({'item': {'name': 'a'}},
+         {'headers': {'Content-Type': 'application/msgpack'}}),
+    ],
+    'renameItem': [
+        ({'id': 1, 'name': 'b', 'aliases': ['c', 'd']}, {}),
+    ],
+    'ping': [
+        ({}, {}),
+    ],
+}
+
+# Operation arguments which raise errors
+ERRORS = [
+    ('getItem', {'id': 1, 'X_Tenant': 't'}),
+    ('getItem', {'id': 1, 'name': 'n'}),
+    ('getItem', {'id': None, 'name': 'n', 'X_Tenant': 't'}),
+    ('getItem', {'id': 1, 'name': 'n', 'X_Tenant': 't', 'other': 1}),
+    ('getItem', {'id': 1, 'name': 'n', 'X_Tenant': 't', 'X-Tenant': 't'}),
+    ('getItem', {'id': 1, 'name': 'n', 'X_Tenant': 't', 'limit': 0}),
+    ('getItem', {'id': 1, 'name': 2, 'X_Tenant': 't'}),
+    ('listItems', {'tags': 'a'}),
+    ('listItems', {'tags': ['a', None]}),
+    ('createItem', {'item': {}}),
+    ('createItem', {'item': None}),
+]
+
+
+class RecordingHttpClient(HttpClient):
+    """HTTP client which records request parameters."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, request_params, operation=None, request_config=None):
+        self.requests.append(request_params)
+
+
+def _load_module(path, name='fast'):
+    module_spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def module(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('fast_requests') / 'fast.py')
+    config = Config(name='Fast', path=path, fast_requests=True)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    return _load_module(path)
+
+
+@pytest.fixture
+def client(module):
+    return module.FastSwaggerClient.from_spec(
+        SPEC_DICT, http_client=RecordingHttpClient())
+
+
+def _operation(client, name):
+    for resource in client.swagger_spec.resources.values():
+        if name in resource.operations:
+            return resource.operations[name]
+    raise KeyError(name)
+
+
+@pytest.mark.parametrize(('name', 'kwargs', 'options'), [
+    (name, kwargs, options)
+    for name, calls in CALLS.items()
+    for kwargs, options in calls
+])
+def test_request_builder(module, client, name, kwargs, options):
+    operation = _operation(client, name)
+    context = module._request_context(operation)
+    assert context is not None
+    expected = construct_request(operation, options, **kwargs)
+    assert context.build(context, options, kwargs) == expected
+
+
+@pytest.mark.parametrize(('name', 'kwargs'), ERRORS)
+def test_request_builder_errors(module, client, name, kwargs):
+    operation = _operation(client, name)
+    context = module._request_context(operation)
+    with pytest.raises((SwaggerMappingError, ValidationError)) as expected:
+        construct_request(operation, {}, **kwargs)
+    with pytest.raises(expected.type) as actual:
+        context.build(context, {}, kwargs)
+    assert str(actual.value) == str(expected.value)
+
+
+def test_request_builder_no_validation(module):
+    client = module.FastSwaggerClient.from_spec(
+        SPEC_DICT, http_client=RecordingHttpClient(),
+        config={'validate_requests': False})
+    operation = _operation(client, 'getItem')
+    context = module._request_context(operation)
+    kwargs = {'id': 1, 'name': 'n', 'X_Tenant': 't', 'limit': 0}
+    assert (context.build(context, {}, kwargs)
+            == construct_request(operation, {}, **kwargs))
+
+
+def test_client_call(client):
+    future = client.items.getItem(
+        id=1, name='n', X_Tenant='t',
+        _request_options={'headers': {'X-Trace-Id': 'x'}})
+    assert future is None
+    [request] = client.swagger_spec.http_client.requests
+    assert request == {
+        'method': 'GET',
+        'url': 'https://example.com/api/items/1/n',
+        'params': {},
+        'headers': {'X-Tenant': 't', 'X-Trace-Id': 'x'},
+    }
+
+
+def test_schema_changes(module):
+    # Changes which do not affect the parameters of an operation
+    spec_dict = json.loads(json.dumps(SPEC_DICT))
+    spec_dict['host'] = 'example.org'
+    spec_dict['definitions']['Item']['properties']['count'] = {
+        'type': 'integer'}
+    spec_dict['paths']['/items/{id}/{name}']['get']['responses']['404'] = {
+        'description': 'Not found'}
+    client = module.FastSwaggerClient.from_spec(
+        spec_dict, http_client=RecordingHttpClient())
+    for name in CALLS:
+        assert module._request_context(_operation(client, name)) is not None
+    client.items.getItem(id=1, name='n', X_Tenant='t')
+    [request] = client.swagger_spec.http_client.requests
+    assert request['url'] == 'https://example.org/api/items/1/n'
+
+
+def test_schema_mismatch(module):
+    spec_dict = json.loads(json.dumps(SPEC_DICT))
+    params = spec_dict['paths']['/items/{id}/{name}']['get']['parameters']
+    params[5]['type'] = 'string'
+    client = module.FastSwaggerClient.from_spec(
+        spec_dict, http_client=RecordingHttpClient())
+    with pytest.warns(UserWarning, match='Parameters of getItem do not'):
+        assert module._request_context(_operation(client, 'getItem')) is None
+    assert module._request_context(_operation(client, 'listItems')) is not None
+    client.items.getItem(id=1, name='n', X_Tenant='t', limit='a')
+    [request] = client.swagger_spec.http_client.requests
+    assert request['params'] == {'limit': 'a'}
+
+
+def test_user_defined_format(module):
+    from bravado_core.formatter import SwaggerFormat
+    int64 = SwaggerFormat(format='int64', to_wire=lambda i: i + 1,
+                          to_python=int, validate=lambda i: None,
+                          description='Shifted integer')
+    client = module.FastSwaggerClient.from_spec(
+        SPEC_DICT, http_client=RecordingHttpClient(),
+        config={'formats': [int64]})
+    assert module._request_context(_operation(client, 'getItem')) is None
+    client.items.getItem(id=1, name='n', X_Tenant='t')
+    [request] = client.swagger_spec.http_client.requests
+    assert request['url'].endswith('/items/2/n')
+
+
+def test_instrumentation(tmp_path):
+    path = str(tmp_path / 'fast_instrumented.py')
+    config = Config(name='Fast', path=path, fast_requests=True,
+                    instrumentation=True)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+    module = _load_module(path, 'fast_instrumented')
+    assert issubclass(module._InstrumentedCallableOperation,
+                      module._FastCallableOperation)
+
+
+def test_ir(tmp_path):
+    # IR files record the request information of each operation
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    config = Config(name='Fast', path=str(tmp_path / 'fast_ir.py'),
+                    fast_requests=True)
+    spec_info = get_spec_info(spec, config)
+    buf = io.StringIO()
+    dump_ir(buf, get_metadata(spec), spec_info, config)
+    buf.seek(0)
+    metadata, spec_info, config = load_ir(buf)
+    render(metadata, spec_info, config)
+    module = _load_module(config.py_path, 'fast_ir')
+    assert set(module._REQUEST_BUILDERS) == {
+        operation.name for operation in spec_info.operations}
@@ -0,0 +1,213 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+from bravado.client import SwaggerClient
+
+from bravado_types.__main__ import main
+from bravado_types.http_cache import (DEFAULT_TIMEOUT, CachingHttpClient,
+                                      SchemaCache, SchemaNotCachedError)
+
+LAST_MODIFIED = 'Mon, 05 Oct 2020 12:00:00 GMT'
+
+DOCUMENTS = {
+    # Validated with ETag
+    '/api.json': {
+        'swagger': '2.0',
+        'info': {'title': 'Cached schema', 'version': '1.0'},
+        'paths': {
+            '/foo': {
+                'get': {
+                    'operationId': 'getFoo',
+                    'tags': ['foo'],
+                    'responses': {
+                        '200': {
+                            'description': 'Success',
+                            'schema': {
+                                '$ref': 'models.json#/definitions/Foo',
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    # Validated with Last-Modified
+    '/models.json': {
+        'definitions': {
+            'Foo': {
+                'type': 'object',
+                'x-model': 'Foo',
+                'properties': {'id': {'type': 'integer'}},
+            },
+        },
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path not in DOCUMENTS:
+            self.send_error(404)
+            return
+        body = json.dumps(DOCUMENTS[self.path]).encode('utf-8')
+        if self.path == '/api.json':
+            etag = f'"{self.server.version}"'
+            if self.headers.get('If-None-Match') == etag:
+                self._not_modified()
+                return
+            headers = {'ETag': etag}
+        else:
+            if self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+                self._not_modified()
+                return
+            headers = {'Last-Modified': LAST_MODIFIED}
+
+        self.server.statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_modified(self):
+        self.server.statuses.append(304)
+        self.send_response(304)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = HTTPServer(('127.0.0.1', 0), _Handler)
+    server.requests = []
+    server.statuses = []
+    server.version = 1
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _url(server, path):
+    return f'http://127.0.0.1:{server.server_port}{path}'
+
+
+def test_fetch_conditional(server, tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    url = _url(server, '/api.json')
+
+    document = cache.fetch(url)
+    assert document.json() == DOCUMENTS['/api.json']
+    assert document.headers['content-type'] == 'application/json'
+    assert server.statuses == [200]
+
+    # A new cache instance revalidates the stored copy
+    document = SchemaCache(str(tmp_path)).fetch(url)
+    assert document.json() == DOCUMENTS['/api.json']
+    assert document.headers['content-type'] == 'application/json'
+    assert server.statuses == [200, 304]
+
+    # Changed documents are downloaded again
+    server.version = 2
+    cache.fetch(url)
+    assert server.statuses == [200, 304, 200]
+
+
+def test_fetch_last_modified(server, tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    url = _url(server, '/models.json')
+    cache.fetch(url)
+    assert cache.fetch(url).json() == DOCUMENTS['/models.json']
+    assert server.statuses == [200, 304]
+
+
+def test_fetch_offline(server, tmp_path):
+    url = _url(server, '/api.json')
+    SchemaCache(str(tmp_path)).fetch(url)
+
+    offline_cache = SchemaCache(str(tmp_path), offline=True)
+    assert offline_cache.fetch(url).json() == DOCUMENTS['/api.json']
+    assert server.requests == ['/api.json']
+
+    with pytest.raises(SchemaNotCachedError):
+        offline_cache.fetch(_url(server, '/models.json'))
+    assert server.requests == ['/api.json']
+
+
+def test_fetch_error(server, tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    with pytest.raises(requests.HTTPError):
+        cache.fetch(_url(server, '/missing.json'))
+    with pytest.raises(SchemaNotCachedError):
+        SchemaCache(str(tmp_path), offline=True).fetch(
+            _url(server, '/missing.json'))
+
+
+def test_fetch_timeout(server, tmp_path):
+    session = requests.Session()
+    timeouts = []
+    get = session.get
+
+    def get_with_timeout(url, **kwargs):
+        timeouts.append(kwargs.get('timeout'))
+        return get(url, **kwargs)
+
+    session.get = get_with_timeout
+    SchemaCache(str(tmp_path), session=session).fetch(
+        _url(server, '/api.json'))
+    SchemaCache(str(tmp_path), session=session, timeout=2.5).fetch(
+        _url(server, '/api.json'))
+    assert timeouts == [DEFAULT_TIMEOUT, 2.5]
+
+
+def test_client_remote_refs(server, tmp_path):
+    http_client = CachingHttpClient(SchemaCache(str(tmp_path)))
+    client = SwaggerClient.from_url(_url(server, '/api.json'),
+                                    http_client=http_client)
+    assert 'Foo' in client.swagger_spec.definitions
+    assert sorted(server.requests) == ['/api.json', '/models.json']
+
+    http_client = CachingHttpClient(SchemaCache(str(tmp_path)))
+    SwaggerClient.from_url(_url(server, '/api.json'), http_client=http_client)
+    assert server.statuses == [200, 200, 304, 304]
+
+
+def test_cli_cache(server, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    args = ['--url', _url(server, '/api.json'), '--name', 'Cached',
+            '--cache-dir', cache_dir]
+
+    main(args + ['--path', str(tmp_path / 'online.py')], exit=False)
+    num_requests = len(server.requests)
+    assert num_requests == 2
+
+    main(args + ['--path', str(tmp_path / 'offline.py'), '--offline'],
+         exit=False)
+    assert len(server.requests) == num_requests
+    with open(tmp_path / 'offline.pyi') as f:
+        assert 'class FooModel(_Model):' in f.read()
+
+
+def test_cli_offline_requires_cache_dir(tmp_path):
+    with pytest.raises(RuntimeError, match='--offline requires --cache-dir'):
+        main(['--url', 'http://127.0.0.1/api.json', '--name', 'Cached',
+              '--path', str(tmp_path / 'cached.py'), '--offline'],
+             exit=False)
+
+
+def test_cli_timeout_must_be_positive(tmp_path):
+    with pytest.raises(RuntimeError, match='--timeout must be positive'):
+        main(['--url', 'http://127.0.0.1/api.json', '--name', 'Cached',
+              '--path', str(tmp_path / 'cached.py'), '--timeout', '0'],
+             exit=False)
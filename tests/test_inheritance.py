@@ -0,0 +1,133 @@
+import pytest
+from bravado_core.spec import Spec
+
+from bravado_types.inheritance import InheritanceGraph
+
+
+def _spec(definitions, config=None):
+    return Spec.from_dict({
+        'swagger': '2.0',
+        'info': {
+            'title': 'Inheritance schema',
+            'version': '1.0',
+        },
+        'paths': {},
+        'definitions': definitions,
+    }, config=config)
+
+
+@pytest.fixture(scope='module')
+def graph():
+    return InheritanceGraph(_spec({
+        'Base': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                'note': {'type': 'string'},
+            },
+            'required': ['id'],
+        },
+        'Named': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+            },
+            'required': ['name'],
+        },
+        'Child': {
+            'allOf': [
+                {'$ref': '#/definitions/Base'},
+                {
+                    'type': 'object',
+                    'properties': {
+                        'note': {'type': 'integer'},
+                        'extra': {'type': 'string'},
+                    },
+                    'required': ['extra'],
+                },
+            ],
+        },
+        'Grandchild': {
+            'allOf': [
+                {'$ref': '#/definitions/Named'},
+                {
+                    'allOf': [
+                        {'$ref': '#/definitions/Child'},
+                    ],
+                },
+            ],
+        },
+        'Alone': {
+            'type': 'object',
+        },
+    }))
+
+
+def test_parents(graph):
+    assert graph.parents('Base') == []
+    assert graph.parents('Child') == ['Base']
+    # Models nested in inline allOf items are not direct parents
+    assert graph.parents('Grandchild') == ['Named']
+
+
+def test_required(graph):
+    assert graph.required('Base') == {'id'}
+    assert graph.required('Child') == {'id', 'extra'}
+    assert graph.required('Grandchild') == {'id', 'extra', 'name'}
+    assert graph.required('Alone') == set()
+
+
+def test_properties(graph):
+    assert graph.properties('Base') == {
+        'id': {'type': 'integer'},
+        'note': {'type': 'string'},
+    }
+    # Later allOf items override earlier ones
+    assert graph.properties('Child') == {
+        'id': {'type': 'integer'},
+        'note': {'type': 'integer'},
+        'extra': {'type': 'string'},
+    }
+    assert set(graph.properties('Grandchild')) == {'id', 'note', 'extra',
+                                                   'name'}
+
+
+def test_properties_match_bravado_core(graph):
+    spec = graph._spec
+    for name, mclass in spec.definitions.items():
+        assert graph.properties(name) == mclass._properties
+
+
+def test_topological_order(graph):
+    assert graph.topological_order() == [
+        'Alone', 'Base', 'Child', 'Named', 'Grandchild',
+    ]
+
+
+def test_deep_hierarchy():
+    depth = 100
+    definitions = {
+        'Model0': {
+            'type': 'object',
+            'properties': {'prop0': {'type': 'string'}},
+            'required': ['prop0'],
+        },
+    }
+    for i in range(1, depth):
+        definitions[f'Model{i}'] = {
+            'allOf': [
+                {'$ref': f'#/definitions/Model{i - 1}'},
+                {
+                    'type': 'object',
+                    'properties': {f'prop{i}': {'type': 'string'}},
+                    'required': [f'prop{i}'] if i % 2 == 0 else [],
+                },
+            ],
+        }
+    graph = InheritanceGraph(
+        _spec(definitions, config={'validate_swagger_spec': False}))
+
+    last = f'Model{depth - 1}'
+    assert len(graph.properties(last)) == depth
+    assert graph.required(last) == {f'prop{i}' for i in range(0, depth, 2)}
+    assert graph.topological_order() == [f'Model{i}' for i in range(depth)]
@@ -0,0 +1,182 @@
+import importlib.util
+import json
+import os.path
+
+import pytest
+import requests
+from bravado.client import SwaggerClient
+from bravado.exception import HTTPNotFound
+from bravado.http_client import HttpClient
+from bravado.http_future import HttpFuture
+from bravado.requests_client import RequestsResponseAdapter
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+PET = json.dumps({'id': 1, 'name': 'Lassie', 'photoUrls': []}).encode()
+
+
+class FakeFutureAdapter:
+    timeout_errors = ()
+    connection_errors = ()
+
+    def __init__(self, response):
+        self.response = response
+
+    def result(self, timeout=None):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+    def cancel(self):
+        pass
+
+
+class FakeHttpClient(HttpClient):
+    """HTTP client which returns canned responses by request path."""
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def request(self, request_params, operation=None, request_config=None):
+        status_code, content = self.responses[request_params['url']
+                                              .split('/v2', 1)[1]]
+        if isinstance(content, Exception):
+            response = content
+        else:
+            response = requests.Response()
+            response.status_code = status_code
+            response.headers['Content-Type'] = 'application/json'
+            response._content = content
+        return HttpFuture(FakeFutureAdapter(response),
+                          RequestsResponseAdapter, operation, request_config)
+
+
+@pytest.fixture(scope='module')
+def spec_dict():
+    with open(PETSTORE_SCHEMA) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='module')
+def module(spec_dict, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('instrumentation') / 'petstore.py')
+    config = Config(name='Petstore', path=path, instrumentation=True)
+    spec = SwaggerClient.from_spec(spec_dict).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+
+    module_spec = importlib.util.spec_from_file_location('petstore', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client(module, spec_dict):
+    http_client = FakeHttpClient({
+        '/pet/1': (200, PET),
+        '/pet/2': (404, b'{}'),
+        '/pet/3': (None, OSError("Connection failed")),
+        '/store/inventory': (200, b'{"available": 1}'),
+    })
+    return module.PetstoreSwaggerClient.from_spec(
+        spec_dict, http_client=http_client)
+
+
+@pytest.fixture
+def calls(client):
+    calls = []
+    client.add_operation_hook(calls.append)
+    return calls
+
+
+def _instrumented(future):
+    return '_get_incoming_response' in vars(future)
+
+
+def test_no_hooks(client):
+    future = client.pet.getPetById(petId=1)
+    assert not _instrumented(future)
+    assert future.result().name == 'Lassie'
+
+
+def test_hook(client, calls):
+    assert client.pet.getPetById(petId=1).response().result.name == 'Lassie'
+    [call] = calls
+    assert call.operation == 'getPetById'
+    assert call.status_code == 200
+    assert call.response_size == len(PET)
+    assert call.request_time >= 0
+    assert call.unmarshal_time >= 0
+    assert call.start_time > 0
+    assert call.exception is None
+
+    client.store.getInventory().result()
+    assert [call.operation for call in calls] == \
+        ['getPetById', 'getInventory']
+
+
+def test_hook_http_error(client, calls):
+    with pytest.raises(HTTPNotFound):
+        client.pet.getPetById(petId=2).result()
+    [call] = calls
+    assert call.status_code == 404
+    assert isinstance(call.exception, HTTPNotFound)
+    assert call.unmarshal_time >= 0
+
+
+def test_hook_request_error(client, calls):
+    with pytest.raises(OSError):
+        client.pet.getPetById(petId=3).result()
+    [call] = calls
+    assert call.status_code is None
+    assert call.response_size is None
+    assert call.request_time >= 0
+    assert call.unmarshal_time is None
+    assert isinstance(call.exception, OSError)
+
+
+def test_hook_operations(client):
+    calls = []
+    client.add_operation_hook(calls.append, ['getInventory'])
+    future = client.pet.getPetById(petId=1)
+    assert not _instrumented(future)
+    future.result()
+    client.store.getInventory().result()
+    assert [call.operation for call in calls] == ['getInventory']
+
+
+def test_hook_registered_after_access(client):
+    operation = client.pet.getPetById
+    calls = []
+    client.add_operation_hook(calls.append)
+    operation(petId=1).result()
+    assert len(calls) == 1
+
+
+def test_remove_hook(client):
+    class Recorder:
+        def __init__(self):
+            self.calls = []
+
+        def hook(self, call):
+            self.calls.append(call)
+
+    recorder = Recorder()
+    client.add_operation_hook(recorder.hook)
+    client.pet.getPetById(petId=1).result()
+    client.remove_operation_hook(recorder.hook)
+    future = client.pet.getPetById(petId=1)
+    assert not _instrumented(future)
+    assert len(recorder.calls) == 1
+
+
+def test_instrumentation_async_client():
+    with pytest.raises(ValueError, match='async'):
+        Config(name='Petstore', path='petstore.py', instrumentation=True,
+               async_client=True)
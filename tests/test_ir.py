@@ -0,0 +1,228 @@
+import io
+import json
+import os.path
+import subprocess
+import sys
+
+import pytest
+from bravado_core.spec import Spec
+
+from bravado_types.__main__ import main
+from bravado_types.config import ArrayTypes, Config, CustomFormats
+from bravado_types.extract import get_spec_info
+from bravado_types.ir import IR_VERSION, dump_ir, load_ir
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+
+@pytest.fixture(scope='module')
+def spec():
+    with open(PETSTORE_SCHEMA) as f:
+        return Spec.from_dict(json.load(f))
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        name='Petstore',
+        path=str(tmp_path / 'petstore.py'),
+        array_types=ArrayTypes.sequence,
+        custom_formats=CustomFormats({('string', 'ipv4'): 'str'},
+                                     ['ipaddress']),
+    )
+
+
+def _dump(spec, config):
+    metadata = get_metadata(spec, ['--example', 'arg'])
+    spec_info = get_spec_info(spec, config)
+    f = io.StringIO()
+    dump_ir(f, metadata, spec_info, config)
+    f.seek(0)
+    return metadata, spec_info, f
+
+
+def test_ir_round_trip(spec, config):
+    metadata, spec_info, f = _dump(spec, config)
+    metadata2, spec_info2, config2 = load_ir(f)
+
+    assert vars(metadata2) == vars(metadata)
+
+    assert spec_info2.spec is None
+    assert [m.name for m in spec_info2.models] == \
+        [m.name for m in spec_info.models]
+    for model2, model in zip(spec_info2.models, spec_info.models):
+        assert model2.mclass is None
+        assert model2.parents == model.parents
+        assert model2.props == model.props
+    for operation2, operation in zip(spec_info2.operations,
+                                     spec_info.operations):
+        assert operation2.operation is None
+        assert operation2.name == operation.name
+        assert [(p.name, p.type, p.required) for p in operation2.params] == \
+            [(p.name, p.type, p.required) for p in operation.params]
+        assert operation2.responses == operation.responses
+    for resource2, resource in zip(spec_info2.resources, spec_info.resources):
+        assert resource2.resource is None
+        assert resource2.name == resource.name
+        # Shared operations are not duplicated
+        for operation2 in resource2.operations:
+            assert operation2 in spec_info2.operations
+
+    assert vars(config2).keys() == vars(config).keys()
+    for key, value in vars(config).items():
+        if key == 'custom_formats':
+            assert vars(config2.custom_formats) == vars(value)
+        else:
+            assert getattr(config2, key) == value
+
+
+def test_ir_render(spec, config, tmp_path):
+    metadata, spec_info, f = _dump(spec, config)
+    render(metadata, spec_info, config)
+    with open(config.py_path) as py, open(config.pyi_path) as pyi:
+        expected = py.read(), pyi.read()
+
+    render(*load_ir(f))
+    with open(config.py_path) as py, open(config.pyi_path) as pyi:
+        assert (py.read(), pyi.read()) == expected
+
+
+@pytest.mark.parametrize('lazy_stubs', [False, True])
+def test_parallel_render(spec, tmp_path, lazy_stubs):
+    metadata = get_metadata(spec)
+    outputs = []
+    for parallel_render in False, True:
+        directory = tmp_path / str(parallel_render)
+        directory.mkdir()
+        config = Config(name='Petstore', path=str(directory / 'petstore.py'),
+                        lazy_stubs=lazy_stubs,
+                        parallel_render=parallel_render)
+        render(metadata, get_spec_info(spec, config), config)
+        outputs.append(_read_outputs(config.py_path))
+    assert outputs[1] == outputs[0]
+
+
+def test_ir_config_overrides(spec, config, tmp_path):
+    _, _, f = _dump(spec, config)
+    path = str(tmp_path / 'other.py')
+    _, _, config2 = load_ir(f, {'name': 'Other', 'path': path})
+    assert config2.name == 'Other'
+    assert config2.py_path == path
+    assert config2.array_types is ArrayTypes.sequence
+
+
+def test_ir_config_overrides_extract_param(spec, config):
+    _, _, f = _dump(spec, config)
+    with pytest.raises(ValueError, match='custom_formats'):
+        load_ir(f, {'custom_formats': None})
+
+
+def test_ir_config_overrides_type_options(spec, config, tmp_path):
+    # Array types and model type format are applied when rendering
+    _, _, f = _dump(spec, config)
+    overrides = {'array_types': ArrayTypes.union,
+                 'model_type_format': '{}Type',
+                 'path': str(tmp_path / 'other.py')}
+    metadata, spec_info, config2 = load_ir(f, overrides)
+    render(metadata, spec_info, config2)
+
+    config3 = Config(name='Petstore', path=str(tmp_path / 'direct.py'),
+                     array_types=ArrayTypes.union, model_type_format='{}Type',
+                     custom_formats=config.custom_formats)
+    render(metadata, get_spec_info(spec, config3), config3)
+    assert _read_outputs(config2.py_path) == _read_outputs(config3.py_path)
+
+
+def test_ir_bad_version(spec, config):
+    _, _, f = _dump(spec, config)
+    data = json.load(f)
+    data['version'] = IR_VERSION + 1
+    with pytest.raises(ValueError, match='Unsupported IR version'):
+        load_ir(io.StringIO(json.dumps(data)))
+
+
+def test_ir_missing_field(spec, config):
+    _, _, f = _dump(spec, config)
+    data = json.load(f)
+    del data['metadata']['schema_fingerprint']
+    with pytest.raises(ValueError, match="missing field 'schema_fingerprint'"):
+        load_ir(io.StringIO(json.dumps(data)))
+
+
+def test_ir_missing_request_info(spec, config):
+    _, _, f = _dump(spec, config)
+    data = json.load(f)
+    for operation in data['spec']['operations']:
+        del operation['http_method']
+    with pytest.raises(ValueError, match="missing field 'http_method'"):
+        load_ir(io.StringIO(json.dumps(data)))
+
+    data = json.load(_dump(spec, config)[2])
+    for operation in data['spec']['operations']:
+        operation['params'] = [param[:3] for param in operation['params']]
+    with pytest.raises(ValueError, match='Invalid IR file: not enough'):
+        load_ir(io.StringIO(json.dumps(data)))
+
+
+def test_ir_bad_format():
+    with pytest.raises(ValueError, match='Not a bravado-types IR file'):
+        load_ir(io.StringIO('{"swagger": "2.0"}'))
+
+
+def _read_outputs(py_path):
+    """Read generated files, omitting header comments."""
+    outputs = []
+    for path in py_path, f"{py_path}i":
+        with open(path) as f:
+            outputs.append([line for line in f
+                            if not line.startswith('# ')])
+    return outputs
+
+
+def test_cli_extract_render(tmp_path):
+    ir_path = str(tmp_path / 'petstore.json')
+    py_path = str(tmp_path / 'petstore.py')
+    args = ['--url', PETSTORE_SCHEMA, '--name', 'Petstore',
+            '--path', py_path, '--array-types', 'sequence']
+
+    main(args, exit=False)
+    expected = _read_outputs(py_path)
+    os.unlink(py_path)
+
+    main(['extract', '--output', ir_path] + args, exit=False)
+    assert not os.path.exists(py_path)
+    main(['render', '--input', ir_path], exit=False)
+    assert _read_outputs(py_path) == expected
+
+    other_path = str(tmp_path / 'other.py')
+    main(['render', '--input', ir_path, '--path', other_path,
+          '--client-type-format', '{}Client'], exit=False)
+    py, pyi = _read_outputs(other_path)
+    assert 'class PetstoreClient(SwaggerClient):\n' in py
+
+    main(['render', '--input', ir_path, '--array-types', 'list',
+          '--model-type-format', 'Model{}'], exit=False)
+    pyi = ''.join(_read_outputs(py_path)[1])
+    assert 'photoUrls: typing.List[str],\n' in pyi
+    assert 'class ModelPet(_Model):\n' in pyi
+    assert 'typing.Sequence' not in pyi
+
+
+def test_cli_render_does_not_import_bravado(tmp_path):
+    ir_path = str(tmp_path / 'petstore.json')
+    py_path = str(tmp_path / 'petstore.py')
+    main(['extract', '--output', ir_path, '--url', PETSTORE_SCHEMA,
+          '--name', 'Petstore', '--path', py_path], exit=False)
+
+    code = (
+        "import sys\n"
+        "from bravado_types.__main__ import main\n"
+        f"main(['render', '--input', {ir_path!r}])\n"
+        "assert not any(m.split('.')[0] in ('bravado', 'bravado_core')\n"
+        "               for m in sys.modules), 'bravado was imported'\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+    assert os.path.exists(py_path)
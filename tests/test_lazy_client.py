@@ -0,0 +1,155 @@
+import copy
+import importlib.util
+import json
+import os.path
+import pickle
+import sys
+
+import pytest
+from bravado.client import SwaggerClient, construct_request
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+ORIGIN_URL = 'https://petstore.swagger.io/v2/swagger.json'
+
+
+@pytest.fixture(scope='module')
+def spec_dict():
+    with open(PETSTORE_SCHEMA) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='module', params=[False, True],
+                ids=['sync', 'async'])
+def module(request, spec_dict, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('lazy_client') / 'petstore.py')
+    config = Config(name='Petstore', path=path, lazy_client=True,
+                    async_client=request.param)
+    spec = SwaggerClient.from_spec(spec_dict, ORIGIN_URL).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+
+    module_spec = importlib.util.spec_from_file_location('petstore', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client(module, spec_dict):
+    # Pass an HTTP client so that bravado-asyncio is not required
+    return module.PetstoreSwaggerClient.from_spec(
+        copy.deepcopy(spec_dict), ORIGIN_URL,
+        http_client=RequestsClient())
+
+
+@pytest.fixture
+def eager_client(spec_dict):
+    return SwaggerClient.from_spec(copy.deepcopy(spec_dict), ORIGIN_URL)
+
+
+def _built(resources):
+    return set(dict.keys(resources))
+
+
+def test_lazy_client_builds_resources_on_access(client):
+    resources = client.swagger_spec.resources
+    assert _built(resources) == set()
+
+    operation = client.pet.getPetById.operation
+    assert _built(resources) == {'pet'}
+    assert operation is resources['pet'].operations['getPetById']
+    assert client.get_model('Pet') is client.swagger_spec.definitions['Pet']
+    assert _built(resources) == {'pet'}
+
+
+def test_lazy_client_resources(client, eager_client):
+    resources = client.swagger_spec.resources
+    eager_resources = eager_client.swagger_spec.resources
+    assert sorted(dir(client)) == sorted(dir(eager_client))
+    assert set(resources) == set(eager_resources)
+    assert len(resources) == len(eager_resources)
+    assert 'pet' in resources
+    assert 'missing' not in resources
+    assert resources.get('missing') is None
+    with pytest.raises(KeyError):
+        resources['missing']
+    with pytest.raises(AttributeError, match='Resource missing not found'):
+        client.missing
+    assert _built(resources) == set()
+
+    for name, resource in resources.items():
+        assert resource.name == name
+        assert resource.operations.keys() == \
+            eager_resources[name].operations.keys()
+
+
+def test_lazy_client_request(client, eager_client):
+    for c in client, eager_client:
+        request = construct_request(c.pet.getPetById, {}, petId=1)
+        assert request['url'] == 'https://petstore.swagger.io/v2/pet/1'
+        assert request['method'] == 'GET'
+
+    op = client.swagger_spec.get_op_for_request('GET', '/v2/pet/{petId}')
+    assert op is client.pet.getPetById.operation
+
+
+def test_lazy_client_copy(module, client, monkeypatch):
+    # Pickling requires the generated module to be importable
+    monkeypatch.setitem(sys.modules, 'petstore', module)
+    client.pet
+    for copied in (copy.deepcopy(client.swagger_spec),
+                   pickle.loads(pickle.dumps(client.swagger_spec))):
+        assert _built(copied.resources) == {'pet', 'store', 'user'}
+        assert copied.resources['pet'].operations.keys() == \
+            client.swagger_spec.resources['pet'].operations.keys()
+
+
+def test_lazy_client_tag_aliases(module):
+    spec_dict = {
+        'swagger': '2.0',
+        'info': {'title': 'Test', 'version': '1.0'},
+        'paths': {
+            '/foo': {
+                'get': {
+                    'operationId': 'getFoo',
+                    'tags': ['foo bar'],
+                    'responses': {'200': {'description': 'Success'}},
+                },
+            },
+            '/baz/{id}': {
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True,
+                     'type': 'integer'},
+                ],
+                'x-extension': {},
+                'get': {
+                    'operationId': 'getBaz',
+                    'responses': {'200': {'description': 'Success'}},
+                },
+            },
+        },
+    }
+    client = module.PetstoreSwaggerClient.from_spec(
+        spec_dict, http_client=RequestsClient())
+    eager_client = SwaggerClient.from_spec(copy.deepcopy(spec_dict))
+    resources = client.swagger_spec.resources
+    assert list(resources) == list(eager_client.swagger_spec.resources)
+    assert resources['foo bar'] is resources['foo_bar']
+    assert client.foo_bar.getFoo.operation.path_name == '/foo'
+    assert client.baz.getBaz.operation.path_name == '/baz/{id}'
+
+
+def test_lazy_client_config(module, spec_dict):
+    client = module.PetstoreSwaggerClient.from_spec(
+        copy.deepcopy(spec_dict), ORIGIN_URL, http_client=RequestsClient(),
+        config={'also_return_response': True,
+                'internally_dereference_refs': True})
+    assert client._SwaggerClient__also_return_response is True
+    # Resources are built eagerly from the dereferenced spec in this mode
+    assert _built(client.swagger_spec.resources) == {'pet', 'store', 'user'}
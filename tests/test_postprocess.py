@@ -0,0 +1,181 @@
+import functools
+import json
+import os.path
+import threading
+
+import pytest
+from bravado_core.spec import Spec
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.postprocess import PostprocessCache, postprocess_files
+from bravado_types.render import render
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+
+class Upper:
+    """Postprocessor which converts files to upper case."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, path):
+        with self.lock:
+            self.calls.append(os.path.basename(path))
+        with open(path) as f:
+            content = f.read()
+        with open(path, 'w') as f:
+            f.write(content.upper())
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for name, content in ('a.py', 'a = 1\n'), ('a.pyi', 'a: int\n'):
+        path = tmp_path / name
+        path.write_text(content)
+        paths.append(str(path))
+    return paths
+
+
+def _contents(paths):
+    contents = []
+    for path in paths:
+        with open(path) as f:
+            contents.append(f.read())
+    return contents
+
+
+def test_postprocess_files(files):
+    upper = Upper()
+    assert postprocess_files(files, upper) == files
+    assert sorted(upper.calls) == ['a.py', 'a.pyi']
+    assert _contents(files) == ['A = 1\n', 'A: INT\n']
+
+
+def test_postprocess_files_cache(files, tmp_path):
+    upper = Upper()
+    cache = PostprocessCache(str(tmp_path / 'cache'), upper)
+    assert postprocess_files(files, upper, cache) == files
+
+    # Regenerate both files, changing only the stub
+    with open(files[0], 'w') as f:
+        f.write('a = 1\n')
+    with open(files[1], 'w') as f:
+        f.write('a: str\n')
+    upper.calls.clear()
+    assert postprocess_files(files, upper, cache) == files[1:]
+    assert upper.calls == ['a.pyi']
+    assert _contents(files) == ['A = 1\n', 'A: STR\n']
+
+
+def test_postprocess_cache_key(tmp_path):
+    def other(path):
+        pass
+
+    upper = Upper()
+    cache = PostprocessCache(str(tmp_path), upper)
+    cache.put('a.py', b'a', b'A')
+    assert cache.get('/other/dir/a.py', b'a') == b'A'
+    assert cache.get('a.pyi', b'a') is None
+    assert cache.get('a.py', b'b') is None
+    assert PostprocessCache(str(tmp_path), other).get('a.py', b'a') is None
+    assert PostprocessCache(str(tmp_path), Upper(),
+                            key='other').get('a.py', b'a') is None
+
+
+def _formatter(path, line_length):
+    pass
+
+
+def _printer(n):
+    return lambda path: print(path, n)
+
+
+def test_postprocess_cache_key_functions(tmp_path):
+    def cache(postprocessor):
+        return PostprocessCache(str(tmp_path), postprocessor)
+
+    lambdas = [lambda path: None, lambda path: print(path)]
+    closures = [_printer(n) for n in range(2)]
+    partials = [functools.partial(_formatter, line_length=n)
+                for n in (79, 88)]
+    for pair in lambdas, closures, partials:
+        keys = [cache(postprocessor).postprocessor_key
+                for postprocessor in pair]
+        assert keys[0] != keys[1]
+    # Keys are stable for equivalent postprocessors
+    assert (cache(functools.partial(_formatter, line_length=79))
+            .postprocessor_key == cache(partials[0]).postprocessor_key)
+    assert (cache(lambda path: None).postprocessor_key
+            == cache(lambdas[0]).postprocessor_key)
+
+
+class _Formatter:
+    def __init__(self, line_length):
+        self.line_length = line_length
+
+    def __repr__(self):
+        return f'_Formatter({self.line_length})'
+
+    def format(self, path):
+        pass
+
+
+def _capture(value):
+    return lambda path: print(path, value)
+
+
+def test_postprocess_cache_key_address(tmp_path):
+    # Keys containing object addresses would never be hit in another run
+    for postprocessor in [_capture(object()), Upper().__call__,
+                          functools.partial(_formatter, object())]:
+        with pytest.raises(ValueError, match='postprocess_cache_key'):
+            PostprocessCache(str(tmp_path), postprocessor)
+        assert PostprocessCache(str(tmp_path), postprocessor,
+                                key='fmt').postprocessor_key == 'fmt'
+        with pytest.raises(ValueError, match='postprocess_cache_key'):
+            Config(name='Test', path='test.py',
+                   file_postprocessor=postprocessor,
+                   postprocess_cache_dir=str(tmp_path))
+        Config(name='Test', path='test.py', file_postprocessor=postprocessor,
+               postprocess_cache_dir=str(tmp_path),
+               postprocess_cache_key='fmt')
+
+
+def test_postprocess_cache_key_methods(tmp_path):
+    # Bound methods are keyed by the repr of their instance
+    keys = [PostprocessCache(str(tmp_path), _Formatter(n).format)
+            .postprocessor_key for n in (79, 88, 79)]
+    assert keys[0] != keys[1]
+    assert keys[0] == keys[2]
+    assert ' at 0x' not in keys[0]
+
+
+def test_render_postprocessors(tmp_path):
+    with open(PETSTORE_SCHEMA) as f:
+        spec = Spec.from_dict(json.load(f))
+    calls = []
+    upper = Upper()
+
+    def postprocessor(py_path, pyi_path):
+        calls.append(_contents([py_path, pyi_path]))
+
+    config = Config(name='Petstore', path=str(tmp_path / 'petstore.py'),
+                    file_postprocessor=upper, postprocessor=postprocessor,
+                    postprocess_cache_dir=str(tmp_path / 'cache'))
+    metadata = get_metadata(spec)
+    spec_info = get_spec_info(spec, config)
+    render(metadata, spec_info, config)
+    assert sorted(upper.calls) == ['petstore.py', 'petstore.pyi']
+    # File postprocessor runs first
+    assert calls[0] == [c.upper() for c in calls[0]]
+
+    upper.calls.clear()
+    render(metadata, spec_info, config)
+    assert upper.calls == []
+    assert calls[1] == calls[0]
@@ -0,0 +1,182 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from bravado_types.__main__ import main
+from bravado_types.http_cache import SchemaCache
+from bravado_types.prefetch import load_client, prefetch_documents
+
+NUM_MODEL_FILES = 6
+
+DOCUMENTS = {
+    '/api.json': {
+        'swagger': '2.0',
+        'info': {'title': 'Multi-file schema', 'version': '1.0'},
+        'paths': {
+            f'/model{i}': {
+                'get': {
+                    'operationId': f'getModel{i}',
+                    'tags': ['models'],
+                    'responses': {
+                        '200': {
+                            'description': 'Success',
+                            'schema': {
+                                '$ref': f'models/model{i}.json'
+                                        f'#/definitions/Model{i}',
+                            },
+                        },
+                    },
+                },
+            }
+            for i in range(NUM_MODEL_FILES)
+        },
+    },
+    '/common.json': {
+        'definitions': {
+            'Id': {'type': 'integer'},
+        },
+    },
+    **{
+        f'/models/model{i}.json': {
+            'definitions': {
+                f'Model{i}': {
+                    'type': 'object',
+                    'x-model': f'Model{i}',
+                    'properties': {
+                        'id': {'$ref': '../common.json#/definitions/Id'},
+                    },
+                },
+            },
+        }
+        for i in range(NUM_MODEL_FILES)
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight,
+                                       server.in_flight)
+        try:
+            time.sleep(server.latency)
+            if self.path not in DOCUMENTS:
+                self.send_error(404)
+                return
+            body = json.dumps(DOCUMENTS[self.path]).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.latency = 0.1
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _url(server, path):
+    return f'http://127.0.0.1:{server.server_port}{path}'
+
+
+def test_prefetch_documents(server):
+    documents = prefetch_documents(_url(server, '/api.json'), max_workers=4)
+    assert set(documents) == {_url(server, path) for path in DOCUMENTS}
+    for path, data in DOCUMENTS.items():
+        assert documents[_url(server, path)].json() == data
+    # Each document is fetched once, several at a time
+    assert sorted(server.requests) == sorted(DOCUMENTS)
+    assert 1 < server.max_in_flight <= 4
+
+
+def test_prefetch_documents_missing_ref(server):
+    DOCUMENTS['/api.json']['definitions'] = {
+        'Missing': {'$ref': 'missing.json#/definitions/Missing'},
+    }
+    try:
+        documents = prefetch_documents(_url(server, '/api.json'))
+    finally:
+        del DOCUMENTS['/api.json']['definitions']
+    assert _url(server, '/missing.json') not in documents
+    assert len(documents) == len(DOCUMENTS)
+
+
+def test_prefetch_documents_missing_root(server):
+    with pytest.raises(requests.HTTPError):
+        prefetch_documents(_url(server, '/missing.json'))
+
+
+def test_prefetch_documents_timeout(server):
+    server.latency = 0.5
+    with pytest.raises(requests.Timeout):
+        prefetch_documents(_url(server, '/api.json'), timeout=0.05)
+
+
+def test_prefetch_documents_file(tmp_path):
+    for path, data in DOCUMENTS.items():
+        file_path = tmp_path / path.lstrip('/')
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps(data))
+    documents = prefetch_documents((tmp_path / 'api.json').as_uri())
+    assert set(documents) == {(tmp_path / path.lstrip('/')).as_uri()
+                              for path in DOCUMENTS}
+
+
+def test_load_client(server):
+    client = load_client(_url(server, '/api.json'))
+    assert set(client.swagger_spec.definitions) == {
+        f'Model{i}' for i in range(NUM_MODEL_FILES)}
+    # Bravado does not make any further requests for schema documents
+    assert len(server.requests) == len(DOCUMENTS)
+
+
+def test_load_client_cache(server, tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    load_client(_url(server, '/api.json'), cache=cache)
+    server.requests.clear()
+    load_client(_url(server, '/api.json'),
+                cache=SchemaCache(str(tmp_path), offline=True))
+    assert server.requests == []
+
+
+def test_cli_fetch_workers(server, tmp_path):
+    py_path = tmp_path / 'multi.py'
+    main(['--url', _url(server, '/api.json'), '--name', 'Multi',
+          '--path', str(py_path), '--fetch-workers', '4'], exit=False)
+    assert len(server.requests) == len(DOCUMENTS)
+    with open(f'{py_path}i') as f:
+        assert 'class Model0Model(_Model):' in f.read()
+
+
+def test_cli_fetch_workers_invalid(tmp_path):
+    with pytest.raises(RuntimeError, match='--fetch-workers must be positive'):
+        main(['--url', 'http://127.0.0.1/api.json', '--name', 'Multi',
+              '--path', str(tmp_path / 'multi.py'), '--fetch-workers', '0'],
+             exit=False)
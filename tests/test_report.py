@@ -0,0 +1,120 @@
+import io
+import json
+import os.path
+
+import pytest
+from bravado.client import SwaggerClient
+
+from bravado_types.__main__ import main
+from bravado_types.config import Config, ResponseTypes
+from bravado_types.emit import emit_stub
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.report import format_report, get_report, sort_elements
+from bravado_types.type_strings import render_spec_types
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+
+@pytest.fixture(scope='module')
+def spec():
+    return SwaggerClient.from_url(f'file://{PETSTORE_SCHEMA}').swagger_spec
+
+
+def _report(spec, **kwargs):
+    config = Config(name='Petstore', path='petstore.py', **kwargs)
+    return get_report(get_metadata(spec), get_spec_info(spec, config),
+                      config)
+
+
+def test_report_elements(spec):
+    report = _report(spec)
+    config = Config(name='Petstore', path='petstore.py')
+    buf = io.StringIO()
+    spec_info = get_spec_info(spec, config)
+    emit_stub(buf, get_metadata(spec), spec_info, config,
+              render_spec_types(spec_info, config))
+    assert report.lines == buf.getvalue().count('\n')
+    assert report.size == len(buf.getvalue())
+
+    kinds = {}
+    for element in report.elements:
+        kinds.setdefault(element.kind, []).append(element.name)
+    assert kinds['get_model'] == ['get_model']
+    assert kinds['resource'] == ['pet', 'store', 'user']
+    assert len(kinds['operation']) == 20
+    assert sorted(kinds['model']) == ['ApiResponse', 'Category', 'Order',
+                                      'Pet', 'Tag', 'User']
+    # The rest of the stub file is the header and base classes
+    assert sum(e.size for e in report.elements) < report.size
+
+    assert report.get_model.lines == 22
+
+
+def test_report_sort(spec):
+    report = _report(spec)
+    by_bytes = sort_elements(report.elements, 'bytes')
+    assert [e.size for e in by_bytes] == \
+        sorted((e.size for e in report.elements), reverse=True)
+    by_name = sort_elements(report.elements, 'name')
+    assert [e.name for e in by_name] == sorted(e.name for e in by_name)
+    with pytest.raises(ValueError, match='Unknown sort key'):
+        sort_elements(report.elements, 'size')
+
+
+def test_report_types(spec):
+    report = _report(spec)
+    assert report.types[0].location == 'getInventory -> 200'
+    assert report.types[0].type == 'typing.Mapping[str, typing.Any]'
+    locations = {t.location for t in report.types}
+    assert {'Pet.tags', 'addPet(body)', 'getPetById -> 200'} <= locations
+
+
+def test_report_unions(spec):
+    report = _report(spec, response_types=ResponseTypes.all)
+    [union] = [u for u in report.unions if u.operation == 'getPetById']
+    assert union.types == ['PetModel', 'None', 'None']
+    assert len(report.unions[0].types) == 3
+
+    report = _report(spec, response_types=ResponseTypes.any)
+    assert all(not u.types for u in report.unions)
+
+
+def test_report_signatures(spec):
+    report = _report(spec)
+    assert report.signatures[0].model == 'User'
+    assert report.signatures[0].params == 8
+    assert report.signatures[0].lines == 12
+
+
+def test_report_lazy_stubs(spec):
+    with pytest.raises(ValueError, match='lazy stubs'):
+        _report(spec, lazy_stubs=True)
+
+
+def test_format_report(spec):
+    text = format_report(_report(spec), top=3)
+    assert text.startswith('Stub file: ')
+    assert 'Elements by bytes (top 3 of 30):' in text
+    assert 'get_model overloads: 22 lines, ' in text
+    assert '  params  lines  bytes  model\n       8     12' in text
+
+
+def test_report_cli(capsys):
+    main(['report', '--url', PETSTORE_SCHEMA, '--name', 'Petstore',
+          '--path', 'petstore.py', '--format', 'json', '--sort', 'name',
+          '--top', '2'], exit=False)
+    data = json.loads(capsys.readouterr().out)
+    assert [e['name'] for e in data['elements']] == ['ApiResponse',
+                                                     'Category']
+    assert len(data['types']) == 2
+    assert data['get_model']['lines'] == 22
+    assert data['signatures'][0]['model'] == 'User'
+    assert data['signatures'][0]['params'] == 8
+
+
+def test_report_cli_lazy_stubs():
+    with pytest.raises(RuntimeError, match='lazy-stubs'):
+        main(['report', '--url', PETSTORE_SCHEMA, '--name', 'Petstore',
+              '--path', 'petstore.py', '--lazy-stubs'], exit=False)
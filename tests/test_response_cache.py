@@ -0,0 +1,348 @@
+import importlib.util
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from bravado.client import SwaggerClient
+from bravado.exception import HTTPNotFound
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+ITEM = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer'},
+        'name': {'type': 'string'},
+        'pageSize': {'type': 'integer'},
+    },
+}
+
+SPEC = {
+    'swagger': '2.0',
+    'info': {'title': 'Items', 'version': '1.0'},
+    'basePath': '/v1',
+    'schemes': ['http'],
+    'produces': ['application/json'],
+    'consumes': ['application/json'],
+    'paths': {
+        '/items/{id}': {
+            'get': {
+                'operationId': 'getItem',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'type': 'integer',
+                     'required': True},
+                    {'name': 'page-size', 'in': 'query', 'type': 'integer',
+                     'default': 10},
+                ],
+                'responses': {
+                    '200': {'description': 'Item',
+                            'schema': {'$ref': '#/definitions/Item'}},
+                    '404': {'description': 'Not found'},
+                },
+            },
+        },
+        '/items': {
+            'post': {
+                'operationId': 'createItem',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'item', 'in': 'body', 'required': True,
+                     'schema': {'$ref': '#/definitions/Item'}},
+                ],
+                'responses': {
+                    '200': {'description': 'Item',
+                            'schema': {'$ref': '#/definitions/Item'}},
+                },
+            },
+        },
+    },
+    'definitions': {'Item': ITEM},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.path)
+        url = urllib.parse.urlsplit(self.path)
+        item_id = int(url.path.rsplit('/', 1)[1])
+        if item_id == 404:
+            self._send(404, {}, {})
+            return
+        query = urllib.parse.parse_qs(url.query)
+        self._send(200, {'id': item_id, 'name': f'item{item_id}',
+                         'pageSize': int(query.get('page-size', ['10'])[0])},
+                   server.headers)
+
+    def _send(self, status, data, headers):
+        body = json.dumps(data).encode('utf-8')
+        # Without the Date header added by send_response(), so that tests
+        # can set it
+        self.send_response_only(status)
+        if 'Date' not in headers:
+            self.send_header('Date', self.date_time_string())
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.headers = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def spec_dict(server):
+    server.requests.clear()
+    server.headers.clear()
+    return {**SPEC, 'host': f'127.0.0.1:{server.server_port}'}
+
+
+def _load_module(tmp_path_factory, name, **options):
+    path = str(tmp_path_factory.mktemp('response_cache') / f'{name}.py')
+    config = Config(name='Items', path=path, response_cache=True, **options)
+    spec = SwaggerClient.from_spec(SPEC).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+
+    module_spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def module(tmp_path_factory):
+    return _load_module(tmp_path_factory, 'items')
+
+
+@pytest.fixture
+def client(module, spec_dict):
+    client = module.ItemsSwaggerClient.from_spec(spec_dict)
+    client.configure_cache('getItem')
+    return client
+
+
+def _info(client):
+    info = client.cache_info('getItem')
+    return info.hits, info.misses, info.currsize
+
+
+def test_hit(client, server):
+    item = client.items.getItem(id=1).result()
+    assert item.name == 'item1'
+    assert client.items.getItem(id=1).result() == item
+    assert server.requests == ['/v1/items/1']
+    assert _info(client) == (1, 1, 1)
+
+    response = client.items.getItem(id=1).response()
+    assert response.result == item
+    assert response.incoming_response.status_code == 200
+    assert _info(client) == (2, 1, 1)
+
+
+def test_hit_copy(client, server):
+    # Changes to results do not affect the cached result
+    item = client.items.getItem(id=1).result()
+    item.name = 'changed'
+    cached = client.items.getItem(id=1).result()
+    assert cached.name == 'item1'
+    cached.name = 'changed'
+    assert client.items.getItem(id=1).result().name == 'item1'
+    assert server.requests == ['/v1/items/1']
+
+
+def test_not_configured(module, spec_dict, server):
+    client = module.ItemsSwaggerClient.from_spec(spec_dict)
+    client.items.getItem(id=1).result()
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 2
+    with pytest.raises(ValueError, match='not configured'):
+        client.cache_info('getItem')
+
+
+def test_not_cacheable(client):
+    with pytest.raises(ValueError, match='Cannot cache results of '
+                       'createItem'):
+        client.configure_cache('createItem')
+
+
+def test_key_normalization(client, server):
+    client.items.getItem(id=1).result()
+    # Aliases and default values are resolved
+    client.items.getItem(**{'id': 1, 'page-size': 10}).result()
+    client.items.getItem(id=1, page_size=10).result()
+    client.items.getItem(id=1, page_size=None).result()
+    assert len(server.requests) == 1
+    client.items.getItem(id=1, page_size=20).result()
+    assert len(server.requests) == 2
+    # Request headers are part of the key
+    client.items.getItem(
+        id=1, _request_options={'headers': {'X-Tenant': 'a'}}).result()
+    client.items.getItem(
+        id=1, _request_options={'headers': {'x-tenant': 'a'}}).result()
+    assert len(server.requests) == 3
+
+
+def test_invalid_params(client, server):
+    with pytest.raises(Exception):
+        client.items.getItem(id=1, unknown=2).result()
+    assert _info(client) == (0, 0, 0)
+
+
+def test_errors_not_cached(client, server):
+    for _ in range(2):
+        with pytest.raises(HTTPNotFound):
+            client.items.getItem(id=404).result()
+    assert len(server.requests) == 2
+    assert _info(client) == (0, 2, 0)
+
+
+def test_lru_eviction(client, server):
+    client.configure_cache('getItem', maxsize=2)
+    for item_id in 1, 2, 1, 3, 1, 2:
+        client.items.getItem(id=item_id).result()
+    assert [path.split('?')[0] for path in server.requests] == [
+        '/v1/items/1', '/v1/items/2', '/v1/items/3', '/v1/items/2']
+    assert _info(client) == (2, 4, 2)
+
+
+def test_ttl(client, server):
+    client.configure_cache('getItem', ttl=0.2)
+    client.items.getItem(id=1).result()
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 1
+    time.sleep(0.3)
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 2
+    assert _info(client) == (1, 2, 1)
+
+
+@pytest.mark.parametrize('headers', [
+    {'Cache-Control': 'no-store'},
+    {'Cache-Control': 'private, no-cache'},
+    {'Cache-Control': 'max-age=0'},
+    {'Cache-Control': 'max-age=60', 'Age': '60'},
+    {'Cache-Control': 'max-age=invalid'},
+    {'Expires': '0'},
+    {'Expires': 'Thu, 01 Jan 1970 00:00:00 GMT'},
+    {'Date': 'Thu, 01 Jan 2026 00:00:00 GMT',
+     'Expires': 'Thu, 01 Jan 2026 00:00:00 GMT'},
+])
+def test_cache_headers_not_cached(client, server, headers):
+    server.headers.update(headers)
+    client.items.getItem(id=1).result()
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 2
+
+
+@pytest.mark.parametrize('headers', [
+    {'Cache-Control': 'public, max-age=60'},
+    {'Cache-Control': 'max-age=60', 'Age': '30'},
+    {'Date': 'Thu, 01 Jan 2026 00:00:00 GMT',
+     'Expires': 'Thu, 01 Jan 2026 00:01:00 GMT'},
+])
+def test_cache_headers_cached(client, server, headers):
+    server.headers.update(headers)
+    client.items.getItem(id=1).result()
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 1
+
+
+def test_cache_header_ttl(client, server):
+    # The shorter of the configured and the header time to live applies
+    client.configure_cache('getItem', ttl=60)
+    server.headers['Cache-Control'] = 'max-age=1, stale-while-revalidate=10'
+    client.items.getItem(id=1).result()
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 1
+    time.sleep(1.1)
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 2
+
+
+def test_invalidate(client, server):
+    for item_id in 1, 2:
+        client.items.getItem(id=item_id).result()
+    client.invalidate_cache('getItem', id=1, page_size=10)
+    assert _info(client) == (0, 2, 1)
+    client.items.getItem(id=2).result()
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 3
+
+    client.invalidate_cache('getItem')
+    assert _info(client) == (1, 3, 0)
+    client.items.getItem(id=1).result()
+    client.items.getItem(id=1).result()
+    client.invalidate_cache()
+    assert _info(client) == (2, 4, 0)
+
+
+def test_invalidate_pending(client, server):
+    # Responses of calls made before invalidation are not cached
+    future = client.items.getItem(id=1)
+    client.invalidate_cache()
+    future.result()
+    assert _info(client) == (0, 1, 0)
+
+
+def test_reconfigure(client, server):
+    client.items.getItem(id=1).result()
+    client.configure_cache('getItem', maxsize=None)
+    assert client.cache_info('getItem').maxsize is None
+    assert _info(client) == (0, 0, 0)
+
+
+def test_maxsize_zero(client, server):
+    client.configure_cache('getItem', maxsize=0)
+    client.items.getItem(id=1).result()
+    client.items.getItem(id=1).result()
+    assert len(server.requests) == 2
+    assert _info(client) == (0, 2, 0)
+
+
+def test_clients_separate(module, client, spec_dict, server):
+    other = module.ItemsSwaggerClient.from_spec(spec_dict)
+    other.configure_cache('getItem')
+    client.items.getItem(id=1).result()
+    other.items.getItem(id=1).result()
+    assert len(server.requests) == 2
+
+
+def test_instrumentation(tmp_path_factory, spec_dict, server):
+    module = _load_module(tmp_path_factory, 'items_instrumented',
+                          instrumentation=True, fast_requests=True)
+    client = module.ItemsSwaggerClient.from_spec(spec_dict)
+    client.configure_cache('getItem')
+    calls = []
+    client.add_operation_hook(calls.append)
+    for _ in range(2):
+        assert client.items.getItem(id=1).result().name == 'item1'
+    assert len(server.requests) == 1
+    assert _info(client) == (1, 1, 1)
+    # Hooks are called for cache hits
+    assert [call.status_code for call in calls] == [200, 200]
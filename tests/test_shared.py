@@ -0,0 +1,309 @@
+import os
+import os.path
+from contextlib import contextmanager
+
+import mypy.api
+import pytest
+from bravado.client import SwaggerClient
+
+from bravado_types import generate_shared_modules
+from bravado_types.__main__ import main
+from bravado_types.config import ArrayTypes, Config
+from bravado_types.data_model import (ModelInfo, PropertyInfo, SpecInfo,
+                                      TypeInfo, TypeWrapper)
+from bravado_types.extract import get_spec_info
+from bravado_types.ir import dump_ir
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render, render_shared
+from bravado_types.shared import SharedModels, find_shared_models
+
+
+def _model(model_name, parents=(), **props):
+    return ModelInfo(None, model_name, list(parents),
+                     [PropertyInfo(pname, (TypeInfo(ptype)
+                                           if isinstance(ptype, str)
+                                           else ptype), True)
+                      for pname, ptype in props.items()])
+
+
+def _spec(*models):
+    return SpecInfo(None, list(models), [], [])
+
+
+def _shared(*specs):
+    models, names = find_shared_models(specs)
+    return [model.name for model in models], [sorted(n) for n in names]
+
+
+def test_find_shared_models():
+    assert _shared(
+        _spec(_model('Error', code='int'), _model('Order', id='int')),
+        _spec(_model('Error', code='int'), _model('Invoice', id='int')),
+        _spec(_model('Invoice', id='int')),
+    ) == (['Error', 'Invoice'], [['Error'], ['Error', 'Invoice'],
+                                 ['Invoice']])
+
+
+def test_find_shared_models_variants():
+    # The most common variant is shared, preferring the first on ties
+    assert _shared(
+        _spec(_model('Error', code='str')),
+        _spec(_model('Error', code='int')),
+        _spec(_model('Error', code='int')),
+        _spec(_model('Page', size='int')),
+        _spec(_model('Page', size='float')),
+        _spec(_model('Page', size='int')),
+        _spec(_model('Page', size='float')),
+    ) == (['Error', 'Page'], [[], ['Error'], ['Error'], ['Page'], [],
+                              ['Page'], []])
+
+
+def test_find_shared_models_references():
+    page = _model('Page', items=TypeInfo('Item', True, [TypeWrapper.array]))
+    assert _shared(
+        _spec(page, _model('Item', id='int')),
+        _spec(page, _model('Item', id='int')),
+        _spec(page, _model('Item', id='str')),
+    ) == (['Page', 'Item'], [['Item', 'Page'], ['Item', 'Page'], []])
+
+    assert _shared(
+        _spec(page, _model('Item', id='int')),
+        _spec(page, _model('Item', id='str')),
+    ) == ([], [[], []])
+
+
+def test_find_shared_models_parents():
+    child = _model('Child', ['Base'], id='int')
+    assert _shared(
+        _spec(_model('Base', name='str'), child),
+        _spec(_model('Base', name='bytes'), child),
+    ) == ([], [[], []])
+    assert _shared(
+        _spec(_model('Base', name='str'), child),
+        _spec(_model('Base', name='str'), child),
+    ) == (['Base', 'Child'], [['Base', 'Child'], ['Base', 'Child']])
+
+
+def test_find_shared_models_nested_references():
+    page = _model('Page', next=TypeInfo('str', False, [TypeWrapper.optional]),
+                  items=TypeInfo('Item', True, [TypeWrapper.optional,
+                                                TypeWrapper.array]))
+    assert _shared(
+        _spec(page, _model('Item', id='int')),
+        _spec(page, _model('Item', id='str')),
+    ) == ([], [[], []])
+
+    # Only model types are references
+    page = _model('Page', items=TypeInfo('Item', False, [TypeWrapper.array]))
+    assert _shared(
+        _spec(page, _model('Item', id='int')),
+        _spec(page, _model('Item', id='str')),
+    ) == (['Page'], [['Page'], ['Page']])
+
+
+def _spec_dict(title, definitions):
+    return {
+        'swagger': '2.0',
+        'info': {'title': title, 'version': '1.0'},
+        'paths': {
+            f'/{title.lower()}/{{id}}': {
+                'get': {
+                    'operationId': f'get{title}',
+                    'tags': [title.lower()],
+                    'parameters': [{'name': 'id', 'in': 'path',
+                                    'required': True, 'type': 'integer'}],
+                    'responses': {
+                        '200': {'description': 'Success', 'schema': {
+                            '$ref': f'#/definitions/{title}'}},
+                        'default': {'description': 'Error', 'schema': {
+                            '$ref': '#/definitions/Error'}},
+                    },
+                },
+            },
+        },
+        'definitions': definitions,
+    }
+
+
+COMMON_DEFINITIONS = {
+    'Error': {
+        'type': 'object',
+        'required': ['code'],
+        'properties': {
+            'code': {'type': 'integer'},
+            'message': {'type': 'string'},
+        },
+    },
+    'Money': {
+        'type': 'object',
+        'properties': {
+            'amount': {'type': 'string'},
+            'currency': {'type': 'string'},
+        },
+    },
+    'Page': {
+        'type': 'object',
+        'properties': {
+            'items': {'type': 'array',
+                      'items': {'$ref': '#/definitions/Item'}},
+        },
+    },
+}
+
+ORDERS = _spec_dict('Order', {
+    **COMMON_DEFINITIONS,
+    'Order': {
+        'type': 'object',
+        'properties': {
+            'id': {'type': 'integer'},
+            'total': {'$ref': '#/definitions/Money'},
+        },
+    },
+    'Item': {
+        'type': 'object',
+        'properties': {'name': {'type': 'string'}},
+    },
+})
+
+INVOICES = _spec_dict('Invoice', {
+    **COMMON_DEFINITIONS,
+    'Invoice': {
+        'type': 'object',
+        'properties': {
+            'total': {'$ref': '#/definitions/Money'},
+        },
+    },
+    'Item': {
+        'type': 'object',
+        'properties': {'sku': {'type': 'string'}},
+    },
+})
+
+# Shared models are the same type in each module, other models are not
+CHECK_MODULE = '''\
+import invoices
+import orders
+
+def convert_error(error: invoices.ErrorModel) -> orders.ErrorModel:
+    return error
+
+def convert_item(item: invoices.ItemModel) -> orders.ItemModel:
+    return item
+
+def get_total(client: orders.OrderSwaggerClient) -> invoices.MoneyModel:
+    order = client.order.getOrder(id=1).response().result
+    assert order and order.total
+    return order.total
+'''
+
+
+@contextmanager
+def _chdir(path):
+    prev_wd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(prev_wd)
+
+
+def _configs(tmp_path, **kwargs):
+    return [Config(name='Order', path=str(tmp_path / 'orders.py'), **kwargs),
+            Config(name='Invoice', path=str(tmp_path / 'invoices.py'),
+                   **kwargs)]
+
+
+def test_generate_shared_modules(tmp_path):
+    configs = _configs(tmp_path)
+    generate_shared_modules(
+        [(SwaggerClient.from_spec(ORDERS), configs[0]),
+         (SwaggerClient.from_spec(INVOICES), configs[1])],
+        'common', str(tmp_path / 'common.pyi'))
+
+    common = (tmp_path / 'common.pyi').read_text()
+    assert '# Models shared by schemas: Order, Invoice\n' in common
+    assert 'class ErrorModel(_Model):' in common
+    assert 'class MoneyModel(_Model):' in common
+    assert 'class PageModel' not in common
+    for config in configs:
+        with open(config.pyi_path) as f:
+            stub = f.read()
+        assert 'ErrorModel as ErrorModel,' in stub
+        assert 'MoneyModel as MoneyModel,' in stub
+        assert 'class ErrorModel' not in stub
+        assert 'class PageModel(_Model):' in stub
+        assert 'class ItemModel(_Model):' in stub
+
+    (tmp_path / 'check.py').write_text(CHECK_MODULE)
+    with _chdir(tmp_path):
+        normal_report, error_report, _ = mypy.api.run(
+            ['common.pyi', 'orders.pyi', 'invoices.pyi'])
+        assert normal_report == "Success: no issues found in 3 source files\n"
+        normal_report, error_report, _ = mypy.api.run(['check.py'])
+    lines = normal_report.splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith('check.py:8: error: Incompatible return value')
+    assert lines[1] == 'Found 1 error in 1 file (checked 1 source file)'
+
+
+def test_render_shared_cli(tmp_path):
+    with _chdir(tmp_path):
+        for name, spec_dict in ('orders', ORDERS), ('invoices', INVOICES):
+            spec = SwaggerClient.from_spec(spec_dict).swagger_spec
+            config = Config(name=name.title(), path=f'{name}.py')
+            with open(f'{name}.json', 'w') as f:
+                dump_ir(f, get_metadata(spec), get_spec_info(spec, config),
+                        config)
+        main(['render-shared', '--input', 'orders.json',
+              '--input', 'invoices.json', '--common-module', 'common',
+              '--common-path', 'common.pyi'], exit=False)
+        assert 'from common import (' in open('orders.pyi').read()
+        assert 'from common import (' in open('invoices.pyi').read()
+        assert 'class ErrorModel(_Model):' in open('common.pyi').read()
+
+
+@pytest.mark.parametrize(('kwargs', 'common_module', 'common_path', 'match'), [
+    pytest.param({}, 'common', 'common.py', 'must end with', id='path'),
+    pytest.param({}, 'common-models', 'common.pyi', 'Invalid module name',
+                 id='module'),
+    pytest.param({'lazy_stubs': True}, 'common', 'common.pyi', 'Lazy stubs',
+                 id='lazy_stubs'),
+])
+def test_render_shared_errors(tmp_path, kwargs, common_module, common_path,
+                              match):
+    outputs = []
+    for spec_dict, config in zip([ORDERS, INVOICES],
+                                 _configs(tmp_path, **kwargs)):
+        spec = SwaggerClient.from_spec(spec_dict).swagger_spec
+        outputs.append((get_metadata(spec), get_spec_info(spec, config),
+                        config))
+    with pytest.raises(ValueError, match=match):
+        render_shared(outputs, common_module,
+                      str(tmp_path / common_path))
+
+
+@pytest.mark.parametrize(('option', 'values'), [
+    pytest.param('model_type_format', ['{}Model', 'Model{}'],
+                 id='model_type_format'),
+    pytest.param('array_types', [ArrayTypes.list, ArrayTypes.sequence],
+                 id='array_types'),
+])
+def test_render_shared_options(tmp_path, option, values):
+    spec = SwaggerClient.from_spec(ORDERS).swagger_spec
+    spec_info = get_spec_info(spec, Config(name='a', path='a.py'))
+    outputs = []
+    for name, value in zip(['a', 'b'], values):
+        config = Config(name=name, path=str(tmp_path / f'{name}.py'),
+                        **{option: value})
+        outputs.append((get_metadata(spec), spec_info, config))
+    with pytest.raises(ValueError, match='same model type format'):
+        render_shared(outputs, 'common', str(tmp_path / 'common.pyi'))
+
+
+def test_render_shared_models_lazy_stubs(tmp_path):
+    spec = SwaggerClient.from_spec(ORDERS).swagger_spec
+    config = Config(name='Order', path=str(tmp_path / 'orders.py'),
+                    lazy_stubs=True)
+    with pytest.raises(ValueError, match='Lazy stubs'):
+        render(get_metadata(spec), get_spec_info(spec, config), config,
+               SharedModels('common', frozenset(['Error'])))
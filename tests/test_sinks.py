@@ -0,0 +1,158 @@
+import io
+import json
+import os.path
+import zipfile
+
+import pytest
+from bravado_core.spec import Spec
+
+from bravado_types import generate_module, generate_shared_modules
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+from bravado_types.sinks import MemorySink, OutputSink, WriterSink, ZipSink
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+# Output paths in a directory which does not exist, so that writing to the
+# filesystem would fail
+OUTPUT_DIR = os.path.join(TESTS_DIR, 'nonexistent', 'pkg')
+
+
+@pytest.fixture(scope='module')
+def spec():
+    with open(PETSTORE_SCHEMA) as f:
+        return Spec.from_dict(json.load(f))
+
+
+def _config(**kwargs):
+    return Config(name='Petstore', path=f'{OUTPUT_DIR}/petstore.py',
+                  **kwargs)
+
+
+def _render_files(spec, config, tmp_path):
+    """Render files to the filesystem and read them back."""
+    metadata = get_metadata(spec)
+    spec_info = get_spec_info(spec, config)
+    file_config = Config(name=config.name, path=str(tmp_path / 'petstore.py'),
+                         lazy_stubs=config.lazy_stubs)
+    render(metadata, spec_info, file_config)
+    files = {}
+    for name in os.listdir(tmp_path):
+        files[f'{OUTPUT_DIR}/{name}'] = (tmp_path / name).read_text()
+    return metadata, spec_info, files
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'lazy_stubs': True},
+    {'parallel_render': True},
+    {'custom_templates_dir': TESTS_DIR},
+])
+def test_memory_sink(spec, tmp_path, kwargs):
+    config = _config(**kwargs)
+    metadata, spec_info, expected = _render_files(
+        spec, _config(lazy_stubs=config.lazy_stubs), tmp_path)
+    sink = MemorySink()
+    render(metadata, spec_info, config, sink=sink)
+    assert sink.files == expected
+    assert not os.path.exists(OUTPUT_DIR)
+
+
+def test_generate_module_sink(spec):
+    sink = MemorySink()
+    generate_module(spec, _config(), sink=sink)
+    assert sorted(sink.files) == [f'{OUTPUT_DIR}/petstore.py',
+                                  f'{OUTPUT_DIR}/petstore.pyi']
+    stub = sink.files[f'{OUTPUT_DIR}/petstore.pyi']
+    assert 'class PetModel(_Model):' in stub
+
+
+def test_writer_sink(spec):
+    config = _config()
+    metadata = get_metadata(spec)
+    spec_info = get_spec_info(spec, config)
+    buffers = {}
+
+    def opener(path):
+        buffers[path] = io.StringIO()
+        return buffers[path]
+
+    render(metadata, spec_info, config, sink=WriterSink(opener, close=False))
+    memory = MemorySink()
+    render(metadata, spec_info, config, sink=memory)
+    assert {path: buf.getvalue() for path, buf in buffers.items()} == \
+        memory.files
+
+    closed = []
+
+    class File(io.StringIO):
+        def close(self):
+            closed.append(self.getvalue())
+            super().close()
+
+    WriterSink(lambda path: File()).write('a.py', 'a = 1\n')
+    assert closed == ['a = 1\n']
+
+
+def test_zip_sink(spec):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as archive:
+        sink = ZipSink(archive, root=os.path.dirname(OUTPUT_DIR))
+        generate_module(spec, _config(lazy_stubs=True), sink=sink)
+    with zipfile.ZipFile(buf) as archive:
+        assert sorted(archive.namelist()) == [
+            'pkg/petstore.py', 'pkg/petstore.pyi', 'pkg/petstore.types.json']
+        index = json.loads(archive.read('pkg/petstore.types.json'))
+        assert 'Pet' in index['models']
+
+
+def test_zip_sink_archive_name():
+    archive = zipfile.ZipFile(io.BytesIO(), 'w')
+    assert ZipSink(archive).archive_name('/a/b/c.py') == 'a/b/c.py'
+    assert ZipSink(archive, '/a').archive_name('/a/b/./c.py') == 'b/c.py'
+    with pytest.raises(ValueError, match='outside of archive root'):
+        ZipSink(archive, '/a/b').archive_name('/a/c.py')
+
+
+def test_output_sink_abstract():
+    class IncompleteSink(OutputSink):
+        pass
+
+    with pytest.raises(TypeError, match='abstract'):
+        IncompleteSink()
+
+
+def test_sink_postprocessors(spec):
+    calls = []
+
+    def file_postprocessor(path):
+        with open(path, 'a') as f:
+            f.write('# postprocessed\n')
+
+    def postprocessor(py_path, pyi_path):
+        calls.append((os.path.basename(py_path), os.path.basename(pyi_path)))
+
+    sink = MemorySink()
+    generate_module(spec, _config(file_postprocessor=file_postprocessor,
+                                  postprocessor=postprocessor), sink=sink)
+    assert len(sink.files) == 2
+    for content in sink.files.values():
+        assert content.endswith('# postprocessed\n')
+    # Postprocessors see files with the same names in a temporary directory
+    assert calls == [('petstore.py', 'petstore.pyi')]
+    assert not os.path.exists(OUTPUT_DIR)
+
+
+def test_shared_modules_sink(spec):
+    sink = MemorySink()
+    generate_shared_modules(
+        [(spec, _config()),
+         (spec, Config(name='Other', path=f'{OUTPUT_DIR}/other.py'))],
+        'pkg.common', f'{OUTPUT_DIR}/common.pyi', sink=sink)
+    assert sorted(os.path.basename(path) for path in sink.files) == [
+        'common.pyi', 'other.py', 'other.pyi', 'petstore.py', 'petstore.pyi']
+    assert 'class PetModel(_Model):' in sink.files[f'{OUTPUT_DIR}/common.pyi']
+    assert not os.path.exists(OUTPUT_DIR)
@@ -0,0 +1,138 @@
+import importlib.util
+import os.path
+import sys
+
+import pytest
+from bravado.client import SwaggerClient, construct_request
+from bravado.requests_client import RequestsClient
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata, spec_fingerprint
+from bravado_types.render import render
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_URL = f"file://{TESTS_DIR}/mypy/petstore/petstore.json"
+MINIMAL_URL = f"file://{TESTS_DIR}/mypy/minimal/minimal.yaml"
+
+OPTIONS = {
+    'sync': {},
+    'async': {'async_client': True},
+    'lazy_client': {'lazy_client': True},
+}
+
+
+@pytest.fixture(scope='module', params=OPTIONS.values(), ids=list(OPTIONS))
+def module(request, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('spec_cache') / 'petstore.py')
+    config = Config(name='Petstore', path=path, spec_cache=True,
+                    **request.param)
+    spec = SwaggerClient.from_url(PETSTORE_URL).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+
+    module_spec = importlib.util.spec_from_file_location('petstore', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def importable(module, monkeypatch):
+    # Unpickling requires the generated module to be importable
+    monkeypatch.setitem(sys.modules, 'petstore', module)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'petstore.spec')
+
+
+def _from_cached_spec(module, cache_path, spec_url=PETSTORE_URL, **kwargs):
+    # Pass an HTTP client so that bravado-asyncio is not required
+    return module.PetstoreSwaggerClient.from_cached_spec(
+        cache_path, spec_url, http_client=RequestsClient(), **kwargs)
+
+
+def _fail_from_url(*args, **kwargs):
+    raise AssertionError("Spec not loaded from cache")
+
+
+def test_spec_fingerprint():
+    spec = SwaggerClient.from_url(PETSTORE_URL).swagger_spec
+    spec2 = SwaggerClient.from_url(
+        PETSTORE_URL, config={'use_models': False,
+                              'validate_swagger_spec': False}).swagger_spec
+    assert spec_fingerprint(spec) == spec_fingerprint(spec2)
+    assert spec_fingerprint(spec) != spec_fingerprint(
+        SwaggerClient.from_url(MINIMAL_URL).swagger_spec)
+
+
+def test_from_cached_spec(module, cache_path, monkeypatch):
+    client = _from_cached_spec(module, cache_path)
+    assert os.path.exists(cache_path)
+
+    monkeypatch.setattr(module.PetstoreSwaggerClient, 'from_url',
+                        _fail_from_url)
+    http_client = RequestsClient()
+    cached = module.PetstoreSwaggerClient.from_cached_spec(
+        cache_path, PETSTORE_URL, http_client=http_client)
+    assert isinstance(cached, module.PetstoreSwaggerClient)
+    assert cached.swagger_spec is not client.swagger_spec
+    assert cached.swagger_spec.http_client is http_client
+    assert dir(cached) == dir(client)
+
+    request = construct_request(cached.pet.getPetById, {}, petId=1)
+    assert request['url'] == 'https://petstore.swagger.io/v2/pet/1'
+    Pet = cached.get_model('Pet')
+    pet = Pet(name='Lassie', photoUrls=[])
+    assert Pet._marshal(pet) == {'name': 'Lassie', 'photoUrls': []}
+
+
+def test_from_cached_spec_config(module, cache_path, monkeypatch):
+    _from_cached_spec(module, cache_path)
+    client = _from_cached_spec(module, cache_path,
+                               config={'also_return_response': True})
+    assert client._SwaggerClient__also_return_response is True
+
+    # The cache file was rewritten with the new config
+    monkeypatch.setattr(module.PetstoreSwaggerClient, 'from_url',
+                        _fail_from_url)
+    client = _from_cached_spec(module, cache_path,
+                               config={'also_return_response': True})
+    assert client._SwaggerClient__also_return_response is True
+
+
+@pytest.mark.parametrize('content', [b'', b'invalid', b'\x80\x04N.'])
+def test_from_cached_spec_invalid_cache(module, cache_path, content):
+    with open(cache_path, 'wb') as f:
+        f.write(content)
+    client = _from_cached_spec(module, cache_path)
+    assert client.pet.getPetById
+    with open(cache_path, 'rb') as f:
+        assert f.read() != content
+
+
+def test_from_cached_spec_stale_cache(module, cache_path, monkeypatch):
+    _from_cached_spec(module, cache_path)
+    # Simulate a cache file written by a different bravado-core version
+    monkeypatch.setattr(module.bravado_core, 'version', '0.0.0')
+    built = []
+    monkeypatch.setattr(module, '_save_spec_cache',
+                        lambda *args: built.append(args))
+    _from_cached_spec(module, cache_path)
+    assert len(built) == 1
+
+
+def test_from_cached_spec_schema_mismatch(module, cache_path):
+    with pytest.warns(UserWarning, match='does not match the generated'):
+        client = _from_cached_spec(module, cache_path, MINIMAL_URL)
+    assert client.swagger_spec.origin_url == MINIMAL_URL
+    assert not os.path.exists(cache_path)
+
+
+def test_from_cached_spec_write_error(module, tmp_path):
+    cache_path = str(tmp_path / 'missing' / 'petstore.spec')
+    with pytest.warns(UserWarning, match='Failed to write spec cache'):
+        client = _from_cached_spec(module, cache_path)
+    assert client.swagger_spec.http_client is not None
+    assert not os.listdir(tmp_path)
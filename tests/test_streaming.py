@@ -0,0 +1,231 @@
+import datetime
+import importlib.util
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from bravado.client import SwaggerClient
+from bravado.exception import HTTPNotFound
+from bravado.requests_client import RequestsClient
+from bravado_core.response import IncomingResponse
+from jsonschema import ValidationError
+
+from bravado_types.config import Config
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+
+SPEC_DICT = {
+    'swagger': '2.0',
+    'info': {'title': 'Streaming', 'version': '1.0'},
+    'schemes': ['http'],
+    'paths': {
+        '/items': {
+            'get': {
+                'operationId': 'listItems',
+                'tags': ['items'],
+                'parameters': [
+                    {'name': 'body', 'in': 'query', 'type': 'string',
+                     'required': True},
+                    {'name': 'status', 'in': 'query', 'type': 'integer'},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {
+                            'type': 'array',
+                            'items': {'$ref': '#/definitions/Item'},
+                        },
+                    },
+                    '201': {
+                        'description': 'Object response',
+                        'schema': {'$ref': '#/definitions/Item'},
+                    },
+                    '204': {'description': 'No content'},
+                    '404': {'description': 'Not found'},
+                },
+            },
+        },
+    },
+    'definitions': {
+        'Item': {
+            'type': 'object',
+            'required': ['id'],
+            'properties': {
+                'id': {'type': 'integer'},
+                'name': {'type': 'string'},
+                'created': {'type': 'string', 'format': 'date-time'},
+            },
+        },
+    },
+}
+
+ITEMS = [
+    {'id': 1, 'name': 'café ☃', 'created': '2020-01-02T03:04:05Z'},
+    {'id': 22, 'name': 'quote " and ] bracket'},
+    {'id': 333},
+]
+
+
+@pytest.fixture(scope='module')
+def module(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('streaming') / 'streaming.py')
+    config = Config(name='Streaming', path=path, stream_helper=True)
+    spec = SwaggerClient.from_spec(SPEC_DICT).swagger_spec
+    render(get_metadata(spec), get_spec_info(spec, config), config)
+
+    module_spec = importlib.util.spec_from_file_location('streaming', path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def server():
+    """Serve the body and status given in the query string."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            query = urllib.parse.parse_qs(
+                urllib.parse.urlsplit(self.path).query,
+                keep_blank_values=True)
+            body = query['body'][0].encode('utf-8')
+            status = int(query.get('status', ['200'])[0])
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(module, server, **config):
+    spec_dict = dict(SPEC_DICT, host=f'127.0.0.1:{server.server_port}')
+    return module.StreamingSwaggerClient.from_spec(
+        spec_dict, http_client=RequestsClient(), config=config)
+
+
+@pytest.fixture
+def client(module, server):
+    return _client(module, server)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 65536])
+def test_stream(client, chunk_size):
+    body = json.dumps(ITEMS, ensure_ascii=False)
+    items = list(client.stream(client.items.listItems(body=body),
+                               chunk_size=chunk_size))
+    Item = client.get_model('Item')
+    assert all(isinstance(item, Item) for item in items)
+    assert [item.id for item in items] == [1, 22, 333]
+    assert items[0].name == 'café ☃'
+    assert items[0].created == datetime.datetime(
+        2020, 1, 2, 3, 4, 5, tzinfo=items[0].created.tzinfo)
+    assert items[1].name == 'quote " and ] bracket'
+    assert items == client.items.listItems(body=body).result()
+
+
+def test_stream_empty(client):
+    assert list(client.stream(client.items.listItems(body=' [ ] '))) == []
+
+
+def test_stream_close(client):
+    body = json.dumps(ITEMS)
+    with client.stream(client.items.listItems(body=body),
+                       chunk_size=1) as items:
+        assert next(items).id == 1
+    assert list(items) == []
+
+
+def test_stream_validation(module, server):
+    body = json.dumps([{'id': 1}, {'id': 'two'}])
+    client = _client(module, server)
+    items = client.stream(client.items.listItems(body=body))
+    assert next(items).id == 1
+    with pytest.raises(ValidationError):
+        next(items)
+
+    client = _client(module, server, validate_responses=False)
+    items = list(client.stream(client.items.listItems(body=body)))
+    assert [item.id for item in items] == [1, 'two']
+
+
+def test_stream_invalid_json(client):
+    item = '{"id": 1}'
+    for body in [f'[{item},]', f'[{item} {item}]', f'[{item}', '{}',
+                 f'[{item}] x', '']:
+        items = client.stream(client.items.listItems(body=body),
+                              chunk_size=1)
+        with pytest.raises(ValueError):
+            list(items)
+
+
+def test_stream_response_callbacks(client):
+    responses = []
+    future = client.items.listItems(
+        body=json.dumps(ITEMS),
+        _request_options={'response_callbacks': [
+            lambda response, operation: responses.append(response)]})
+    assert len(list(client.stream(future))) == 3
+    [response] = responses
+    assert isinstance(response, IncomingResponse)
+    assert response.status_code == 200
+
+
+def test_stream_not_streamed(client):
+    # Responses which are not arrays are handled as by HttpFuture.result()
+    future = client.items.listItems(body='', status=204)
+    assert list(client.stream(future)) == []
+    future = client.items.listItems(body='{}', status=404)
+    with pytest.raises(HTTPNotFound):
+        list(client.stream(future))
+    future = client.items.listItems(body='{"id": 1}', status=201)
+    with pytest.raises(TypeError, match='not an array'):
+        list(client.stream(future))
+
+
+def test_stream_http_client(module, server):
+    class OtherClient(RequestsClient):
+        def request(self, request_params, operation=None,
+                    request_config=None):
+            future = super().request(request_params, operation,
+                                     request_config)
+            future.future = object()
+            return future
+
+    spec_dict = dict(SPEC_DICT, host=f'127.0.0.1:{server.server_port}')
+    client = module.StreamingSwaggerClient.from_spec(
+        spec_dict, http_client=OtherClient())
+    with pytest.raises(TypeError, match='RequestsClient'):
+        client.stream(client.items.listItems(body='[]'))
+
+
+@pytest.mark.parametrize('text', [
+    '[]',
+    ' \n[ 1 , -2.5e3,true,false,null, "a\\"b\\u00e9", {"x": [1, {}]}, []] ',
+    json.dumps(ITEMS, ensure_ascii=False),
+    json.dumps(list(range(100))),
+])
+def test_iter_json_array(module, text):
+    data = text.encode('utf-8')
+    for size in range(1, 12):
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        assert list(module._iter_json_array(chunks)) == json.loads(text)
+
+
+def test_stream_async_client():
+    with pytest.raises(ValueError, match='async'):
+        Config(name='Streaming', path='streaming.py', stream_helper=True,
+               async_client=True)
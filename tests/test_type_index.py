@@ -0,0 +1,136 @@
+import json
+import os
+import os.path
+
+import mypy.api
+import pytest
+from bravado.client import SwaggerClient
+
+from bravado_types import generate_module
+from bravado_types.config import Config, ResponseTypes
+from bravado_types.data_model import OperationInfo, ResponseInfo, TypeInfo
+from bravado_types.type_index import (TYPE_INDEX_FORMAT, TYPE_INDEX_VERSION,
+                                      future_type)
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+OPERATION = OperationInfo(None, 'getPet', [], [
+    ResponseInfo('200', TypeInfo('Pet', True)),
+    ResponseInfo('201', TypeInfo('None')),
+    ResponseInfo('404', TypeInfo('Error', True)),
+], 'get', '/pet/{petId}')
+TYPES = {TypeInfo('Pet', True): 'PetModel', TypeInfo('None'): 'None',
+         TypeInfo('Error', True): 'ErrorModel'}
+
+
+@pytest.mark.parametrize(('response_types', 'expected'), [
+    pytest.param(ResponseTypes.success, 'typing.Union[PetModel, None]',
+                 id='success'),
+    pytest.param(ResponseTypes.all,
+                 'typing.Union[PetModel, None, ErrorModel]', id='all'),
+    pytest.param(ResponseTypes.any, 'typing.Any', id='any'),
+])
+def test_future_type(response_types, expected):
+    config = Config(name='Test', path='test.py',
+                    response_types=response_types)
+    assert future_type(OPERATION, config, TYPES) == \
+        f'bravado.http_future.HttpFuture[{expected}]'
+
+
+def test_future_type_single():
+    operation = OperationInfo(None, 'getPet', [], [
+        ResponseInfo('200', TypeInfo('Pet', True)),
+    ], 'get', '/pet/{petId}')
+    config = Config(name='Test', path='test.py', async_client=True)
+    assert future_type(operation, config, TYPES) == \
+        '_AsyncHttpFuture[PetModel]'
+
+
+def test_future_type_no_success():
+    operation = OperationInfo(None, 'getPet', [], [
+        ResponseInfo('default', TypeInfo('Error', True)),
+    ], 'get', '/pet/{petId}')
+    config = Config(name='Test', path='test.py')
+    assert future_type(operation, config, TYPES) == \
+        'bravado.http_future.HttpFuture[None]'
+
+
+@pytest.fixture(scope='module')
+def lazy_module(tmp_path_factory):
+    path = tmp_path_factory.mktemp('lazy')
+    with open(path / 'mypy.ini', 'w') as f:
+        f.write('[mypy]\nplugins = bravado_types.mypy_plugin\n')
+    client = SwaggerClient.from_url(f'file://{PETSTORE_SCHEMA}')
+    config = Config(name='Petstore', path=str(path / 'petstore.py'),
+                    lazy_stubs=True)
+    generate_module(client, config)
+    return path, config
+
+
+def test_type_index(lazy_module):
+    _, config = lazy_module
+    with open(config.index_path) as f:
+        index = json.load(f)
+    assert index['format'] == TYPE_INDEX_FORMAT
+    assert index['version'] == TYPE_INDEX_VERSION
+    assert index['resources']['pet']['type'] == 'petResource'
+    assert 'getPetById' in index['resources']['pet']['operations']
+    assert index['operations']['getPetById'] == {
+        'type': 'getPetByIdOperation',
+        'params': [['api_key', 'str', False], ['petId', 'int', True]],
+        'returns': 'bravado.http_future.HttpFuture[PetModel]',
+    }
+    assert ['name', 'str', True] in index['models']['Pet']['props']
+
+
+def _run_mypy(path, source):
+    with open(path / 'example.py', 'w') as f:
+        f.write(source)
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        return mypy.api.run(['example.py'])
+    finally:
+        os.chdir(cwd)
+
+
+def test_plugin_index_mismatch(lazy_module):
+    path, config = lazy_module
+    with open(config.index_path) as f:
+        content = f.read()
+    try:
+        with open(config.index_path, 'w') as f:
+            f.write(content.replace('"int"', '"str"'))
+        out, _, status = _run_mypy(
+            path,
+            "from petstore import PetstoreSwaggerClient\n"
+            "client: PetstoreSwaggerClient\n"
+            "client.pet\n")
+    finally:
+        with open(config.index_path, 'w') as f:
+            f.write(content)
+    assert status == 1
+    assert 'does not match stub file' in out
+
+
+def test_plugin_non_literal_model_name(lazy_module):
+    path, _ = lazy_module
+    out, _, _ = _run_mypy(
+        path,
+        "from petstore import PetstoreSwaggerClient\n"
+        "client: PetstoreSwaggerClient\n"
+        "name: str\n"
+        "reveal_type(client.get_model(name))\n")
+    assert 'error' not in out
+    assert 'Type[bravado_core.model.Model]' in out
+
+
+def test_plugin_unsupported_mypy_version(monkeypatch):
+    from mypy.checkexpr import ExpressionChecker
+
+    from bravado_types.mypy_plugin import plugin
+
+    monkeypatch.delattr(ExpressionChecker, 'check_call')
+    with pytest.raises(RuntimeError, match='Unsupported MyPy version'):
+        plugin('0.0')
@@ -0,0 +1,102 @@
+import json
+import os.path
+
+import pytest
+from bravado_core.spec import Spec
+
+from bravado_types.config import ArrayTypes, Config
+from bravado_types.data_model import TypeInfo, TypeWrapper
+from bravado_types.extract import get_spec_info
+from bravado_types.metadata import get_metadata
+from bravado_types.render import render
+from bravado_types.sinks import MemorySink
+from bravado_types.type_strings import render_spec_types, render_type
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSTORE_SCHEMA = f"{TESTS_DIR}/mypy/petstore/petstore.json"
+
+PETS = TypeInfo('Pet', True, [TypeWrapper.optional, TypeWrapper.array])
+
+
+@pytest.mark.parametrize(('type_info', 'options', 'expected'), [
+    pytest.param(TypeInfo('int'), {}, 'int', id='simple'),
+    pytest.param(TypeInfo('Pet', True), {}, 'PetModel', id='model'),
+    pytest.param(TypeInfo('Pet', True), {'model_type_format': 'Model{}'},
+                 'ModelPet', id='model_type_format'),
+    pytest.param(PETS, {}, 'typing.Optional[typing.List[PetModel]]',
+                 id='list'),
+    pytest.param(PETS, {'array_types': ArrayTypes.sequence},
+                 'typing.Optional[typing.Sequence[PetModel]]',
+                 id='sequence'),
+    pytest.param(PETS, {'array_types': ArrayTypes.union},
+                 'typing.Optional[typing.Union[typing.List[PetModel], '
+                 'typing.Tuple[PetModel, ...]]]', id='union'),
+])
+def test_render_type(type_info, options, expected):
+    config = Config(name='Test', path='test.py', **options)
+    assert render_type(type_info, config) == expected
+
+
+def test_render_spec_types():
+    with open(PETSTORE_SCHEMA) as f:
+        spec = Spec.from_dict(json.load(f))
+    config = Config(name='Petstore', path='petstore.py',
+                    array_types=ArrayTypes.sequence)
+    spec_info = get_spec_info(spec, config)
+    types = render_spec_types(spec_info, config)
+    pet = next(model for model in spec_info.models if model.name == 'Pet')
+    props = {prop.name: types[prop.type] for prop in pet.props}
+    assert props['tags'] == 'typing.Sequence[TagModel]'
+    assert props['category'] == 'CategoryModel'
+    # Each type of the spec is rendered
+    for operation in spec_info.operations:
+        for param in operation.params:
+            assert types[param.type] == render_type(param.type, config)
+        for response in operation.responses:
+            assert types[response.type] == render_type(response.type, config)
+    # The type information is not changed
+    assert all(isinstance(prop.type, TypeInfo) for prop in pet.props)
+
+
+def test_type_info_str():
+    with pytest.raises(TypeError, match=r'types\[prop.type\]'):
+        str(PETS)
+    with pytest.raises(TypeError, match='is not a type string'):
+        f'{PETS}'
+
+
+def test_custom_template_type_string(tmp_path):
+    # Templates written for type strings fail instead of writing reprs
+    (tmp_path / 'models.mako').write_text(
+        '<%page args="models, config, types" />\\\n'
+        '% for model in models:\n'
+        '    % for prop in model.props:\n'
+        '${prop.name}: ${prop.type}\n'
+        '    % endfor\n'
+        '% endfor\n')
+    with open(PETSTORE_SCHEMA) as f:
+        spec = Spec.from_dict(json.load(f))
+    config = Config(name='Petstore', path='petstore.py',
+                    custom_templates_dir=str(tmp_path))
+    with pytest.raises(TypeError, match='is not a type string'):
+        render(get_metadata(spec), get_spec_info(spec, config), config,
+               sink=MemorySink())
+
+
+def test_render_variants():
+    # One extraction renders the same files as extracting for each config
+    with open(PETSTORE_SCHEMA) as f:
+        spec = Spec.from_dict(json.load(f))
+    metadata = get_metadata(spec)
+    spec_info = get_spec_info(spec, Config(name='Petstore',
+                                           path='petstore.py'))
+    for options in [
+        {'array_types': ArrayTypes.list},
+        {'array_types': ArrayTypes.sequence},
+        {'array_types': ArrayTypes.union, 'model_type_format': 'Model{}'},
+    ]:
+        config = Config(name='Petstore', path='petstore.py', **options)
+        shared, separate = MemorySink(), MemorySink()
+        render(metadata, spec_info, config, sink=shared)
+        render(metadata, get_spec_info(spec, config), config, sink=separate)
+        assert shared.files == separate.files
@@ -1,7 +1,11 @@
+import pickle
+
 import pytest
 from bravado_core.spec import Spec
 
 from bravado_types.config import ArrayTypes, Config, CustomFormats
+from bravado_types.data_model import TypeInfo, TypeWrapper
+from bravado_types.type_strings import render_type
 from bravado_types.types import get_type_info, get_response_type_info
 
 
@@ -175,7 +179,8 @@ def test_get_type_info(schema, expected):
     spec = Spec.from_dict(spec_dict)
     pschema = spec.definitions['Nested']._model_spec['properties']['test']
     assert pschema == schema
-    assert get_type_info(spec, pschema, config) == expected
+    assert render_type(get_type_info(spec, pschema, config),
+                       config) == expected
 
 
 @pytest.mark.parametrize(('array_types', 'expected'), [
@@ -213,7 +218,8 @@ def test_get_type_info_array_types_list(array_types, expected):
     spec = Spec.from_dict(spec_dict)
     pschema = spec.definitions['Object']._model_spec['properties']['test']
     config = Config(name='Test', path='/tmp/test.py', array_types=array_types)
-    assert get_type_info(spec, pschema, config) == expected
+    assert render_type(get_type_info(spec, pschema, config),
+                       config) == expected
 
 
 def test_get_type_info_custom_format():
@@ -245,7 +251,8 @@ def test_get_type_info_custom_format():
     )
     config = Config(name='Test', path='/tmp/test.py',
                     custom_formats=custom_formats)
-    assert get_type_info(spec, pschema, config) == 'ipaddress.IPV4Address'
+    assert get_type_info(spec, pschema, config) == \
+        TypeInfo('ipaddress.IPV4Address')
 
 
 @pytest.mark.parametrize(('schema', 'expected'), [
@@ -341,4 +348,137 @@ def test_get_response_type_info(schema, expected):
     operation = spec.resources['rsc'].operations['op']
     rschema = operation.op_spec['responses']['200']
     assert rschema == schema
-    assert get_response_type_info(spec, rschema, config) == expected
+    assert render_type(get_response_type_info(spec, rschema, config),
+                       config) == expected
+
+
+def _deep_spec(definitions):
+    """
+    Create a spec with the given definitions.
+
+    The definitions are added after the spec is built, since model discovery
+    in bravado-core does not support deeply nested schemas.
+    """
+    spec = Spec.from_dict({
+        'swagger': '2.0',
+        'info': {
+            'title': 'Example schema',
+            'version': '1.0',
+        },
+        'paths': {},
+        'definitions': {},
+    })
+    spec.spec_dict['definitions'].update(definitions)
+    return spec
+
+
+@pytest.mark.parametrize('depth', [1000, 5000])
+def test_get_type_info_deep_inline_arrays(depth):
+    schema = {'type': 'string'}
+    for _ in range(depth):
+        schema = {'type': 'array', 'items': schema}
+    config = Config(name='Test', path='/tmp/test.py')
+    expected = 'typing.List[' * depth + 'str' + ']' * depth
+    assert render_type(get_type_info(_deep_spec({}), schema, config),
+                       config) == expected
+
+
+def test_get_type_info_deep_refs():
+    depth = 3000
+    definitions = {}
+    for i in range(depth):
+        if i % 2:
+            definitions[f'D{i}'] = {
+                'x-nullable': True,
+                'allOf': [{'$ref': f'#/definitions/D{i + 1}'}],
+            }
+        else:
+            definitions[f'D{i}'] = {
+                'type': 'array',
+                'items': {'$ref': f'#/definitions/D{i + 1}'},
+            }
+    definitions[f'D{depth}'] = {'type': 'integer'}
+    config = Config(name='Test', path='/tmp/test.py',
+                    array_types=ArrayTypes.sequence)
+    expected = ('typing.Sequence[typing.Optional[' * (depth // 2) + 'int'
+                + ']]' * (depth // 2))
+    type_info = get_type_info(_deep_spec(definitions),
+                              {'$ref': '#/definitions/D0'}, config)
+    assert render_type(type_info, config) == expected
+
+
+def test_get_type_info_nested_union_arrays():
+    schema = {'type': 'array', 'x-nullable': True, 'items': {
+        'type': 'array', 'items': {'type': 'integer'},
+    }}
+    config = Config(name='Test', path='/tmp/test.py',
+                    array_types=ArrayTypes.union)
+    inner = 'typing.Union[typing.List[int], typing.Tuple[int, ...]]'
+    expected = (f'typing.Optional[typing.Union[typing.List[{inner}], '
+                f'typing.Tuple[{inner}, ...]]]')
+    assert render_type(get_type_info(_deep_spec({}), schema, config),
+                       config) == expected
+
+
+@pytest.mark.parametrize(('definitions', 'expected'), [
+    pytest.param(
+        {'Loop': {'type': 'array', 'items': {'$ref': '#/definitions/Loop'}}},
+        'typing.List[typing.Any]',
+        id="array",
+    ),
+    pytest.param(
+        {
+            'Loop': {'x-nullable': True,
+                     'allOf': [{'$ref': '#/definitions/Loop2'}]},
+            'Loop2': {'type': 'array',
+                      'items': {'$ref': '#/definitions/Loop'}},
+        },
+        'typing.Optional[typing.List[typing.Any]]',
+        id="all_of",
+    ),
+])
+def test_get_type_info_recursive(definitions, expected):
+    config = Config(name='Test', path='/tmp/test.py')
+    with pytest.warns(UserWarning, match='Recursive schema'):
+        type_info = get_type_info(_deep_spec(definitions),
+                                  {'$ref': '#/definitions/Loop'}, config)
+    assert render_type(type_info, config) == expected
+
+
+def test_get_type_info_structure():
+    spec = _deep_spec({'Object': {'type': 'object', 'x-model': 'Object'}})
+    schema = {'type': 'array', 'x-nullable': True,
+              'items': {'$ref': '#/definitions/Object'}}
+    expected = TypeInfo('Object', True,
+                        [TypeWrapper.optional, TypeWrapper.array])
+    # Types do not depend on the options applied when they are rendered
+    for config in [
+        Config(name='Test', path='/tmp/test.py'),
+        Config(name='Test', path='/tmp/test.py',
+               array_types=ArrayTypes.sequence, model_type_format='{}Type'),
+    ]:
+        type_info = get_type_info(spec, schema, config)
+        assert type_info == expected
+        assert hash(type_info) == hash(expected)
+    assert render_type(expected, config) == \
+        'typing.Optional[typing.Sequence[ObjectType]]'
+
+
+def test_type_info_deep():
+    depth = 5000
+    schema = {'type': 'string'}
+    for _ in range(depth):
+        schema = {'type': 'array', 'items': schema}
+    config = Config(name='Test', path='/tmp/test.py')
+    type_info = get_type_info(_deep_spec({}), schema, config)
+    other = TypeInfo('str', wrappers=['array'] * depth)
+    assert type_info == other
+    assert {type_info, other} == {other}
+    assert type_info != TypeInfo('str', wrappers=['array'] * (depth - 1))
+
+
+def test_type_info_pickle():
+    type_info = TypeInfo('Pet', True, [TypeWrapper.array])
+    copy = pickle.loads(pickle.dumps(type_info))
+    assert copy == type_info
+    assert vars(copy) == vars(type_info)